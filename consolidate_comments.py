@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Consolidate scraped comment JSON files into one partitioned dataset
+Usage: python consolidate_comments.py [--force] [comments_*.json all_oem_comments_*.json ...]
+(default: every comments_*.json, all_oem_comments_*.json and real_youtube_comments_*.json file,
+except the enhanced datasets the agent never loads)
+The dataset is COMMENT_DATASET_DIR (default comment_dataset): one JSON file per OEM and month plus a
+manifest. Comments seen in several files are kept once. The agent loads the dataset instead of
+picking the largest scraped file while the manifest exists.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_dataset import consolidate_comments, default_dataset_dir
+from services.comment_store import scraped_source_paths
+
+
+def main():
+    args = sys.argv[1:]
+    force = '--force' in args
+    paths = [arg for arg in args if arg != '--force'] or scraped_source_paths()
+    if not paths:
+        print("❌ No comment files to consolidate")
+        return
+
+    start_time = time.time()
+    manifest = consolidate_comments(paths, force=force)
+    print(f"✅ {default_dataset_dir()} (version {manifest['version']}): {manifest['rows']} comments "
+          f"from {len(manifest['sources'])} files in {time.time() - start_time:.1f}s")
+    for oem_name, summary in manifest['oems'].items():
+        print(f"📊 {oem_name}: {summary['rows']} comments in {summary['partitions']} partitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Debug/benchmark long comments: sequence matcher vs per-pattern `.*` regexes
+Pathological 5-10K character comments repeat the opening keyword of a phrase
+without the closing one, which makes backtracking `re.search` quadratic.
+"""
+import re
+import sys
+import time
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+def build_long_texts():
+    """Long comments that hit the worst case of the `.*` phrase patterns"""
+    return {
+        'repeated_opening_word': 'great service ' * 500,
+        'no_closing_keyword': 'not ' * 1500 + 'a ' * 1500,
+        'range_without_issue': 'range ' * 1500,
+        'long_whitespace_run': 'good' + ' ' * 8000 + 'bad',
+        'multi_line_rant': ('thanks for nothing\nworst service\n' * 200) + 'great',
+    }
+
+
+def time_call(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def scan_hits(engine, text, groups):
+    matches = engine.scan(text)
+    return {group: matches.hits(group) for group in groups}
+
+
+def main():
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    engine = classifier.pattern_engine
+    groups = {group: patterns for group, (kind, patterns) in engine.groups.items() if kind == 'sequence'}
+    compiled = {group: [re.compile(pattern) for pattern in patterns] for group, patterns in groups.items()}
+
+    print("🔍 Long text phrase matching")
+    print("=" * 70)
+    print(f"{'text':<24}{'chars':>7}{'regex loop':>14}{'sequence':>12}{'speedup':>10}")
+
+    mismatches = 0
+    for name, text in build_long_texts().items():
+        text = text.lower()
+        regex_time, expected = time_call(
+            lambda: {group: [r.pattern for r in regexes if r.search(text)] for group, regexes in compiled.items()},
+            repeat=1)
+        sequence_time, actual = time_call(lambda: scan_hits(engine, text, groups))
+        if actual != expected:
+            mismatches += 1
+            print(f"❌ {name}: results differ")
+        print(f"{name:<24}{len(text):>7}{regex_time * 1000:>11.1f} ms{sequence_time * 1000:>9.1f} ms"
+              f"{regex_time / max(sequence_time, 1e-9):>9.1f}x")
+
+    full_time, _ = time_call(lambda: classifier.classify_comment({'text': build_long_texts()['no_closing_keyword']}))
+    print(f"\nFull classification of a {len(build_long_texts()['no_closing_keyword'])}-char comment: "
+          f"{full_time * 1000:.1f} ms")
+    print("✅ Results identical" if not mismatches else f"❌ {mismatches} mismatching texts")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
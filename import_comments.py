@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Import scraped comment JSON files into the SQLite comment repository
+Usage: python import_comments.py [--force] [comments_*.json all_oem_comments_*.json ...]
+(default: every comments_*.json, all_oem_comments_*.json and real_youtube_comments_*.json file,
+except the enhanced datasets the agent never loads)
+The repository is COMMENT_DB_PATH (default comments.db). Files unchanged since their last import are
+skipped; comments seen in several files are stored once.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_repository import CommentRepository
+from services.comment_store import scraped_source_paths
+
+
+def main():
+    args = sys.argv[1:]
+    force = '--force' in args
+    paths = [arg for arg in args if arg != '--force'] or scraped_source_paths()
+    if not paths:
+        print("❌ No comment files to import")
+        return
+
+    repository = CommentRepository()
+    start_time = time.time()
+    imported = skipped = 0
+    for path in paths:
+        try:
+            written = repository.import_file(path, force=force)
+        except Exception as e:
+            print(f"⚠️ Failed to import {path}: {e}")
+            continue
+        if written is None:
+            skipped += 1
+        else:
+            imported += 1
+            print(f"📥 {path}: {written} comments")
+
+    stats = repository.stats()
+    print(f"✅ Imported {imported} files ({skipped} unchanged) in {time.time() - start_time:.1f}s")
+    print(f"🗄️ {stats['db_path']}: {stats['comments']} comments across {stats['oems']} OEMs "
+          f"from {stats['sources']} files (full-text search: {'FTS5' if stats['fts_enabled'] else 'LIKE'})")
+
+
+if __name__ == "__main__":
+    main()
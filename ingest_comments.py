@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Convert scraped comment JSON files into columnar, memory-mapped comment stores
+Usage: python ingest_comments.py [all_oem_comments_*.json ...]
+(default: every all_oem_comments_*.json and real_youtube_comments_*.json file)
+Each file becomes COMMENT_STORE_DIR/<file name>/ (default comment_store), holding the real comments the
+agent would load from it. The agent opens the store instead of the JSON file while the file is unchanged.
+"""
+
+import os
+import sys
+import glob
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_store import ingest_scraped_json, store_path_for
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob('all_oem_comments_*.json') + glob.glob('real_youtube_comments_*.json'))
+    if not paths:
+        print("❌ No comment files to ingest")
+        return
+
+    for path in paths:
+        start_time = time.time()
+        try:
+            manifest = ingest_scraped_json(path)
+        except Exception as e:
+            print(f"⚠️ Failed to ingest {path}: {e}")
+            continue
+        store_path = store_path_for(path)
+        store_size = sum(os.path.getsize(os.path.join(store_path, name)) for name in os.listdir(store_path))
+        print(f"📦 {path}: {manifest['rows']} comments, {len(manifest['oems'])} OEMs, "
+              f"{len(manifest['columns'])} columns -> {store_path} "
+              f"({store_size / (1024 * 1024):.1f} MB) in {time.time() - start_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
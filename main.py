@@ -127,6 +127,7 @@ class HealthResponse(BaseModel):
     status: str
     timestamp: str
     services: Dict[str, Any]
+    dataset_version: Optional[int] = None
 
 # Mount static files (for web interface)
 try:
@@ -864,6 +865,29 @@ async def get_youtube_analytics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analytics error: {str(e)}")
 
+@app.get("/api/youtube-analytics/comment-counts")
+async def count_youtube_comments(all_of: Optional[str] = None, any_of: Optional[str] = None,
+                                 none_of: Optional[str] = None, oem: Optional[str] = None,
+                                 sentiment: Optional[str] = None, month: Optional[str] = None):
+    """Count comments by the lexicon/pattern features that fired and by OEM, sentiment and month (YYYY-MM),
+    from the feature index; every filter is a comma-separated list, e.g. all_of=range_issue,service"""
+    def split(values: Optional[str]) -> Optional[List[str]]:
+        return [value.strip() for value in values.split(',') if value.strip()] if values else None
+
+    filters = dict(all_of=split(all_of), any_of=split(any_of), none_of=split(none_of),
+                   oem=split(oem), sentiment=split(sentiment), month=split(month))
+    try:
+        counts = await enhanced_agent_service.count_comments(**filters)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=str(e.args[0]))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Comment count error: {str(e)}")
+    return {
+        **counts,
+        "filters": {name: values for name, values in filters.items() if values},
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """Get the health status of the application and its services"""
@@ -871,7 +895,8 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now().isoformat(),
-        services=health_status
+        services=health_status,
+        dataset_version=health_status['data_watcher'].get('dataset_version')
     )
 
 @app.get("/api/temporal-analysis/{oem_name}")
@@ -956,6 +981,7 @@ async def api_documentation():
             "GET /api/conversation-memory": "Get conversation memory and user preferences",
             "DELETE /api/conversation-memory": "Clear conversation memory",
             "GET /api/youtube-analytics": "Get YouTube comment analytics",
+            "GET /api/youtube-analytics/comment-counts": "Count comments by features, OEM, sentiment and month",
             "GET /api/export/{file_type}/{filename}": "Download export files",
             "GET /api/health": "Health check with all services",
             "GET /api/analytics/summary": "Get analytics summary",
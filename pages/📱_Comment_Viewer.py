@@ -9,6 +9,13 @@ import plotly.express as px
 from datetime import datetime
 import glob
 import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.comment_repository import CommentRepository
+
+# Pseudo file entry of the SQLite comment repository (filled by import_comments.py)
+REPOSITORY_SOURCE = "🗄️ Comment database"
 
 st.set_page_config(
     page_title="📱 YouTube Comments Viewer", 
@@ -67,18 +74,27 @@ def load_comments_from_file(filename):
         st.error(f"Error loading file {filename}: {e}")
         return {}, 0, 'Error'
 
+@st.cache_resource
+def get_comment_repository():
+    """The comment repository, or None when nothing was imported yet"""
+    repository = CommentRepository()
+    return repository if repository.exists() else None
+
 # Sidebar - File Selection
 with st.sidebar:
     st.header("📁 Comment Files")
     
     files = load_comment_files()
+    repository = get_comment_repository()
     
-    if not files:
+    if not files and not repository:
         st.warning("No comment files found. Run scraping first.")
         st.stop()
     
     # Show file information
     st.subheader("Available Files:")
+    if repository:
+        st.write(f"🗄️ `{repository.db_path}` (indexed, full-text search)")
     for file_info in files:
         file_type_icon = "📊" if file_info['type'] == 'combined' else "🏭"
         size_mb = file_info['size'] / (1024 * 1024)
@@ -90,13 +106,20 @@ with st.sidebar:
     # File selector
     selected_file = st.selectbox(
         "Select file to view:",
-        [f['file'] for f in files],
-        format_func=lambda x: f"{'📊' if 'all_oem' in x else '🏭'} {x}"
+        ([REPOSITORY_SOURCE] if repository else []) + [f['file'] for f in files],
+        format_func=lambda x: x if x == REPOSITORY_SOURCE else f"{'📊' if 'all_oem' in x else '🏭'} {x}"
     )
 
 # Load selected file
 if selected_file:
-    comments_data, total_comments, timestamp = load_comments_from_file(selected_file)
+    use_repository = selected_file == REPOSITORY_SOURCE
+    if use_repository:
+        # Counts, statistics and filters are SQL queries; only the filtered comments are loaded
+        comments_data = repository.oem_counts()
+        total_comments = sum(comments_data.values())
+        timestamp = repository.stats()['last_import'] or 'Unknown'
+    else:
+        comments_data, total_comments, timestamp = load_comments_from_file(selected_file)
     
     # File information
     col1, col2, col3 = st.columns(3)
@@ -117,27 +140,36 @@ if selected_file:
     )
     
     if selected_oem and comments_data[selected_oem]:
-        oem_comments = comments_data[selected_oem]
+        if use_repository:
+            oem_stats = repository.oem_stats(selected_oem, real_methods=['downloader', 'ytdlp'])
+            oem_total = oem_stats['comments']
+            avg_likes = oem_stats['avg_likes']
+            unique_authors = oem_stats['unique_authors']
+            real_comments = oem_stats['real_comments']
+            unique_videos = oem_stats['unique_videos']
+        else:
+            oem_comments = comments_data[selected_oem]
+            oem_total = len(oem_comments)
+            avg_likes = sum(c.get('likes', 0) for c in oem_comments) / len(oem_comments)
+            unique_authors = len(set(c.get('author', 'Unknown') for c in oem_comments))
+            real_comments = len([c for c in oem_comments if c.get('extraction_method') in ['downloader', 'ytdlp']])
+            unique_videos = len(set(c.get('video_title', 'Unknown') for c in oem_comments))
         
-        st.subheader(f"📱 {selected_oem} Comments ({len(oem_comments)} total)")
+        st.subheader(f"📱 {selected_oem} Comments ({oem_total} total)")
         
         # Comment statistics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            avg_likes = sum(c.get('likes', 0) for c in oem_comments) / len(oem_comments)
             st.metric("👍 Avg Likes", f"{avg_likes:.1f}")
         
         with col2:
-            unique_authors = len(set(c.get('author', 'Unknown') for c in oem_comments))
             st.metric("👤 Unique Users", unique_authors)
         
         with col3:
-            real_comments = len([c for c in oem_comments if c.get('extraction_method') in ['downloader', 'ytdlp']])
             st.metric("✅ Real Comments", real_comments)
         
         with col4:
-            unique_videos = len(set(c.get('video_title', 'Unknown') for c in oem_comments))
             st.metric("📺 Videos", unique_videos)
         
         st.divider()
@@ -149,18 +181,24 @@ if selected_file:
             min_likes = st.slider("Minimum likes", 0, 100, 0)
             
         with col2:
-            search_text = st.text_input("🔍 Search in comments", placeholder="Enter keywords...")
+            search_text = st.text_input("🔍 Search in comments", placeholder="Enter keywords...",
+                                        help="Database: comments containing words that start with every keyword"
+                                        if use_repository else None)
         
         # Filter comments
-        filtered_comments = oem_comments
-        
-        if min_likes > 0:
-            filtered_comments = [c for c in filtered_comments if c.get('likes', 0) >= min_likes]
-        
-        if search_text:
-            filtered_comments = [c for c in filtered_comments if search_text.lower() in c.get('text', '').lower()]
+        if use_repository:
+            filtered_comments = repository.query(oem=selected_oem, min_likes=min_likes,
+                                                 keywords=search_text.split() if search_text else None)
+        else:
+            filtered_comments = oem_comments
+            
+            if min_likes > 0:
+                filtered_comments = [c for c in filtered_comments if c.get('likes', 0) >= min_likes]
+            
+            if search_text:
+                filtered_comments = [c for c in filtered_comments if search_text.lower() in c.get('text', '').lower()]
         
-        st.write(f"📋 Showing {len(filtered_comments)} of {len(oem_comments)} comments")
+        st.write(f"📋 Showing {len(filtered_comments)} of {oem_total} comments")
         
         # Display comments
         for i, comment in enumerate(filtered_comments[:20]):  # Show first 20
@@ -248,7 +286,7 @@ st.divider()
 st.markdown("""
 ### 💡 How to Use This Viewer
 
-1. **Select a file** from the sidebar (📊 = combined data, 🏭 = individual OEM)
+1. **Select a file** from the sidebar (🗄️ = comment database, 📊 = combined data, 🏭 = individual OEM)
 2. **Choose an OEM** to view their specific comments
 3. **Filter comments** by likes or search for keywords
 4. **Click on comments** to see full details and video links
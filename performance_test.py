@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Classifier micro-benchmarks
+Run directly: python performance_test.py [benchmark_name ...]
+(functions are named benchmark_* so pytest does not collect them as tests)
+"""
+
+import sys
+import os
+import glob
+import json
+import time
+import tempfile
+import subprocess
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.feature_index import FeatureIndex
+from services import distilled_classifier
+from services.distilled_classifier import DistilledSentimentModel, DistilledSentimentScorer
+from services.rule_pack import RulePack
+
+
+SAMPLE_COMMENTS = [
+    "Ola S1 Pro is amazing 😍 but service center is worst",
+    "Ather ka range bahut badhiya hai, dil se recommend karunga",
+    "Which is better, Chetak or iQube? Please suggest for daily 40 km commute",
+    "बैटरी बहुत अच्छी है लेकिन सर्विस खराब है 😡",
+    "இது நல்ல ஸ்கூட்டர், range சிறந்த",
+    "ഇത് നല്ല വണ്ടി ആണ് 👍",
+    "ఇది మంచి స్కూటర్ కానీ సర్వీస్ చెత్త",
+    "Thanks for nothing Ola! 3rd visit to the service centre this month",
+    "first",
+    "Great video bhai, keep it up 🔥🔥",
+    "Battery drained in 2 days, range issue is real. Not good at all",
+    "Hero Vida V1 price kitna hai on road Bangalore?",
+]
+
+
+def _time_best(func, repeat: int = 5) -> float:
+    """Best wall time of several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_language_detection(rounds: int = 200):
+    """Script profiling and detect_language_mix throughput in characters per second"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    texts = SAMPLE_COMMENTS * rounds
+    total_chars = sum(len(text) for text in texts)
+
+    profile_time = _time_best(lambda: [classifier.profile_scripts(text) for text in texts])
+    detect_time = _time_best(lambda: [classifier.detect_language_mix(text) for text in texts])
+
+    print(f"🌐 Language detection over {len(texts)} comments ({total_chars} chars)")
+    print(f"   Script profile:      {total_chars / profile_time / 1e6:6.2f} M chars/s "
+          f"({profile_time / len(texts) * 1e6:.1f} µs/comment)")
+    print(f"   detect_language_mix: {total_chars / detect_time / 1e6:6.2f} M chars/s "
+          f"({detect_time / len(texts) * 1e6:.1f} µs/comment)")
+    return {'profile_chars_per_sec': total_chars / profile_time,
+            'detect_chars_per_sec': total_chars / detect_time}
+
+
+def benchmark_emoji_analysis(rounds: int = 200):
+    """Emoji analysis as a separate regex pass vs taken from the shared script profile scan"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    texts = SAMPLE_COMMENTS * rounds
+
+    separate_time = _time_best(lambda: [(classifier.profile_scripts(text), classifier.analyze_emojis(text))
+                                        for text in texts])
+    fused_time = _time_best(lambda: [classifier.analyze_emojis(text, classifier.profile_scripts(text))
+                                     for text in texts])
+
+    print(f"😀 Script profile + emoji analysis over {len(texts)} comments")
+    print(f"   Separate emoji pass: {separate_time / len(texts) * 1e6:6.1f} µs/comment")
+    print(f"   Fused into profile:  {fused_time / len(texts) * 1e6:6.1f} µs/comment "
+          f"({separate_time / fused_time:.2f}x)")
+    return {'separate_sec': separate_time, 'fused_sec': fused_time}
+
+
+def benchmark_classification(rounds: int = 50):
+    """End-to-end classify_comment throughput"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text, 'likes': i} for i, text in enumerate(SAMPLE_COMMENTS * rounds)]
+    total_chars = sum(len(comment['text']) for comment in comments)
+
+    elapsed = _time_best(lambda: [classifier.classify_comment(comment, 'Ola Electric') for comment in comments], 3)
+    print(f"🚀 classify_comment over {len(comments)} comments")
+    print(f"   {len(comments) / elapsed:8.0f} comments/s, {total_chars / elapsed / 1e6:.2f} M chars/s")
+    return {'comments_per_sec': len(comments) / elapsed, 'chars_per_sec': total_chars / elapsed}
+
+
+def benchmark_feature_index(rounds: int = 200):
+    """Filtered count from the bitset feature index vs re-scanning and re-classifying every comment"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    oems = ['Ola Electric', 'Ather', 'Bajaj Chetak']
+    comments = [{'text': text, 'likes': i} for i, text in enumerate(SAMPLE_COMMENTS * rounds)]
+    classified = {}
+    for oem in oems:
+        classified[oem] = []
+        for comment in comments:
+            classification = classifier.classify_comment(comment, oem)
+            classified[oem].append(dict(comment, sentiment_classification={
+                'sentiment': classification['sentiment'],
+                'sarcasm_detected': classification['sarcasm_detected'],
+            }))
+
+    start = time.perf_counter()
+    index = FeatureIndex.build(classified, classifier)
+    build_time = time.perf_counter() - start
+
+    def rescan():
+        count = 0
+        for comment in comments:
+            classification = classifier.classify_comment(comment, 'Ather')
+            matches = classifier.scan_patterns(comment['text'])
+            if classification['sentiment'] == 'negative' and matches.any('range_issue') and \
+                    (matches.any('relevance:service') or matches.any('context:service')):
+                count += 1
+        return count
+
+    filters = dict(all_of=['range_issue', 'service'], oem='Ather', sentiment='negative')
+    assert index.count(**filters) == rescan()
+    query_time = _time_best(lambda: index.count(**filters))
+    rescan_time = _time_best(rescan, 1)
+
+    print(f"🗂️ Feature index over {index.size} classified comments (built in {build_time:.2f}s)")
+    print(f"   Indexed count: {query_time * 1e3:8.3f} ms")
+    print(f"   Re-scan:       {rescan_time * 1e3:8.1f} ms ({rescan_time / query_time:.0f}x)")
+    return {'build_sec': build_time, 'query_sec': query_time, 'rescan_sec': rescan_time}
+
+
+def benchmark_distilled_model(rounds: int = 100):
+    """Distilled model (alone and with rule fallback) vs full classify_comment throughput
+    (uses DISTILLED_MODEL_PATH when trained, otherwise a model fitted on the sample comments)"""
+    if not distilled_classifier._SKLEARN_AVAILABLE:
+        print("⚠️ scikit-learn not installed, skipping distilled model benchmark")
+        return {}
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text, 'likes': i} for i, text in enumerate(SAMPLE_COMMENTS * rounds)]
+    texts = [comment['text'] for comment in comments]
+
+    path = os.getenv('DISTILLED_MODEL_PATH', 'models/distilled_sentiment.npz')
+    if os.path.exists(path):
+        model = DistilledSentimentModel.load(path)
+    else:
+        labels = [classifier.classify_comment(comment, 'Ather')['sentiment'] for comment in comments]
+        model = DistilledSentimentModel.train(texts, labels)
+    scorer = DistilledSentimentScorer(model, classifier)
+
+    model_time = _time_best(lambda: model.predict(texts), 3)
+    scorer_time = _time_best(lambda: scorer.score_batch(comments, 'Ather'), 3)
+    rules_time = _time_best(lambda: [classifier.classify_comment(comment, 'Ather') for comment in comments], 1)
+
+    print(f"🧠 Distilled sentiment over {len(comments)} comments")
+    print(f"   Model only:     {len(comments) / model_time:8.0f} comments/s ({rules_time / model_time:.1f}x)")
+    print(f"   With fallback:  {len(comments) / scorer_time:8.0f} comments/s ({rules_time / scorer_time:.1f}x, "
+          f"{scorer.get_stats()['fallback_percentage']}% to rules)")
+    print(f"   Rules:          {len(comments) / rules_time:8.0f} comments/s")
+    return {'model_per_sec': len(comments) / model_time, 'scorer_per_sec': len(comments) / scorer_time,
+            'rules_per_sec': len(comments) / rules_time}
+
+
+def benchmark_rule_pack(rounds: int = 200):
+    """Classifier startup from the rule pack source vs its pickled compiled form (fresh processes,
+    so no regex cache is shared), and pattern scan throughput of the pack"""
+    pack = RulePack.load()
+    startup_script = ('import sys, json; sys.path.insert(0, sys.argv[1]); '
+                      'from services.advanced_sentiment_classifier import AdvancedSentimentClassifier; '
+                      'print(json.dumps(AdvancedSentimentClassifier(use_cache=False).rule_pack_info))')
+    root = os.path.dirname(os.path.abspath(__file__))
+    startup = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, CLASSIFIER_RULE_PACK_CACHE_DIR=cache_dir)
+        for _ in range(2):
+            output = subprocess.run([sys.executable, '-c', startup_script, root], env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            info = json.loads(output.strip().splitlines()[-1])
+            startup[info['compiled_from']] = info['startup_ms']
+
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    texts = SAMPLE_COMMENTS * rounds
+    scan_time = _time_best(lambda: [classifier.scan_patterns(text, classifier.profile_scripts(text))
+                                    for text in texts])
+
+    print(f"📦 Rule pack {pack.name} version {pack.version}")
+    print(f"   Startup (compile):  {startup['source']:8.1f} ms")
+    print(f"   Startup (pickled):  {startup['cache']:8.1f} ms")
+    print(f"   Match throughput:   {len(texts) / scan_time:8.0f} comments/s")
+    return {'version': pack.version, 'compile_ms': startup['source'], 'pickled_ms': startup['cache'],
+            'scans_per_sec': len(texts) / scan_time}
+
+
+# Cold load in a fresh process (Linux, resident size from /proc): argv = repo root, JSON path, 'json' or 'store'
+COMMENT_LOAD_SCRIPT = """
+import sys, os, json, time
+sys.path.insert(0, sys.argv[1])
+from services import comment_store
+def rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+base_rss = rss_mb()
+start = time.perf_counter()
+if sys.argv[3] == 'json':
+    data = comment_store.real_comments_by_oem(comment_store.read_scraped_json(sys.argv[2]))
+    rows = sum(len(comments) for comments in data.values())
+    liked = sum(1 for comments in data.values() for comment in comments if comment.get('likes', 0) > 0)
+else:
+    store = comment_store.open_current_store(sys.argv[2])
+    rows = store.rows
+    liked = int((store.column('likes') > 0).sum())
+load_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({'rows': rows, 'liked': liked, 'load_ms': load_ms,
+                  'rss_mb': rss_mb() - base_rss}))
+"""
+
+
+def benchmark_comment_store(path: str = None):
+    """Cold load of a scraped JSON file vs its memory-mapped comment store, each in a fresh process
+    (load time and resident memory growth to count the liked comments)"""
+    path = path or max(glob.glob('all_oem_comments_historical_*.json'), key=os.path.getsize, default=None)
+    if not path:
+        print("🗄️ Comment store: no all_oem_comments_historical_*.json file to load")
+        return {}
+    root = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    with tempfile.TemporaryDirectory() as store_dir:
+        env = dict(os.environ, COMMENT_STORE_DIR=store_dir)
+        ingest_start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(root, 'ingest_comments.py'), path], env=env,
+                       capture_output=True, check=True)
+        ingest_ms = (time.perf_counter() - ingest_start) * 1000
+        for mode in ['json', 'store']:
+            output = subprocess.run([sys.executable, '-c', COMMENT_LOAD_SCRIPT, root, path, mode], env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"🗄️ Comment store for {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB, "
+          f"{results['json']['rows']} comments; ingest {ingest_ms:.0f} ms)")
+    for mode, label in [('json', 'JSON load'), ('store', 'Store open')]:
+        print(f"   {label + ':':<12} {results[mode]['load_ms']:8.1f} ms  "
+              f"+{results[mode]['rss_mb']:.1f} MB resident")
+    return results
+
+
+BENCHMARKS = {name: func for name, func in globals().items() if name.startswith('benchmark_')}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
+        print()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Profile the classifier's rules on real comments: hit counts, label flips and time per rule group
+Usage: python profile_rules.py [comments.json ...]
+(default: every comments_*_comments_*.json file; each file holds a list of comments or {oem: [comments]})
+Writes CLASSIFIER_RULE_PROFILE_PATH (default rule_profile) .json and .csv, sorted by cumulative time,
+and prints the slowest groups, the rules that flip labels and the number of dead patterns
+"""
+
+import os
+import sys
+import glob
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from train_distilled_model import load_comments
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob('comments_*_comments_*.json'))
+    output_path = os.getenv('CLASSIFIER_RULE_PROFILE_PATH', 'rule_profile')
+    tiered = os.getenv('CLASSIFIER_RULE_PROFILE_TIERED', 'false').lower() == 'true'
+
+    pairs = load_comments(paths)
+    print(f"📂 Loaded {len(pairs)} comments from {len(paths)} files")
+    if not pairs:
+        print("❌ No comments to profile")
+        return
+
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    start_time = time.time()
+    with classifier.profile_rules() as profiler:
+        for comment, oem in pairs:
+            classifier.classify_comment(comment, oem, tiered)
+    report = profiler.write_reports(output_path)
+    print(f"⏱️ Profiled {report['comments']} comments in {time.time() - start_time:.1f}s")
+
+    print("🐢 Slowest pattern groups:")
+    for group in report['groups'][:10]:
+        print(f"   {group['name']:<32} {group['total_ms']:>9.1f}ms  {group['avg_us']:>7.2f}µs/call  "
+              f"hit {group['hit_rate']}% of comments")
+    print("🔀 Label flips:")
+    for rule in report['rules']:
+        if rule['flips']:
+            print(f"   {rule['name']:<36} {rule['flips']} flips ({rule['fired']} fired)")
+    print(f"🪦 Dead patterns (never matched): {report['dead_patterns']}")
+    print(f"💾 Saved {output_path}.json and {output_path}.csv")
+
+
+if __name__ == "__main__":
+    main()
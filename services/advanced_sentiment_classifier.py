@@ -8,271 +8,296 @@ Advanced Sentiment Classifier with Enhanced Features
 """
 
 import re
+import os
 import json
 import asyncio
-from typing import Dict, List, Any, Tuple, Optional
+import hashlib
+import time
+import atexit
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Tuple, Optional, Iterable, Iterator, AsyncIterator
 from collections import defaultdict
 import unicodedata
 
+from .pattern_engine import PatternEngine, PatternMatches
+from .script_profiler import ScriptProfiler, ScriptProfile
+from .classification_cache import ClassificationCache
+from .compact_classification import CompactClassification
+from .batch_summary import BatchSummaryAccumulator
+from .explanations import rule, sentiment_word, render_classification
+from .rule_profiler import RuleProfiler
+from .rule_pack import RulePack, compiled_key, load_compiled, save_compiled
+
+# Classifier attributes derived from the rule pack, pickled with its compiled form
+COMPILED_RULE_ATTRIBUTES = ['_english_word_set', '_local_word_lists', 'emoji_regex', 'script_profiler',
+                            'pattern_engine', 'transliteration_superstrings', 'sarcasm_scores']
+
+# Early-exit gates of the full pipeline, in evaluation order
+EARLY_EXIT_GATES = ['irrelevant', 'neutral_request']
+
+
 class AdvancedSentimentClassifier:
-    def __init__(self):
-        self.initialize_language_patterns()
-        self.initialize_emoji_mapping()
-        self.initialize_company_patterns()
-        self.initialize_sentiment_patterns()
-        
-    def initialize_language_patterns(self):
-        """Initialize patterns for language detection"""
-        # English patterns
-        self.english_patterns = {
-            'words': [
-                'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-                'good', 'bad', 'best', 'worst', 'love', 'hate', 'like', 'dislike',
-                'service', 'battery', 'range', 'price', 'quality', 'performance'
-            ],
-            'contractions': ["don't", "won't", "can't", "shouldn't", "wouldn't", "couldn't", "isn't", "aren't"],
-            'pronouns': ['i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them']
-        }
-        
-        # Hindi/Local language patterns
-        self.local_language_patterns = {
-            'hindi_words': [
-                'है', 'के', 'में', 'से', 'को', 'का', 'की', 'और', 'या', 'लेकिन',
-                'अच्छा', 'बुरा', 'अच्छी', 'बुरी', 'बेहतरीन', 'खराब', 'प्यार', 'नफरत',
-                'सर्विस', 'बैटरी', 'रेंज', 'कीमत', 'गुणवत्ता', 'प्रदर्शन'
-            ],
-            'tamil_words': [
-                'இது', 'அது', 'என்', 'உன்', 'அவன்', 'அவள்', 'நம்', 'அவர்கள்',
-                'நல்ல', 'கெட்ட', 'சிறந்த', 'மோசமான', 'காதல்', 'வெறுப்பு'
-            ],
-            'malayalam_words': [
-                'ഇത്', 'അത്', 'എന്റെ', 'നിന്റെ', 'അവന്റെ', 'അവളുടെ', 'നമ്മുടെ',
-                'നല്ല', 'മോശം', 'മികച്ച', 'കുറ്റം', 'സ്നേഹം', 'വെറുപ്പ്'
-            ],
-            'telugu_words': [
-                'ఇది', 'అది', 'నా', 'నీ', 'అతని', 'ఆమె', 'మా', 'వారి',
-                'మంచి', 'చెడు', 'అత్యుత్తమ', 'చెత్త', 'ప్రేమ', 'ద్వేషం'
-            ]
-        }
-        
-        # Script detection patterns
-        self.script_patterns = {
-            'devanagari': re.compile(r'[\u0900-\u097F]+'),  # Hindi
-            'tamil': re.compile(r'[\u0B80-\u0BFF]+'),       # Tamil
-            'malayalam': re.compile(r'[\u0D00-\u0D7F]+'),   # Malayalam
-            'telugu': re.compile(r'[\u0C00-\u0C7F]+'),      # Telugu
-            'bengali': re.compile(r'[\u0980-\u09FF]+'),     # Bengali
-            'gujarati': re.compile(r'[\u0A80-\u0AFF]+'),    # Gujarati
-            'kannada': re.compile(r'[\u0C80-\u0CFF]+'),     # Kannada
+    def __init__(self, use_cache: bool = None, rule_pack_path: str = None):
+        self.initialize_rule_pack(rule_pack_path)
+        self.initialize_gate_settings()
+        self.initialize_classification_cache(use_cache)
+        self.initialize_parallel_settings()
+        self.initialize_tier_settings()
+        self.initialize_dedup_settings()
+        self.initialize_rule_profiling()
+        
+    def initialize_rule_pack(self, path: str = None):
+        """Load the declarative rule pack (CLASSIFIER_RULE_PACK) with its compiled matcher structures,
+        unpickled when this pack version was compiled before by the same code, otherwise compiled and
+        pickled now"""
+        start_time = time.perf_counter()
+        pack = RulePack.load(path)
+        key = compiled_key(pack.version)
+        compiled = load_compiled(key)
+        compiled_from = 'cache'
+        if compiled is None:
+            compiled = self.compile_rule_pack(pack)
+            save_compiled(compiled, key)
+            compiled_from = 'source'
+        self.__dict__.update(compiled)
+        self.rule_pack_info = {
+            'name': pack.name,
+            'path': pack.path,
+            'version': pack.version,
+            'compiled_from': compiled_from,
+            'startup_ms': round((time.perf_counter() - start_time) * 1000, 2)
         }
 
-    def initialize_emoji_mapping(self):
-        """Initialize emoji sentiment mapping"""
-        self.emoji_sentiment = {
-            # Positive emojis
-            '😊': 0.8, '😀': 0.9, '😃': 0.9, '😄': 0.9, '😁': 0.8, '😆': 0.7,
-            '😍': 0.9, '🥰': 0.9, '😘': 0.8, '😗': 0.7, '😙': 0.7, '😚': 0.8,
-            '🤗': 0.8, '🤩': 0.9, '😇': 0.8, '😊': 0.8, '🙂': 0.6, '😉': 0.7,
-            '👍': 0.8, '👌': 0.7, '👏': 0.8, '🙌': 0.8, '💯': 0.9, '✨': 0.7,
-            '⭐': 0.8, '🌟': 0.8, '💫': 0.7, '🔥': 0.8, '💪': 0.8, '🚀': 0.9,
-            '❤️': 0.9, '💖': 0.9, '💕': 0.8, '💗': 0.8, '💓': 0.8, '💝': 0.8,
-            
-            # Laughing emojis (moved from positive to context-dependent)
-            '😂': 0.3, '🤣': 0.3, '😹': 0.2, '😻': 0.8, '🥳': 0.9, '🎉': 0.8,
-            
-            # Negative emojis
-            '😠': -0.8, '😡': -0.9, '🤬': -0.9, '😤': -0.7, '😒': -0.6, '🙄': -0.5,
-            '😞': -0.7, '😔': -0.7, '😟': -0.6, '😕': -0.6, '🙁': -0.6, '☹️': -0.7,
-            '😣': -0.7, '😖': -0.7, '😫': -0.8, '😩': -0.8, '🥺': -0.6, '😢': -0.8,
-            '😭': -0.9, '😰': -0.7, '😨': -0.7, '😱': -0.8, '🤯': -0.7, '😳': -0.5,
-            '👎': -0.8, '🤦': -0.7, '🤷': -0.3, '💔': -0.9, '😵': -0.8, '🤮': -0.9,
-            '🤢': -0.8, '🤧': -0.5, '😷': -0.4, '🙃': -0.3, '😬': -0.5, '😐': -0.2,
-            
-            # Neutral emojis
-            '😐': 0.0, '😑': 0.0, '🤔': 0.0, '🧐': 0.0, '🤨': 0.0, '😶': 0.0,
-            '😯': 0.0, '😮': 0.0, '😲': 0.0, '🤐': 0.0,
-            
-            # Context-dependent emojis (Indian specific)
-            '🙏': 0.6, '🕉️': 0.5, '🪔': 0.6, '🎊': 0.7, '🎈': 0.6, '🎁': 0.7,
-        }
-        
-        # Compile emoji pattern
+    def compile_rule_pack(self, pack: RulePack) -> Dict[str, Any]:
+        """Every classifier attribute a rule pack defines or derives (lexicons plus compiled matchers)"""
+        attributes = pack.attributes()
+        attributes['script_patterns'] = {script: re.compile(pattern)
+                                         for script, pattern in attributes['script_patterns'].items()}
+        attributes['sarcasm_patterns'] = {group: [tuple(rule) for rule in rules]
+                                          for group, rules in attributes['sarcasm_patterns'].items()}
+        self.__dict__.update(attributes)
+        self.initialize_language_lookups()
+        self.initialize_emoji_matchers()
+        self.initialize_pattern_engine()
+        
+        compiled = {name: getattr(self, name) for name in list(attributes) + COMPILED_RULE_ATTRIBUTES}
+        compiled['rule_pack_version'] = pack.version
+        return compiled
+
+    def initialize_language_lookups(self):
+        """Word lookups for detect_language_mix: English set, and for each local word
+        the number of language lists containing it"""
+        self._english_word_set = frozenset(self.english_patterns['words'] + self.english_patterns['contractions'])
+        self._local_word_lists = {}
+        for lang_words in self.local_language_patterns.values():
+            for word in set(lang_words):
+                self._local_word_lists[word] = self._local_word_lists.get(word, 0) + 1
+
+    def initialize_emoji_matchers(self):
+        """Emoji regex, and the shared scan that collects script runs and emojis of each text"""
         emoji_pattern = '|'.join(re.escape(emoji) for emoji in self.emoji_sentiment.keys())
         self.emoji_regex = re.compile(f'({emoji_pattern})')
+        self.script_profiler = ScriptProfiler(self.script_patterns, self.emoji_sentiment)
 
-    def initialize_company_patterns(self):
-        """Initialize company and product mention patterns"""
-        self.company_patterns = {
-            'Ola Electric': {
-                'primary': ['ola electric', 'ola', 's1 pro', 's1 air', 's1 x'],
-                'products': ['s1', 'pro', 'air', 'x+', 'gen 2', 'gen2'],
-                'variations': ['olla', 'ola scooter', 'ola bike']
-            },
-            'Ather': {
-                'primary': ['ather', '450x', '450 x', '450plus', '450 plus'],
-                'products': ['450', 'rizta', 'gen 3', 'gen3'],
-                'variations': ['ather energy', 'ather scooter']
-            },
-            'Bajaj Chetak': {
-                'primary': ['bajaj chetak', 'chetak', 'bajaj'],
-                'products': ['chetak premium', 'chetak urbane'],
-                'variations': ['chetak electric', 'bajaj electric']
-            },
-            'TVS iQube': {
-                'primary': ['tvs iqube', 'iqube', 'tvs'],
-                'products': ['iqube electric', 'iqube s', 'iqube st'],
-                'variations': ['tvs electric', 'tvs scooter']
-            },
-            'Hero Vida': {
-                'primary': ['hero vida', 'vida', 'hero'],
-                'products': ['vida v1', 'vida v1 pro', 'vida v1 plus'],
-                'variations': ['hero electric', 'hero motocorp']
-            },
-            'Ampere': {
-                'primary': ['ampere', 'magnus', 'primus'],
-                'products': ['magnus ex', 'magnus pro', 'primus', 'zeal'],
-                'variations': ['ampere vehicles', 'ampere electric']
-            },
-            'River Mobility': {
-                'primary': ['river', 'river mobility', 'indie'],
-                'products': ['river indie', 'indie electric'],
-                'variations': ['river scooter', 'river bike']
-            },
-            'Ultraviolette': {
-                'primary': ['ultraviolette', 'f77', 'f 77'],
-                'products': ['f77 mach 2', 'f77 recon', 'f77 space edition'],
-                'variations': ['uv f77', 'ultraviolette automotive']
-            },
-            'Revolt': {
-                'primary': ['revolt', 'rv400', 'rv 400'],
-                'products': ['rv400 brava', 'rv400 premium', 'rz1'],
-                'variations': ['revolt motors', 'revolt electric']
-            },
-            'BGauss': {
-                'primary': ['bgauss', 'b gauss', 'ruo'],
-                'products': ['ruo smart', 'ruo bs6', 'a2b'],
-                'variations': ['bgauss scooter', 'bgauss electric']
-            }
-        }
+    def initialize_pattern_engine(self):
+        """Compile every lexicon and rule pattern once into a single-pass matcher"""
+        engine = PatternEngine()
+
+        # Neutral request / off-topic gates
+        engine.add_literals('advice', self.advice_patterns)
+        engine.add_literals('information_seeking', self.information_seeking_patterns)
+        engine.add_literals('question', self.question_patterns)
+        engine.add_literals('irrelevant', self.irrelevant_patterns)
+
+        # Strong negatives: exact match for phrases, word boundaries for single words
+        engine.add_literals('strong_negative_phrases', [p for p in self.strong_negative_patterns if ' ' in p])
+        engine.add_literals('strong_negative_words', [p for p in self.strong_negative_patterns if ' ' not in p],
+                            word_boundary=True)
+        engine.add_sequences('range_issue', self.range_issue_patterns)
+        engine.add_sequences('negative_phrase', self.negative_phrase_patterns)
+
+        # Transliterations and their context words
+        engine.add_literals('transliteration', self.transliteration_corrections.keys())
+        for polarity, words in self.transliteration_context.items():
+            engine.add_literals(f'transliteration_context_{polarity}', words)
+        for group, patterns in self.contextual_patterns.items():
+            engine.add_literals(group, patterns)
+
+        # Sentiment lexicons (English uses word boundaries, e.g. "bad" must not match "badhiya")
+        engine.add_literals('english_positive', self.positive_patterns['english'], word_boundary=True)
+        engine.add_literals('english_negative', self.negative_patterns['english'], word_boundary=True)
+        engine.add_literals('hindi_positive', self.positive_patterns['hindi'])
+        engine.add_literals('hindi_negative', self.negative_patterns['hindi'])
+        engine.add_literals('amplifiers', self.intensity_modifiers['amplifiers'])
+        engine.add_literals('diminishers', self.intensity_modifiers['diminishers'])
+
+        # Company, sarcasm, relevance and context keywords
+        for company, patterns in self.company_patterns.items():
+            engine.add_literals(f'company:{company}',
+                                patterns['primary'] + patterns['products'] + patterns['variations'])
+        engine.add_literals('sarcasm_complaint', self.sarcasm_complaint_words)
+        for group, patterns in self.sarcasm_patterns.items():
+            engine.add_sequences(f'sarcasm:{group}', [pattern for pattern, _ in patterns])
+        engine.add_sequences('exclamation_complaint', [self.exclamation_complaint_pattern])
+        engine.add_sequences('good_negation', self.good_negation_patterns)
+        engine.add_sequences('contextual_sarcastic', self.contextual_sarcastic_patterns)
+        for group, keywords in self.relevance_keywords.items():
+            engine.add_literals(f'relevance:{group}', keywords)
+        for context, keywords in self.context_patterns.items():
+            engine.add_literals(f'context:{context}', keywords)
 
-    def initialize_sentiment_patterns(self):
-        """Initialize sentiment analysis patterns"""
-        self.positive_patterns = {
-            'english': [
-                'excellent', 'amazing', 'awesome', 'fantastic', 'outstanding', 'brilliant',
-                'superb', 'magnificent', 'wonderful', 'perfect', 'incredible', 'remarkable',
-                'good', 'great', 'nice', 'fine', 'ok', 'okay', 'decent', 'solid',
-                'love', 'like', 'enjoy', 'appreciate', 'recommend', 'impressed',
-                'satisfied', 'happy', 'pleased', 'delighted', 'thrilled'
-            ],
-            'hindi': [
-                'अच्छा', 'बढ़िया', 'शानदार', 'उत्कृष्ट', 'बेहतरीन', 'जबरदस्त',
-                'सुंदर', 'प्यारा', 'मस्त', 'धमाकेदार', 'कमाल', 'लाजवाब'
-            ]
+        self.pattern_engine = engine.compile()
+
+        # English lexicon words that are part of a transliteration (e.g. "bad" in "badhiya")
+        english_words = set(self.positive_patterns['english']) | set(self.negative_patterns['english'])
+        self.transliteration_superstrings = {
+            word: tuple(trans_word for trans_word in self.transliteration_corrections if word in trans_word)
+            for word in english_words
         }
-        
-        self.negative_patterns = {
-            'english': [
-                'terrible', 'awful', 'horrible', 'disgusting', 'pathetic', 'useless',
-                'worst', 'bad', 'poor', 'disappointing', 'frustrating', 'annoying',
-                'hate', 'dislike', 'regret', 'waste', 'problem', 'issue', 'trouble',
-                'broken', 'defective', 'faulty', 'damaged', 'cheap', 'overpriced',
-                'fraud', 'cheat', 'cheating', 'scam', 'fake', 'duplicate', 'copy',
-                'looting', 'loot', 'theft', 'stealing', 'ripping off', 'ripoff',
-                'disaster', 'nightmare', 'hell', 'cursed', 'doomed', 'failed',
-                'failure', 'disaster', 'catastrophe', 'rubbish', 'garbage', 'trash',
-                'shame', 'shameful', 'embarrassing', 'ridiculous', 'stupid', 'idiotic',
-                'nonsense', 'bullshit', 'crap', 'shit', 'damn', 'fucking', 'bastard',
-                'sucks', 'sucking', 'suck', 'crappy', 'shitty', 'terrible service',
-                'worst service', 'pathetic service', 'useless service', 'hopeless',
-                'hopeless condition', 'hopeless situation', 'never again', 'never buy',
-                'warning', 'beware', 'avoid', 'dont buy', 'do not buy', 'money waste',
-                'time waste', 'energy waste', 'complete waste', 'total waste',
-                'faltu', 'bewakoof', 'pagal', 'stupid company', 'worst company',
-                'disaster company', 'fail', 'failing', 'going to fail', 'will fail',
-                'like fail', 'going down', 'downfall', 'collapse', 'dead', 'dying',
-                'finish', 'finished', 'over', 'end', 'ended', 'no good', 'not good',
-                'kaam nahi', 'work nahi', 'start nahi', 'nahi hogi', 'nahi karegi',
-                'bigjaye', 'bigad', 'kharab ho', 'problem hai', 'issue hai', 'bekar',
-                'not learning', 'complaint', 'complaints', 'water into trunk', 
-                'weird seat design', 'should have changed', 'still laggy', 'mediocre',
-                'build quality same', 'not worth', 'not worth buying', 'tbh not worth',
-                'complicating', 'instead of simplifying', 'fasgaya', 'fas gaya',
-                'mailage', 'jyda nahi', 'zyada nahi', 'eco mod pe', 'se jyda nahi',
-                'just new colour', 'v1 is worth', 'v2 is just', 'dont purchase',
-                "don't purchase", 'choor company', 'choor compnay', 'बनिए चोर',
-                'डिजाइन अच्छा नही', 'design achha nahi', 'yamaha niken'
-            ],
-            'hindi': [
-                'बुरा', 'खराब', 'गंदा', 'बकवास', 'फालतू', 'व्यर्थ',
-                'समस्या', 'परेशानी', 'दिक्कत', 'गलत', 'टूटा', 'ख़राब',
-                'धोखा', 'फ्रॉड', 'झूठ', 'नकली', 'डुप्लिकेट', 'कॉपी',
-                'लूट', 'चोरी', 'ठगी', 'बेईमानी', 'गलत काम', 'बर्बाद',
-                'तबाह', 'नष्ट', 'बेकार', 'निकम्मा', 'गंदगी', 'कचरा',
-                'शर्म', 'शर्मनाक', 'बेशर्म', 'बेवकूफी', 'मूर्खता', 'गलती',
-                'भूल', 'नुकसान', 'हानि', 'घाटा', 'परेशान', 'तंग',
-                'चिढ़', 'गुस्सा', 'क्रोध', 'नफरत', 'घृणा', 'अफसोस',
-                'पछतावा', 'दुःख', 'दर्द', 'कष्ट', 'सज़ा', 'सिरदर्द',
-                'dhokha', 'fraud', 'jhooth', 'nakli', 'duplicate', 'copy',
-                'loot', 'chori', 'thagi', 'beimani', 'galat kaam', 'barbad',
-                'tabah', 'nasht', 'bekaar', 'nikamma', 'gandagi', 'kachra',
-                'sharm', 'sharmnak', 'besharm', 'bewakoofi', 'murkhata', 'galti',
-                'bhool', 'nuksan', 'hani', 'ghata', 'pareshan', 'tang',
-                'chidh', 'gussa', 'krodh', 'nafrat', 'ghrina', 'afsos',
-                'pachtawa', 'dukh', 'dard', 'kasht', 'saza', 'sirdard',
-                'ghatiya', 'bekaar', 'faltu', 'bewakoof', 'pagal', 'stupid',
-                'kharab', 'barbad', 'tabah', 'nasht', 'nuksaan', 'hani',
-                'अच्छा नही', 'अच्छा नहीं', 'good nahi', 'achha nahi', 'achha nhi',
-                'accha nahi', 'accha nhi', 'theek nahi', 'theek nhi', 'sahi nahi',
-                'sahi nhi', 'bekar ha', 'bekar hai', 'kaam nahi', 'kaam nhi',
-                'start nahi', 'start nhi', 'nahi hogi', 'nhi hogi', 'nahi karegi',
-                'nhi karegi', 'bigjaye', 'bigad jaye', 'bigad gaye', 'kharab ho',
-                'problem aa', 'issue aa', 'barish ma', 'barish me', 'switches kaam',
-                'chور', 'chor', 'चोर कंपनी', 'chor company', 'चोर कम्पनी',
-                # Frustration patterns
-                'samjhti kyu nahi', 'समझती क्यों नहीं', 'kyun nahi samjhte', 'क्यों नहीं समझते',
-                'samjhte kyu nahi', 'समझते क्यों नहीं', 'company samjhti nahi', 'कंपनी समझती नहीं',
-                'koi company', 'कोई कंपनी', 'kyu nahi', 'क्यों नहीं', 'kyun nahi', 'क्यूं नहीं'
-            ]
+
+        # Scores of the individual sarcasm rules
+        self.sarcasm_scores = {
+            group: {pattern: score for pattern, score in patterns}
+            for group, patterns in self.sarcasm_patterns.items()
         }
-        
-        self.intensity_modifiers = {
-            'amplifiers': ['very', 'extremely', 'really', 'super', 'too', 'so', 'बहुत', 'काफी', 'अत्यधिक'],
-            'diminishers': ['somewhat', 'rather', 'quite', 'fairly', 'slightly', 'थोड़ा', 'कम', 'हल्का']
+
+    def initialize_classification_cache(self, use_cache: bool = None):
+        """Set up the persistent classification cache (CLASSIFICATION_CACHE_ENABLED=false disables it)"""
+        self.rule_version = self.compute_rule_version()
+        if use_cache is None:
+            use_cache = os.getenv('CLASSIFICATION_CACHE_ENABLED', 'true').lower() == 'true'
+        self.classification_cache = ClassificationCache(rule_version=self.rule_version) if use_cache else None
+        if self.classification_cache:
+            # Every rule change leaves a stale copy of the classified corpus behind
+            try:
+                purged = self.classification_cache.purge_stale()
+                if purged:
+                    print(f"🧹 Classification cache: removed {purged} entries of older rule versions")
+            except Exception as e:
+                print(f"⚠️ Classification cache purge failed: {e}")
+
+    def initialize_parallel_settings(self):
+        """Worker pool settings for parallel batch classification"""
+        self.parallel_workers = int(os.getenv('CLASSIFIER_WORKERS', os.cpu_count() or 1))
+        self.parallel_chunk_size = int(os.getenv('CLASSIFIER_CHUNK_SIZE', 500))
+        self.parallel_min_batch = int(os.getenv('CLASSIFIER_PARALLEL_MIN_BATCH', 1000))
+        self.stream_chunk_size = int(os.getenv('CLASSIFIER_STREAM_CHUNK_SIZE', 1000))
+        self._process_pool = None
+        self._process_pool_key = None
+
+    def initialize_gate_settings(self):
+        """Early-exit gates of the decision pipeline (CLASSIFIER_EARLY_EXIT_ENABLED=false disables them)"""
+        self.early_exit_enabled = os.getenv('CLASSIFIER_EARLY_EXIT_ENABLED', 'true').lower() == 'true'
+        self.reset_gate_stats()
+
+    def reset_gate_stats(self):
+        """Reset per-gate early-exit counters"""
+        self.gate_stats = {'comments': 0, 'exits': defaultdict(int)}
+
+    def initialize_tier_settings(self):
+        """Thresholds and counters for tiered (fast-path) classification"""
+        self.fast_path_max_chars = int(os.getenv('CLASSIFIER_FAST_PATH_MAX_CHARS', 120))
+        self.fast_path_margin = float(os.getenv('CLASSIFIER_FAST_PATH_MARGIN', 1.5))
+        self.reset_tier_stats()
+
+    def reset_tier_stats(self):
+        """Reset per-tier counts and timings"""
+        self.tier_stats = {
+            'fast': {'count': 0, 'seconds': 0.0},
+            'full': {'count': 0, 'seconds': 0.0},
+            'escalation_reasons': defaultdict(int)
         }
 
-    def detect_language_mix(self, text: str) -> Dict[str, Any]:
+    def initialize_dedup_settings(self):
+        """Duplicate-text folding for batch classification (CLASSIFIER_DEDUP_ENABLED=false disables it)"""
+        self.dedup_enabled = os.getenv('CLASSIFIER_DEDUP_ENABLED', 'true').lower() == 'true'
+        self.reset_dedup_stats()
+        self.reset_reuse_stats()
+
+    def reset_dedup_stats(self):
+        """Reset duplicate-folding counters"""
+        self.dedup_stats = {'comments': 0, 'unique_texts': 0}
+
+    def reset_reuse_stats(self):
+        """Reset the classified/reused counters of batch classification"""
+        self.reuse_stats = {'comments': 0, 'classified': 0, 'cache_hits': 0, 'id_hits': 0}
+
+    def initialize_rule_profiling(self):
+        """Per-rule profiling (CLASSIFIER_RULE_PROFILING=true profiles every classification and
+        writes CLASSIFIER_RULE_PROFILE_PATH .json/.csv reports at exit)"""
+        self.rule_profiler = None
+        if os.getenv('CLASSIFIER_RULE_PROFILING', 'false').lower() == 'true':
+            profiler = RuleProfiler(self).attach()
+            atexit.register(profiler.write_reports, os.getenv('CLASSIFIER_RULE_PROFILE_PATH', 'rule_profile'))
+
+    @contextmanager
+    def profile_rules(self, report_path: str = None) -> Iterator[RuleProfiler]:
+        """Record hit counts, label flips and time of every rule group inside the block
+        (writes report_path .json/.csv on exit when given):
+        
+            with classifier.profile_rules('rule_profile') as profiler:
+                classifier.classify_comment(comment, 'Ather')
+        """
+        already_profiling = self.rule_profiler is not None
+        profiler = self.rule_profiler if already_profiling else RuleProfiler(self).attach()
+        try:
+            yield profiler
+        finally:
+            if not already_profiling:
+                profiler.detach()
+            if report_path:
+                profiler.write_reports(report_path)
+
+    def compute_rule_version(self) -> str:
+        """Content hash of the rule pack and of the classifier, pattern engine, script profiler and
+        explanation sources (which hold the rule logic and weights); any rule change invalidates the cache"""
+        digest = hashlib.sha256(self.rule_pack_info['version'].encode('ascii'))
+        # Early-exited classifications skip the detail of the stages they do not need
+        digest.update(b'early-exit' if self.early_exit_enabled else b'full')
+        service_dir = os.path.dirname(os.path.abspath(__file__))
+        for module in ['advanced_sentiment_classifier.py', 'pattern_engine.py', 'script_profiler.py', 'explanations.py']:
+            with open(os.path.join(service_dir, module), 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    def scan_patterns(self, text: str, profile: Optional[ScriptProfile] = None) -> PatternMatches:
+        """Scan a text once for every compiled pattern group (reusing the profile's tokens if given)"""
+        if profile is None:
+            return self.pattern_engine.scan(text.lower())
+        return self.pattern_engine.scan(profile.text, profile.tokens)
+
+    def profile_scripts(self, text: str) -> ScriptProfile:
+        """Single-pass script profile and token list of the lowercased text"""
+        return self.script_profiler.profile(text.lower())
+
+    def detect_language_mix(self, text: str, profile: Optional[ScriptProfile] = None) -> Dict[str, Any]:
         """Detect language composition of text"""
-        text = text.lower().strip()
+        if profile is None:
+            profile = self.profile_scripts(text)
         
         # Count different script characters
-        script_counts = {}
-        total_chars = len(re.sub(r'[^\w]', '', text))
+        total_chars = profile.word_chars
         
         if total_chars == 0:
             return {'is_mixed': False, 'primary_language': 'unknown', 'languages': {}}
         
-        for script_name, pattern in self.script_patterns.items():
-            matches = pattern.findall(text)
-            char_count = sum(len(match) for match in matches)
-            if char_count > 0:
-                script_counts[script_name] = char_count / total_chars
+        script_counts = profile.script_ratios()
         
         # Count English words
-        english_word_count = 0
-        words = re.findall(r'\b\w+\b', text)
-        for word in words:
-            if word in self.english_patterns['words'] or word in self.english_patterns['contractions']:
-                english_word_count += 1
+        words = profile.tokens
+        english_words = self._english_word_set
+        english_word_count = sum(1 for word in words if word in english_words)
         
         english_ratio = english_word_count / len(words) if words else 0
         
-        # Count local language words
+        # Count local language words (the lists hold no ASCII words, so ASCII text has none)
         local_word_count = 0
-        for lang_words in self.local_language_patterns.values():
-            for word in words:
-                if word in lang_words:
-                    local_word_count += 1
+        if not profile.text.isascii():
+            local_lists = self._local_word_lists
+            local_word_count = sum(local_lists.get(word, 0) for word in words)
         
         local_ratio = local_word_count / len(words) if words else 0
         
@@ -297,9 +322,9 @@ class AdvancedSentimentClassifier:
             'script_distribution': script_counts
         }
 
-    def analyze_emojis(self, text: str) -> Dict[str, Any]:
-        """Analyze emoji sentiment in text"""
-        emojis_found = self.emoji_regex.findall(text)
+    def analyze_emojis(self, text: str, profile: Optional[ScriptProfile] = None) -> Dict[str, Any]:
+        """Analyze emoji sentiment in text (taking the emojis from the profile's scan if given)"""
+        emojis_found = self.emoji_regex.findall(text) if profile is None else profile.emojis
         
         if not emojis_found:
             return {
@@ -310,19 +335,12 @@ class AdvancedSentimentClassifier:
                 'emojis': []
             }
         
-        emoji_scores = []
-        emoji_details = []
+        # Every match is a key of the mapping, so each emoji is a single lookup
+        emoji_sentiment = self.emoji_sentiment
+        emoji_scores = [emoji_sentiment[emoji] for emoji in emojis_found]
+        emoji_details = [{'emoji': emoji, 'score': score} for emoji, score in zip(emojis_found, emoji_scores)]
         
-        for emoji in emojis_found:
-            if emoji in self.emoji_sentiment:
-                score = self.emoji_sentiment[emoji]
-                emoji_scores.append(score)
-                emoji_details.append({'emoji': emoji, 'score': score})
-        
-        if not emoji_scores:
-            avg_score = 0.0
-        else:
-            avg_score = sum(emoji_scores) / len(emoji_scores)
+        avg_score = sum(emoji_scores) / len(emoji_scores)
         
         # Determine overall emoji sentiment
         if avg_score > 0.3:
@@ -341,32 +359,37 @@ class AdvancedSentimentClassifier:
             'unique_emojis': len(set(emojis_found))
         }
 
-    def detect_company_mentions(self, text: str) -> Dict[str, Any]:
+    def detect_company_mentions(self, text: str, matches: Optional[PatternMatches] = None) -> Dict[str, Any]:
         """Detect company and product mentions with attribution"""
-        text_lower = text.lower()
+        if matches is None:
+            matches = self.scan_patterns(text)
         mentions = {}
         primary_mention = None
         competitor_mentions = []
         
         for company, patterns in self.company_patterns.items():
+            # Skip companies without a single hit from the scan
+            if not matches.any(f'company:{company}'):
+                continue
+            
             mention_score = 0
             mention_types = []
             
             # Check primary mentions
             for pattern in patterns['primary']:
-                if pattern in text_lower:
+                if matches.contains(pattern):
                     mention_score += 3
                     mention_types.append(f'primary: {pattern}')
             
             # Check product mentions
             for pattern in patterns['products']:
-                if pattern in text_lower:
+                if matches.contains(pattern):
                     mention_score += 2
                     mention_types.append(f'product: {pattern}')
             
             # Check variations
             for pattern in patterns['variations']:
-                if pattern in text_lower:
+                if matches.contains(pattern):
                     mention_score += 1
                     mention_types.append(f'variation: {pattern}')
             
@@ -431,690 +454,127 @@ class AdvancedSentimentClassifier:
             'share_weight': round(share_weight, 3)
         }
 
-    def _apply_contextual_sentiment_analysis(self, text_lower: str, positive_score: float, negative_score: float, sentiment_words: list) -> tuple:
+    def _apply_contextual_sentiment_analysis(self, text_lower: str, positive_score: float, negative_score: float, sentiment_words: list,
+                                             matches: Optional[PatternMatches] = None, explain: bool = True) -> tuple:
         """Apply contextual sentiment analysis for complex patterns"""
-        import re
+        if matches is None:
+            matches = self.pattern_engine.scan(text_lower)
         
         # Pattern 1: "Recommend" context analysis
         if 'recommend' in text_lower:
             # Positive recommend contexts
-            if any(pattern in text_lower for pattern in ['dil se recommend', 'strongly recommend', 'definitely recommend', 'highly recommend']):
+            if matches.any('recommend_positive'):
                 positive_score += 1.5
-                sentiment_words.append({'word': 'contextual_positive_recommend', 'sentiment': 'positive', 'language': 'contextual'})
+                sentiment_words.append(sentiment_word(explain, 'contextual_positive_recommend', 'positive', 'contextual'))
             # Negative recommend contexts
-            elif any(pattern in text_lower for pattern in ['dont recommend', 'do not recommend', 'never recommend', 'not recommend']):
+            elif matches.any('recommend_negative'):
                 negative_score += 1.5
-                sentiment_words.append({'word': 'contextual_negative_recommend', 'sentiment': 'negative', 'language': 'contextual'})
+                sentiment_words.append(sentiment_word(explain, 'contextual_negative_recommend', 'negative', 'contextual'))
         
         # Pattern 2: "Good" with negation analysis
-        good_negation_patterns = [
-            r'not\s+good', r'nahi\s+good', r'nhi\s+good',
-            r'good\s+nahi', r'good\s+nhi', r'achha\s+nahi', r'achha\s+nhi'
-        ]
-        for pattern in good_negation_patterns:
-            if re.search(pattern, text_lower):
-                negative_score += 1.5
-                sentiment_words.append({'word': f'negated_good_{pattern}', 'sentiment': 'negative', 'language': 'contextual'})
+        for pattern in matches.hits('good_negation'):
+            negative_score += 1.5
+            sentiment_words.append(sentiment_word(explain, f'negated_good_{pattern}', 'negative', 'contextual'))
         
         # Pattern 3: "Dil se" context beyond direct patterns
         if 'dil se' in text_lower and 'dil se recommend' not in text_lower and 'dil se mana' not in text_lower:
-            # Check broader context
-            context_window = text_lower
-            # Look for negative context indicators
-            negative_indicators = ['mat', 'mana', 'avoid', 'warning', 'beware', 'dont', 'nahi', 'problem', 'issue']
-            positive_indicators = ['suggest', 'achha', 'good', 'badhiya', 'mast', 'best', 'love', 'like']
-            
-            neg_count = sum(1 for indicator in negative_indicators if indicator in context_window)
-            pos_count = sum(1 for indicator in positive_indicators if indicator in context_window)
+            # Check broader context for negative and positive indicators
+            neg_count = matches.count('dil_se_negative')
+            pos_count = matches.count('dil_se_positive')
             
             if neg_count > pos_count:
                 negative_score += 1.0
-                sentiment_words.append({'word': 'dil_se_negative_context', 'sentiment': 'negative', 'language': 'contextual'})
+                sentiment_words.append(sentiment_word(explain, 'dil_se_negative_context', 'negative', 'contextual'))
             elif pos_count > neg_count:
                 positive_score += 1.0
-                sentiment_words.append({'word': 'dil_se_positive_context', 'sentiment': 'positive', 'language': 'contextual'})
+                sentiment_words.append(sentiment_word(explain, 'dil_se_positive_context', 'positive', 'contextual'))
         
         # Pattern 4: Sarcastic positive patterns
-        sarcastic_patterns = [
-            r'(great|excellent|amazing)\s+(service|experience)\s+.*(problem|issue|terrible)',
-            r'(love|loved)\s+.*(service\s+center|repair|multiple\s+times)',
-            r'(perfect|fantastic)\s+.*(again|third\s+time|fourth\s+time)'
-        ]
-        for pattern in sarcastic_patterns:
-            if re.search(pattern, text_lower):
-                negative_score += 2.0  # Strong negative for sarcasm
-                sentiment_words.append({'word': f'sarcastic_pattern_{pattern[:20]}', 'sentiment': 'negative', 'language': 'contextual'})
+        for pattern in matches.hits('contextual_sarcastic'):
+            negative_score += 2.0  # Strong negative for sarcasm
+            sentiment_words.append(sentiment_word(explain, f'sarcastic_pattern_{pattern[:20]}', 'negative', 'contextual'))
         
         return positive_score, negative_score
 
-    def analyze_sentiment_patterns(self, text: str, language_info: Dict) -> Dict[str, Any]:
-        """Analyze sentiment using pattern matching with improved word boundary detection"""
-        import re  # Import re module for regex operations
-        
+    def analyze_sentiment_patterns(self, text: str, language_info: Dict, matches: Optional[PatternMatches] = None,
+                                   explain: bool = True) -> Dict[str, Any]:
+        """Analyze sentiment using pattern matching with improved word boundary detection
+        (explain=False records sentiment words as (word, sentiment, language) tuples)"""
         text_lower = text.lower()
+        if matches is None:
+            matches = self.pattern_engine.scan(text_lower)
         
         positive_score = 0
         negative_score = 0
         sentiment_words = []
         
-        # Check for advice/question patterns first (should be neutral)
-        # But be more specific to avoid false positives with sentiment statements
-        advice_patterns = [
-            'suggest me', 'recommend me', 'advice me', 'help me', 'bta', 'batao', 'tell me', 'koi', 'kaun', 'which',
-            'please help', 'mujhe', 'chahiye', 'leni', 'kharidna', 'buy karna', 'purchase karna', 'planning',
-            'bhaiya', 'sir', 'please', 'confusion', 'decide', 'choice', 'option', 'budget',
-            'suggestion', 'guide', 'kya lena', 'best hai', 'dijiye', 'bataye', 'should i buy',
-            'which one to buy', 'what to buy', 'help me choose', 'suggest karo', 'advice dena',
-            'your opinion', 'plzzz rply', 'please reply', 'pls reply', 'reply pls', 'rply pls',
-            'which one is best', 'which is best', 'what is best', 'kya best hai', 'kaun sa best',
-            'information about', 'interested to know', 'want to know', 'sales number', 'sales data',
-            'sales information', 'give me info', 'give information', 'batao sales', 'numbers dedo',
-            'data chahiye', 'figures chahiye', 'stats chahiye', 'research purpose', 'analysis purpose',
-            'comparison karna', 'compare karna', 'vs comparison', 'or comparison', 'between comparison',
-            'lesser known companies', 'unknown companies', 'small companies', 'tier 2 companies'
-        ]
-        
-        # Strong negative patterns that should override neutral bias
-        strong_negative_patterns = [
-            'fraud', 'dhokha', 'dhoka', 'cheat', 'cheating', 'scam', 'fake',
-            'duplicate', 'copy', 'loot', 'looting', 'theft', 'stealing', 'chori',
-            'thagi', 'beimani', 'ripping off', 'ripoff', 'disaster', 'nightmare',
-            'worst company', 'pathetic service', 'useless service', 'terrible service',
-            'never again', 'never buy', 'warning', 'beware', 'avoid', 'dont buy',
-            'do not buy', 'money waste', 'time waste', 'complete waste', 'total waste',
-            'barbad', 'tabah', 'nasht', 'bekaar service', 'faltu company',
-            'bewakoof company', 'pagal company', 'stupid company', 'ghatiya service',
-            'bakwaas service', 'kharab experience', 'pareshan kar diya', 'tang aa gaya',
-            'gussa aa gaya', 'nafrat ho gayi', 'ghrina ho gayi', 'afsos hai',
-            'pachtawa hai', 'galti ki', 'bhool gaye', 'nuksan hua', 'hani hui',
-            'going to fail', 'will fail', 'like fail', 'going down', 'downfall',
-            'collapse', 'dead', 'dying', 'finish', 'finished', 'over', 'end', 'ended',
-            'achha nahi', 'achha nhi', 'accha nahi', 'accha nhi', 'good nahi',
-            'theek nahi', 'theek nhi', 'sahi nahi', 'sahi nhi', 'bekar ha', 'bekar hai',
-            'kaam nahi', 'kaam nhi', 'start nahi', 'start nhi', 'nahi hogi', 'nhi hogi',
-            'nahi karegi', 'nhi karegi', 'bigjaye', 'bigad jaye', 'bigad gaye',
-            'kharab ho', 'problem aa', 'issue aa', 'barish ma bigjaye', 'barish me bigjaye',
-            'switches kaam nahi', 'switches kaam nhi', 'chor company', 'chor कंपनी',
-            'चोर कंपनी', 'चोर कम्पनी', 'no good', 'not good', 'डिजाइन अच्छा नही',
-            'design achha nahi', 'design accha nahi', 'डिजाइन अच्छा नहीं',
-            'not learning from mistakes', 'weird seat design', 'weird design',
-            'bekar hai', 'bekaar hai', 'not worth buying', 'not worth it',
-            'complicating things', 'making complicated', 'avoid buying', 'dont buy',
-            'do not buy', 'should not buy', 'shouldnt buy', 'regret buying',
-            'buying mistake', 'design problem', 'design issue', 'design flaw',
-            'seat problem', 'uncomfortable seat', 'bad design', 'poor design',
-            'faulty design',
-            # Issue-related patterns
-            'main issue', 'मुख्य समस्या', 'badi samasya', 'बड़ी समस्या',
-            'major issue', 'major problem', 'big issue', 'big problem',
-            'serious issue', 'serious problem', 'critical issue', 'critical problem',
-            # Range-related issues
-            'range issue', 'range problem', 'range is issue', 'range is problem',
-            'range main issue', 'range ki samasya', 'रेंज की समस्या', 'रेंज इश्यू',
-            # New critical patterns from user examples
-            'बरोबर नही', 'बरोबर नहीं', 'barobar nahi', 'barobar nhi',
-            'सर्विस बरोबर नही', 'service barobar nahi', 'service barobar nhi',
-            'lot of problems', 'lots of problems', 'a lot of problems',
-            'stops in the middle', 'stops in middle', 'band ho jata', 'ruk jata',
-            'life threatening', 'life threat', 'jaan ka khatra', 'dangerous',
-            'kharaab gaadi', 'kharab gaadi', 'खराब गाडी', 'bad vehicle',
-            'jaan liya', 'जान लिया', 'killed people', 'death cases',
-            'rubbish', 'garbage', 'bakwas', 'बकवास', 'faltu',
-            'promot math karna', 'promote mat karna', 'प्रमोट मत करना',
-            'please dont buy', 'please don\'t buy', 'कृपया मत खरीदो',
-            'mat lo', 'मत लो', 'dont take', 'don\'t take', 'nahi lena',
-            'नहीं लेना', 'avoid karo', 'बचें', 'stay away',
-            # Fraud typos and informal negative patterns
-            'froud', 'frawd', 'frod', 'company froud', 'company frawd',
-            'koi service nhi', 'koi service nahi', 'कोई सर्विस नही',
-            'bhag gya', 'भाग गया', 'bhag gaya', 'company bhag gyi', 'company bhag gayi',
-            'kmpny froud', 'cmpany fraud', 'hero froud', 'ola froud', 'ather froud',
-            # Sound/noise related negatives
-            'sound irritating', 'noise irritating', 'sound annoying', 'noise annoying',
-            'sound bad', 'noise bad', 'sound terrible', 'noise terrible',
-            'sound problem', 'noise problem', 'sound issue', 'noise issue',
-            'irritating sound', 'annoying sound', 'bad sound', 'terrible sound',
-            'irritating noise', 'annoying noise', 'bad noise', 'terrible noise',
-            # Sarcastic negative patterns
-            'will never run', 'never run on road', 'never work on road', 'wont work on road',
-            'it will never', 'never run on indian road', 'never work on indian road',
-            'just enjoy video', 'enjoy video never', 'video enjoy never',
-            # Chinese product negativity
-            'chinese maal', 'chinese product', 'chinese copy', 'chinese duplicate',
-            'made in china', 'china ka maal', 'china product', 'cheap chinese',
-            'चाइनीज माल', 'चीनी माल', 'चीन का माल', 'चाइना प्रोडक्ट'
-        ]
-        
-        # Negative phrase patterns that contain multiple words
-        negative_phrase_patterns = [
-            r'going to fail',
-            r'will fail',
-            r'like.*fail',
-            r'अच्छा नही',
-            r'अच्छा नहीं', 
-            r'achha nahi',
-            r'achha nhi',
-            r'accha nahi',
-            r'accha nhi',
-            r'good nahi',
-            r'good nhi',
-            r'theek nahi',
-            r'theek nhi',
-            r'sahi nahi',
-            r'sahi nhi',
-            r'bekar ha',
-            r'bekar hai',
-            r'kaam nahi.*karegi',
-            r'kaam nhi.*karegi',
-            r'start nahi.*hogi',
-            r'start nhi.*hogi',
-            r'barish.*bigjaye',
-            r'switches.*kaam.*nahi',
-            r'switches.*kaam.*nhi',
-            r'chor.*company',
-            r'chor.*कंपनी',
-            r'चोर.*कंपनी',
-            r'चोर.*कम्पनी',
-            r'no.*good',
-            r'not.*good',
-            r'डिजाइन.*अच्छा.*नही',
-            r'डिजाइन.*अच्छा.*नहीं',
-            r'design.*achha.*nahi',
-            r'design.*accha.*nahi',
-            r'not.*learning.*mistakes',
-            r'not.*learning.*from.*mistakes',
-            r'weird.*seat.*design',
-            r'weird.*design',
-            r'seat.*design.*weird',
-            r'bekar.*hai',
-            r'bekaar.*hai',
-            r'not.*worth.*buying',
-            r'not.*worth.*it',
-            r'complicating.*things',
-            r'making.*complicated',
-            r'avoid.*buying',
-            r'dont.*buy',
-            r'do.*not.*buy',
-            r'should.*not.*buy',
-            r'shouldnt.*buy',
-            r'regret.*buying',
-            r'buying.*mistake',
-            r'design.*problem',
-            r'design.*issue',
-            r'design.*flaw',
-            r'seat.*problem',
-            r'uncomfortable.*seat',
-            r'bad.*design',
-            r'poor.*design',
-            r'faulty.*design',
-            # Critical new patterns from user examples
-            r'बरोबर.*नही',
-            r'बरोबर.*नहीं',
-            r'barobar.*nahi',
-            r'barobar.*nhi',
-            r'सर्विस.*बरोबर.*नही',
-            r'service.*barobar.*nahi',
-            r'service.*barobar.*nhi',
-            r'lot.*of.*problems',
-            r'lots.*of.*problems',
-            r'a.*lot.*of.*problems',
-            r'stops.*in.*the.*middle',
-            r'stops.*in.*middle',
-            r'band.*ho.*jata',
-            r'रुक.*जाता',
-            r'life.*threatening',
-            r'life.*threat',
-            r'jaan.*ka.*khatra',
-            r'जान.*का.*खतरा',
-            r'kharaab.*gaadi',
-            r'kharab.*gaadi',
-            r'खराब.*गाडी',
-            r'bad.*vehicle',
-            r'jaan.*liya',
-            r'जान.*लिया',
-            r'killed.*people',
-            r'death.*cases',
-            r'rubbish.*wheels',
-            r'garbage.*wheels',
-            r'bakwas.*wheels',
-            r'promot.*math.*karna',
-            r'promote.*mat.*karna',
-            r'प्रमोट.*मत.*करना',
-            r'please.*dont.*buy',
-            r'please.*don\'t.*buy',
-            r'कृपया.*मत.*खरीदो',
-            r'mat.*lo.*koi.*bhi',
-            r'मत.*लो.*कोई.*भी',
-            r'dont.*take.*any',
-            r'don\'t.*take.*any',
-            r'nahi.*lena.*chahiye',
-            r'नहीं.*लेना.*चाहिए',
-            r'avoid.*this.*vehicle',
-            r'stay.*away.*from',
-            # Negation + positive word patterns (should be negative)
-            r'don\'t.*like.*sound',
-            r'dont.*like.*sound',
-            r'don\'t.*like.*noise',
-            r'dont.*like.*noise',
-            r'don\'t.*like.*scooter',
-            r'dont.*like.*scooter',
-            r'not.*like.*sound',
-            r'not.*like.*noise',
-            r'not.*like.*scooter',
-            # Sarcastic patterns
-            r'just.*enjoy.*video',
-            r'enjoy.*video.*never',
-            r'will.*never.*run',
-            r'never.*run.*on.*road',
-            r'never.*work.*on.*road',
-            r'wont.*work.*on.*road',
-            r'it.*will.*never',
-            r'never.*run.*on.*indian.*road',
-            r'never.*work.*on.*indian.*road',
-            # Chinese product negativity patterns
-            r'chinese.*maal',
-            r'chinese.*product',
-            r'chinese.*copy',
-            r'chinese.*duplicate',
-            r'made.*in.*china',
-            r'china.*ka.*maal',
-            r'china.*product',
-            r'cheap.*chinese',
-            r'चाइनीज.*माल',
-            r'चीनी.*माल',
-            r'चीन.*का.*माल',
-            r'चाइना.*प्रोडक्ट'
-        ]
-        
-        # Information seeking patterns (should be neutral)
-        information_seeking_patterns = [
-            'interested to know', 'want to know', 'information about', 'info about', 'details about',
-            'sales of', 'sales number', 'sales data', 'sales figures', 'sales information',
-            'numbers of', 'data of', 'statistics of', 'stats of', 'figures of',
-            'range of', 'number range', 'companies which are', 'companies in range',
-            'lesser known', 'unknown companies', 'small companies', 'tier 2 companies',
-            'nothing new', 'everywhere available', 'top 5 or top 10', 'research purpose',
-            'analysis purpose', 'study purpose', 'comparison data', 'market data'
-        ]
-        
-        # Question/inquiry patterns (should be neutral)
-        question_patterns = [
-            'which one is best', 'which is best', 'what is best', 'kya best hai', 'kaun sa best',
-            'your opinion', 'plzzz rply', 'please reply', 'pls reply', 'reply pls', 'rply pls',
-            'give me opinion', 'bata do', 'batao na', 'suggest kar do', 'recommend kar do',
-            'vs comparison', 'or comparison', 'between', ' or ', ' vs ', 'comparison karna',
-            'compare karna', 'kaun lena chahiye', 'kya lena chahiye', 'which to choose'
-        ]
-        
-        # Irrelevant/Off-topic patterns (should be neutral for EV analysis)
-        irrelevant_patterns = [
-            'petrol scooter', 'petrol scooty', 'petrol bike', 'petrol vehicle', 'petrol two wheeler',
-            'diesel scooter', 'diesel bike', 'diesel vehicle', 'diesel two wheeler',
-            'cng scooter', 'cng bike', 'cng vehicle', 'cng two wheeler',
-            'fuel scooter', 'fuel bike', 'fuel vehicle', 'fuel scooty',
-            'gas scooter', 'gas bike', 'gas vehicle', 'gas scooty',
-            'i like petrol', 'love petrol', 'prefer petrol', 'petrol is better',
-            'i like diesel', 'love diesel', 'prefer diesel', 'diesel is better',
-            'i like fuel', 'love fuel', 'prefer fuel', 'fuel is better',
-            'non electric', 'not electric', 'traditional scooter', 'traditional bike',
-            'conventional scooter', 'conventional bike', 'conventional vehicle',
-            'गैसोलीन स्कूटर', 'पेट्रोल स्कूटर', 'डीजल स्कूटर',
-            'bike chahiye petrol', 'scooter chahiye petrol', 'petrol wala chahiye',
-            # Off-topic personal comments and jokes
-            'namkaran', 'naming', 'name', 'wife ko yaad', 'wife ko jyada yaad',
-            'enjoy video', 'just enjoy', 'video enjoy', 'enjoy the video',
-            'yrr', 'yaar', 'bro', 'dude', 'buddy', 'friend',
-            # Number corrections and factual statements
-            'nahi 26', 'nahi 36', 'matlab 50 km', 'matlab 200 km',
-            'battery matlab', 'bharat ko time', 'time lagega', 'aage badhne',
-            '1 battery matlab', '4 battery matlab', 'bharat ko time lagega',
-            'abhi electric me', 'electric me aage', 'aage badhne me',
-            # Random expressions and names
-            'haha', 'lol', 'lmao', 'rofl', 'hehe', 'hihi'
-        ]
-        
-        is_advice_request = any(pattern in text_lower for pattern in advice_patterns)
-        is_information_seeking = any(pattern in text_lower for pattern in information_seeking_patterns)
-        is_question = any(pattern in text_lower for pattern in question_patterns)
-        is_irrelevant = any(pattern in text_lower for pattern in irrelevant_patterns)
-        
-        # Check for strong negative patterns with word boundaries to avoid false matches
-        has_strong_negative = False
-        import re
-        for pattern in strong_negative_patterns:
-            # Use word boundary for single words, exact match for phrases
-            if ' ' in pattern:  # Multi-word phrase
-                if pattern in text_lower:
-                    has_strong_negative = True
-                    break
-            else:  # Single word - use word boundary
-                if re.search(r'\b' + re.escape(pattern) + r'\b', text_lower):
-                    has_strong_negative = True
-                    break
-        
-        # Additional strong negative detection for RANGE issues
-        range_issue_patterns = [
-            r'range.*is.*main.*issue',
-            r'range.*is.*issue',
-            r'main.*issue.*range',
-            r'issue.*range',
-            r'range.*problem',
-            r'problem.*range',
-            r'range.*terrible',
-            r'range.*bad',
-            r'range.*worst',
-            r'range.*disappointing',
-            r'range.*pathetic',
-            r'range.*useless',
-            r'samjhti.*kyu.*nahi',
-            r'समझती.*क्यों.*नहीं',
-            r'kyun.*nahi.*samjhte',
-            r'क्यों.*नहीं.*समझते',
-            r'company.*samjhti.*nahi',
-            r'कंपनी.*समझती.*नहीं'
-        ]
-        
-        for pattern in range_issue_patterns:
-            if re.search(pattern, text_lower):
-                has_strong_negative = True
-                break
-        
-        # Check for negative phrase patterns using regex
-        has_negative_phrase = False
-        for pattern in negative_phrase_patterns:
-            if re.search(pattern, text_lower):
-                has_negative_phrase = True
-                break
-        
-        # Transliteration corrections - words that might be mismatched
-        transliteration_corrections = {
-            'badhiya': 'positive',  # "badhiya" contains "bad" but means "good"
-            'badiya': 'positive',
-            'achha': 'positive',
-            'accha': 'positive',
-            'mast': 'positive',
-            'bekaar': 'negative',
-            'bakwaas': 'negative',
-            'ghatiya': 'negative',
-            'dhokha': 'negative',  # fraud
-            'dhoka': 'negative',   # fraud (alternate spelling)
-            'fraud': 'negative',
-            'jhooth': 'negative',  # lie
-            'jhoot': 'negative',   # lie (alternate spelling)
-            'nakli': 'negative',   # fake
-            'duplicate': 'negative',
-            'loot': 'negative',    # robbery/overcharging
-            'looting': 'negative',
-            'chori': 'negative',   # theft
-            'thagi': 'negative',   # cheating
-            'beimani': 'negative', # dishonesty
-            'barbad': 'negative',  # ruined
-            'tabah': 'negative',   # destroyed
-            'nasht': 'negative',   # destroyed
-            'nikamma': 'negative', # useless
-            'gandagi': 'negative', # filth/mess
-            'kachra': 'negative',  # garbage
-            'sharmnak': 'negative',# shameful
-            'besharm': 'negative', # shameless
-            'bewakoof': 'negative',# stupid
-            'bewakoofi': 'negative',# stupidity
-            'murkhata': 'negative',# foolishness
-            'galti': 'negative',   # mistake
-            'bhool': 'negative',   # mistake
-            'nuksan': 'negative',  # loss
-            'nuksaan': 'negative', # loss (alternate spelling)
-            'hani': 'negative',    # harm
-            'ghata': 'negative',   # loss
-            'pareshan': 'negative',# troubled
-            'tang': 'negative',    # troubled
-            'gussa': 'negative',   # anger
-            'krodh': 'negative',   # anger
-            'nafrat': 'negative',  # hate
-            'ghrina': 'negative',  # hate
-            'afsos': 'negative',   # regret
-            'pachtawa': 'negative',# repentance
-            'dukh': 'negative',    # sorrow
-            'dard': 'negative',    # pain
-            'kasht': 'negative',   # trouble
-            'saza': 'negative',    # punishment
-            'sirdard': 'negative', # headache
-            'kharab': 'negative',  # bad
-            'faltu': 'negative',   # useless
-            'pagal': 'negative',   # crazy (when used negatively)
-            'bekar': 'negative',   # useless/bad
-            'fail': 'negative',    # failure
-            'failing': 'negative', # failing
-            'achha nahi': 'negative', # not good
-            'achha nhi': 'negative',  # not good
-            'accha nahi': 'negative', # not good
-            'accha nhi': 'negative',  # not good
-            'good nahi': 'negative',  # not good
-            'theek nahi': 'negative', # not okay
-            'theek nhi': 'negative',  # not okay
-            'sahi nahi': 'negative',  # not right
-            'sahi nhi': 'negative',   # not right
-            'kaam nahi': 'negative',  # doesn't work
-            'kaam nhi': 'negative',   # doesn't work
-            'start nahi': 'negative', # doesn't start
-            'start nhi': 'negative',  # doesn't start
-            'nahi hogi': 'negative',  # won't happen/work
-            'nhi hogi': 'negative',   # won't happen/work
-            'nahi karegi': 'negative',# won't work
-            'nhi karegi': 'negative', # won't work
-            'bigjaye': 'negative',    # gets spoiled
-            'bigad': 'negative',      # spoiled
-            'chor': 'negative',       # thief
-            'chor company': 'negative', # thief company
-            'bekar hai': 'negative',  # it's useless/bad
-            'bekaar hai': 'negative', # it's useless/bad
-            'not worth': 'negative',  # not worth it
-            'not worth buying': 'negative', # not worth buying
-            'not learning': 'negative', # not learning from mistakes
-            'weird seat': 'negative', # weird seat design
-            'weird design': 'negative', # weird design
-            'seat design': 'negative', # problematic seat design (context dependent)
-            'complicating': 'negative', # making things complicated
-            'complicate': 'negative',  # making complicated
-            'mistakes': 'negative',    # making mistakes
-            'learning mistakes': 'negative', # not learning from mistakes
-            'worth nahi': 'negative',  # not worth it (Hindi-English mix)
-            'worth nhi': 'negative',   # not worth it (Hindi-English mix)
-            'design problem': 'negative', # design issues
-            'design issue': 'negative',   # design problems
-            'design flaw': 'negative',    # design flaws
-            'seat problem': 'negative',   # seat related problems
-            'uncomfortable seat': 'negative', # uncomfortable seating
-            'bad design': 'negative',     # poor design
-            'poor design': 'negative',    # poor design
-            'faulty design': 'negative',  # faulty design
-            'buying mistake': 'negative', # mistake in buying
-            'regret buying': 'negative',  # regret the purchase
-            'shouldnt buy': 'negative',   # shouldn't buy
-            'should not buy': 'negative', # should not buy
-            'avoid buying': 'negative',   # avoid purchasing
-            'dont buy': 'negative',       # don't buy
-            'do not buy': 'negative',     # do not buy
-            # Critical Hindi-English mixed patterns from user examples
-            'बरोबर नही': 'negative',      # service not proper
-            'बरोबर नहीं': 'negative',     # service not proper (formal)
-            'barobar nahi': 'negative',   # service not proper (transliterated)
-            'barobar nhi': 'negative',    # service not proper (transliterated short)
-            'सर्विस बरोबर नही': 'negative', # service not proper
-            'service barobar nahi': 'negative', # service not proper (mixed)
-            'service barobar nhi': 'negative',  # service not proper (mixed short)
-            'lot of problems': 'negative', # many problems
-            'lots of problems': 'negative', # many problems
-            'a lot of problems': 'negative', # many problems
-            'stops in middle': 'negative', # vehicle breakdown
-            'stops in the middle': 'negative', # vehicle breakdown
-            'band ho jata': 'negative',   # gets stopped/breaks down
-            'रुक जाता': 'negative',       # gets stopped
-            'life threatening': 'negative', # dangerous
-            'life threat': 'negative',    # dangerous
-            'jaan ka khatra': 'negative', # life danger
-            'जान का खतरा': 'negative',   # life danger
-            'kharaab gaadi': 'negative',  # bad vehicle
-            'kharab gaadi': 'negative',   # bad vehicle
-            'खराब गाडी': 'negative',      # bad vehicle
-            'bad vehicle': 'negative',    # bad vehicle
-            'jaan liya': 'negative',      # killed/took life
-            'जान लिया': 'negative',       # killed/took life
-            'killed people': 'negative',  # fatal incidents
-            'death cases': 'negative',    # fatal incidents
-            'rubbish wheels': 'negative', # poor quality wheels
-            'rubbish alloy': 'negative',  # poor quality alloy
-            'garbage wheels': 'negative', # poor quality wheels
-            'bakwas wheels': 'negative',  # poor quality wheels
-            'promot math karna': 'negative', # don't promote
-            'promote mat karna': 'negative', # don't promote
-            'प्रमोट मत करना': 'negative', # don't promote
-            'please dont buy': 'negative', # strong purchase warning
-            'please don\'t buy': 'negative', # strong purchase warning
-            'कृपया मत खरीदो': 'negative', # please don't buy
-            'mat lo koi bhi': 'negative', # don't take any
-            'मत लो कोई भी': 'negative',   # don't take any
-            'dont take any': 'negative',  # don't take any
-            'don\'t take any': 'negative', # don't take any
-            'nahi lena chahiye': 'negative', # shouldn't take
-            'नहीं लेना चाहिए': 'negative', # shouldn't take
-            'avoid this vehicle': 'negative', # avoid this vehicle
-            'stay away from': 'negative', # stay away from
-            'mat karo promote': 'negative', # don't promote
-            'मत करो प्रमोट': 'negative',  # don't promote
-            'dangerous vehicle': 'negative', # dangerous vehicle
-            'खतरनाक गाडी': 'negative',    # dangerous vehicle
-            'khatarnak gaadi': 'negative', # dangerous vehicle
-            'problem bahut': 'negative',  # too many problems
-            'समस्या बहुत': 'negative',    # too many problems
-            'samasya bahut': 'negative',  # too many problems
-            # New critical patterns for typos and informal language
-            'froud': 'negative',          # fraud (typo)
-            'frawd': 'negative',          # fraud (typo)
-            'frod': 'negative',           # fraud (typo)
-            'company froud': 'negative',  # company fraud (typo)
-            'company frawd': 'negative',  # company fraud (typo)
-            'koi service nhi': 'negative', # no service at all
-            'koi service nahi': 'negative', # no service at all
-            'कोई सर्विस नही': 'negative', # no service at all
-            'bhag gya': 'negative',       # ran away / escaped
-            'भाग गया': 'negative',        # ran away / escaped
-            'bhag gaya': 'negative',      # ran away / escaped
-            'company bhag gyi': 'negative', # company ran away
-            'company bhag gayi': 'negative', # company ran away
-            'kmpny froud': 'negative',    # company fraud (informal typing)
-            'cmpany fraud': 'negative',   # company fraud (informal typing)
-            # Positive Hindi informal patterns
-            'bhot achhi': 'positive',     # very good (informal)
-            'बहुत अच्छी': 'positive',     # very good
-            'bahut achhi': 'positive',    # very good
-            'bahut acchi': 'positive',    # very good
-            'bhot acchi': 'positive',     # very good (informal)
-            'bhot achha': 'positive',     # very good (informal)
-            'बहुत अच्छा': 'positive',     # very good
-            'bahut achha': 'positive',    # very good
-            'bahut accha': 'positive',    # very good
-            'bhot accha': 'positive',     # very good (informal)
-            'gadi hai': 'neutral',        # vehicle is (context dependent)
-            'गाडी है': 'neutral',         # vehicle is (context dependent)
-            'bhot badhiya': 'positive',   # very good (informal)
-            'बहुत बढ़िया': 'positive',    # very good
-            'bahut badhiya': 'positive',  # very good
-            'bhot badiya': 'positive',    # very good (informal)
-            'बहुत बडिया': 'positive',     # very good (alternate spelling)
-            'bahut badiya': 'positive',   # very good
-            'ekdum mast': 'positive',     # totally awesome
-            'एकदम मस्त': 'positive',      # totally awesome
-            'bilkul sahi': 'positive',    # absolutely right
-            'बिल्कुल सही': 'positive',    # absolutely right
-            'bhot sahi': 'positive',      # very right/good (informal)
-            'बहुत सही': 'positive',       # very right/good
-            'bahut sahi': 'positive',     # very right/good
-            # Contextual "dil se" patterns - positive contexts
-            'dil se recommend': 'positive',    # heartfelt recommendation
-            'dil se suggest': 'positive',      # heartfelt suggestion
-            'dil se bolta hun': 'positive',    # speaking from heart (usually positive advice)
-            'dil se kehta hun': 'positive',    # saying from heart (usually positive)
-            'dil se pasand': 'positive',       # like from heart
-            'dil se khush': 'positive',        # happy from heart
-            'दिल से रेकमेंड': 'positive',      # heartfelt recommendation
-            'दिल से सुझाव': 'positive',       # heartfelt suggestion
-            # Contextual "dil se" patterns - negative contexts  
-            'dil se mana': 'negative',         # heartfelt refusal/warning
-            'dil se mana karta': 'negative',   # heartfelt refusal
-            'dil se mat lo': 'negative',       # heartfelt warning not to take
-            'dil se avoid': 'negative',        # heartfelt avoidance advice
-            'dil se warning': 'negative',      # heartfelt warning
-            'dil se bol raha': 'context_dependent', # depends on what follows
-            'दिल से मना': 'negative',          # heartfelt refusal
-            'दिल से चेतावनी': 'negative'       # heartfelt warning
-        }
+        is_advice_request = matches.any('advice')
+        is_information_seeking = matches.any('information_seeking')
+        is_question = matches.any('question')
+        is_irrelevant = matches.any('irrelevant')
+        
+        # Strong negatives: exact match for phrases, word boundaries for single words, plus RANGE issues
+        has_strong_negative = (matches.any('strong_negative_phrases') or
+                               matches.any('strong_negative_words') or
+                               matches.any('range_issue'))
+        
+        # Check for negative phrases that should override neutral classification
+        has_negative_phrase = matches.any('negative_phrase')
         
         # Apply transliteration corrections first with contextual analysis
-        for word, sentiment in transliteration_corrections.items():
-            if word in text_lower:
-                # Handle context-dependent patterns
-                if sentiment == 'context_dependent':
-                    if word == 'dil se bol raha':
-                        # Check what follows "dil se bol raha"
-                        if any(neg_word in text_lower for neg_word in ['mat', 'mana', 'avoid', 'warning', 'beware', 'dont', 'nahi']):
-                            negative_score += 1.5
-                            sentiment_words.append({'word': word, 'sentiment': 'negative', 'language': 'transliteration_contextual'})
-                        elif any(pos_word in text_lower for pos_word in ['recommend', 'suggest', 'achha', 'good', 'badhiya', 'mast']):
-                            positive_score += 2.0
-                            sentiment_words.append({'word': word, 'sentiment': 'positive', 'language': 'transliteration_contextual'})
-                        # If neutral context, treat as neutral - no score change
-                elif sentiment == 'positive':
-                    positive_score += 2.0  # Increased weight for positive informal patterns
-                    sentiment_words.append({'word': word, 'sentiment': 'positive', 'language': 'transliteration'})
-                else:  # negative
-                    negative_score += 1
-                    sentiment_words.append({'word': word, 'sentiment': 'negative', 'language': 'transliteration'})
+        for word in matches.hits('transliteration'):
+            sentiment = self.transliteration_corrections[word]
+            # Handle context-dependent patterns
+            if sentiment == 'context_dependent':
+                if word == 'dil se bol raha':
+                    # Check what follows "dil se bol raha"
+                    if matches.any('transliteration_context_negative'):
+                        negative_score += 1.5
+                        sentiment_words.append(sentiment_word(explain, word, 'negative', 'transliteration_contextual'))
+                    elif matches.any('transliteration_context_positive'):
+                        positive_score += 2.0
+                        sentiment_words.append(sentiment_word(explain, word, 'positive', 'transliteration_contextual'))
+                    # If neutral context, treat as neutral - no score change
+            elif sentiment == 'positive':
+                positive_score += 2.0  # Increased weight for positive informal patterns
+                sentiment_words.append(sentiment_word(explain, word, 'positive', 'transliteration'))
+            else:  # negative
+                negative_score += 1
+                sentiment_words.append(sentiment_word(explain, word, 'negative', 'transliteration'))
         
         # Additional contextual analysis for complex patterns
-        positive_score, negative_score = self._apply_contextual_sentiment_analysis(text_lower, positive_score, negative_score, sentiment_words)
+        positive_score, negative_score = self._apply_contextual_sentiment_analysis(text_lower, positive_score, negative_score, sentiment_words, matches, explain)
         
-        # Analyze English patterns with word boundary checks
+        # Analyze English patterns with word boundary checks (e.g., "bad" must not match "badhiya")
         if language_info['primary_language'] == 'english' or 'english' in language_info['languages']:
-            for word in self.positive_patterns['english']:
-                # Use word boundary to avoid false matches (e.g., "bad" in "badhiya")
-                import re
-                if re.search(r'\b' + re.escape(word) + r'\b', text_lower):
-                    # Exclude if part of transliteration word
-                    if not any(trans_word in text_lower and word in trans_word for trans_word in transliteration_corrections.keys()):
-                        positive_score += 1
-                        sentiment_words.append({'word': word, 'sentiment': 'positive', 'language': 'english'})
+            for word in matches.hits('english_positive'):
+                # Exclude if part of transliteration word
+                if not any(matches.contains(trans_word) for trans_word in self.transliteration_superstrings[word]):
+                    positive_score += 1
+                    sentiment_words.append(sentiment_word(explain, word, 'positive', 'english'))
             
-            for word in self.negative_patterns['english']:
-                # Use word boundary to avoid false matches
-                if re.search(r'\b' + re.escape(word) + r'\b', text_lower):
-                    # Exclude if part of transliteration word  
-                    if not any(trans_word in text_lower and word in trans_word for trans_word in transliteration_corrections.keys()):
-                        negative_score += 1
-                        sentiment_words.append({'word': word, 'sentiment': 'negative', 'language': 'english'})
+            for word in matches.hits('english_negative'):
+                # Exclude if part of transliteration word  
+                if not any(matches.contains(trans_word) for trans_word in self.transliteration_superstrings[word]):
+                    negative_score += 1
+                    sentiment_words.append(sentiment_word(explain, word, 'negative', 'english'))
         
         # Analyze Hindi patterns
         if language_info['primary_language'] in ['devanagari', 'local_words'] or language_info['is_mixed']:
-            for word in self.positive_patterns['hindi']:
-                if word in text_lower:
-                    positive_score += 1
-                    sentiment_words.append({'word': word, 'sentiment': 'positive', 'language': 'hindi'})
+            for word in matches.hits('hindi_positive'):
+                positive_score += 1
+                sentiment_words.append(sentiment_word(explain, word, 'positive', 'hindi'))
             
-            for word in self.negative_patterns['hindi']:
-                if word in text_lower:
-                    negative_score += 1
-                    sentiment_words.append({'word': word, 'sentiment': 'negative', 'language': 'hindi'})
+            for word in matches.hits('hindi_negative'):
+                negative_score += 1
+                sentiment_words.append(sentiment_word(explain, word, 'negative', 'hindi'))
         
         # Check for intensity modifiers
         intensity_multiplier = 1.0
-        for amplifier in self.intensity_modifiers['amplifiers']:
-            if amplifier in text_lower:
-                intensity_multiplier = 1.5
-                break
-        
-        for diminisher in self.intensity_modifiers['diminishers']:
-            if diminisher in text_lower:
-                intensity_multiplier = 0.7
-                break
+        if matches.any('amplifiers'):
+            intensity_multiplier = 1.5
+        if matches.any('diminishers'):
+            intensity_multiplier = 0.7
         
         # Apply intensity
         positive_score *= intensity_multiplier
@@ -1200,61 +660,41 @@ class AdvancedSentimentClassifier:
             'has_negative_phrase': has_negative_phrase
         }
 
-    def detect_sarcasm_advanced(self, text: str, emoji_info: Dict, company_info: Dict) -> Dict[str, Any]:
-        """Advanced sarcasm detection with context"""
+    def detect_sarcasm_advanced(self, text: str, emoji_info: Dict, company_info: Dict,
+                                matches: Optional[PatternMatches] = None, explain: bool = True) -> Dict[str, Any]:
+        """Advanced sarcasm detection with context (explain=False records indicators as rule IDs)"""
         sarcasm_indicators = []
         sarcasm_score = 0.0
         
         text_lower = text.lower()
+        if matches is None:
+            matches = self.pattern_engine.scan(text_lower)
         
         # Pattern 1: Positive words with negative context
-        positive_negative_patterns = [
-            (r'(great|excellent|amazing|wonderful).*(problem|issue|trouble|broken|fail|fraud|dhokha)', 0.8),
-            (r'(love|like).*(visit.*center|repair|fix|replace|service.*center)', 0.7),
-            (r'(perfect|fantastic).*(again|multiple|many times|third.*time|fourth.*time)', 0.6),
-            (r'(good|nice).*(service center|complaint|issue|problem|trouble)', 0.5),
-            (r'(best|superb).*(experience|service).*(fraud|dhokha|cheat|loot|waste)', 0.9),
-            (r'(awesome|brilliant).*(company|service).*(never.*again|warning|avoid)', 0.8)
-        ]
-        
-        for pattern, score in positive_negative_patterns:
-            if re.search(pattern, text_lower):
-                sarcasm_score += score
-                sarcasm_indicators.append(f'positive_negative_pattern: {pattern}')
+        for pattern in matches.hits('sarcasm:positive_negative'):
+            sarcasm_score += self.sarcasm_scores['positive_negative'][pattern]
+            sarcasm_indicators.append(rule(explain, 'positive_negative_pattern', pattern))
         
         # Pattern 2: Exclamation with complaints
-        if re.search(r'!.*(problem|issue|trouble|broken|service)', text_lower):
+        if matches.any('exclamation_complaint'):
             sarcasm_score += 0.4
-            sarcasm_indicators.append('exclamation_with_complaint')
+            sarcasm_indicators.append(rule(explain, 'exclamation_with_complaint'))
         
         # Pattern 3: Emoji-text mismatch
         if emoji_info['has_emojis']:
-            if emoji_info['emoji_sentiment'] == 'positive' and any(word in text_lower for word in ['problem', 'issue', 'terrible', 'worst']):
+            if emoji_info['emoji_sentiment'] == 'positive' and matches.any('sarcasm_complaint'):
                 sarcasm_score += 0.6
-                sarcasm_indicators.append('emoji_text_mismatch')
+                sarcasm_indicators.append(rule(explain, 'emoji_text_mismatch'))
         
         # Pattern 4: Thanks with complaints
-        thanks_complaint_patterns = [
-            r'thanks.*(for nothing|but|however)',
-            r'grateful.*(worst|terrible|problem)',
-            r'appreciate.*(waste|useless|pathetic)'
-        ]
-        
-        for pattern in thanks_complaint_patterns:
-            if re.search(pattern, text_lower):
-                sarcasm_score += 0.7
-                sarcasm_indicators.append(f'thanks_complaint: {pattern}')
+        for pattern in matches.hits('sarcasm:thanks_complaint'):
+            sarcasm_score += self.sarcasm_scores['thanks_complaint'][pattern]
+            sarcasm_indicators.append(rule(explain, 'thanks_complaint', pattern))
         
         # Pattern 5: Repeated service center visits with positive words
-        service_patterns = [
-            r'(great|good|excellent).*(visit.*\d+.*times|multiple.*visit|again.*service)',
-            r'(amazing|wonderful).*(third.*time|fourth.*time|many.*visits)'
-        ]
-        
-        for pattern in service_patterns:
-            if re.search(pattern, text_lower):
-                sarcasm_score += 0.9
-                sarcasm_indicators.append(f'service_visit_sarcasm: {pattern}')
+        for pattern in matches.hits('sarcasm:service_visit'):
+            sarcasm_score += self.sarcasm_scores['service_visit'][pattern]
+            sarcasm_indicators.append(rule(explain, 'service_visit_sarcasm', pattern))
         
         # Normalize sarcasm score
         sarcasm_score = min(sarcasm_score, 1.0)
@@ -1271,52 +711,140 @@ class AdvancedSentimentClassifier:
 
     async def classify_comment_advanced(self, comment: Dict, target_oem: str = None) -> Dict[str, Any]:
         """Perform advanced multi-layered sentiment classification"""
+        return self.classify_comment(comment, target_oem)
+
+    def classify_comment(self, comment: Dict, target_oem: str = None, tiered: bool = False,
+                         explain: bool = True) -> Dict[str, Any]:
+        """Synchronous core of classify_comment_advanced (CPU-bound, safe to run in worker processes)
+        
+        tiered=True first tries the cheap lexicon + emoji pass and only escalates ambiguous
+        or long comments to the full multi-layer pipeline.
+        explain=False records factors, sarcasm indicators and sentiment words as compact rule IDs
+        (marked 'explained': False); explain_classification renders them when displayed.
+        """
+        return self.score_features(self.extract_features(comment, tiered, explain), target_oem)
+
+    def classify_comment_for_oems(self, comment: Dict, target_oems: List[Optional[str]],
+                                  tiered: bool = False, explain: bool = True) -> Dict[Optional[str], Dict[str, Any]]:
+        """Classify one comment against several target OEMs, extracting its features only once"""
+        features = self.extract_features(comment, tiered, explain)
+        return {target_oem: self.score_features(features, target_oem) for target_oem in target_oems}
+
+    def explain_classification(self, classification: Dict[str, Any]) -> Dict[str, Any]:
+        """Classification with human-readable factors, sarcasm indicators and sentiment words
+        (renders rule IDs recorded with explain=False; explained results are returned as is)"""
+        if isinstance(classification, CompactClassification):
+            return classification.detail()
+        return render_classification(classification)
+
+    def extract_features(self, comment: Dict, tiered: bool = False, explain: bool = True) -> Optional[Dict[str, Any]]:
+        """OEM-independent phase: every analysis that does not depend on the target OEM
+        (None for a comment without text; reusable across score_features calls)"""
         text = comment.get('text', '')
         likes = comment.get('likes', 0)
         replies = comment.get('replies', 0)
         shares = comment.get('shares', 0)
         
         if not text:
-            return self._create_default_classification()
+            return None
+        
+        start_time = time.perf_counter() if tiered else 0.0
+        
+        # Profile scripts and tokenize once, then scan every compiled pattern group once;
+        # both are shared by all steps below
+        profile = self.profile_scripts(text)
+        matches = self.scan_patterns(text, profile)
         
         # Step 1: Language Analysis
-        language_info = self.detect_language_mix(text)
+        language_info = self.detect_language_mix(text, profile)
         
         # Step 2: Emoji Analysis
-        emoji_info = self.analyze_emojis(text)
+        emoji_info = self.analyze_emojis(text, profile)
+        
+        features = {
+            'text': text,
+            'matches': matches,
+            'language_info': language_info,
+            'emoji_info': emoji_info,
+            'engagement_info': self.calculate_engagement_weight(likes, replies, shares),
+            'explain': explain
+        }
+        
+        # Tier 1: clear-margin comments skip pattern, sarcasm and final-combination stages
+        if tiered:
+            fast_decision = self._fast_path_decision(text, matches, language_info, emoji_info)
+            if 'escalation_reason' not in fast_decision:
+                features['fast_decision'] = fast_decision
+                features['company_info'] = self.detect_company_mentions(text, matches)
+                features['context_info'] = self._detect_context_advanced(text, matches)
+                self._record_tier('fast', start_time)
+                return features
+            self.tier_stats['escalation_reasons'][fast_decision['escalation_reason']] += 1
         
         # Step 3: Company Mention Analysis
-        company_info = self.detect_company_mentions(text)
+        company_info = self.detect_company_mentions(text, matches)
+        features['company_info'] = company_info
+        
+        # Cheap gates first: settled requests and off-topic text skip lexicon scoring
+        gate_decision = self._early_exit_decision(matches, emoji_info) if self.early_exit_enabled else None
+        if gate_decision is not None:
+            features['early_exit'] = gate_decision['early_exit']
+            features['pattern_sentiment'] = gate_decision
+        else:
+            # Step 4: Pattern-based Sentiment Analysis
+            features['pattern_sentiment'] = self.analyze_sentiment_patterns(text, language_info, matches, explain)
         
-        # Step 4: Engagement Analysis
-        engagement_info = self.calculate_engagement_weight(likes, replies, shares)
+        # Step 5: Advanced Sarcasm Detection (exported even when the gates settle the sentiment)
+        features['sarcasm_info'] = self.detect_sarcasm_advanced(text, emoji_info, company_info, matches, explain)
+        if self.early_exit_enabled:
+            self._record_gate(features.get('early_exit'))
         
-        # Step 5: Pattern-based Sentiment Analysis
-        pattern_sentiment = self.analyze_sentiment_patterns(text, language_info)
+        # Step 6: Context Detection
+        features['context_info'] = self._detect_context_advanced(text, matches)
         
-        # Step 6: Advanced Sarcasm Detection
-        sarcasm_info = self.detect_sarcasm_advanced(text, emoji_info, company_info)
+        if tiered:
+            self._record_tier('full', start_time)
         
-        # Step 7: Combine all factors for final sentiment
-        final_sentiment = self._calculate_final_sentiment(
-            pattern_sentiment, emoji_info, sarcasm_info, engagement_info, company_info, target_oem
-        )
+        return features
+
+    def score_features(self, features: Optional[Dict[str, Any]], target_oem: str = None) -> Dict[str, Any]:
+        """OEM-specific phase: final sentiment and product relevance for one target OEM"""
+        if features is None:
+            return self._create_default_classification()
         
-        # Step 8: Product Relevance
-        relevance_info = self._calculate_product_relevance(text, company_info, target_oem)
+        # Product Relevance (early exits only settle the sentiment, so relevance is always scored)
+        relevance_info = self._calculate_product_relevance(
+            features['text'], features['company_info'], target_oem, features['matches']
+        )
         
-        # Step 9: Context Detection
-        context_info = self._detect_context_advanced(text)
+        if 'fast_decision' in features:
+            classification = self._create_fast_path_classification(features, relevance_info)
+        else:
+            classification = self._create_full_classification(features, relevance_info, target_oem)
+        if not features['explain']:
+            classification['explained'] = False
+        return classification
+
+    def _create_full_classification(self, features: Dict[str, Any], relevance_info: Dict[str, Any],
+                                    target_oem: str) -> Dict[str, Any]:
+        """Combine all factors of the full pipeline into the final classification"""
+        pattern_sentiment = features['pattern_sentiment']
+        sarcasm_info = features['sarcasm_info']
+        context_info = features['context_info']
+        final_sentiment = self._calculate_final_sentiment(
+            pattern_sentiment, features['emoji_info'], sarcasm_info, features['engagement_info'],
+            features['company_info'], target_oem, features['explain']
+        )
         
         return {
             'sentiment': final_sentiment['sentiment'],
             'confidence': final_sentiment['confidence'],
             'sarcasm_detected': sarcasm_info['sarcasm_detected'],
             'sarcasm_score': sarcasm_info['sarcasm_score'],
-            'language_analysis': language_info,
-            'emoji_analysis': emoji_info,
-            'company_analysis': company_info,
-            'engagement_analysis': engagement_info,
+            'language_analysis': features['language_info'],
+            'emoji_analysis': features['emoji_info'],
+            'company_analysis': features['company_info'],
+            'engagement_analysis': features['engagement_info'],
             'pattern_analysis': pattern_sentiment,
             'sarcasm_analysis': sarcasm_info,
             'product_relevance': relevance_info['level'],
@@ -1327,45 +855,270 @@ class AdvancedSentimentClassifier:
             'classification_factors': final_sentiment['factors']
         }
 
+    def _fast_path_decision(self, text: str, matches: PatternMatches, language_info: Dict,
+                            emoji_info: Dict) -> Dict[str, Any]:
+        """Cheap first pass: lexicon hits plus emoji score, or the reason to escalate"""
+        if len(text) > self.fast_path_max_chars:
+            return {'escalation_reason': 'long_text'}
+        
+        # Requests, questions, off-topic text and strong negatives have dedicated handling
+        for group in ['advice', 'information_seeking', 'question', 'irrelevant',
+                      'strong_negative_phrases', 'strong_negative_words']:
+            if matches.any(group):
+                return {'escalation_reason': 'special_pattern'}
+        if matches.any('range_issue') or matches.any('negative_phrase'):
+            return {'escalation_reason': 'special_pattern'}
+        if 'recommend' in matches.text or 'dil se' in matches.text or '!' in text:
+            return {'escalation_reason': 'special_pattern'}
+        
+        # Brand mentions interact with the target OEM in the final combination
+        if any(matches.any(f'company:{company}') for company in self.company_patterns):
+            return {'escalation_reason': 'brand_mention'}
+        
+        positive_hits = 0
+        negative_hits = 0
+        for word in matches.hits('transliteration'):
+            sentiment = self.transliteration_corrections[word]
+            if sentiment == 'context_dependent':
+                return {'escalation_reason': 'special_pattern'}
+            if sentiment == 'positive':
+                positive_hits += 1
+            else:
+                negative_hits += 1
+        
+        if language_info['primary_language'] == 'english' or 'english' in language_info['languages']:
+            positive_hits += matches.count('english_positive')
+            negative_hits += matches.count('english_negative')
+        if language_info['primary_language'] in ['devanagari', 'local_words'] or language_info['is_mixed']:
+            positive_hits += matches.count('hindi_positive')
+            negative_hits += matches.count('hindi_negative')
+        
+        emoji_score = emoji_info['emoji_sentiment_score'] if emoji_info['has_emojis'] else 0.0
+        
+        # Mixed polarity (text vs text, or text vs emoji) can be sarcasm or a contrast
+        if positive_hits and negative_hits:
+            return {'escalation_reason': 'mixed_polarity'}
+        if (positive_hits and emoji_score < 0) or (negative_hits and emoji_score > 0):
+            return {'escalation_reason': 'mixed_polarity'}
+        
+        # No sentiment signal at all: the full pipeline would settle on neutral
+        if not positive_hits and not negative_hits and not emoji_score:
+            return {'sentiment': 'neutral', 'confidence': 0.3, 'margin': 0.0,
+                    'positive_hits': 0, 'negative_hits': 0}
+        
+        margin = positive_hits - negative_hits + emoji_score
+        if abs(margin) < self.fast_path_margin:
+            return {'escalation_reason': 'low_margin'}
+        
+        return {
+            'sentiment': 'positive' if margin > 0 else 'negative',
+            'confidence': round(min(0.9, 0.5 + abs(margin) * 0.1), 3),
+            'margin': round(margin, 3),
+            'positive_hits': positive_hits,
+            'negative_hits': negative_hits
+        }
+
+    def _early_exit_decision(self, matches: PatternMatches, emoji_info: Dict) -> Optional[Dict[str, Any]]:
+        """Pattern sentiment of a comment whose outcome the gates already settle, or None to score it.
+        
+        Gates only fire when analyze_sentiment_patterns and _calculate_final_sentiment would reach
+        the same label and confidence: no strong-negative override is possible and upper bounds
+        of the lexicon scores stay below the thresholds that could change the outcome. Sarcasm is
+        still detected for gated comments; it cannot flip a neutral label without a positive emoji.
+        """
+        is_irrelevant = matches.any('irrelevant')
+        is_advice_request = matches.any('advice')
+        is_information_seeking = matches.any('information_seeking')
+        is_question = matches.any('question')
+        if not (is_irrelevant or is_advice_request or is_information_seeking or is_question):
+            return None
+        
+        # Strong negatives and negative phrases override both gates
+        if (matches.any('strong_negative_phrases') or matches.any('strong_negative_words') or
+                matches.any('range_issue') or matches.any('negative_phrase')):
+            return None
+        positive_bound, negative_bound = self._sentiment_score_bounds(matches)
+        
+        if is_irrelevant:
+            # Forced neutral unless the negative score could exceed 3.0
+            if negative_bound > 3.0:
+                return None
+            gate, confidence = 'irrelevant', 0.9
+        else:
+            # Neutral unless a score could reach 2.5; a positive emoji could turn sarcasm into a flip
+            if max(positive_bound, negative_bound) >= 2.5 or emoji_info['emoji_sentiment'] == 'positive':
+                return None
+            gate, confidence = 'neutral_request', 0.85
+        
+        return {
+            'sentiment': 'neutral',
+            'confidence': confidence,
+            # Same keys as analyze_sentiment_patterns; the lexicon scores are not computed
+            'positive_score': 0.0,
+            'negative_score': 0.0,
+            'intensity_multiplier': 1.0,
+            'sentiment_words': [],
+            'is_advice_request': is_advice_request,
+            'is_information_seeking': is_information_seeking,
+            'is_question': is_question,
+            'is_irrelevant': is_irrelevant,
+            'is_neutral_request': is_advice_request or is_information_seeking or is_question,
+            'has_strong_negative': False,
+            'has_negative_phrase': False,
+            'early_exit': gate
+        }
+
+    def _sentiment_score_bounds(self, matches: PatternMatches) -> Tuple[float, float]:
+        """Upper bounds of the positive and negative scores of analyze_sentiment_patterns"""
+        text = matches.text
+        transliterations = matches.count('transliteration')
+        positive_bound = matches.count('english_positive') + matches.count('hindi_positive') + transliterations * 2.0
+        negative_bound = (matches.count('english_negative') + matches.count('hindi_negative') + transliterations * 1.5 +
+                          matches.count('good_negation') * 1.5 + matches.count('contextual_sarcastic') * 2.0)
+        if 'recommend' in text:
+            positive_bound += 1.5
+            negative_bound += 1.5
+        if 'dil se' in text:
+            positive_bound += 1.0
+            negative_bound += 1.0
+        # Largest intensity multiplier
+        return positive_bound * 1.5, negative_bound * 1.5
+
+    def _record_gate(self, gate: Optional[str]):
+        """Count one comment reaching the gates and the gate it exited at (None: fully scored)"""
+        self.gate_stats['comments'] += 1
+        if gate is not None:
+            self.gate_stats['exits'][gate] += 1
+
+    def get_gate_stats(self) -> Dict[str, Any]:
+        """Early-exit counts and rates per gate, over the comments that reached the gates"""
+        comments = self.gate_stats['comments']
+        exits = self.gate_stats['exits']
+        total_exits = sum(exits.values())
+        return {
+            'enabled': self.early_exit_enabled,
+            'total_comments': comments,
+            'early_exit_percentage': round(total_exits / comments * 100, 2) if comments else 0.0,
+            'gates': {
+                gate: {
+                    'exits': exits.get(gate, 0),
+                    'rate': round(exits.get(gate, 0) / comments * 100, 2) if comments else 0.0
+                }
+                for gate in EARLY_EXIT_GATES
+            },
+            'fully_scored': comments - total_exits
+        }
+
+    def merge_gate_stats(self, other: Dict[str, Any]):
+        """Add raw gate counters collected elsewhere (e.g. in a worker process)"""
+        self.gate_stats['comments'] += other['comments']
+        for gate, count in other['exits'].items():
+            self.gate_stats['exits'][gate] += count
+
+    def _create_fast_path_classification(self, features: Dict[str, Any],
+                                         relevance_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a full-shape classification for a comment decided by the fast path"""
+        fast_decision = features['fast_decision']
+        context_info = features['context_info']
+        sarcasm_info = {'sarcasm_detected': False, 'sarcasm_score': 0.0, 'sarcasm_indicators': [], 'confidence': 0.0}
+        
+        return {
+            'sentiment': fast_decision['sentiment'],
+            'confidence': fast_decision['confidence'],
+            'sarcasm_detected': False,
+            'sarcasm_score': 0.0,
+            'language_analysis': features['language_info'],
+            'emoji_analysis': features['emoji_info'],
+            'company_analysis': features['company_info'],
+            'engagement_analysis': features['engagement_info'],
+            'pattern_analysis': {
+                'sentiment': fast_decision['sentiment'],
+                'confidence': fast_decision['confidence'],
+                'positive_hits': fast_decision['positive_hits'],
+                'negative_hits': fast_decision['negative_hits']
+            },
+            'sarcasm_analysis': sarcasm_info,
+            'product_relevance': relevance_info['level'],
+            'relevance_score': relevance_info['score'],
+            'context': context_info['primary_context'],
+            'context_details': context_info,
+            'analysis_method': 'tiered_fast_path',
+            'classification_factors': [rule(features['explain'], 'fast_path_margin', fast_decision['margin'])]
+        }
+
+    def _record_tier(self, tier: str, start_time: float):
+        """Accumulate the count and elapsed time of one tiered classification"""
+        self.tier_stats[tier]['count'] += 1
+        self.tier_stats[tier]['seconds'] += time.perf_counter() - start_time
+
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """Per-tier counts, timings and escalation reasons of tiered classification"""
+        fast = self.tier_stats['fast']
+        full = self.tier_stats['full']
+        total = fast['count'] + full['count']
+        return {
+            'total_comments': total,
+            'fast_path_percentage': round(fast['count'] / total * 100, 2) if total else 0.0,
+            'tiers': {
+                tier: {
+                    'count': stats['count'],
+                    'total_seconds': round(stats['seconds'], 4),
+                    'avg_ms': round(stats['seconds'] / stats['count'] * 1000, 4) if stats['count'] else 0.0
+                }
+                for tier, stats in [('fast', fast), ('full', full)]
+            },
+            'escalation_reasons': dict(self.tier_stats['escalation_reasons']),
+            'fast_path_max_chars': self.fast_path_max_chars,
+            'fast_path_margin': self.fast_path_margin
+        }
+
+    def merge_tier_stats(self, other: Dict[str, Any]):
+        """Add raw tier counters collected elsewhere (e.g. in a worker process)"""
+        for tier in ['fast', 'full']:
+            self.tier_stats[tier]['count'] += other[tier]['count']
+            self.tier_stats[tier]['seconds'] += other[tier]['seconds']
+        for reason, count in other['escalation_reasons'].items():
+            self.tier_stats['escalation_reasons'][reason] += count
+
     def _calculate_final_sentiment(self, pattern_sentiment: Dict, emoji_info: Dict, 
                                   sarcasm_info: Dict, engagement_info: Dict, 
-                                  company_info: Dict, target_oem: str) -> Dict[str, Any]:
-        """Calculate final sentiment by combining all factors"""
+                                  company_info: Dict, target_oem: str, explain: bool = True) -> Dict[str, Any]:
+        """Calculate final sentiment by combining all factors (explain=False records factors as rule IDs)"""
         
         factors = []
         
         # Base sentiment from patterns
         base_sentiment = pattern_sentiment['sentiment']
         base_confidence = pattern_sentiment['confidence']
-        factors.append(f"pattern_sentiment: {base_sentiment} (conf: {base_confidence})")
+        factors.append(rule(explain, 'pattern_sentiment', base_sentiment, base_confidence))
         
         # Emoji influence
         emoji_influence = 0.0
         if emoji_info['has_emojis']:
             emoji_influence = emoji_info['emoji_sentiment_score'] * 0.5  # Increased to 50% weight
-            factors.append(f"emoji_influence: {emoji_influence:.2f}")
+            factors.append(rule(explain, 'emoji_influence', emoji_influence))
             
             # Strong emoji override for very negative emojis
             if emoji_info['emoji_sentiment_score'] <= -0.8:  # Very negative emojis like 😡
                 if base_sentiment == 'neutral':
                     base_sentiment = 'negative'
                     base_confidence = max(base_confidence, 0.8)
-                    factors.append("strong_negative_emoji_override: neutral -> negative")
+                    factors.append(rule(explain, 'strong_negative_emoji_override', 'neutral'))
                 elif base_sentiment == 'positive':
                     base_sentiment = 'negative' 
                     base_confidence = max(base_confidence, 0.75)
-                    factors.append("strong_negative_emoji_override: positive -> negative")
+                    factors.append(rule(explain, 'strong_negative_emoji_override', 'positive'))
         
         # Sarcasm adjustment
         if sarcasm_info['sarcasm_detected']:
             if base_sentiment == 'positive':
                 base_sentiment = 'negative'
                 base_confidence *= 0.8  # Reduce confidence for sarcasm
-                factors.append("sarcasm_flip: positive -> negative")
+                factors.append(rule(explain, 'sarcasm_flip'))
             elif base_sentiment == 'neutral' and emoji_info['emoji_sentiment'] == 'positive':
                 base_sentiment = 'negative'
                 base_confidence = 0.6
-                factors.append("sarcasm_flip: neutral -> negative (emoji positive)")
+                factors.append(rule(explain, 'sarcasm_flip_emoji'))
         
         # Irrelevant content override (highest priority for neutralization)
         if pattern_sentiment.get('is_irrelevant', False):
@@ -1375,11 +1128,11 @@ class AdvancedSentimentClassifier:
                 pattern_sentiment.get('negative_score', 0) > 3.0):
                 base_sentiment = 'negative'
                 base_confidence = max(base_confidence, 0.8)
-                factors.append("irrelevant_strong_negative_override: -> negative")
+                factors.append(rule(explain, 'irrelevant_strong_negative_override'))
             else:
                 base_sentiment = 'neutral'
                 base_confidence = 0.9  # Very high confidence for irrelevant being neutral
-                factors.append("irrelevant_content_override: -> neutral")
+                factors.append(rule(explain, 'irrelevant_content_override'))
                 # Skip further processing for irrelevant content
                 return {
                     'sentiment': base_sentiment,
@@ -1391,7 +1144,7 @@ class AdvancedSentimentClassifier:
         # Engagement amplification
         if engagement_info['engagement_level'] in ['high', 'viral']:
             base_confidence *= engagement_info['amplification_factor']
-            factors.append(f"engagement_boost: {engagement_info['amplification_factor']}")
+            factors.append(rule(explain, 'engagement_boost', engagement_info['amplification_factor']))
         
         # Company mention relevance
         if company_info['has_mentions']:
@@ -1399,7 +1152,7 @@ class AdvancedSentimentClassifier:
                 # This comment is about the target company
                 relevance_boost = company_info['all_mentions'][target_oem]['confidence'] * 0.1
                 base_confidence += relevance_boost
-                factors.append(f"target_company_relevance: +{relevance_boost:.2f}")
+                factors.append(rule(explain, 'target_company_relevance', relevance_boost))
             elif target_oem and target_oem not in company_info['all_mentions']:
                 # This comment mentions other companies but not the target (off-topic)
                 # Check for wrong brand context like "Like for ola" in VIDA thread
@@ -1412,7 +1165,7 @@ class AdvancedSentimentClassifier:
                     ):
                         base_sentiment = 'neutral'
                         base_confidence = 0.8
-                        factors.append(f"wrong_brand_context: {mentioned_brands} in {target_oem} thread -> neutral")
+                        factors.append(rule(explain, 'wrong_brand_context', mentioned_brands, target_oem))
         
         # Brand context neutralization for simple positive mentions
         if (base_sentiment == 'positive' and target_oem and 
@@ -1424,11 +1177,11 @@ class AdvancedSentimentClassifier:
                 # Simple positive statement about wrong brand
                 base_sentiment = 'neutral'
                 base_confidence = 0.75
-                factors.append(f"off_topic_brand_mention: -> neutral")
+                factors.append(rule(explain, 'off_topic_brand_mention'))
             elif company_info['primary_company'] != target_oem:
                 # This comment is about a different company
                 base_confidence *= 0.7  # Reduce confidence for misattributed sentiment
-                factors.append("competitor_mention: confidence reduced")
+                factors.append(rule(explain, 'competitor_mention'))
         
         # Apply emoji influence to final sentiment
         final_score = 0
@@ -1457,27 +1210,15 @@ class AdvancedSentimentClassifier:
             'final_score': round(final_score, 3)
         }
 
-    def _calculate_product_relevance(self, text: str, company_info: Dict, target_oem: str) -> Dict[str, Any]:
+    def _calculate_product_relevance(self, text: str, company_info: Dict, target_oem: str,
+                                     matches: Optional[PatternMatches] = None) -> Dict[str, Any]:
         """Calculate product relevance for the text"""
+        if matches is None:
+            matches = self.scan_patterns(text)
         
-        # EV-related keywords
-        ev_keywords = [
-            'electric', 'battery', 'range', 'charging', 'scooter', 'bike', 'motorcycle',
-            'ev', 'electric vehicle', 'eco-friendly', 'green', 'sustainable',
-            'motor', 'acceleration', 'speed', 'mileage', 'efficiency'
-        ]
-        
-        # Service-related keywords
-        service_keywords = [
-            'service', 'maintenance', 'repair', 'support', 'center', 'technician',
-            'warranty', 'parts', 'replacement', 'fix', 'issue', 'problem'
-        ]
-        
-        text_lower = text.lower()
-        
-        # Count relevant keywords
-        ev_score = sum(1 for keyword in ev_keywords if keyword in text_lower)
-        service_score = sum(1 for keyword in service_keywords if keyword in text_lower)
+        # Count relevant keywords (EV-related and service-related)
+        ev_score = matches.count('relevance:ev')
+        service_score = matches.count('relevance:service')
         
         # Company mention score
         company_score = 0
@@ -1511,45 +1252,15 @@ class AdvancedSentimentClassifier:
             'company_score': company_score
         }
 
-    def _detect_context_advanced(self, text: str) -> Dict[str, Any]:
+    def _detect_context_advanced(self, text: str, matches: Optional[PatternMatches] = None) -> Dict[str, Any]:
         """Detect context categories with advanced classification"""
+        if matches is None:
+            matches = self.scan_patterns(text)
         
-        context_patterns = {
-            'service': [
-                'service center', 'maintenance', 'repair', 'technician', 'support',
-                'warranty', 'parts', 'replacement', 'fix', 'issue', 'problem'
-            ],
-            'battery_performance': [
-                'battery', 'range', 'mileage', 'charging', 'charge', 'power',
-                'distance', 'km', 'battery life', 'backup'
-            ],
-            'riding_experience': [
-                'ride', 'driving', 'acceleration', 'speed', 'performance', 'handling',
-                'comfort', 'seat', 'suspension', 'brakes'
-            ],
-            'purchase_decision': [
-                'buy', 'purchase', 'price', 'cost', 'expensive', 'cheap', 'value',
-                'money', 'worth', 'deal', 'offer', 'discount'
-            ],
-            'comparison': [
-                'vs', 'versus', 'compare', 'better', 'best', 'worst', 'than',
-                'alternative', 'option', 'choice'
-            ],
-            'build_quality': [
-                'build', 'quality', 'material', 'plastic', 'metal', 'finish',
-                'design', 'look', 'appearance', 'style'
-            ],
-            'features': [
-                'feature', 'technology', 'smart', 'app', 'connectivity', 'digital',
-                'display', 'instrument', 'cluster'
-            ]
-        }
-        
-        text_lower = text.lower()
         context_scores = {}
         
-        for context, keywords in context_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+        for context in self.context_patterns:
+            score = matches.count(f'context:{context}')
             if score > 0:
                 context_scores[context] = score
         
@@ -1591,99 +1302,376 @@ class AdvancedSentimentClassifier:
             'analysis_method': 'default'
         }
 
-    async def analyze_comment_batch(self, comments: List[Dict], target_oem: str = None) -> List[Dict]:
-        """Analyze a batch of comments with advanced classification"""
-        enhanced_comments = []
+    async def analyze_comment_batch(self, comments: List[Dict], target_oem: str = None,
+                                    parallel: bool = None, workers: int = None,
+                                    chunk_size: int = None, compact: bool = False,
+                                    tiered: bool = False, dedup: bool = None,
+                                    features_memo: Dict = None, explain: bool = None,
+                                    summary: BatchSummaryAccumulator = None) -> List[Dict]:
+        """Analyze a batch of comments with advanced classification, optionally across a process pool
+        (compact=True stores CompactClassification records whose full detail is recomputed on demand,
+        tiered=True decides clear-margin comments with the fast path,
+        dedup=True classifies each distinct text once and fans the result out to its duplicates,
+        features_memo shares OEM-independent features between calls and keeps classification in-process,
+        explain=False records rule IDs instead of explanation strings; the default explains unless compact,
+        whose detail is recomputed with explanations on demand,
+        summary accumulates summary statistics as each comment is finished, see summarize_batch)"""
+        if explain is None:
+            explain = not compact
+        plan = self._plan_batch(comments, target_oem, tiered, dedup, explain)
+        pending_comments = plan['to_classify']
+        
+        # Auto mode: shard only when enough uncached comments justify the pool
+        workers = workers or self.parallel_workers
+        if features_memo is not None or self.rule_profiler is not None:
+            # Memoised features and rule profiles live in this process
+            parallel = False
+        elif parallel is None:
+            parallel = workers > 1 and len(pending_comments) >= self.parallel_min_batch
+        
+        if parallel and pending_comments:
+            classifications = await self._classify_parallel(pending_comments, target_oem, workers,
+                                                            chunk_size or self.parallel_chunk_size, tiered, explain)
+        else:
+            classifications = _classify_comments(self, pending_comments, target_oem, tiered, features_memo, explain)
         
-        for comment in comments:
+        return self._finish_batch(plan, classifications, target_oem, compact, summary)
+
+    def iter_classify(self, comments: Iterable[Dict], target_oem: str = None, chunk_size: int = None,
+                      compact: bool = False, tiered: bool = False, dedup: bool = None,
+                      explain: bool = None, summary: BatchSummaryAccumulator = None) -> Iterator[List[Dict]]:
+        """Classify comments chunk by chunk in-process, yielding each chunk's enhanced comments as soon
+        as it is done (comments may be any iterable, only one chunk is held at a time)"""
+        if explain is None:
+            explain = not compact
+        for chunk in _iter_chunks(comments, chunk_size or self.stream_chunk_size):
+            plan = self._plan_batch(chunk, target_oem, tiered, dedup, explain)
+            classifications = _classify_comments(self, plan['to_classify'], target_oem, tiered, explain=explain)
+            yield self._finish_batch(plan, classifications, target_oem, compact, summary)
+
+    async def aiter_classify(self, comments: Iterable[Dict], target_oem: str = None, chunk_size: int = None,
+                             parallel: bool = None, compact: bool = False, tiered: bool = False,
+                             dedup: bool = None, explain: bool = None,
+                             summary: BatchSummaryAccumulator = None) -> AsyncIterator[List[Dict]]:
+        """Async variant of iter_classify; each chunk goes through analyze_comment_batch (and the
+        process pool when it is large enough)"""
+        for chunk in _iter_chunks(comments, chunk_size or self.stream_chunk_size):
+            yield await self.analyze_comment_batch(chunk, target_oem, parallel=parallel, compact=compact,
+                                                   tiered=tiered, dedup=dedup, explain=explain, summary=summary)
+
+    def _plan_batch(self, comments: List[Dict], target_oem: str, tiered: bool, dedup: bool,
+                    explain: bool = True) -> Dict[str, Any]:
+        """Cache lookup and duplicate folding: which comments of a batch still need classifying"""
+        # Look up the whole batch in the persistent cache first
+        cache = self.classification_cache
+        cached = {}
+        keys = []
+        if cache:
             try:
-                classification = await self.classify_comment_advanced(comment, target_oem)
-                enhanced_comment = comment.copy()
-                enhanced_comment['advanced_sentiment_classification'] = classification
-                enhanced_comments.append(enhanced_comment)
+                # Rule-ID results are stored apart from explained ones
+                variant = ('tiered' if tiered else '') + ('' if explain else ':rule_ids')
+                keys = [cache.key_for_comment(comment, target_oem, variant) for comment in comments]
+                cached = cache.get_many(keys)
             except Exception as e:
-                # Fallback to default classification
-                enhanced_comment = comment.copy()
-                enhanced_comment['advanced_sentiment_classification'] = self._create_default_classification()
-                enhanced_comments.append(enhanced_comment)
+                print(f"⚠️ Classification cache unavailable: {e}")
+                cache = None
         
-        return enhanced_comments
-
-    def get_batch_summary(self, enhanced_comments: List[Dict]) -> Dict[str, Any]:
-        """Generate summary statistics for a batch of classified comments"""
-        total_comments = len(enhanced_comments)
-        if total_comments == 0:
-            return {'error': 'No comments to analyze'}
+        pending = [i for i in range(len(comments)) if not cache or keys[i] not in cached]
         
-        # Initialize counters
-        sentiment_counts = defaultdict(int)
-        language_counts = defaultdict(int)
-        emoji_counts = {'with_emojis': 0, 'without_emojis': 0}
-        sarcasm_counts = {'detected': 0, 'not_detected': 0}
-        engagement_counts = defaultdict(int)
-        company_mention_counts = defaultdict(int)
+        # Comments seen before under the same stable ID (e.g. re-scraped with new like counts)
+        # reuse their stored text analysis; only new or edited comments are classified
+        id_keys = {}
+        stored = {}
+        if cache and pending:
+            try:
+                id_keys = {i: cache.id_key_for_comment(comments[i], target_oem, variant) for i in pending}
+                found = cache.get_many_by_id(id_keys.values())
+                stored = {i: found[id_keys[i]] for i in pending if id_keys[i] in found}
+                pending = [i for i in pending if i not in stored]
+            except Exception as e:
+                print(f"⚠️ Comment ID lookup unavailable: {e}")
+                id_keys = {}
+        self.reuse_stats['comments'] += len(comments)
+        self.reuse_stats['cache_hits'] += len(comments) - len(pending) - len(stored)
+        self.reuse_stats['id_hits'] += len(stored)
+        
+        # Fold duplicate texts: only the first comment of each normalised text is classified
+        if dedup is None:
+            dedup = self.dedup_enabled
+        if dedup:
+            first_by_text = {}
+            representative = {i: first_by_text.setdefault(_dedup_key(comments[i].get('text', '')), i)
+                              for i in pending}
+            unique = list(first_by_text.values())
+            self.dedup_stats['comments'] += len(pending)
+            self.dedup_stats['unique_texts'] += len(unique)
+        else:
+            representative = {i: i for i in pending}
+            unique = pending
+        self.reuse_stats['classified'] += len(unique)
         
-        total_confidence = 0
-        total_engagement_score = 0
+        return {
+            'comments': comments,
+            'cache': cache,
+            'keys': keys,
+            'cached': cached,
+            'pending': pending,
+            'id_keys': id_keys,
+            'stored': stored,
+            'representative': representative,
+            'unique': unique,
+            'to_classify': [comments[i] for i in unique]
+        }
+
+    def _finish_batch(self, plan: Dict[str, Any], classifications: List[Optional[Dict]],
+                      target_oem: str, compact: bool,
+                      summary: BatchSummaryAccumulator = None) -> List[Dict]:
+        """Fan results out to duplicates, store new results in the cache and build the enhanced comments
+        (counting each into the summary accumulator, if any)"""
+        comments = plan['comments']
+        cache = plan['cache']
+        keys = plan['keys']
+        cached = plan['cached']
+        representative = plan['representative']
+        unique_results = dict(zip(plan['unique'], classifications))
+        
+        # Duplicates share the text analysis; only engagement-dependent fields are recomputed
+        results = {}
+        for i in plan['pending']:
+            classification = unique_results[representative[i]]
+            if representative[i] != i and classification is not None:
+                classification = self.reapply_engagement(classification, comments[i], target_oem)
+            results[i] = classification
+        new_id_results = {plan['id_keys'][i]: results[i] for i in plan['pending']
+                          if results[i] is not None and i in plan['id_keys']}
+        for i, classification in plan['stored'].items():
+            results[i] = self.reapply_engagement(classification, comments[i], target_oem)
         
-        for comment in enhanced_comments:
-            classification = comment.get('advanced_sentiment_classification', {})
-            
-            # Sentiment distribution
-            sentiment_counts[classification.get('sentiment', 'unknown')] += 1
-            
-            # Language distribution
-            lang_info = classification.get('language_analysis', {})
-            primary_lang = lang_info.get('primary_language', 'unknown')
-            language_counts[primary_lang] += 1
-            
-            # Emoji usage
-            emoji_info = classification.get('emoji_analysis', {})
-            if emoji_info.get('has_emojis', False):
-                emoji_counts['with_emojis'] += 1
-            else:
-                emoji_counts['without_emojis'] += 1
-            
-            # Sarcasm detection
-            if classification.get('sarcasm_detected', False):
-                sarcasm_counts['detected'] += 1
+        enhanced_comments = []
+        new_results = {}
+        for i, comment in enumerate(comments):
+            enhanced_comment = comment.copy()
+            if i in results:
+                classification = results[i]
+                if classification is None:
+                    # Fallback to default classification
+                    classification = self._create_default_classification()
+                elif cache:
+                    new_results[keys[i]] = classification
             else:
-                sarcasm_counts['not_detected'] += 1
-            
-            # Engagement levels
-            engagement_info = classification.get('engagement_analysis', {})
-            engagement_level = engagement_info.get('engagement_level', 'none')
-            engagement_counts[engagement_level] += 1
-            
-            # Company mentions
-            company_info = classification.get('company_analysis', {})
-            if company_info.get('has_mentions', False):
-                primary_company = company_info.get('primary_company')
-                if primary_company:
-                    company_mention_counts[primary_company] += 1
-            
-            # Accumulate metrics
-            total_confidence += classification.get('confidence', 0)
-            total_engagement_score += engagement_info.get('engagement_score', 0)
-        
-        # Calculate averages
-        avg_confidence = total_confidence / total_comments
-        avg_engagement = total_engagement_score / total_comments
+                classification = cached[keys[i]]
+            if compact:
+                classification = CompactClassification(classification, comment, target_oem, self)
+            enhanced_comment['advanced_sentiment_classification'] = classification
+            enhanced_comments.append(enhanced_comment)
+            if summary is not None:
+                summary.add(classification, target_oem)
+        
+        if cache and new_results:
+            try:
+                cache.put_many(new_results)
+            except Exception as e:
+                print(f"⚠️ Failed to update classification cache: {e}")
+        if cache and new_id_results:
+            try:
+                cache.put_many_by_id(new_id_results)
+            except Exception as e:
+                print(f"⚠️ Failed to store results by comment ID: {e}")
         
+        return enhanced_comments
+
+    async def analyze_comment_batches_by_oem(self, comments_by_oem: Dict[str, List[Dict]],
+                                             compact: bool = False, tiered: bool = False,
+                                             summary: BatchSummaryAccumulator = None) -> Dict[str, List[Dict]]:
+        """Classify each OEM's comments against that OEM (e.g. for comparisons); a comment that
+        appears under several OEMs has its OEM-independent features extracted only once"""
+        features_memo = {}
+        return {
+            oem: await self.analyze_comment_batch(comments, oem, compact=compact, tiered=tiered,
+                                                  features_memo=features_memo, summary=summary)
+            for oem, comments in comments_by_oem.items()
+        }
+
+    def reapply_engagement(self, classification: Dict[str, Any], comment: Dict,
+                           target_oem: str = None) -> Dict[str, Any]:
+        """Adapt a classification of the same text to another comment's likes/replies/shares"""
+        engagement_info = self.calculate_engagement_weight(
+            comment.get('likes', 0), comment.get('replies', 0), comment.get('shares', 0)
+        )
+        method = classification.get('analysis_method')
+        if method == 'default' or engagement_info == classification.get('engagement_analysis'):
+            return dict(classification)
+        
+        adapted = dict(classification, engagement_analysis=engagement_info)
+        if method == 'advanced_multi_layer':
+            # Engagement only enters the final combination step
+            final_sentiment = self._calculate_final_sentiment(
+                classification['pattern_analysis'], classification['emoji_analysis'],
+                classification['sarcasm_analysis'], engagement_info,
+                classification['company_analysis'], target_oem, classification.get('explained', True)
+            )
+            adapted['sentiment'] = final_sentiment['sentiment']
+            adapted['confidence'] = final_sentiment['confidence']
+            adapted['classification_factors'] = final_sentiment['factors']
+        return adapted
+
+    def get_dedup_stats(self) -> Dict[str, Any]:
+        """How many classified comments were served from a duplicate text"""
+        comments = self.dedup_stats['comments']
+        unique_texts = self.dedup_stats['unique_texts']
         return {
-            'total_comments': total_comments,
-            'sentiment_distribution': dict(sentiment_counts),
-            'language_distribution': dict(language_counts),
-            'emoji_usage': dict(emoji_counts),
-            'sarcasm_statistics': dict(sarcasm_counts),
-            'engagement_distribution': dict(engagement_counts),
-            'company_mentions': dict(company_mention_counts),
-            'average_confidence': round(avg_confidence, 3),
-            'average_engagement_score': round(avg_engagement, 3),
-            'multilingual_percentage': round(
-                sum(1 for c in enhanced_comments 
-                    if c.get('advanced_sentiment_classification', {})
-                    .get('language_analysis', {}).get('is_mixed', False)) / total_comments * 100, 2
-            ),
-            'sarcasm_percentage': round(sarcasm_counts['detected'] / total_comments * 100, 2)
+            'enabled': self.dedup_enabled,
+            'comments': comments,
+            'unique_texts': unique_texts,
+            'duplicates': comments - unique_texts,
+            'dedup_ratio': round((comments - unique_texts) / comments * 100, 2) if comments else 0.0
         }
+
+    def get_reuse_stats(self) -> Dict[str, Any]:
+        """How many batch comments were classified and how many reused a cached, stored-by-ID or
+        duplicate result"""
+        stats = dict(self.reuse_stats)
+        stats['reused'] = stats['comments'] - stats['classified']
+        return stats
+
+    async def _classify_parallel(self, comments: List[Dict], target_oem: str, workers: int, chunk_size: int,
+                                 tiered: bool = False, explain: bool = True) -> List[Optional[Dict]]:
+        """Shard comments across the process pool without blocking the event loop"""
+        chunk_size = max(1, chunk_size)
+        chunks = [comments[start:start + chunk_size] for start in range(0, len(comments), chunk_size)]
+        try:
+            pool = self._get_process_pool(workers)
+            loop = asyncio.get_running_loop()
+            chunk_results = await asyncio.gather(*[
+                loop.run_in_executor(pool, _classify_chunk, chunk, target_oem, tiered, explain) for chunk in chunks
+            ])
+        except Exception as e:
+            print(f"⚠️ Parallel classification failed: {e}, classifying sequentially...")
+            self.shutdown_process_pool()
+            return _classify_comments(self, comments, target_oem, tiered, explain=explain)
+        
+        # Workers report their tier and gate counters alongside each shard
+        classifications = []
+        for chunk_classifications, chunk_tier_stats, chunk_gate_stats in chunk_results:
+            classifications.extend(chunk_classifications)
+            if tiered:
+                self.merge_tier_stats(chunk_tier_stats)
+            self.merge_gate_stats(chunk_gate_stats)
+        return classifications
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return a warm worker pool for this process (recreated after a fork or resize)"""
+        pool_key = (os.getpid(), workers)
+        if self._process_pool is None or self._process_pool_key != pool_key:
+            if self._process_pool is not None and self._process_pool_key[0] == os.getpid():
+                self._process_pool.shutdown(wait=False)
+            self._process_pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                     mp_context=_worker_context())
+            self._process_pool_key = pool_key
+        return self._process_pool
+
+    def shutdown_process_pool(self):
+        """Stop the parallel classification workers"""
+        if self._process_pool is not None and self._process_pool_key[0] == os.getpid():
+            self._process_pool.shutdown(wait=True)
+        self._process_pool = None
+        self._process_pool_key = None
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics of the persistent classification cache"""
+        if not self.classification_cache:
+            return {'enabled': False}
+        try:
+            return {'enabled': True, **self.classification_cache.get_stats()}
+        except Exception as e:
+            return {'enabled': True, 'error': str(e)}
+
+    def get_batch_summary(self, enhanced_comments: List[Dict]) -> Dict[str, Any]:
+        """Generate summary statistics for a batch of classified comments"""
+        summary = BatchSummaryAccumulator()
+        for comment in enhanced_comments:
+            summary.add(comment.get('advanced_sentiment_classification', {}))
+        return self.summarize_batch(summary)
+
+    def summarize_batch(self, summary: BatchSummaryAccumulator) -> Dict[str, Any]:
+        """Summary statistics from an accumulator filled while the batch was classified"""
+        batch_summary = summary.summary()
+        if 'error' in batch_summary:
+            return batch_summary
+        batch_summary['cache_statistics'] = self.get_cache_stats()
+        batch_summary['tier_statistics'] = self.get_tier_stats()
+        batch_summary['gate_statistics'] = self.get_gate_stats()
+        batch_summary['dedup_statistics'] = self.get_dedup_stats()
+        return batch_summary
+
+def _dedup_key(text: str) -> str:
+    """Normalised text under which duplicate comments share one classification.
+    
+    Every rule matches on lower-cased text, so case variants classify identically. Whitespace
+    is kept as is: `.*` stops at newlines, phrases expect single spaces and the fast path
+    looks at the length, so even leading/trailing whitespace can change the result.
+    """
+    return text.lower()
+
+
+def _iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """Consecutive lists of at most chunk_size items, without materialising the whole iterable"""
+    iterator = iter(items)
+    chunk_size = max(1, chunk_size)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Parallel batch classification workers
+_worker_classifier = None
+
+
+def _worker_context():
+    """Start method of the worker processes (CLASSIFIER_MP_START_METHOD, default forkserver, or spawn
+    where unavailable). Never a plain fork: the serving process runs threads (data watcher, file
+    system observer, cache locks) whose held locks a forked child would inherit"""
+    method = os.getenv('CLASSIFIER_MP_START_METHOD')
+    if not method:
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def _init_worker():
+    """Build the compiled classifier once per worker process"""
+    global _worker_classifier
+    _worker_classifier = AdvancedSentimentClassifier(use_cache=False)
+
+
+def _classify_comments(classifier: AdvancedSentimentClassifier, comments: List[Dict],
+                       target_oem: str = None, tiered: bool = False,
+                       features_memo: Dict = None, explain: bool = True) -> List[Optional[Dict]]:
+    """Classify comments in order; None marks a comment that failed to classify
+    (features_memo, when given, keeps extracted features for reuse with other target OEMs)"""
+    classifications = []
+    for comment in comments:
+        try:
+            if features_memo is None:
+                classifications.append(classifier.classify_comment(comment, target_oem, tiered, explain))
+                continue
+            key = (comment.get('text', ''), comment.get('likes', 0), comment.get('replies', 0),
+                   comment.get('shares', 0), tiered, explain)
+            if key not in features_memo:
+                features_memo[key] = classifier.extract_features(comment, tiered, explain)
+            classifications.append(classifier.score_features(features_memo[key], target_oem))
+        except Exception:
+            classifications.append(None)
+    return classifications
+
+
+def _classify_chunk(comments: List[Dict], target_oem: str = None, tiered: bool = False,
+                    explain: bool = True) -> Tuple[List[Optional[Dict]], Dict, Dict]:
+    """Worker entry point for one shard of a parallel batch; also returns the shard's tier and gate counters"""
+    if _worker_classifier is None:
+        _init_worker()
+    _worker_classifier.reset_tier_stats()
+    _worker_classifier.reset_gate_stats()
+    classifications = _classify_comments(_worker_classifier, comments, target_oem, tiered, explain=explain)
+    return classifications, _worker_classifier.tier_stats, _worker_classifier.gate_stats
@@ -0,0 +1,126 @@
+"""
+Batch Summary Accumulator - Streaming summary statistics of classified comments
+- Updated once per comment as its classification is finalised, so summaries and per-OEM
+  sentiment counts need no further passes over the results
+- Reads CompactClassification scalar fields directly (no detail materialisation)
+- Accumulators merge, so per-call or per-worker accumulators can be combined
+"""
+
+from collections import defaultdict
+from typing import Dict, Any, Optional, Mapping
+
+from .compact_classification import CompactClassification
+
+
+class BatchSummaryAccumulator:
+    """Running counters behind get_batch_summary, plus sentiment counts per target OEM"""
+
+    def __init__(self):
+        self.total_comments = 0
+        self.sentiment_counts = defaultdict(int)
+        self.language_counts = defaultdict(int)
+        self.emoji_counts = {'with_emojis': 0, 'without_emojis': 0}
+        self.sarcasm_counts = {'detected': 0, 'not_detected': 0}
+        self.engagement_counts = defaultdict(int)
+        self.company_mention_counts = defaultdict(int)
+        self.total_confidence = 0
+        self.total_engagement_score = 0
+        self.multilingual_count = 0
+        self.sentiment_by_oem = {}
+
+    def add(self, classification: Mapping, target_oem: Optional[str] = None):
+        """Count one advanced classification (or legacy sentiment_classification dict)"""
+        self.total_comments += 1
+        sentiment = classification.get('sentiment', 'unknown')
+        self.sentiment_counts[sentiment] += 1
+        oem_counts = self.sentiment_by_oem.get(target_oem)
+        if oem_counts is None:
+            oem_counts = self.sentiment_by_oem[target_oem] = {'positive': 0, 'negative': 0, 'neutral': 0}
+        oem_counts[sentiment] = oem_counts.get(sentiment, 0) + 1
+
+        # Compact records carry the summary fields directly (no detail materialisation)
+        if isinstance(classification, CompactClassification):
+            primary_lang = classification.primary_language
+            is_mixed = classification.is_mixed
+            has_emojis = classification.has_emojis
+            engagement_level = classification.engagement_level
+            engagement_score = classification.engagement_score
+            primary_company = classification.primary_company
+        else:
+            lang_info = classification.get('language_analysis', {})
+            primary_lang = lang_info.get('primary_language', 'unknown')
+            is_mixed = lang_info.get('is_mixed', False)
+            has_emojis = classification.get('emoji_analysis', {}).get('has_emojis', False)
+            engagement_info = classification.get('engagement_analysis', {})
+            engagement_level = engagement_info.get('engagement_level', 'none')
+            engagement_score = engagement_info.get('engagement_score', 0)
+            company_info = classification.get('company_analysis', {})
+            primary_company = company_info.get('primary_company') if company_info.get('has_mentions', False) else None
+
+        # Language distribution
+        self.language_counts[primary_lang] += 1
+        if is_mixed:
+            self.multilingual_count += 1
+
+        # Emoji usage
+        if has_emojis:
+            self.emoji_counts['with_emojis'] += 1
+        else:
+            self.emoji_counts['without_emojis'] += 1
+
+        # Sarcasm detection
+        if classification.get('sarcasm_detected', False):
+            self.sarcasm_counts['detected'] += 1
+        else:
+            self.sarcasm_counts['not_detected'] += 1
+
+        # Engagement levels and company mentions
+        self.engagement_counts[engagement_level] += 1
+        if primary_company:
+            self.company_mention_counts[primary_company] += 1
+
+        self.total_confidence += classification.get('confidence', 0)
+        self.total_engagement_score += engagement_score
+
+    def merge(self, other: 'BatchSummaryAccumulator'):
+        """Add another accumulator's counts"""
+        self.total_comments += other.total_comments
+        for mine, theirs in [(self.sentiment_counts, other.sentiment_counts),
+                             (self.language_counts, other.language_counts),
+                             (self.emoji_counts, other.emoji_counts),
+                             (self.sarcasm_counts, other.sarcasm_counts),
+                             (self.engagement_counts, other.engagement_counts),
+                             (self.company_mention_counts, other.company_mention_counts)]:
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.total_confidence += other.total_confidence
+        self.total_engagement_score += other.total_engagement_score
+        self.multilingual_count += other.multilingual_count
+        for oem, counts in other.sentiment_by_oem.items():
+            mine = self.sentiment_by_oem.setdefault(oem, {'positive': 0, 'negative': 0, 'neutral': 0})
+            for sentiment, count in counts.items():
+                mine[sentiment] = mine.get(sentiment, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        """Distribution part of the batch summary (same fields and rounding as get_batch_summary)"""
+        total_comments = self.total_comments
+        if total_comments == 0:
+            return {'error': 'No comments to analyze'}
+        return {
+            'total_comments': total_comments,
+            'sentiment_distribution': dict(self.sentiment_counts),
+            'language_distribution': dict(self.language_counts),
+            'emoji_usage': dict(self.emoji_counts),
+            'sarcasm_statistics': dict(self.sarcasm_counts),
+            'engagement_distribution': dict(self.engagement_counts),
+            'company_mentions': dict(self.company_mention_counts),
+            'average_confidence': round(self.total_confidence / total_comments, 3),
+            'average_engagement_score': round(self.total_engagement_score / total_comments, 3),
+            'multilingual_percentage': round(self.multilingual_count / total_comments * 100, 2),
+            'sarcasm_percentage': round(self.sarcasm_counts['detected'] / total_comments * 100, 2)
+        }
+
+    def oem_sentiment(self) -> Dict[Optional[str], Dict[str, Any]]:
+        """{'total', 'sentiment'} per target OEM, as reported in the full-dataset prompt statistics"""
+        return {oem: {'total': sum(counts.values()), 'sentiment': dict(counts)}
+                for oem, counts in self.sentiment_by_oem.items()}
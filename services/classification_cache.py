@@ -0,0 +1,208 @@
+"""
+Classification Cache - Persistent content-addressed cache for comment classifications
+- Keyed by a hash of the comment text, engagement counts, target OEM and classifier rule version
+- SQLite in WAL mode, safe to share between processes and gunicorn workers
+- Connections are opened lazily per process, so a cache created before a fork keeps working
+- A second table keys results by stable comment ID (video, author, time and text hash), so a
+  re-scraped comment whose like counts changed reuses its text analysis
+- Tracks hit/miss counts for reporting; entries of older rule versions are purged when a classifier opens it
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, List, Any, Optional, Iterable
+
+
+def stable_comment_id(comment: Dict) -> str:
+    """Stable identity of a scraped comment: video_id + author + time + text hash"""
+    text_hash = hashlib.sha256(comment.get('text', '').encode('utf-8')).hexdigest()
+    fields = [comment.get('video_id', ''), comment.get('author', ''),
+              comment.get('time', comment.get('date', '')), text_hash]
+    payload = json.dumps(fields, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class ClassificationCache:
+    """Disk-backed cache of advanced_sentiment_classification results"""
+
+    def __init__(self, db_path: str = None, rule_version: str = ''):
+        self.db_path = db_path or os.getenv('CLASSIFICATION_CACHE_PATH', 'classification_cache.db')
+        self.rule_version = rule_version
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.id_hits = 0
+        self.id_misses = 0
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process (reopened after a fork)"""
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS classifications (
+                    key TEXT PRIMARY KEY,
+                    rule_version TEXT NOT NULL,
+                    result TEXT NOT NULL
+                )
+            ''')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS comment_results (
+                    key TEXT PRIMARY KEY,
+                    rule_version TEXT NOT NULL,
+                    result TEXT NOT NULL
+                )
+            ''')
+            # Entry counts and stale-version purges filter on the rule version
+            for table in ('classifications', 'comment_results'):
+                connection.execute(f'CREATE INDEX IF NOT EXISTS {table}_rule_version ON {table} (rule_version)')
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def make_key(self, text: str, likes: Any = 0, replies: Any = 0, shares: Any = 0,
+                 target_oem: Optional[str] = None, variant: str = '') -> str:
+        """Content address of one classification request (variant separates classification modes)"""
+        fields = [text, likes, replies, shares, target_oem, self.rule_version]
+        if variant:
+            fields.append(variant)
+        payload = json.dumps(fields, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def key_for_comment(self, comment: Dict, target_oem: Optional[str] = None, variant: str = '') -> str:
+        """Cache key for a comment dict as passed to classify_comment_advanced"""
+        return self.make_key(comment.get('text', ''), comment.get('likes', 0),
+                             comment.get('replies', 0), comment.get('shares', 0), target_oem, variant)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up several keys at once; returns only the cached entries"""
+        keys = list(dict.fromkeys(keys))
+        found = self._select('classifications', keys)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _select(self, table: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        found = {}
+        with self._lock:
+            connection = self._get_connection()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = connection.execute(
+                    f'SELECT key, result FROM {table} WHERE key IN ({placeholders})', chunk
+                ).fetchall()
+                for key, result in rows:
+                    found[key] = json.loads(result)
+        return found
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single key"""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, results: Dict[str, Dict[str, Any]]):
+        """Store several classifications in one transaction"""
+        self.writes += self._insert('classifications', results)
+
+    def _insert(self, table: str, results: Dict[str, Dict[str, Any]]) -> int:
+        if not results:
+            return 0
+        rows = [(key, self.rule_version, json.dumps(result, ensure_ascii=False))
+                for key, result in results.items()]
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    f'INSERT OR REPLACE INTO {table} (key, rule_version, result) VALUES (?, ?, ?)', rows
+                )
+        return len(rows)
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a single classification"""
+        self.put_many({key: result})
+
+    def id_key_for_comment(self, comment: Dict, target_oem: Optional[str] = None, variant: str = '') -> str:
+        """Key of a comment's result by stable comment ID (independent of its engagement counts)"""
+        fields = [stable_comment_id(comment), target_oem, self.rule_version]
+        if variant:
+            fields.append(variant)
+        payload = json.dumps(fields, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_many_by_id(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up results by id_key_for_comment keys; returns only the stored entries"""
+        keys = list(dict.fromkeys(keys))
+        found = self._select('comment_results', keys)
+        self.id_hits += len(found)
+        self.id_misses += len(keys) - len(found)
+        return found
+
+    def put_many_by_id(self, results: Dict[str, Dict[str, Any]]):
+        """Store results under their id_key_for_comment keys"""
+        self.writes += self._insert('comment_results', results)
+
+    def purge_stale(self) -> int:
+        """Delete entries written by other rule versions"""
+        deleted = 0
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                for table in ('classifications', 'comment_results'):
+                    cursor = connection.execute(f'DELETE FROM {table} WHERE rule_version != ?',
+                                                (self.rule_version,))
+                    deleted += cursor.rowcount
+        return deleted
+
+    def clear(self):
+        """Delete every cached entry and reset the counters"""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute('DELETE FROM classifications')
+                connection.execute('DELETE FROM comment_results')
+            self.hits = self.misses = self.writes = 0
+            self.id_hits = self.id_misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counts for this process and the size of the cache"""
+        with self._lock:
+            connection = self._get_connection()
+            entries = connection.execute(
+                'SELECT COUNT(*) FROM classifications WHERE rule_version = ?', (self.rule_version,)
+            ).fetchone()[0]
+            id_entries = connection.execute(
+                'SELECT COUNT(*) FROM comment_results WHERE rule_version = ?', (self.rule_version,)
+            ).fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            'entries': entries,
+            'id_hits': self.id_hits,
+            'id_misses': self.id_misses,
+            'id_entries': id_entries,
+            'rule_version': self.rule_version,
+            'db_path': self.db_path
+        }
+
+    def close(self):
+        """Close the connection of the current process"""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
@@ -0,0 +1,310 @@
+"""
+Comment Dataset - Scraped comment files consolidated into one partitioned dataset
+- Every scraped file (per-video monthly files and combined datasets) is merged, with comments seen in
+  several files kept once by stable comment ID; the most recently modified file's copy wins
+- Comments are partitioned by OEM, year and month: <dataset>/<oem>/<yyyy>/<mm>.json, plus
+  <dataset>/<oem>/undated.json for comments without a parseable date
+- manifest.json records the source files, and per partition its row count, date and time range and
+  content hash; readers open only the partitions a query selects
+- Re-consolidation rewrites only partitions whose content changed
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+from collections.abc import Mapping
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+from .classification_cache import stable_comment_id
+from .comment_store import comments_from_file, normalize_date
+
+DATASET_FORMAT = 1
+
+
+def default_dataset_dir() -> str:
+    """Directory of the consolidated dataset (COMMENT_DATASET_DIR, default comment_dataset)"""
+    return os.getenv('COMMENT_DATASET_DIR', 'comment_dataset')
+
+
+def oem_slug(oem: str) -> str:
+    """Directory name of an OEM: 'Ola Electric' -> 'ola_electric'"""
+    return re.sub(r'[^a-z0-9]+', '_', oem.lower()).strip('_') or 'unknown'
+
+
+def _source_stat(path: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _write_json(path: str, data: Any, indent: int = None):
+    """Write JSON atomically (readers never see a partial file)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, default=str)
+    os.replace(temp_path, path)
+
+
+def _read_manifest(dataset_dir: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(dataset_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != DATASET_FORMAT:
+        raise ValueError(f"Unsupported comment dataset format in {dataset_dir}: {manifest.get('format')}")
+    return manifest
+
+
+def partition_content_hash(comments: List[Dict]) -> str:
+    """Content hash of a partition's comments (independent of key order)"""
+    payload = json.dumps(comments, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def consolidate_comments(source_paths: Iterable[str], dataset_dir: str = None,
+                         force: bool = False) -> Dict[str, Any]:
+    """Merge scraped comment files into the partitioned dataset; returns the manifest. Nothing is
+    rewritten while the dataset was built from the same files as they are now (unless forced)."""
+    dataset_dir = dataset_dir or default_dataset_dir()
+    sources = sorted((_source_stat(path) for path in source_paths), key=lambda s: (s['mtime_ns'], s['path']))
+    previous = None
+    try:
+        previous = _read_manifest(dataset_dir)
+    except Exception as e:
+        print(f"⚠️ Rebuilding unreadable comment dataset {dataset_dir}: {e}")
+    if previous and not force:
+        previous_sources = [{key: source[key] for key in ('path', 'size', 'mtime_ns')}
+                            for source in previous['sources']]
+        if previous_sources == sources:
+            return previous
+
+    # Oldest file first, so the newest copy of a comment replaces earlier ones in place
+    merged = {}
+    read = 0
+    for source in sources:
+        source['rows'] = 0
+        try:
+            comments_by_oem = comments_from_file(source['path'])
+        except Exception as e:
+            print(f"⚠️ Skipping unreadable comment file {source['path']}: {e}")
+            continue
+        for oem_name, comments in comments_by_oem.items():
+            for comment in comments:
+                merged[(oem_name, stable_comment_id(comment))] = (oem_name, comment)
+            source['rows'] += len(comments)
+        read += source['rows']
+
+    grouped = {}
+    for oem_name, comment in merged.values():
+        date = normalize_date(comment.get('date'))
+        key = (oem_name, date[:4], date[5:7]) if date else (oem_name, None, None)
+        grouped.setdefault(key, []).append((date or '', comment))
+
+    previous_partitions = {p['path']: p for p in previous['partitions']} if previous else {}
+    partitions = []
+    written = 0
+    for (oem_name, year, month), dated in sorted(grouped.items(), key=lambda item: (item[0][0], item[0][1] or '', item[0][2] or '')):
+        dated.sort(key=lambda entry: entry[0])
+        comments = [comment for _, comment in dated]
+        dates = [date for date, _ in dated if date]
+        times = [c['time'] for c in comments if isinstance(c.get('time'), (int, float))]
+        relative_path = '/'.join([oem_slug(oem_name), year, f'{month}.json'] if year else
+                                 [oem_slug(oem_name), 'undated.json'])
+        content_hash = partition_content_hash(comments)
+        unchanged = previous_partitions.get(relative_path, {}).get('content_hash') == content_hash
+        if not unchanged or not os.path.exists(os.path.join(dataset_dir, relative_path)):
+            _write_json(os.path.join(dataset_dir, relative_path), comments, indent=2)
+            written += 1
+        partitions.append({
+            'oem': oem_name,
+            'year': year,
+            'month': month,
+            'path': relative_path,
+            'rows': len(comments),
+            'first_date': dates[0] if dates else None,
+            'last_date': dates[-1] if dates else None,
+            'min_time': min(times) if times else None,
+            'max_time': max(times) if times else None,
+            'content_hash': content_hash
+        })
+
+    # Partitions that no longer hold comments
+    current_paths = {p['path'] for p in partitions}
+    for relative_path in set(previous_partitions) - current_paths:
+        try:
+            os.remove(os.path.join(dataset_dir, relative_path))
+        except OSError:
+            pass
+
+    oems = {}
+    for partition in partitions:
+        summary = oems.setdefault(partition['oem'], {'rows': 0, 'partitions': 0})
+        summary['rows'] += partition['rows']
+        summary['partitions'] += 1
+    version_payload = json.dumps([(p['path'], p['content_hash']) for p in partitions])
+    manifest = {
+        'format': DATASET_FORMAT,
+        'version': hashlib.sha256(version_payload.encode('utf-8')).hexdigest()[:16],
+        'created_at': time.time(),
+        'rows': len(merged),
+        'duplicates': read - len(merged),
+        'sources': sources,
+        'oems': oems,
+        'partitions': partitions
+    }
+    _write_json(os.path.join(dataset_dir, 'manifest.json'), manifest, indent=2)
+    print(f"🧩 Consolidated {len(sources)} files into {len(merged)} comments ({read - len(merged)} duplicates): "
+          f"{len(partitions)} partitions, {written} rewritten")
+    return manifest
+
+
+class CommentDataset:
+    """Read side of a consolidated dataset; partitions are read on first use"""
+
+    def __init__(self, path: str, manifest: Dict[str, Any], manifest_mtime_ns: int = None):
+        self.path = path
+        self.manifest = manifest
+        self.version = manifest['version']
+        self.rows = manifest['rows']
+        self.partitions = manifest['partitions']
+        self._manifest_mtime_ns = manifest_mtime_ns
+        self._partition_comments = {}
+
+    @classmethod
+    def open(cls, path: str = None) -> 'CommentDataset':
+        """Open a dataset directory (reads only its manifest)"""
+        path = path or default_dataset_dir()
+        manifest = _read_manifest(path)
+        if manifest is None:
+            raise FileNotFoundError(f"No comment dataset manifest in {path}")
+        return cls(path, manifest, os.stat(os.path.join(path, 'manifest.json')).st_mtime_ns)
+
+    @property
+    def oems(self) -> List[str]:
+        return list(self.manifest['oems'])
+
+    def count(self, oem: str = None) -> int:
+        """Number of comments (of one OEM), from the manifest"""
+        if oem is None:
+            return self.rows
+        return self.manifest['oems'].get(oem, {}).get('rows', 0)
+
+    def is_latest(self) -> bool:
+        """False once the dataset was consolidated again since it was opened (one stat call)"""
+        try:
+            return os.stat(os.path.join(self.path, 'manifest.json')).st_mtime_ns == self._manifest_mtime_ns
+        except OSError:
+            return False
+
+    def is_current(self, source_paths: Iterable[str]) -> bool:
+        """True if the dataset was consolidated from exactly these files as they are now"""
+        try:
+            sources = sorted((_source_stat(path) for path in source_paths), key=lambda s: s['path'])
+        except OSError:
+            return False
+        recorded = sorted(({key: source[key] for key in ('path', 'size', 'mtime_ns')}
+                           for source in self.manifest['sources']), key=lambda s: s['path'])
+        return sources == recorded
+
+    def select(self, oem: str = None, year: Any = None, month: Any = None,
+               start_date: Any = None, end_date: Any = None) -> List[Dict[str, Any]]:
+        """Manifest entries of the partitions a query needs: by OEM, year and month, and overlapping
+        the half-open date range [start_date, end_date)"""
+        year = f'{int(year):04d}' if year is not None else None
+        month = f'{int(month):02d}' if month is not None else None
+        start = normalize_date(start_date) if start_date is not None else None
+        end = normalize_date(end_date) if end_date is not None else None
+        selected = []
+        for partition in self.partitions:
+            if oem is not None and partition['oem'] != oem:
+                continue
+            if year is not None and partition['year'] != year:
+                continue
+            if month is not None and partition['month'] != month:
+                continue
+            if start is not None or end is not None:
+                if partition['first_date'] is None:
+                    continue
+                if start is not None and partition['last_date'] < start:
+                    continue
+                if end is not None and partition['first_date'] >= end:
+                    continue
+            selected.append(partition)
+        return selected
+
+    def read_partition(self, partition: Dict[str, Any], cache: bool = True) -> List[Dict]:
+        """Comments of one partition (kept for later reads unless cache=False)"""
+        comments = self._partition_comments.get(partition['path'])
+        if comments is None:
+            with open(os.path.join(self.path, partition['path']), 'r', encoding='utf-8') as f:
+                comments = json.load(f)
+            if cache:
+                self._partition_comments[partition['path']] = comments
+        return comments
+
+    def comments(self, oem: str = None, year: Any = None, month: Any = None,
+                 start_date: Any = None, end_date: Any = None) -> List[Dict]:
+        """Comments of the selected partitions, within [start_date, end_date) when given"""
+        start = normalize_date(start_date) if start_date is not None else None
+        end = normalize_date(end_date) if end_date is not None else None
+        comments = []
+        for partition in self.select(oem, year, month, start_date, end_date):
+            partition_comments = self.read_partition(partition)
+            if (start is not None and partition['first_date'] < start) or \
+                    (end is not None and partition['last_date'] >= end):
+                # Partition straddles a bound: keep only the comments inside the range
+                partition_comments = [c for c in partition_comments if self._in_range(c, start, end)]
+            comments.extend(partition_comments)
+        return comments
+
+    @staticmethod
+    def _in_range(comment: Dict, start: Optional[str], end: Optional[str]) -> bool:
+        date = normalize_date(comment.get('date'))
+        return date is not None and (start is None or date >= start) and (end is None or date < end)
+
+
+def open_dataset(path: str = None) -> Optional[CommentDataset]:
+    """The consolidated dataset, or None when there is none (or it cannot be read)"""
+    path = path or default_dataset_dir()
+    if not os.path.exists(os.path.join(path, 'manifest.json')):
+        return None
+    try:
+        return CommentDataset.open(path)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable comment dataset {path}: {e}")
+        return None
+
+
+class DatasetCommentData(Mapping):
+    """OEM -> comment list mapping over a dataset; each OEM's partitions are read on first access"""
+
+    def __init__(self, dataset: CommentDataset):
+        self.dataset = dataset
+        self._comments = {}
+
+    def __getitem__(self, oem: str) -> List[Dict]:
+        comments = self._comments.get(oem)
+        if comments is None:
+            if oem not in self.dataset.manifest['oems']:
+                raise KeyError(oem)
+            comments = self._comments[oem] = self.dataset.comments(oem)
+        return comments
+
+    def __contains__(self, oem: object) -> bool:
+        # Mapping's default would build the OEM's comments
+        return oem in self.dataset.manifest['oems']
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.dataset.manifest['oems'])
+
+    def __len__(self) -> int:
+        return len(self.dataset.manifest['oems'])
+
+    def comment_counts(self) -> Dict[str, int]:
+        """Comments per OEM, from the manifest"""
+        return {oem: self.dataset.count(oem) for oem in self.dataset.manifest['oems']}
@@ -0,0 +1,349 @@
+"""
+Comment Repository - SQLite store of every scraped comment, queried with pushdown
+- One row per comment, keyed by OEM and stable comment ID (re-imports update rows in place)
+- Indexed by (oem, time), (oem, date), video_id and author; an FTS5 table over the comment text
+  serves keyword search (LIKE scans when the SQLite build lacks FTS5)
+- SQLite in WAL mode, connections opened lazily per process like the classification cache
+- Imported files are recorded with their size and mtime, so unchanged files are skipped
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+from .classification_cache import stable_comment_id
+from .comment_store import comments_from_file, normalize_date, REAL_EXTRACTION_METHODS
+
+# Public order_by values -> ORDER BY clause
+ORDERINGS = {
+    'id': 'id',
+    'time': 'time, id',
+    '-time': 'time DESC, id',
+    'date': 'date, id',
+    '-date': 'date DESC, id',
+    'likes': 'likes, id',
+    '-likes': 'likes DESC, id'
+}
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS comments (
+        id INTEGER PRIMARY KEY,
+        comment_id TEXT NOT NULL,
+        oem TEXT NOT NULL,
+        time INTEGER,
+        date TEXT,
+        video_id TEXT,
+        author TEXT,
+        likes INTEGER NOT NULL DEFAULT 0,
+        text TEXT NOT NULL,
+        source TEXT,
+        data TEXT NOT NULL,
+        UNIQUE (oem, comment_id)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_comments_oem_time ON comments (oem, time)',
+    'CREATE INDEX IF NOT EXISTS idx_comments_oem_date ON comments (oem, date)',
+    'CREATE INDEX IF NOT EXISTS idx_comments_video_id ON comments (video_id)',
+    'CREATE INDEX IF NOT EXISTS idx_comments_author ON comments (author)',
+    '''
+    CREATE TABLE IF NOT EXISTS sources (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        comments INTEGER NOT NULL,
+        imported_at REAL NOT NULL
+    )
+    '''
+]
+
+# External-content FTS table kept in sync with comments by triggers
+FTS_SCHEMA = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(text, content='comments', content_rowid='id')",
+    '''
+    CREATE TRIGGER IF NOT EXISTS comments_fts_insert AFTER INSERT ON comments BEGIN
+        INSERT INTO comments_fts (rowid, text) VALUES (new.id, new.text);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS comments_fts_delete AFTER DELETE ON comments BEGIN
+        INSERT INTO comments_fts (comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS comments_fts_update AFTER UPDATE OF text ON comments BEGIN
+        INSERT INTO comments_fts (comments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        INSERT INTO comments_fts (rowid, text) VALUES (new.id, new.text);
+    END
+    '''
+]
+
+
+def fts_query(keywords: Iterable[str], match_all: bool = True) -> Optional[str]:
+    """FTS5 MATCH expression of keywords: each one a quoted prefix phrase (no query syntax leaks through)"""
+    terms = []
+    for keyword in keywords:
+        keyword = keyword.strip()
+        if keyword:
+            terms.append('"' + keyword.replace('"', '""') + '"*')
+    if not terms:
+        return None
+    return (' AND ' if match_all else ' OR ').join(terms)
+
+
+class CommentRepository:
+    """SQLite-backed comment repository with indexed filters and full-text keyword search"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv('COMMENT_DB_PATH', 'comments.db')
+        self.fts_enabled = False
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process (reopened after a fork)"""
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            for statement in SCHEMA:
+                connection.execute(statement)
+            try:
+                for statement in FTS_SCHEMA:
+                    connection.execute(statement)
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                print(f"⚠️ FTS5 unavailable ({e}), keyword search falls back to LIKE scans")
+                self.fts_enabled = False
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def exists(self) -> bool:
+        """Whether the database file exists and holds comments (does not create it)"""
+        if not os.path.exists(self.db_path):
+            return False
+        try:
+            return self.count() > 0
+        except sqlite3.Error:
+            return False
+
+    # Import
+
+    def add_comments(self, comments_by_oem: Dict[str, Iterable[Dict]], source: str = None) -> int:
+        """Insert or update comments in one transaction; returns the number of comments written"""
+        rows = []
+        for oem_name, comments in comments_by_oem.items():
+            for comment in comments:
+                timestamp = comment.get('time')
+                rows.append((
+                    stable_comment_id(comment), oem_name,
+                    int(timestamp) if isinstance(timestamp, (int, float)) else None,
+                    normalize_date(comment.get('date')),
+                    comment.get('video_id'), comment.get('author'),
+                    int(comment.get('likes') or 0), comment.get('text', ''), source,
+                    json.dumps(comment, ensure_ascii=False, default=str)
+                ))
+        if not rows:
+            return 0
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany('''
+                    INSERT INTO comments (comment_id, oem, time, date, video_id, author, likes, text, source, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (oem, comment_id) DO UPDATE SET
+                        time = excluded.time, date = excluded.date, likes = excluded.likes,
+                        source = excluded.source, data = excluded.data
+                ''', rows)
+        return len(rows)
+
+    def import_file(self, path: str, force: bool = False) -> Optional[int]:
+        """Import a scraped JSON file; returns the number of comments, or None when the file is
+        unchanged since its last import"""
+        stat = os.stat(path)
+        source = os.path.abspath(path)
+        if not force:
+            with self._lock:
+                row = self._get_connection().execute(
+                    'SELECT size, mtime_ns FROM sources WHERE path = ?', (source,)
+                ).fetchone()
+            if row == (stat.st_size, stat.st_mtime_ns):
+                return None
+
+        written = self.add_comments(comments_from_file(path), os.path.basename(path))
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO sources (path, size, mtime_ns, comments, imported_at) VALUES (?, ?, ?, ?, ?)',
+                    (source, stat.st_size, stat.st_mtime_ns, written, time.time())
+                )
+        return written
+
+    # Queries
+
+    def _where(self, oem: str = None, start_date: Any = None, end_date: Any = None,
+               start_time: int = None, end_time: int = None, keywords: Iterable[str] = None,
+               match_all: bool = True, min_likes: int = None, video_id: str = None,
+               author: str = None, sources: Iterable[str] = None) -> Tuple[str, List[Any]]:
+        """WHERE clause and parameters of the filters; date and time ranges are half-open [start, end)"""
+        clauses, params = [], []
+        if oem is not None:
+            clauses.append('oem = ?')
+            params.append(oem)
+        if start_date is not None:
+            clauses.append('date >= ?')
+            params.append(normalize_date(start_date))
+        if end_date is not None:
+            clauses.append('date < ?')
+            params.append(normalize_date(end_date))
+        if start_time is not None:
+            clauses.append('time >= ?')
+            params.append(int(start_time))
+        if end_time is not None:
+            clauses.append('time < ?')
+            params.append(int(end_time))
+        if min_likes:
+            clauses.append('likes >= ?')
+            params.append(int(min_likes))
+        if video_id is not None:
+            clauses.append('video_id = ?')
+            params.append(video_id)
+        if author is not None:
+            clauses.append('author = ?')
+            params.append(author)
+        if sources is not None:
+            # File names the comments were last imported from
+            sources = list(sources)
+            clauses.append(f"source IN ({', '.join('?' * len(sources))})" if sources else '0')
+            params.extend(sources)
+        if keywords:
+            keywords = [keyword for keyword in keywords if keyword.strip()]
+            with self._lock:
+                self._get_connection()  # Detects FTS5 support
+            if keywords and self.fts_enabled:
+                clauses.append('id IN (SELECT rowid FROM comments_fts WHERE comments_fts MATCH ?)')
+                params.append(fts_query(keywords, match_all))
+            elif keywords:
+                likes = ['text LIKE ?'] * len(keywords)
+                clauses.append('(' + (' AND ' if match_all else ' OR ').join(likes) + ')')
+                params.extend(f'%{keyword.strip()}%' for keyword in keywords)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def _execute(self, sql: str, params: List[Any]) -> List[tuple]:
+        with self._lock:
+            return self._get_connection().execute(sql, params).fetchall()
+
+    def query(self, order_by: str = 'id', limit: int = None, offset: int = 0, **filters) -> List[Dict]:
+        """Comments matching the filters (see _where), as the scraped comment dicts"""
+        where, params = self._where(**filters)
+        sql = f'SELECT data FROM comments{where} ORDER BY {ORDERINGS[order_by]}'
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params += [int(limit), int(offset)]
+        return [json.loads(data) for (data,) in self._execute(sql, params)]
+
+    def count(self, **filters) -> int:
+        """Number of comments matching the filters"""
+        where, params = self._where(**filters)
+        return self._execute(f'SELECT COUNT(*) FROM comments{where}', params)[0][0]
+
+    def oem_counts(self, **filters) -> Dict[str, int]:
+        """Comments per OEM matching the filters (OEMs in name order)"""
+        where, params = self._where(**filters)
+        rows = self._execute(f'SELECT oem, COUNT(*) FROM comments{where} GROUP BY oem ORDER BY oem', params)
+        return dict(rows)
+
+    def oem_stats(self, oem: str, real_methods: List[str] = None, **filters) -> Dict[str, Any]:
+        """Aggregates of one OEM's matching comments, computed in SQL (real comments are those with one
+        of real_methods as extraction method, default REAL_EXTRACTION_METHODS)"""
+        real_methods = real_methods or REAL_EXTRACTION_METHODS
+        where, params = self._where(oem=oem, **filters)
+        placeholders = ','.join('?' * len(real_methods))
+        row = self._execute(f'''
+            SELECT COUNT(*), AVG(likes), COUNT(DISTINCT COALESCE(author, 'Unknown')),
+                   SUM(json_extract(data, '$.extraction_method') IN ({placeholders})),
+                   COUNT(DISTINCT COALESCE(json_extract(data, '$.video_title'), 'Unknown')),
+                   MIN(date), MAX(date)
+            FROM comments{where}
+        ''', list(real_methods) + params)[0]
+        return {
+            'comments': row[0],
+            'avg_likes': row[1] or 0,
+            'unique_authors': row[2],
+            'real_comments': row[3] or 0,
+            'unique_videos': row[4],
+            'first_date': row[5],
+            'last_date': row[6]
+        }
+
+    def comments_by_oem(self, **filters) -> Dict[str, List[Dict]]:
+        """OEM -> matching comments"""
+        return {oem_name: self.query(oem=oem_name, **filters) for oem_name in self.oem_counts(**filters)}
+
+    def sources_imported_since(self, timestamp: float) -> List[str]:
+        """File names (as in the comments' source column) imported at or after a time.time() timestamp"""
+        rows = self._execute('SELECT path FROM sources WHERE imported_at >= ? ORDER BY path', [timestamp])
+        return [os.path.basename(path) for (path,) in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Repository size and import summary"""
+        sources = self._execute('SELECT COUNT(*), MAX(imported_at) FROM sources', [])[0]
+        return {
+            'db_path': self.db_path,
+            'comments': self.count(),
+            'oems': len(self.oem_counts()),
+            'sources': sources[0],
+            'last_import': datetime.fromtimestamp(sources[1]).isoformat() if sources[1] else None,
+            'fts_enabled': self.fts_enabled
+        }
+
+    def close(self):
+        """Close this process's connection"""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
+
+
+class RepositoryCommentData(Mapping):
+    """OEM -> comment list mapping over a repository; each OEM's list is queried on first access"""
+
+    def __init__(self, repository: CommentRepository):
+        self.repository = repository
+        self._counts = repository.oem_counts()
+        self._comments = {}
+
+    def __getitem__(self, oem: str) -> List[Dict]:
+        comments = self._comments.get(oem)
+        if comments is None:
+            if oem not in self._counts:
+                raise KeyError(oem)
+            comments = self._comments[oem] = self.repository.query(oem=oem)
+        return comments
+
+    def __contains__(self, oem: object) -> bool:
+        # Mapping's default would build the OEM's comments
+        return oem in self._counts
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def comment_counts(self) -> Dict[str, int]:
+        """Comments per OEM, without loading any comment"""
+        return dict(self._counts)
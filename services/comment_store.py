@@ -0,0 +1,431 @@
+"""
+Comment Store - Columnar, memory-mapped storage of scraped comments
+- One directory per ingested JSON file: a manifest plus one file per column
+  (NumPy .npy arrays for numbers and flags, UTF-8 heaps with row offsets for strings)
+- Rows are grouped by OEM, so each OEM is a contiguous row range of every column
+- Columns are opened with mmap on first use: a query only pages in the columns it reads
+- Comment dicts are only built when an OEM's comment list is accessed
+"""
+
+import os
+import json
+import time
+import glob
+import shutil
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Iterator
+
+import numpy as np
+from dateutil import parser as date_parser
+
+COMMENT_STORE_FORMAT = 1
+
+# Column kinds: NumPy dtype of the value array (string kinds keep a heap instead)
+NUMERIC_KINDS = {'int': np.int64, 'float': np.float64, 'bool': np.bool_}
+
+REAL_EXTRACTION_METHODS = ['downloader', 'ytdlp', 'real_scraping', 'working_scraper']
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def default_store_dir() -> str:
+    """Directory holding one store per ingested file (COMMENT_STORE_DIR, default comment_store)"""
+    return os.getenv('COMMENT_STORE_DIR', 'comment_store')
+
+
+def store_path_for(source_path: str, store_dir: str = None) -> str:
+    """Store directory of a scraped JSON file"""
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(store_dir or default_store_dir(), name)
+
+
+# Scraped JSON input
+
+def enhance_comment(comment: Dict, video_title: Callable[[str], str] = None) -> Dict:
+    """Copy of a comment with its video URL and title, and default extraction fields"""
+    enhanced_comment = comment.copy()
+    if 'video_id' in comment and comment['video_id']:
+        enhanced_comment['video_url'] = f"https://www.youtube.com/watch?v={comment['video_id']}"
+        title = video_title(comment['video_id']) if video_title else f"YouTube Video {comment['video_id']}"
+        if title:
+            enhanced_comment['video_title'] = title
+    if 'extraction_method' not in enhanced_comment:
+        enhanced_comment['extraction_method'] = 'youtube_api'
+    if 'verified_real' not in enhanced_comment:
+        enhanced_comment['verified_real'] = True
+    return enhanced_comment
+
+
+def read_scraped_json(path: str, video_title: Callable[[str], str] = None) -> Dict[str, List[Dict]]:
+    """Comments per OEM of a scraped JSON file (an array grouped by 'oem', a {'comments': ...}
+    wrapper, OEM -> [comments] or OEM -> year -> month -> [comments]); comments of OEM mappings
+    are enhanced with their video URL and title"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    combined_data = {}
+    if isinstance(data, list):
+        # Array format: group by OEM
+        for comment in data:
+            combined_data.setdefault(comment.get('oem', 'Unknown'), []).append(comment)
+    elif isinstance(data, dict):
+        if 'comments' in data:
+            # Metadata format with comments key
+            combined_data = data['comments']
+        else:
+            for oem_name, oem_data in data.items():
+                if isinstance(oem_data, list):
+                    # Flat format: OEM -> [comments]
+                    combined_data[oem_name] = [enhance_comment(c, video_title) for c in oem_data]
+                elif isinstance(oem_data, dict):
+                    # Nested format: OEM -> Year -> Month -> [comments]
+                    oem_comments = []
+                    for year_data in oem_data.values():
+                        if isinstance(year_data, dict):
+                            for comments in year_data.values():
+                                if isinstance(comments, list):
+                                    oem_comments.extend(comments)
+                        elif isinstance(year_data, list):
+                            oem_comments.extend(year_data)
+                    combined_data[oem_name] = [enhance_comment(c, video_title) for c in oem_comments]
+    return combined_data
+
+
+def is_real_comment(comment: Dict) -> bool:
+    """Proper YouTube metadata, a scraping extraction method or the verified_real flag"""
+    return bool(comment.get('extraction_method') in REAL_EXTRACTION_METHODS or
+                comment.get('verified_real') == True or
+                ('youtube.com' in comment.get('video_url', '') and
+                 comment.get('video_id') and
+                 comment.get('author')) or
+                (comment.get('video_id') and len(comment.get('video_id', '')) > 5 and comment.get('author')))
+
+
+def real_comments_by_oem(combined_data: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """Only the real comments of every OEM (OEMs left without comments are dropped)"""
+    filtered_data = {}
+    for oem_name, comments in combined_data.items():
+        real_comments = [comment for comment in comments if is_real_comment(comment)]
+        if real_comments:
+            filtered_data[oem_name] = real_comments
+    return filtered_data
+
+
+def comments_from_file(path: str) -> Dict[str, List[Dict]]:
+    """Comments per OEM of a scraped file: the real comments of an all-OEM dataset (as the agent loads
+    them), or every comment of a per-video file grouped by its 'oem' field"""
+    if os.path.basename(path).startswith('comments_'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            comments_by_oem = {}
+            for comment in data:
+                comments_by_oem.setdefault(comment.get('oem', 'Unknown'), []).append(comment)
+            return comments_by_oem
+    return real_comments_by_oem(read_scraped_json(path))
+
+
+def scraped_source_paths(directory: str = '.') -> List[str]:
+    """Every scraped comment file of a directory the agent treats as real data: per-video comments_*
+    files, all_oem_comments_* and real_youtube_comments_* datasets (not the enhanced datasets)"""
+    paths = []
+    for pattern in ['comments_*.json', 'all_oem_comments_*.json', 'real_youtube_comments_*.json']:
+        paths.extend(glob.glob(os.path.join(directory, pattern)))
+    excluded = set(glob.glob(os.path.join(directory, 'all_oem_comments_*_enhanced_*.json')))
+    return sorted(os.path.normpath(path) for path in paths if path not in excluded)
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """A comment date as 'YYYY-MM-DD HH:MM:SS' (sortable text), or None when it does not parse"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    try:
+        return datetime.strptime(value, DATE_FORMAT).strftime(DATE_FORMAT)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return date_parser.parse(str(value)).replace(tzinfo=None).strftime(DATE_FORMAT)
+    except (ValueError, OverflowError):
+        return None
+
+
+# Writing
+
+def _column_kind(values: List[Any]) -> str:
+    """Narrowest column kind holding every present value exactly"""
+    types = {type(value) for value in values}
+    if types == {bool}:
+        return 'bool'
+    if types == {int} and all(-2 ** 63 <= value < 2 ** 63 for value in values):
+        return 'int'
+    if types == {float}:
+        return 'float'
+    if types == {str}:
+        return 'str'
+    return 'json'
+
+
+def _write_heap(directory: str, name: str, strings: List[str]):
+    """UTF-8 heap of a string column plus its row offsets"""
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.array([len(value) for value in encoded], dtype=np.int64), out=offsets[1:])
+    with open(os.path.join(directory, f'{name}.heap'), 'wb') as f:
+        f.write(b''.join(encoded))
+    np.save(os.path.join(directory, f'{name}.offsets.npy'), offsets)
+
+
+def write_comment_store(comments_by_oem: Dict[str, List[Dict]], path: str,
+                        source_path: str = None) -> Dict[str, Any]:
+    """Write comments per OEM as a columnar store (replacing any store at path); returns the manifest"""
+    rows = [comment for comments in comments_by_oem.values() for comment in comments]
+    oems = []
+    start = 0
+    for oem_name, comments in comments_by_oem.items():
+        oems.append({'name': oem_name, 'start': start, 'stop': start + len(comments)})
+        start += len(comments)
+
+    # Columns in first-seen key order
+    names = list(dict.fromkeys(key for comment in rows for key in comment))
+
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+    columns = {}
+    for index, name in enumerate(names):
+        file_name = f'c{index}'
+        present = np.array([name in comment for comment in rows], dtype=np.bool_)
+        values = [comment[name] for comment in rows if name in comment]
+        kind = _column_kind(values)
+        # Absent rows hold a placeholder, so every column is indexed by row
+        if kind in NUMERIC_KINDS:
+            filled = np.zeros(len(rows), dtype=NUMERIC_KINDS[kind])
+            filled[present] = values
+            np.save(os.path.join(temp_path, f'{file_name}.npy'), filled)
+        else:
+            encode = (lambda value: value) if kind == 'str' else \
+                (lambda value: json.dumps(value, ensure_ascii=False))
+            _write_heap(temp_path, file_name,
+                        [encode(comment[name]) if name in comment else '' for comment in rows])
+        column = {'kind': kind, 'file': file_name}
+        if not present.all():
+            np.save(os.path.join(temp_path, f'{file_name}.present.npy'), present)
+            column['sparse'] = True
+        columns[name] = column
+
+    manifest = {
+        'format': COMMENT_STORE_FORMAT,
+        'rows': len(rows),
+        'oems': oems,
+        'columns': columns,
+        'created_at': time.time()
+    }
+    if source_path:
+        stat = os.stat(source_path)
+        manifest['source'] = {'path': os.path.abspath(source_path), 'size': stat.st_size,
+                              'mtime_ns': stat.st_mtime_ns}
+    with open(os.path.join(temp_path, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(temp_path, path)
+    return manifest
+
+
+def ingest_scraped_json(source_path: str, store_dir: str = None,
+                        video_title: Callable[[str], str] = None) -> Dict[str, Any]:
+    """Convert a scraped JSON file into its store (the real comments the agent would load)"""
+    comments_by_oem = real_comments_by_oem(read_scraped_json(source_path, video_title))
+    return write_comment_store(comments_by_oem, store_path_for(source_path, store_dir), source_path)
+
+
+# Reading
+
+def _decode_json(value: str) -> Any:
+    return json.loads(value) if value else None
+
+
+class StringColumn:
+    """Read-only view of a string (or JSON) column over a row range"""
+
+    def __init__(self, heap: np.ndarray, offsets: np.ndarray, decode: Callable[[str], Any] = None):
+        self.heap = heap
+        self.offsets = offsets
+        self.decode = decode
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        value = self.heap[self.offsets[index]:self.offsets[index + 1]].tobytes().decode('utf-8')
+        return self.decode(value) if self.decode else value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+    def byte_lengths(self) -> np.ndarray:
+        """Encoded length of every value (no string is decoded)"""
+        return np.diff(self.offsets)
+
+    def tolist(self) -> List[Any]:
+        """Every value, decoding the row range's heap slice once"""
+        if len(self) == 0:
+            return []
+        base = int(self.offsets[0])
+        buffer = self.heap[base:int(self.offsets[-1])].tobytes()
+        bounds = (self.offsets - base).tolist()
+        values = [buffer[start:stop].decode('utf-8') for start, stop in zip(bounds, bounds[1:])]
+        return [self.decode(value) for value in values] if self.decode else values
+
+
+class CommentStore:
+    """Read side of one store directory; columns are memory-mapped on first use"""
+
+    def __init__(self, path: str, manifest: Dict[str, Any]):
+        self.path = path
+        self.manifest = manifest
+        self.rows = manifest['rows']
+        self.oem_ranges = {oem['name']: (oem['start'], oem['stop']) for oem in manifest['oems']}
+        self.columns = manifest['columns']
+        self._arrays = {}
+
+    @classmethod
+    def open(cls, path: str) -> 'CommentStore':
+        """Open a store directory (reads only its manifest)"""
+        with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') != COMMENT_STORE_FORMAT:
+            raise ValueError(f"Unsupported comment store format in {path}: {manifest.get('format')}")
+        return cls(path, manifest)
+
+    @property
+    def oems(self) -> List[str]:
+        return list(self.oem_ranges)
+
+    def is_current(self, source_path: str) -> bool:
+        """True if the store was ingested from the source file as it is now"""
+        source = self.manifest.get('source')
+        if not source:
+            return False
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        return stat.st_size == source['size'] and stat.st_mtime_ns == source['mtime_ns']
+
+    def count(self, oem: str = None) -> int:
+        """Number of comments (of one OEM)"""
+        if oem is None:
+            return self.rows
+        start, stop = self.oem_ranges[oem]
+        return stop - start
+
+    def _array(self, file_name: str) -> np.ndarray:
+        array = self._arrays.get(file_name)
+        if array is None:
+            path = os.path.join(self.path, file_name)
+            if file_name.endswith('.heap'):
+                # A zero-length file cannot be mapped
+                array = np.memmap(path, dtype=np.uint8, mode='r') if os.path.getsize(path) else \
+                    np.empty(0, dtype=np.uint8)
+            else:
+                array = np.load(path, mmap_mode='r')
+            self._arrays[file_name] = array
+        return array
+
+    def _range(self, oem: Optional[str]) -> slice:
+        if oem is None:
+            return slice(0, self.rows)
+        return slice(*self.oem_ranges[oem])
+
+    def column(self, name: str, oem: str = None):
+        """Values of one column (of one OEM): a memory-mapped NumPy array for numeric and flag
+        columns, a StringColumn for string and JSON columns; absent rows hold 0, '' or None"""
+        column = self.columns[name]
+        rows = self._range(oem)
+        if column['kind'] in NUMERIC_KINDS:
+            return self._array(f"{column['file']}.npy")[rows]
+        offsets = self._array(f"{column['file']}.offsets.npy")[rows.start:rows.stop + 1]
+        return StringColumn(self._array(f"{column['file']}.heap"), offsets,
+                            _decode_json if column['kind'] == 'json' else None)
+
+    def present(self, name: str, oem: str = None) -> np.ndarray:
+        """Which rows have the field"""
+        column = self.columns[name]
+        rows = self._range(oem)
+        if not column.get('sparse'):
+            return np.ones(rows.stop - rows.start, dtype=np.bool_)
+        return self._array(f"{column['file']}.present.npy")[rows]
+
+    def isin(self, name: str, values: List[Any], oem: str = None) -> np.ndarray:
+        """Which rows have the field set to one of the values (all False for a missing column)"""
+        rows = self._range(oem)
+        if name not in self.columns:
+            return np.zeros(rows.stop - rows.start, dtype=np.bool_)
+        column = self.column(name, oem)
+        if isinstance(column, StringColumn):
+            column = np.array(column.tolist(), dtype=object)
+        return np.isin(column, values) & self.present(name, oem)
+
+    def comments(self, oem: str) -> List[Dict]:
+        """Comment dicts of one OEM, built column by column"""
+        count = self.count(oem)
+        rows = [{} for _ in range(count)]
+        for name, column in self.columns.items():
+            values = self.column(name, oem).tolist()
+            if column.get('sparse'):
+                for row, value, present in zip(rows, values, self.present(name, oem).tolist()):
+                    if present:
+                        row[name] = value
+            else:
+                for row, value in zip(rows, values):
+                    row[name] = value
+        return rows
+
+
+def open_current_store(source_path: str, store_dir: str = None) -> Optional[CommentStore]:
+    """The store of a scraped JSON file, or None when it was not ingested or the file changed since"""
+    path = store_path_for(source_path, store_dir)
+    if not os.path.exists(os.path.join(path, 'manifest.json')):
+        return None
+    try:
+        store = CommentStore.open(path)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable comment store {path}: {e}")
+        return None
+    return store if store.is_current(source_path) else None
+
+
+class StoredCommentData(Mapping):
+    """OEM -> comment list mapping over a store; each OEM's list is built on first access"""
+
+    def __init__(self, store: CommentStore):
+        self.store = store
+        self._comments = {}
+
+    def __getitem__(self, oem: str) -> List[Dict]:
+        comments = self._comments.get(oem)
+        if comments is None:
+            if oem not in self.store.oem_ranges:
+                raise KeyError(oem)
+            comments = self._comments[oem] = self.store.comments(oem)
+        return comments
+
+    def __contains__(self, oem: object) -> bool:
+        # Mapping's default would build the OEM's comments
+        return oem in self.store.oem_ranges
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.oem_ranges)
+
+    def __len__(self) -> int:
+        return len(self.store.oem_ranges)
+
+    def comment_counts(self) -> Dict[str, int]:
+        """Comments per OEM, without building any comment"""
+        return {oem: self.store.count(oem) for oem in self.store.oem_ranges}
@@ -0,0 +1,122 @@
+"""
+Compact Classification - Memory-light classification records with lazy detail
+- __slots__ records keep only the scalar fields used for filtering and summaries
+- Full nested analysis (language, emoji, company, patterns, factors) is recomputed on first access
+- Read-only mapping interface, so existing dict-style consumers keep working
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any, Optional
+
+
+class CompactClassification(Mapping):
+    """Compact view of one advanced_sentiment_classification result"""
+
+    CORE_FIELDS = ('sentiment', 'confidence', 'sarcasm_detected', 'sarcasm_score',
+                   'product_relevance', 'relevance_score', 'context')
+    SUMMARY_FIELDS = ('primary_language', 'is_mixed', 'has_emojis', 'primary_company',
+                      'engagement_level', 'engagement_score')
+
+    __slots__ = CORE_FIELDS + SUMMARY_FIELDS + ('_comment', '_target_oem', '_classifier', '_detail',
+                                                '_is_default', '_is_fast_path')
+
+    def __init__(self, classification: Dict[str, Any], comment: Dict, target_oem: Optional[str] = None,
+                 classifier: Any = None):
+        for field in self.CORE_FIELDS:
+            setattr(self, field, classification.get(field))
+
+        language_info = classification.get('language_analysis', {})
+        emoji_info = classification.get('emoji_analysis', {})
+        company_info = classification.get('company_analysis', {})
+        engagement_info = classification.get('engagement_analysis', {})
+        self.primary_language = language_info.get('primary_language', 'unknown')
+        self.is_mixed = language_info.get('is_mixed', False)
+        self.has_emojis = emoji_info.get('has_emojis', False)
+        self.primary_company = company_info.get('primary_company') if company_info.get('has_mentions', False) else None
+        self.engagement_level = engagement_info.get('engagement_level', 'none')
+        self.engagement_score = engagement_info.get('engagement_score', 0)
+
+        self._comment = comment
+        self._target_oem = target_oem
+        self._classifier = classifier
+        self._detail = None
+        self._is_default = classification.get('analysis_method') == 'default'
+        self._is_fast_path = classification.get('analysis_method') == 'tiered_fast_path'
+
+    def detail(self) -> Dict[str, Any]:
+        """Materialise the full classification dict (recomputed once, then kept)"""
+        if self._detail is None:
+            if self._classifier is None:
+                raise ValueError("Full classification detail is not available without a classifier")
+            if self._is_default:
+                self._detail = self._classifier._create_default_classification()
+            else:
+                self._detail = self._classifier.classify_comment(self._comment, self._target_oem,
+                                                                 tiered=self._is_fast_path)
+        return self._detail
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the full classification (e.g. for JSON serialisation)"""
+        return dict(self.detail())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.CORE_FIELDS:
+            return getattr(self, key)
+        return self.detail()[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.CORE_FIELDS:
+            return True
+        return key in self.detail()
+
+    def __iter__(self):
+        return iter(self.detail())
+
+    def __len__(self) -> int:
+        return len(self.detail())
+
+    def __repr__(self) -> str:
+        return (f"CompactClassification(sentiment={self.sentiment!r}, confidence={self.confidence!r}, "
+                f"context={self.context!r}, primary_company={self.primary_company!r})")
+
+
+class CompactSentimentView(Mapping):
+    """Legacy `sentiment_classification` view over a CompactClassification"""
+
+    DIRECT_FIELDS = CompactClassification.CORE_FIELDS
+
+    __slots__ = ('record',)
+
+    def __init__(self, record: CompactClassification):
+        self.record = record
+
+    def __getitem__(self, key: str) -> Any:
+        record = self.record
+        if key in self.DIRECT_FIELDS:
+            return getattr(record, key)
+        if key == 'language_mix':
+            return record.is_mixed
+        if key == 'analysis_method':
+            return 'advanced_multi_layer_v2'
+        if key == 'key_factors':
+            return record.detail().get('classification_factors', [])
+        if key == 'advanced_features':
+            detail = record.detail()
+            return {
+                'emoji_analysis': detail['emoji_analysis'],
+                'company_analysis': detail['company_analysis'],
+                'engagement_analysis': detail['engagement_analysis'],
+                'language_breakdown': detail['language_analysis'],
+                'context_details': detail.get('context_details', {})
+            }
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.DIRECT_FIELDS + ('language_mix', 'analysis_method', 'key_factors', 'advanced_features'))
+
+    def __len__(self) -> int:
+        return len(self.DIRECT_FIELDS) + 4
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy including the lazily materialised fields"""
+        return {key: self[key] for key in self}
@@ -0,0 +1,193 @@
+"""
+Data Watcher - Background change detection for the comment data files
+- Keeps an in-memory manifest (path -> size, mtime) of every scraped comment file, the consolidated
+  dataset manifest and the comment repository database
+- A background thread rescans when the file system reports a change to a data file (inotify through
+  watchdog, where available) and at least every DATA_WATCH_INTERVAL seconds (the polling rate when
+  file system events are unavailable)
+- Every manifest change bumps an integer dataset version, so requests compare one integer instead of
+  globbing and stat-ing the data files
+- The thread is started lazily per process, so a watcher created before a fork keeps working
+"""
+
+import os
+import time
+import fnmatch
+import threading
+from typing import Dict, Any, List, Tuple
+
+from .comment_store import scraped_source_paths
+from .comment_dataset import default_dataset_dir
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    _WATCHDOG_AVAILABLE = True
+except ImportError:
+    _WATCHDOG_AVAILABLE = False
+
+# Names of files whose changes trigger a rescan (a superset of the scanned files is fine)
+WATCHED_PATTERNS = ['comments_*.json', 'all_oem_comments_*.json', 'real_youtube_comments_*.json', 'manifest.json']
+
+
+if _WATCHDOG_AVAILABLE:
+    class _DataFileEventHandler(FileSystemEventHandler):
+        """Wakes the scan thread on events concerning data files"""
+
+        def __init__(self, watcher: 'DataWatcher'):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            paths = [getattr(event, 'src_path', ''), getattr(event, 'dest_path', '')]
+            if any(path and self.watcher.is_data_file(os.fsdecode(path)) for path in paths):
+                self.watcher.request_scan()
+
+
+class DataWatcher:
+    """In-memory manifest of the data files and a version number that changes with it"""
+
+    def __init__(self, directory: str = '.', scan_interval: float = None, dataset_dir: str = None,
+                 repository_path: str = None, use_events: bool = True):
+        self.directory = directory
+        self.scan_interval = scan_interval if scan_interval is not None else \
+            float(os.getenv('DATA_WATCH_INTERVAL', '30'))
+        self.dataset_dir = dataset_dir or default_dataset_dir()
+        self.repository_path = repository_path or os.getenv('COMMENT_DB_PATH', 'comments.db')
+        self.use_events = use_events and _WATCHDOG_AVAILABLE
+        if use_events and not _WATCHDOG_AVAILABLE:
+            print(f"⚠️ watchdog not installed, polling data files every {self.scan_interval}s")
+        self.version = 0
+        self.files = {}
+        self.scans = 0
+        self.last_scan = None
+        self.last_change = None
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+        self._pid = None
+
+    def _extra_paths(self) -> List[str]:
+        """Data files besides the scraped files: dataset manifest and repository database (with WAL)"""
+        return [os.path.join(self.dataset_dir, 'manifest.json'), self.repository_path, f'{self.repository_path}-wal']
+
+    def is_data_file(self, path: str) -> bool:
+        """Whether a changed path can affect the manifest"""
+        name = os.path.basename(path)
+        if any(fnmatch.fnmatch(name, pattern) for pattern in WATCHED_PATTERNS):
+            return True
+        return os.path.abspath(path) in {os.path.abspath(extra) for extra in self._extra_paths()}
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        files = {}
+        for path in scraped_source_paths(self.directory) + self._extra_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def scan(self) -> bool:
+        """Rescan the data files; bumps the version and returns True when anything changed"""
+        files = self._snapshot()
+        with self._lock:
+            self.scans += 1
+            self.last_scan = time.time()
+            if files == self.files and self.version:
+                return False
+            if self.version:
+                added = len(files.keys() - self.files.keys())
+                removed = len(self.files.keys() - files.keys())
+                modified = sum(1 for path in files.keys() & self.files.keys() if files[path] != self.files[path])
+                print(f"🔔 Data files changed: {added} added, {modified} modified, {removed} removed "
+                      f"(dataset version {self.version + 1})")
+            self.files = files
+            self.version += 1
+            self.last_change = self.last_scan
+            return True
+
+    def request_scan(self):
+        """Ask the scan thread for a rescan (called on file system events)"""
+        self._wake.set()
+
+    def ensure_running(self) -> int:
+        """Start the watcher in this process if needed (first scan runs synchronously); returns the
+        current dataset version"""
+        if self._pid != os.getpid():
+            with self._start_lock:
+                if self._pid != os.getpid():
+                    self._start()
+        return self.version
+
+    def _start(self):
+        self._pid = os.getpid()
+        self._stop.clear()
+        self._observer = None
+        # The version carries over a fork: it only moves when the files differ from the inherited scan
+        self.scan()
+        if self.use_events:
+            try:
+                observer = Observer()
+                handler = _DataFileEventHandler(self)
+                observer.schedule(handler, self.directory, recursive=False)
+                for path in [self.dataset_dir, os.path.dirname(os.path.abspath(self.repository_path))]:
+                    if os.path.isdir(path) and os.path.abspath(path) != os.path.abspath(self.directory):
+                        observer.schedule(handler, path, recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+            except Exception as e:
+                print(f"⚠️ File system events unavailable ({e}), polling data files every {self.scan_interval}s")
+        self._thread = threading.Thread(target=self._run, name='data-watcher', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            woken = self._wake.wait(self.scan_interval)
+            if self._stop.is_set():
+                break
+            if woken:
+                # Let a burst of writes (a scraper saving several files) settle into one rescan
+                time.sleep(0.2)
+                self._wake.clear()
+            try:
+                self.scan()
+            except Exception as e:
+                print(f"⚠️ Data file scan failed: {e}")
+
+    def stop(self):
+        """Stop the background thread and file system observer"""
+        self._stop.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=5)
+        self._thread = None
+        self._pid = None
+        self._wake.clear()
+
+    @property
+    def mode(self) -> str:
+        """'events' (inotify on Linux) or 'polling'"""
+        return 'events' if self._observer is not None else 'polling'
+
+    def get_status(self) -> Dict[str, Any]:
+        """Watcher state for health reporting"""
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'mode': self.mode,
+            'observer': type(self._observer).__name__ if self._observer is not None else None,
+            'dataset_version': self.version,
+            'data_files': len(self.files),
+            'scan_interval_seconds': self.scan_interval,
+            'scans': self.scans,
+            'last_scan': self.last_scan,
+            'last_change': self.last_change
+        }
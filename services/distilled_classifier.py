@@ -0,0 +1,245 @@
+"""
+Distilled Sentiment Model - Linear student of the rule classifier for dashboard-scale aggregates
+- Hashed word unigram/bigram features (punctuation and emojis are tokens too) and an SGD logistic
+  model trained offline on AdvancedSentimentClassifier labels
+- Only the weights, the vectorizer settings and the fallback margin are saved, in one .npz file
+- A batch is scored as one sparse matrix product; comments whose margin between the two best
+  classes is below the model's threshold fall back to the full rule pipeline
+- scikit-learn is optional: without it no model is loaded and callers keep the rule path
+"""
+
+import os
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import SGDClassifier
+    _SKLEARN_AVAILABLE = True
+except ImportError:
+    _SKLEARN_AVAILABLE = False
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+
+DEFAULT_VECTORIZER = {
+    'n_features': 2 ** 20,
+    'ngram_range': (1, 2),
+    'token_pattern': r'\w+|[^\w\s]',
+}
+
+
+def _make_vectorizer(settings: Dict[str, Any]) -> 'HashingVectorizer':
+    return HashingVectorizer(n_features=settings['n_features'], ngram_range=tuple(settings['ngram_range']),
+                             token_pattern=settings['token_pattern'], alternate_sign=False, norm='l2')
+
+
+def _agreement(predicted: List[str], expected: List[str]) -> Dict[str, Any]:
+    """Agreement rate, confusion matrix and per-class precision/recall against reference labels"""
+    total = len(expected)
+    confusion = {actual: {label: 0 for label in SENTIMENTS} for actual in SENTIMENTS}
+    for label, actual in zip(predicted, expected):
+        confusion.setdefault(actual, {s: 0 for s in SENTIMENTS})[label] += 1
+
+    per_class = {}
+    for sentiment in SENTIMENTS:
+        true_positive = confusion[sentiment][sentiment]
+        predicted_count = sum(row[sentiment] for row in confusion.values())
+        actual_count = sum(confusion[sentiment].values())
+        per_class[sentiment] = {
+            'precision': round(true_positive / predicted_count, 3) if predicted_count else 0.0,
+            'recall': round(true_positive / actual_count, 3) if actual_count else 0.0,
+            'support': actual_count
+        }
+
+    agreed = sum(1 for label, actual in zip(predicted, expected) if label == actual)
+    return {
+        'comments': total,
+        'agreement': round(agreed / total, 4) if total else 0.0,
+        'per_class': per_class,
+        'confusion': confusion
+    }
+
+
+class DistilledSentimentModel:
+    """Hashed bag-of-ngrams linear model distilled from the rule classifier"""
+
+    def __init__(self, coef: np.ndarray, intercept: np.ndarray, classes: List[str],
+                 vectorizer: Dict[str, Any] = None, min_margin: float = 0.0, rule_version: str = ''):
+        if not _SKLEARN_AVAILABLE:
+            raise ImportError("scikit-learn is required for the distilled sentiment model")
+        self.coef = np.asarray(coef, dtype=np.float32)
+        self.intercept = np.asarray(intercept, dtype=np.float32)
+        self.classes = [str(label) for label in classes]
+        self.vectorizer_settings = dict(vectorizer or DEFAULT_VECTORIZER)
+        self.min_margin = float(min_margin)
+        self.rule_version = rule_version
+        self._vectorizer = _make_vectorizer(self.vectorizer_settings)
+        # Weights transposed once so a batch is a single (comments x features) @ (features x classes)
+        self._weights = np.ascontiguousarray(self.coef.T)
+
+    @classmethod
+    def train(cls, texts: List[str], labels: List[str], fallback_rate: float = 0.1,
+              alpha: float = 3e-7, epochs: int = 30, rule_version: str = '',
+              vectorizer: Dict[str, Any] = None) -> 'DistilledSentimentModel':
+        """Fit on rule-labelled texts; min_margin is set so that fallback_rate of the training
+        texts (the least certain ones) go to the rule pipeline"""
+        if not _SKLEARN_AVAILABLE:
+            raise ImportError("scikit-learn is required to train the distilled sentiment model")
+        settings = dict(vectorizer or DEFAULT_VECTORIZER)
+        features = _make_vectorizer(settings).transform(texts)
+        model = SGDClassifier(loss='log_loss', alpha=alpha, max_iter=epochs, tol=None, random_state=0)
+        model.fit(features, labels)
+
+        distilled = cls(model.coef_, model.intercept_, list(model.classes_), settings, 0.0, rule_version)
+        _, margins = distilled._scores(features)
+        distilled.min_margin = float(np.quantile(margins, fallback_rate)) if fallback_rate > 0 else 0.0
+        return distilled
+
+    def save(self, path: str):
+        """Write the weights and settings to a compressed .npz file"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as handle:
+            np.savez_compressed(
+                handle, coef=self.coef, intercept=self.intercept, classes=np.array(self.classes),
+                n_features=self.vectorizer_settings['n_features'],
+                ngram_range=np.array(self.vectorizer_settings['ngram_range']),
+                token_pattern=self.vectorizer_settings['token_pattern'],
+                min_margin=self.min_margin, rule_version=self.rule_version
+            )
+
+    @classmethod
+    def load(cls, path: str) -> 'DistilledSentimentModel':
+        with np.load(path, allow_pickle=False) as data:
+            vectorizer = {
+                'n_features': int(data['n_features']),
+                'ngram_range': tuple(int(n) for n in data['ngram_range']),
+                'token_pattern': str(data['token_pattern']),
+            }
+            return cls(data['coef'], data['intercept'], list(data['classes']), vectorizer,
+                       float(data['min_margin']), str(data['rule_version']))
+
+    def _scores(self, features) -> Tuple[np.ndarray, np.ndarray]:
+        """Decision scores (comments x classes) and the margin between the two best classes"""
+        scores = np.asarray(features @ self._weights) + self.intercept
+        if scores.shape[1] < 2:
+            return scores, np.full(scores.shape[0], np.inf)
+        top_two = np.partition(scores, -2, axis=1)[:, -2:]
+        return scores, top_two[:, 1] - top_two[:, 0]
+
+    def predict(self, texts: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Predicted sentiments and margins of a batch of texts"""
+        if not texts:
+            return [], np.zeros(0)
+        scores, margins = self._scores(self._vectorizer.transform(texts))
+        classes = np.array(self.classes)
+        return classes[scores.argmax(axis=1)].tolist(), margins
+
+
+class DistilledSentimentScorer:
+    """Scores comment batches with the distilled model, deferring low-margin comments to the rules"""
+
+    def __init__(self, model: DistilledSentimentModel, classifier, min_margin: float = None):
+        self.model = model
+        self.classifier = classifier
+        self.min_margin = model.min_margin if min_margin is None else min_margin
+        self.stats = {'comments': 0, 'distilled': 0, 'fallback': 0, 'distilled_time': 0.0, 'fallback_time': 0.0}
+        if model.rule_version and model.rule_version != getattr(classifier, 'rule_version', model.rule_version):
+            print("⚠️ Distilled sentiment model was trained on an older rule version; consider retraining")
+
+    @classmethod
+    def from_env(cls, classifier) -> Optional['DistilledSentimentScorer']:
+        """Load the model from DISTILLED_MODEL_PATH if it exists (None when unavailable or disabled)"""
+        if os.getenv('DISTILLED_MODEL_ENABLED', 'true').lower() != 'true':
+            return None
+        path = os.getenv('DISTILLED_MODEL_PATH', 'models/distilled_sentiment.npz')
+        if not os.path.exists(path):
+            return None
+        if not _SKLEARN_AVAILABLE:
+            print("⚠️ scikit-learn not installed, distilled sentiment model disabled")
+            return None
+        try:
+            model = DistilledSentimentModel.load(path)
+        except Exception as e:
+            print(f"⚠️ Could not load distilled sentiment model: {e}")
+            return None
+        min_margin = os.getenv('DISTILLED_MIN_MARGIN')
+        print(f"✅ Distilled sentiment model loaded from {path}")
+        return cls(model, classifier, float(min_margin) if min_margin else None)
+
+    def _predict(self, comments: List[Dict]) -> Tuple[List[str], np.ndarray]:
+        """Distilled labels and margins (empty texts are neutral without scoring, as in the rules)"""
+        texts = [comment.get('text', '') or '' for comment in comments]
+        predictions, margins = self.model.predict(texts)
+        for i, text in enumerate(texts):
+            if not text:
+                predictions[i] = 'neutral'
+                margins[i] = np.inf
+        return predictions, margins
+
+    def score_batch(self, comments: List[Dict], target_oem: str = None) -> List[Dict[str, Any]]:
+        """Sentiment of every comment: {'sentiment', 'margin', 'method': 'distilled' | 'rules'}"""
+        start_time = time.perf_counter()
+        predictions, margins = self._predict(comments)
+        results = [{'sentiment': label, 'margin': float(margin), 'method': 'distilled'}
+                   for label, margin in zip(predictions, margins)]
+        uncertain = [i for i, margin in enumerate(margins) if margin < self.min_margin]
+        distilled_done = time.perf_counter()
+
+        if uncertain:
+            classified = [comment for chunk in self.classifier.iter_classify(
+                [comments[i] for i in uncertain], target_oem, compact=True) for comment in chunk]
+            for i, comment in zip(uncertain, classified):
+                results[i]['sentiment'] = comment['advanced_sentiment_classification'].get('sentiment', 'neutral')
+                results[i]['method'] = 'rules'
+
+        self.stats['comments'] += len(comments)
+        self.stats['fallback'] += len(uncertain)
+        self.stats['distilled'] += len(comments) - len(uncertain)
+        self.stats['distilled_time'] += distilled_done - start_time
+        self.stats['fallback_time'] += time.perf_counter() - distilled_done
+        return results
+
+    def sentiment_distribution(self, comments: List[Dict], target_oem: str = None) -> Dict[str, int]:
+        """Sentiment counts of a batch (the dashboard aggregate)"""
+        counts = {sentiment: 0 for sentiment in SENTIMENTS}
+        for result in self.score_batch(comments, target_oem):
+            counts[result['sentiment']] = counts.get(result['sentiment'], 0) + 1
+        return counts
+
+    def agreement_report(self, comments: List[Dict], target_oem: str = None,
+                         rule_labels: List[str] = None) -> Dict[str, Any]:
+        """Agreement of the distilled model alone and of the scorer (with fallback) with the rule labels
+        (computed with the full classifier when rule_labels are not given)"""
+        if rule_labels is None:
+            rule_labels = [comment['advanced_sentiment_classification'].get('sentiment', 'neutral')
+                           for chunk in self.classifier.iter_classify(comments, target_oem, compact=True)
+                           for comment in chunk]
+        predictions, margins = self._predict(comments)
+        confident = [i for i, margin in enumerate(margins) if margin >= self.min_margin]
+        # Fallback comments get exactly the rule label
+        scored = [label if margin >= self.min_margin else rule_label
+                  for label, margin, rule_label in zip(predictions, margins, rule_labels)]
+
+        return {
+            'min_margin': round(self.min_margin, 4),
+            'coverage': round(len(confident) / len(comments), 4) if comments else 0.0,
+            'distilled_only': _agreement(predictions, rule_labels),
+            'confident_only': _agreement([predictions[i] for i in confident], [rule_labels[i] for i in confident]),
+            'with_fallback': _agreement(scored, rule_labels)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Distilled vs fallback counts and throughput"""
+        comments = self.stats['comments']
+        total_time = self.stats['distilled_time'] + self.stats['fallback_time']
+        return {
+            'comments': comments,
+            'distilled': self.stats['distilled'],
+            'fallback': self.stats['fallback'],
+            'fallback_percentage': round(self.stats['fallback'] / comments * 100, 1) if comments else 0.0,
+            'comments_per_sec': round(comments / total_time) if total_time else 0
+        }
@@ -3,6 +3,7 @@ Enhanced Agent Service - Combines YouTube Comments with Google Search and Gemini
 """
 
 import asyncio
+import heapq
 import time
 import json
 import os
@@ -18,6 +19,14 @@ from .temporal_analysis_service import TemporalAnalysisService
 from .conversation_memory_service import ConversationMemoryService
 from .enhanced_sentiment_analyzer import EnhancedSentimentAnalyzer
 from .conversation_memory_service import ConversationMemoryService
+from .feature_index import FeatureIndex
+from .batch_summary import BatchSummaryAccumulator
+from .comment_store import open_current_store, read_scraped_json, real_comments_by_oem, StoredCommentData
+from .comment_repository import CommentRepository, RepositoryCommentData
+from .comment_dataset import open_dataset, DatasetCommentData
+from .query_planner import OEM_ALIASES, QueryPlan, plan_query, load_planned_comments
+from .data_watcher import DataWatcher
+from .classification_refresh import changed_comment_batches, refresh_classifications
 
 class EnhancedAgentService:
     def __init__(self):
@@ -29,19 +38,40 @@ class EnhancedAgentService:
         self.memory_service = ConversationMemoryService()
         self.sentiment_analyzer = EnhancedSentimentAnalyzer()
         self.youtube_data_cache = {}
+        self.comment_repository = (CommentRepository()
+                                   if os.getenv('COMMENT_REPOSITORY_ENABLED', 'true').lower() == 'true' else None)
+        self.data_watcher = DataWatcher() if os.getenv('DATA_WATCH_ENABLED', 'true').lower() == 'true' else None
+        self._loaded_data_version = None
+        self._data_loaded_at = None
+        self._classification_refresh = None
+        self.feature_index = None
+        self._feature_index_data = None
 
     async def load_youtube_data(self, force_refresh: bool = False, use_enhanced_scraping: bool = False, auto_update: bool = True) -> Dict[str, Any]:
         """Load or refresh YouTube comment data with REAL data priority"""
         
         # Check for newer data files if auto_update is enabled
         if auto_update and self.youtube_data_cache:
-            newer_files = self._check_for_newer_data()
-            if newer_files:
-                print("🔄 Found newer data files, updating cache...")
-                force_refresh = True
+            if self.data_watcher:
+                # The watcher rescans the data files in the background; a request only compares versions
+                if self.data_watcher.ensure_running() != self._loaded_data_version:
+                    print(f"🔄 Dataset version {self.data_watcher.version} is newer than the cached data, updating cache...")
+                    force_refresh = True
+            else:
+                newer_files = self._check_for_newer_data()
+                if newer_files:
+                    print("🔄 Found newer data files, updating cache...")
+                    force_refresh = True
         
         if not self.youtube_data_cache or force_refresh:
+            if self.data_watcher:
+                # Taken before loading, so files changing during the load trigger another refresh
+                self._loaded_data_version = self.data_watcher.ensure_running()
+            is_refresh = bool(self.youtube_data_cache)
+            previous_data, previous_loaded_at = self.youtube_data_cache, self._data_loaded_at
+            self._data_loaded_at = time.time()
             print("🔄 Loading YouTube comment data...")
+            dataset = None if use_enhanced_scraping else open_dataset()
             
             if use_enhanced_scraping:
                 print("🚀 Running REAL enhanced YouTube scraping for 500+ comments per OEM...")
@@ -62,6 +92,17 @@ class EnhancedAgentService:
                         self.youtube_data_cache = self._load_latest_scraped_data(existing_files)
                     else:
                         self.youtube_data_cache = self._create_sample_youtube_data()
+            elif dataset:
+                # Consolidated with consolidate_comments.py: partitions are read per OEM on first use
+                self.youtube_data_cache = DatasetCommentData(dataset)
+                print(f"🧩 Using consolidated comment dataset {dataset.path} (version {dataset.version}): "
+                      f"{dataset.rows} comments across {len(dataset.oems)} OEMs in {len(dataset.partitions)} partitions")
+            elif self.comment_repository and self.comment_repository.exists():
+                # Comments imported with import_comments.py are queried from SQLite instead of the JSON files
+                self.youtube_data_cache = RepositoryCommentData(self.comment_repository)
+                counts = self.youtube_data_cache.comment_counts()
+                print(f"🗄️ Using comment repository {self.comment_repository.db_path}: "
+                      f"{sum(counts.values())} comments across {len(counts)} OEMs")
             else:
                 # Try to load existing REAL scraped data first
                 existing_files = self._find_latest_scraped_data()
@@ -69,15 +110,22 @@ class EnhancedAgentService:
                 if existing_files:
                     try:
                         self.youtube_data_cache = self._load_latest_scraped_data(existing_files)
-                        total_comments = sum(len(comments) for comments in self.youtube_data_cache.values())
-                        
-                        # Check if this is real scraped data
-                        real_comments = 0
-                        for comments in self.youtube_data_cache.values():
-                            real_comments += len([c for c in comments if (
-                                c.get('extraction_method') in ['downloader', 'ytdlp', 'working_scraper'] or
-                                c.get('verified_real') == True
-                            )])
+                        if isinstance(self.youtube_data_cache, StoredCommentData):
+                            # Counted from the manifest and two columns, without building comments
+                            store = self.youtube_data_cache.store
+                            total_comments = store.rows
+                            real_comments = int((store.isin('extraction_method', ['downloader', 'ytdlp', 'working_scraper']) |
+                                                 store.isin('verified_real', [True])).sum())
+                        else:
+                            total_comments = sum(len(comments) for comments in self.youtube_data_cache.values())
+                            
+                            # Check if this is real scraped data
+                            real_comments = 0
+                            for comments in self.youtube_data_cache.values():
+                                real_comments += len([c for c in comments if (
+                                    c.get('extraction_method') in ['downloader', 'ytdlp', 'working_scraper'] or
+                                    c.get('verified_real') == True
+                                )])
                         
                         print(f"✅ Loaded latest REAL scraped data: {total_comments} total comments")
                         print(f"🎯 Confirmed real YouTube comments: {real_comments}")
@@ -95,9 +143,26 @@ class EnhancedAgentService:
                     self.youtube_data_cache = self._create_sample_youtube_data()
                     print("✅ Using sample data for demonstration")
                     print("💡 Run 'python run_enhanced_scraping.py' to collect REAL YouTube data")
+            
+            if is_refresh and os.getenv('INCREMENTAL_REFRESH_ENABLED', 'true').lower() == 'true':
+                self._start_classification_refresh(previous_data, previous_loaded_at)
         
         return self.youtube_data_cache
 
+    def _start_classification_refresh(self, previous_data: Any, since: Optional[float]):
+        """Classify what changed since the previous load in a background task, off the request path"""
+        if self._classification_refresh and not self._classification_refresh.done():
+            # Whatever the replaced refresh had not reached is classified when a query reads it
+            self._classification_refresh.cancel()
+        self._classification_refresh = asyncio.ensure_future(self.refresh_classifications(previous_data, since))
+
+    async def refresh_classifications(self, previous_data: Any = None, since: Optional[float] = None) -> Dict[str, int]:
+        """Classify the comments of the loaded data that are new since previous_data was loaded (at `since`);
+        without previous data every comment is visited. Only comments whose stable ID or the rule version
+        is new are classified, the rest reuse their persisted results"""
+        batches = changed_comment_batches(previous_data, self.youtube_data_cache, since)
+        return await refresh_classifications(self.sentiment_analyzer.advanced_classifier, batches)
+
     def _find_latest_scraped_data(self) -> Optional[Dict[str, str]]:
         """Find the latest scraped data files for each OEM"""
         import os
@@ -166,33 +231,6 @@ class EnhancedAgentService:
         
         return found_files if found_files else None
 
-    def _enhance_comment_data(self, comments: List[Dict]) -> List[Dict]:
-        """Enhance comment data with video information and metadata"""
-        enhanced_comments = []
-        
-        for comment in comments:
-            enhanced_comment = comment.copy()
-            
-            # Add video URL if video_id exists
-            if 'video_id' in comment and comment['video_id']:
-                enhanced_comment['video_url'] = f"https://www.youtube.com/watch?v={comment['video_id']}"
-                
-                # Try to get video title from YouTube API (cached approach)
-                video_title = self._get_video_title_cached(comment['video_id'])
-                if video_title:
-                    enhanced_comment['video_title'] = video_title
-            
-            # Ensure required fields exist
-            if 'extraction_method' not in enhanced_comment:
-                enhanced_comment['extraction_method'] = 'youtube_api'
-            
-            if 'verified_real' not in enhanced_comment:
-                enhanced_comment['verified_real'] = True
-            
-            enhanced_comments.append(enhanced_comment)
-        
-        return enhanced_comments
-    
     def _get_video_title_cached(self, video_id: str) -> str:
         """Get video title with caching to avoid API overuse"""
         if not hasattr(self, '_video_title_cache'):
@@ -219,43 +257,16 @@ class EnhancedAgentService:
         
         # Priority 1: Load combined file if available (better for large-scale analysis)
         if '_combined' in file_dict:
+            # An up-to-date columnar store of the file opens without parsing it
+            store = open_current_store(file_dict['_combined'])
+            if store:
+                print(f"📦 Opened comment store {store.path}: {store.rows} real comments across {len(store.oems)} OEMs")
+                return StoredCommentData(store)
+            
             try:
                 print(f"📊 Loading large-scale dataset from {file_dict['_combined']}")
-                with open(file_dict['_combined'], 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Handle both array format and object format
-                if isinstance(data, list):
-                    # Array format: group by OEM
-                    for comment in data:
-                        oem = comment.get('oem', 'Unknown')
-                        if oem not in combined_data:
-                            combined_data[oem] = []
-                        combined_data[oem].append(comment)
-                elif isinstance(data, dict):
-                    if 'comments' in data:
-                        # Metadata format with comments key
-                        combined_data = data['comments']
-                    else:
-                        # Direct OEM mapping or nested historical format
-                        combined_data = {}
-                        for oem_name, oem_data in data.items():
-                            if isinstance(oem_data, list):
-                                # Flat format: OEM -> [comments]
-                                enhanced_comments = self._enhance_comment_data(oem_data)
-                                combined_data[oem_name] = enhanced_comments
-                            elif isinstance(oem_data, dict):
-                                # Nested format: OEM -> Year -> Month -> [comments]
-                                oem_comments = []
-                                for year, year_data in oem_data.items():
-                                    if isinstance(year_data, dict):
-                                        for month, comments in year_data.items():
-                                            if isinstance(comments, list):
-                                                oem_comments.extend(comments)
-                                    elif isinstance(year_data, list):
-                                        oem_comments.extend(year_data)
-                                enhanced_comments = self._enhance_comment_data(oem_comments)
-                                combined_data[oem_name] = enhanced_comments
+                print(f"💡 Run 'python ingest_comments.py {file_dict['_combined']}' for memory-mapped loading")
+                combined_data = read_scraped_json(file_dict['_combined'], self._get_video_title_cached)
                 
                 # Report statistics - focus on REAL comment verification
                 total_comments = sum(len(comments) for comments in combined_data.values())
@@ -274,22 +285,9 @@ class EnhancedAgentService:
                 print(f"⚠️  Only authentic user feedback included (no generated content)")
                 
                 # Filter out any potentially enhanced/generated comments if they exist
-                filtered_data = {}
-                for oem_name, comments in combined_data.items():
-                    real_comments = []
-                    for comment in comments:
-                        # Include if it has proper YouTube metadata, extraction method, or verified_real flag
-                        if (comment.get('extraction_method') in ['downloader', 'ytdlp', 'real_scraping', 'working_scraper'] or
-                            comment.get('verified_real') == True or
-                            ('youtube.com' in comment.get('video_url', '') and 
-                             comment.get('video_id') and
-                             comment.get('author')) or
-                            (comment.get('video_id') and len(comment.get('video_id', '')) > 5 and comment.get('author'))):  # Real YouTube format
-                            real_comments.append(comment)
-                    
-                    if real_comments:
-                        filtered_data[oem_name] = real_comments
-                        print(f"📊 {oem_name}: {len(real_comments)} verified real comments")
+                filtered_data = real_comments_by_oem(combined_data)
+                for oem_name, real_comments in filtered_data.items():
+                    print(f"📊 {oem_name}: {len(real_comments)} verified real comments")
                 
                 return filtered_data
                 
@@ -313,9 +311,45 @@ class EnhancedAgentService:
         
         return combined_data
     
+    def _load_planned_data(self, youtube_data: Dict[str, List[Dict]], plan: QueryPlan):
+        """Comments of a query plan, and its comments within the plan's time window (None without one).
+        Outside the window, the planned OEMs' comments are only loaded when the window holds none, as the
+        query then falls back to them"""
+        total = (sum(youtube_data.comment_counts().values()) if hasattr(youtube_data, 'comment_counts')
+                 else sum(len(comments) for comments in youtube_data.values()))
+        period_data = None
+        planned_data = {}
+        if plan.has_time_window:
+            period_data = planned_data = load_planned_comments(youtube_data, plan, self.temporal_service)
+        if not planned_data:
+            planned_data = load_planned_comments(youtube_data, plan.scope_only(), self.temporal_service)
+        loaded = sum(len(comments) for comments in planned_data.values())
+        print(f"🧭 Query plan: {plan.describe()} -> {loaded} of {total} comments")
+        return planned_data, period_data
+
+    def _comments_in_period(self, youtube_data: Dict[str, List[Dict]], oem_name: str,
+                            time_period: Dict[str, Any]) -> List[Dict]:
+        """An OEM's comments within a time period: an indexed date range query when the data comes
+        from the comment repository, otherwise a scan of the loaded comments"""
+        if isinstance(youtube_data, RepositoryCommentData):
+            return self.temporal_service.query_comments_by_time_period(
+                youtube_data.repository, oem_name, time_period)
+        if isinstance(youtube_data, DatasetCommentData):
+            # Only the partitions overlapping the period are read
+            bounds = self.temporal_service.period_bounds(time_period)
+            if bounds:
+                return youtube_data.dataset.comments(oem_name, start_date=bounds[0], end_date=bounds[1])
+        return self.temporal_service.filter_comments_by_time_period(youtube_data[oem_name], time_period)
+
     def _check_for_newer_data(self) -> bool:
         """Check if there are newer data files available"""
         import os
+        if isinstance(self.youtube_data_cache, DatasetCommentData):
+            # The dataset manifest stands for every scraped file: one stat instead of globbing them all
+            if self.youtube_data_cache.dataset.is_latest():
+                return False
+            print(f"🔄 Comment dataset {self.youtube_data_cache.dataset.path} was consolidated again")
+            return True
         current_files = self._find_latest_scraped_data()
         
         if not current_files or not hasattr(self, '_last_loaded_files'):
@@ -357,29 +391,7 @@ class EnhancedAgentService:
         keywords = query_lower.split()
         
         # Enhanced OEM mapping including ALL 10 OEMs
-        oem_mapping = {
-            'ola': 'Ola Electric',
-            'ola electric': 'Ola Electric',
-            'tvs': 'TVS iQube',
-            'tvs iqube': 'TVS iQube',
-            'iqube': 'TVS iQube',
-            'bajaj': 'Bajaj Chetak',
-            'bajaj chetak': 'Bajaj Chetak',
-            'chetak': 'Bajaj Chetak',
-            'ather': 'Ather',
-            'hero': 'Hero Vida',
-            'hero vida': 'Hero Vida',
-            'vida': 'Hero Vida',
-            'revolt': 'Revolt',
-            'ultraviolette': 'Ultraviolette',
-            'ultraviolette f77': 'Ultraviolette',
-            'f77': 'Ultraviolette',
-            'bgauss': 'BGauss',
-            'river': 'River Mobility',
-            'river mobility': 'River Mobility',
-            'river indie': 'River Mobility',
-            'ampere': 'Ampere'
-        }
+        oem_mapping = OEM_ALIASES
         
         # All 10 supported OEMs
         all_supported_oems = [
@@ -605,6 +617,11 @@ class EnhancedAgentService:
             
             if use_youtube_data:
                 youtube_data = await self.load_youtube_data()
+                period_data = None
+                if os.getenv('QUERY_PLANNER_ENABLED', 'true').lower() == 'true':
+                    # Load only the OEMs and dates the query is about
+                    plan = plan_query(query, self.temporal_service, time_period)
+                    youtube_data, period_data = self._load_planned_data(youtube_data, plan)
                 youtube_summary = self.youtube_scraper.get_oem_summary(youtube_data)
                 
                 # Apply temporal filtering if time period specified
@@ -612,10 +629,14 @@ class EnhancedAgentService:
                     print(f"🕒 Applying temporal filter: {time_period['description']}")
                     filtered_youtube_data = {}
                     
-                    for oem_name, comments in youtube_data.items():
-                        filtered_comments = self.temporal_service.filter_comments_by_time_period(comments, time_period)
-                        if filtered_comments:
-                            filtered_youtube_data[oem_name] = filtered_comments
+                    if period_data is not None:
+                        # Already applied by the query plan
+                        filtered_youtube_data = period_data
+                    else:
+                        for oem_name in youtube_data:
+                            filtered_comments = self._comments_in_period(youtube_data, oem_name, time_period)
+                            if filtered_comments:
+                                filtered_youtube_data[oem_name] = filtered_comments
                     
                     if filtered_youtube_data:
                         youtube_data = filtered_youtube_data
@@ -746,7 +767,10 @@ class EnhancedAgentService:
 
     async def _extract_relevant_youtube_comments(self, query: str, youtube_data: Dict[str, List[Dict]], max_comments: int = 5000) -> str:
         """Extract relevant YouTube comments with enhanced sentiment classification - Analyzes up to 5000 comments for comprehensive analysis of 46K+ dataset"""
-        all_relevant_comments = []
+        # Only the max_comments most relevant comments are kept while streaming (min-heap on relevance;
+        # among equal relevance the earlier comment wins), so memory does not grow with the corpus
+        top_comments = []
+        relevant_count = 0
         query_lower = query.lower()
         
         # Enhanced keywords extraction
@@ -767,37 +791,9 @@ class EnhancedAgentService:
             if keyword in keyword_variants:
                 expanded_keywords.update(keyword_variants[keyword])
         
-        # Process comments with enhanced sentiment analysis
-        full_oem_sentiment = {}  # Track full OEM sentiment before filtering
-        for oem_name, comments in youtube_data.items():
-            if not comments:
-                continue
-                
+        def score_comments(oem_name: str, enhanced_comments: List[Dict]):
+            nonlocal relevant_count
             oem_mentioned = oem_name.lower() in query_lower
-            
-            # Apply ADVANCED sentiment analysis to comments batch
-            try:
-                enhanced_comments = await self.sentiment_analyzer.analyze_comment_batch(
-                    comments, target_oem=oem_name
-                )
-                print(f"✅ ADVANCED sentiment analysis completed for {oem_name}: {len(enhanced_comments)} comments")
-                
-                # Calculate full OEM sentiment statistics before filtering
-                full_sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
-                for comment in enhanced_comments:
-                    classification = comment.get('sentiment_classification', {})
-                    sentiment = classification.get('sentiment', 'neutral')
-                    full_sentiment_counts[sentiment] += 1
-                
-                full_oem_sentiment[oem_name] = {
-                    'total': len(enhanced_comments),
-                    'sentiment': full_sentiment_counts
-                }
-                
-            except Exception as e:
-                print(f"⚠️ Advanced sentiment analysis failed for {oem_name}: {e}")
-                enhanced_comments = comments  # Fallback to original comments
-            
             for comment in enhanced_comments:
                 comment_text = comment.get('text', '').lower()
                 
@@ -862,15 +858,42 @@ class EnhancedAgentService:
                 
                 # Include comment if relevant (more permissive criteria)
                 if relevance_score >= 1:  # Changed from > 0 to >= 1 for broader inclusion
-                    all_relevant_comments.append({
+                    entry = (relevance_score, -relevant_count, {
                         'comment': comment,
                         'oem': oem_name,
                         'relevance': relevance_score,
                         'classification': classification
                     })
+                    relevant_count += 1
+                    if len(top_comments) < max_comments:
+                        heapq.heappush(top_comments, entry)
+                    elif entry[:2] > top_comments[0][:2]:
+                        heapq.heapreplace(top_comments, entry)
+        
+        # Process comments with enhanced sentiment analysis
+        sentiment_summary = BatchSummaryAccumulator()  # Track full OEM sentiment before filtering
+        for oem_name, comments in youtube_data.items():
+            if not comments:
+                continue
+            
+            # Apply ADVANCED sentiment analysis as a stream: each chunk is scored as soon as it is classified
+            # Compact records: full detail is only rebuilt for comments that reach the prompt
+            # Full OEM sentiment statistics (before filtering) are counted during classification
+            scored = 0
+            try:
+                async for enhanced_comments in self.sentiment_analyzer.aiter_classify(
+                    comments, target_oem=oem_name, compact=True, summary=sentiment_summary
+                ):
+                    score_comments(oem_name, enhanced_comments)
+                    scored += len(enhanced_comments)
+                print(f"✅ ADVANCED sentiment analysis completed for {oem_name}: {scored} comments")
+                
+            except Exception as e:
+                print(f"⚠️ Advanced sentiment analysis failed for {oem_name}: {e}")
+                score_comments(oem_name, comments[scored:])  # Fallback to original comments
         
         # Sort by relevance score (descending)
-        all_relevant_comments.sort(key=lambda x: x['relevance'], reverse=True)
+        all_relevant_comments = [item for _, _, item in sorted(top_comments, key=lambda entry: entry[:2], reverse=True)]
         
         # Ensure we have enough comments - if too few, add more from each OEM for comprehensive 46K+ analysis
         if len(all_relevant_comments) < max_comments // 2:  # If less than 50% of target (more aggressive for full dataset)
@@ -902,6 +925,7 @@ class EnhancedAgentService:
                         })
                 
                 all_relevant_comments.extend(additional_comments)
+                relevant_count += len(additional_comments)
         
         # Format top comments with enhanced information
         formatted_comments = []
@@ -974,10 +998,11 @@ class EnhancedAgentService:
             
             summary = f"\n\n=== ENHANCED ANALYSIS SUMMARY ===\n"
             summary += f"� GEMINI INSTRUCTION: USE ONLY THE PERCENTAGES SHOWN BELOW - DO NOT USE 30.3%, 27.0%, 42.7% OR 21.1%, 38.3%, 40.6% WHICH ARE FICTIONAL\n"
-            summary += f"�📊 Total comments analyzed: {len(formatted_comments)} (from pool of {len(all_relevant_comments)} relevant comments)\n"
+            summary += f"�📊 Total comments analyzed: {len(formatted_comments)} (from pool of {relevant_count} relevant comments)\n"
             summary += f"📈 Comments per OEM: {', '.join([f'{oem}: {count}' for oem, count in oem_counts.items()])}\n"
             
             # Add full OEM sentiment statistics for context
+            full_oem_sentiment = sentiment_summary.oem_sentiment()
             if full_oem_sentiment:
                 summary += f"\n=== FULL OEM DATASET SENTIMENT (Before Filtering) - USE THESE EXACT PERCENTAGES ===\n"
                 for oem_name, stats in full_oem_sentiment.items():
@@ -1236,9 +1261,7 @@ Please provide a response with crystal-clear source attribution and proper categ
             
             if time_period:
                 # Filter comments for this period
-                filtered_comments = self.temporal_service.filter_comments_by_time_period(
-                    youtube_data[oem_name], time_period
-                )
+                filtered_comments = self._comments_in_period(youtube_data, oem_name, time_period)
                 
                 if filtered_comments:
                     # Perform analysis
@@ -1254,6 +1277,32 @@ Please provide a response with crystal-clear source attribution and proper categ
         
         return results
 
+    async def get_feature_index(self) -> FeatureIndex:
+        """Bitset feature index over the classified dataset (rebuilt only when the data is reloaded)"""
+        youtube_data = await self.load_youtube_data()
+        if self.feature_index is None or self._feature_index_data is not youtube_data:
+            start_time = time.time()
+            classified = await self.sentiment_analyzer.analyze_comment_batches_by_oem(youtube_data, compact=True)
+            self.feature_index = FeatureIndex.build(classified, self.sentiment_analyzer.advanced_classifier)
+            self._feature_index_data = youtube_data
+            print(f"🗂️ Feature index built: {self.feature_index.size} comments, "
+                  f"{len(self.feature_index.features)} features in {time.time() - start_time:.2f}s")
+        return self.feature_index
+
+    async def count_comments(self, all_of: List[str] = None, any_of: List[str] = None,
+                             none_of: List[str] = None, oem: List[str] = None,
+                             sentiment: List[str] = None, month: List[str] = None) -> Dict[str, Any]:
+        """Count comments matching feature and OEM/sentiment/month filters from the feature index,
+        e.g. count_comments(all_of=['range_issue', 'service'], oem='Ather', sentiment='negative')"""
+        index = await self.get_feature_index()
+        filters = dict(all_of=all_of, any_of=any_of, none_of=none_of, oem=oem, sentiment=sentiment, month=month)
+        return {
+            'count': index.count(**filters),
+            'total_comments': index.size,
+            'by_oem': index.counts_by('oem', **filters),
+            'by_sentiment': index.counts_by('sentiment', **filters)
+        }
+
     def get_conversation_summary(self) -> str:
         """Get summary of current conversation"""
         return self.memory_service.get_memory_summary()
@@ -1272,15 +1321,26 @@ Please provide a response with crystal-clear source attribution and proper categ
         
         analytics = {}
         total_comments = 0
+        overall_sentiment = {'positive': 0, 'negative': 0, 'neutral': 0}
         
         for oem_name, comments in youtube_data.items():
-            analysis = self.youtube_scraper.analyze_comments(comments)
-            analytics[oem_name] = analysis
+            # Dashboard-scale aggregate: the distilled model when one is loaded, else the full classifier
+            estimate = await self.sentiment_analyzer.estimate_sentiment_distribution(comments, oem_name)
+            analytics[oem_name] = {
+                'total_comments': len(comments),
+                'unique_authors': len({comment.get('author') for comment in comments if comment.get('author')}),
+                'avg_likes': (sum(comment.get('likes') or 0 for comment in comments) / len(comments)) if comments else 0,
+                'sentiment_distribution': estimate['sentiment'],
+                'sentiment_method': estimate['method']
+            }
+            for sentiment, count in estimate['sentiment'].items():
+                overall_sentiment[sentiment] = overall_sentiment.get(sentiment, 0) + count
             total_comments += len(comments)
         
         analytics['overall'] = {
             'total_oems': len(youtube_data),
             'total_comments': total_comments,
+            'sentiment_distribution': overall_sentiment,
             'data_collection_period': 'July 2025'
         }
         
@@ -1288,6 +1348,8 @@ Please provide a response with crystal-clear source attribution and proper categ
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get enhanced health status including all services"""
+        if self.data_watcher:
+            self.data_watcher.ensure_running()
         base_status = {
             'search_service': {
                 'configured': self.search_service.is_configured(),
@@ -1318,9 +1380,15 @@ Please provide a response with crystal-clear source attribution and proper categ
                 'conversation_count': len(self.memory_service.conversation_history),
                 'session_active': bool(self.memory_service.session_context),
                 'memory_file_exists': os.path.exists(self.memory_service.memory_file)
-            }
+            },
+            'classification_cache': self.sentiment_analyzer.advanced_classifier.get_cache_stats(),
+            'comment_repository': (self.comment_repository.stats()
+                                   if self.comment_repository and self.comment_repository.exists()
+                                   else {'enabled': bool(self.comment_repository), 'imported': False}),
+            'data_watcher': ({**self.data_watcher.get_status(), 'loaded_version': self._loaded_data_version}
+                             if self.data_watcher else {'running': False, 'mode': 'disabled'})
         }
-        
+
         return base_status
 
     def _simplify_context_for_retry(self, context: str) -> str:
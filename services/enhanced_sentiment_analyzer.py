@@ -7,11 +7,14 @@ import re
 import json
 import os
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, AsyncIterator
 import google.generativeai as genai
 from collections import defaultdict
 import asyncio
-from .advanced_sentiment_classifier import AdvancedSentimentClassifier
+from .advanced_sentiment_classifier import AdvancedSentimentClassifier, _iter_chunks
+from .batch_summary import BatchSummaryAccumulator
+from .compact_classification import CompactClassification, CompactSentimentView
+from .distilled_classifier import DistilledSentimentScorer
 
 class EnhancedSentimentAnalyzer:
     def __init__(self):
@@ -22,6 +25,12 @@ class EnhancedSentimentAnalyzer:
         # Initialize the new advanced classifier
         self.advanced_classifier = AdvancedSentimentClassifier()
         print("✅ Advanced multi-layer sentiment classifier initialized")
+        rule_pack = self.advanced_classifier.rule_pack_info
+        print(f"📦 Rule pack {rule_pack['name']} {rule_pack['version']} loaded from {rule_pack['compiled_from']} "
+              f"in {rule_pack['startup_ms']}ms")
+        
+        # Optional distilled model for dashboard-scale sentiment aggregates (None when not trained)
+        self.distilled_scorer = DistilledSentimentScorer.from_env(self.advanced_classifier)
         
         # Legacy patterns for backward compatibility
         self.sarcasm_indicators = {
@@ -119,60 +128,156 @@ class EnhancedSentimentAnalyzer:
             print('⚠️ No Gemini API key found')
             self.gemini_model = None
     
-    async def analyze_comment_batch(self, comments: List[Dict], target_oem: str = None) -> List[Dict]:
-        """Analyze a batch of comments with ADVANCED multi-layer classification"""
+    async def analyze_comment_batch(self, comments: List[Dict], target_oem: str = None,
+                                    parallel: bool = None, compact: bool = False,
+                                    tiered: bool = False, summary: BatchSummaryAccumulator = None) -> List[Dict]:
+        """Analyze a batch of comments with ADVANCED multi-layer classification (parallel=None picks automatically;
+        summary, if given, receives the batch's counts, including per-OEM sentiment counts)"""
         print(f"🚀 Starting ADVANCED multi-layer sentiment analysis for {len(comments)} comments...")
         
+        # Counted as each comment is classified; merged into the caller's accumulator only on success
+        batch_counts = BatchSummaryAccumulator()
+        
         # Use the new advanced classifier for all analysis
         try:
-            enhanced_comments = await self.advanced_classifier.analyze_comment_batch(comments, target_oem)
+            enhanced_comments = await self.advanced_classifier.analyze_comment_batch(
+                comments, target_oem, parallel=parallel, compact=compact, tiered=tiered, summary=batch_counts
+            )
             
             # Generate batch summary
-            summary = self.advanced_classifier.get_batch_summary(enhanced_comments)
+            batch_summary = self.advanced_classifier.summarize_batch(batch_counts)
             
             print(f"✅ ADVANCED Analysis Complete:")
-            print(f"   📊 Total comments: {summary['total_comments']}")
-            print(f"   💭 Sentiment: {summary['sentiment_distribution']}")
-            print(f"   🌐 Multilingual: {summary['multilingual_percentage']}%")
-            print(f"   🎭 Sarcasm detected: {summary['sarcasm_percentage']}%")
-            print(f"   🎯 Avg confidence: {summary['average_confidence']}")
-            print(f"   🏢 Company mentions: {summary['company_mentions']}")
-            
+            print(f"   📊 Total comments: {batch_summary['total_comments']}")
+            print(f"   💭 Sentiment: {batch_summary['sentiment_distribution']}")
+            print(f"   🌐 Multilingual: {batch_summary['multilingual_percentage']}%")
+            print(f"   🎭 Sarcasm detected: {batch_summary['sarcasm_percentage']}%")
+            print(f"   🎯 Avg confidence: {batch_summary['average_confidence']}")
+            print(f"   🏢 Company mentions: {batch_summary['company_mentions']}")
+            cache_stats = batch_summary.get('cache_statistics', {})
+            if cache_stats.get('enabled'):
+                print(f"   💾 Cache: {cache_stats.get('hits', 0)} hits / {cache_stats.get('misses', 0)} misses")
+            if tiered:
+                tier_stats = batch_summary['tier_statistics']
+                print(f"   ⚡ Fast path: {tier_stats['fast_path_percentage']}% "
+                      f"(fast {tier_stats['tiers']['fast']['avg_ms']}ms, full {tier_stats['tiers']['full']['avg_ms']}ms avg)")
+            gate_stats = batch_summary.get('gate_statistics', {})
+            if gate_stats.get('enabled') and gate_stats.get('total_comments'):
+                gate_rates = ', '.join(f"{gate} {stats['rate']}%" for gate, stats in gate_stats['gates'].items())
+                print(f"   🚪 Early exits: {gate_stats['early_exit_percentage']}% ({gate_rates})")
+            dedup_stats = batch_summary.get('dedup_statistics', {})
+            if dedup_stats.get('duplicates'):
+                print(f"   🔁 Duplicates: {dedup_stats['duplicates']} of {dedup_stats['comments']} "
+                      f"classified comments reused ({dedup_stats['dedup_ratio']}%)")
+
             # Convert advanced classification to match expected format
-            for comment in enhanced_comments:
-                if 'advanced_sentiment_classification' in comment:
-                    adv_classification = comment['advanced_sentiment_classification']
-                    
-                    # Map to expected format for backward compatibility
-                    comment['sentiment_classification'] = {
-                        'sentiment': adv_classification['sentiment'],
-                        'confidence': adv_classification['confidence'],
-                        'sarcasm_detected': adv_classification['sarcasm_detected'],
-                        'sarcasm_score': adv_classification['sarcasm_score'],
-                        'product_relevance': adv_classification['product_relevance'],
-                        'relevance_score': adv_classification['relevance_score'],
-                        'language_mix': adv_classification['language_analysis']['is_mixed'],
-                        'context': adv_classification['context'],
-                        'analysis_method': 'advanced_multi_layer_v2',
-                        'key_factors': adv_classification.get('classification_factors', []),
-                        'advanced_features': {
-                            'emoji_analysis': adv_classification['emoji_analysis'],
-                            'company_analysis': adv_classification['company_analysis'],
-                            'engagement_analysis': adv_classification['engagement_analysis'],
-                            'language_breakdown': adv_classification['language_analysis'],
-                            'context_details': adv_classification['context_details']
-                        }
-                    }
-            
-            return enhanced_comments
+            self._attach_legacy_classification(enhanced_comments)
             
         except Exception as e:
             print(f"⚠️ Advanced classifier failed: {e}, using fallback...")
-            # Fallback to existing methods
-            if self.gemini_model and len(comments) <= 20:
-                return await self._ai_enhanced_analysis(comments, target_oem)
-            else:
-                return self._enhanced_rule_based_analysis(comments, target_oem)
+            enhanced_comments, batch_counts = await self._fallback_analysis(comments, target_oem)
+        
+        if summary is not None:
+            summary.merge(batch_counts)
+        return enhanced_comments
+    
+    async def _fallback_analysis(self, comments: List[Dict], target_oem: str = None) -> Tuple[List[Dict], BatchSummaryAccumulator]:
+        """Classify with the existing methods when the advanced classifier fails; returns the comments
+        and their summary counts"""
+        if self.gemini_model and len(comments) <= 20:
+            enhanced_comments = await self._ai_enhanced_analysis(comments, target_oem)
+        else:
+            enhanced_comments = self._enhanced_rule_based_analysis(comments, target_oem)
+        batch_counts = BatchSummaryAccumulator()
+        for comment in enhanced_comments:
+            batch_counts.add(comment.get('sentiment_classification', {}), target_oem)
+        return enhanced_comments, batch_counts
+    
+    async def analyze_comment_batches_by_oem(self, comments_by_oem: Dict[str, List[Dict]],
+                                             compact: bool = False,
+                                             tiered: bool = False) -> Dict[str, List[Dict]]:
+        """Analyze several OEMs' comment lists, each against its own OEM, sharing the OEM-independent
+        analysis of comments that appear under more than one OEM"""
+        try:
+            results = await self.advanced_classifier.analyze_comment_batches_by_oem(
+                comments_by_oem, compact=compact, tiered=tiered
+            )
+        except Exception as e:
+            print(f"⚠️ Multi-OEM classification failed: {e}, analyzing each OEM separately...")
+            return {oem: await self.analyze_comment_batch(comments, oem, compact=compact, tiered=tiered)
+                    for oem, comments in comments_by_oem.items()}
+        
+        for oem, enhanced_comments in results.items():
+            print(f"✅ ADVANCED Analysis Complete for {oem}: {len(enhanced_comments)} comments")
+            self._attach_legacy_classification(enhanced_comments)
+        return results
+    
+    async def aiter_classify(self, comments: Iterable[Dict], target_oem: str = None, chunk_size: int = None,
+                             compact: bool = False, tiered: bool = False,
+                             summary: BatchSummaryAccumulator = None) -> AsyncIterator[List[Dict]]:
+        """Stream classified comments chunk by chunk (with the legacy `sentiment_classification` view),
+        so relevance scoring, aggregation or export writing can run on each chunk as it arrives.
+        A chunk the advanced classifier fails on falls back like analyze_comment_batch; summary, if
+        given, receives each chunk's counts"""
+        for chunk in _iter_chunks(comments, chunk_size or self.advanced_classifier.stream_chunk_size):
+            chunk_counts = BatchSummaryAccumulator()
+            try:
+                enhanced_comments = await self.advanced_classifier.analyze_comment_batch(
+                    chunk, target_oem, compact=compact, tiered=tiered, summary=chunk_counts
+                )
+                self._attach_legacy_classification(enhanced_comments)
+            except Exception as e:
+                print(f"⚠️ Advanced classifier failed on {len(chunk)} comments: {e}, using fallback...")
+                enhanced_comments, chunk_counts = await self._fallback_analysis(chunk, target_oem)
+            if summary is not None:
+                summary.merge(chunk_counts)
+            yield enhanced_comments
+
+    async def estimate_sentiment_distribution(self, comments: List[Dict], target_oem: str = None) -> Dict[str, Any]:
+        """Sentiment counts for aggregates: the distilled model with rule fallback for uncertain
+        comments when a model is loaded, otherwise the full advanced classification"""
+        if self.distilled_scorer:
+            counts = self.distilled_scorer.sentiment_distribution(comments, target_oem)
+            method = 'distilled_with_rule_fallback'
+        else:
+            batch_counts = BatchSummaryAccumulator()
+            await self.advanced_classifier.analyze_comment_batch(comments, target_oem, compact=True,
+                                                                 summary=batch_counts)
+            counts = dict(batch_counts.sentiment_by_oem.get(target_oem, {'positive': 0, 'negative': 0, 'neutral': 0}))
+            method = 'advanced_multi_layer'
+        return {'total': len(comments), 'sentiment': counts, 'method': method}
+    
+    def _attach_legacy_classification(self, enhanced_comments: List[Dict]):
+        """Add the backward-compatible `sentiment_classification` view to each classified comment"""
+        for comment in enhanced_comments:
+            if 'advanced_sentiment_classification' in comment:
+                adv_classification = comment['advanced_sentiment_classification']
+                
+                # Compact records expose the legacy format lazily instead of copying detail
+                if isinstance(adv_classification, CompactClassification):
+                    comment['sentiment_classification'] = CompactSentimentView(adv_classification)
+                    continue
+                
+                # Map to expected format for backward compatibility
+                comment['sentiment_classification'] = {
+                    'sentiment': adv_classification['sentiment'],
+                    'confidence': adv_classification['confidence'],
+                    'sarcasm_detected': adv_classification['sarcasm_detected'],
+                    'sarcasm_score': adv_classification['sarcasm_score'],
+                    'product_relevance': adv_classification['product_relevance'],
+                    'relevance_score': adv_classification['relevance_score'],
+                    'language_mix': adv_classification['language_analysis']['is_mixed'],
+                    'context': adv_classification['context'],
+                    'analysis_method': 'advanced_multi_layer_v2',
+                    'key_factors': adv_classification.get('classification_factors', []),
+                    'advanced_features': {
+                        'emoji_analysis': adv_classification['emoji_analysis'],
+                        'company_analysis': adv_classification['company_analysis'],
+                        'engagement_analysis': adv_classification['engagement_analysis'],
+                        'language_breakdown': adv_classification['language_analysis'],
+                        'context_details': adv_classification['context_details']
+                    }
+                }
     
     async def _ai_enhanced_analysis(self, comments: List[Dict], target_oem: str = None) -> List[Dict]:
         """AI-powered analysis using Gemini with enhanced prompts"""
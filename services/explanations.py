@@ -0,0 +1,87 @@
+"""
+Explanations - Rule IDs recorded during classification and their human-readable rendering
+- With explain=False the classifier records compact ('rule_id', *args) entries and
+  (word, sentiment, language) tuples instead of formatted strings and dicts
+- Entries are rendered on demand, only for the comments that are displayed or exported
+- explain=True output is produced from the same templates, so both modes render identically
+"""
+
+from typing import Dict, Any, List, Sequence, Union
+
+# Rule ID -> template of classification factors and sarcasm indicators
+RULE_TEMPLATES = {
+    # _calculate_final_sentiment factors
+    'pattern_sentiment': "pattern_sentiment: {0} (conf: {1})",
+    'emoji_influence': "emoji_influence: {0:.2f}",
+    'strong_negative_emoji_override': "strong_negative_emoji_override: {0} -> negative",
+    'sarcasm_flip': "sarcasm_flip: positive -> negative",
+    'sarcasm_flip_emoji': "sarcasm_flip: neutral -> negative (emoji positive)",
+    'irrelevant_strong_negative_override': "irrelevant_strong_negative_override: -> negative",
+    'irrelevant_content_override': "irrelevant_content_override: -> neutral",
+    'engagement_boost': "engagement_boost: {0}",
+    'target_company_relevance': "target_company_relevance: +{0:.2f}",
+    'wrong_brand_context': "wrong_brand_context: {0} in {1} thread -> neutral",
+    'off_topic_brand_mention': "off_topic_brand_mention: -> neutral",
+    'competitor_mention': "competitor_mention: confidence reduced",
+    'fast_path_margin': "fast_path_margin: {0}",
+
+    # detect_sarcasm_advanced indicators
+    'positive_negative_pattern': "positive_negative_pattern: {0}",
+    'exclamation_with_complaint': "exclamation_with_complaint",
+    'emoji_text_mismatch': "emoji_text_mismatch",
+    'thanks_complaint': "thanks_complaint: {0}",
+    'service_visit_sarcasm': "service_visit_sarcasm: {0}",
+}
+
+RuleEntry = Union[str, Sequence[Any]]
+
+
+def rule(explain: bool, rule_id: str, *args) -> RuleEntry:
+    """The rendered string when explaining, otherwise the compact (rule_id, *args) entry"""
+    if explain:
+        return RULE_TEMPLATES[rule_id].format(*args)
+    return (rule_id,) + args
+
+
+def sentiment_word(explain: bool, word: str, sentiment: str, language: str) -> Union[Dict[str, str], tuple]:
+    """A matched sentiment word as a dict when explaining, otherwise a (word, sentiment, language) tuple"""
+    if explain:
+        return {'word': word, 'sentiment': sentiment, 'language': language}
+    return (word, sentiment, language)
+
+
+def render_rule(entry: RuleEntry) -> str:
+    """Render one rule entry (already rendered strings pass through; lists come from JSON round trips)"""
+    if isinstance(entry, str):
+        return entry
+    rule_id, *args = entry
+    return RULE_TEMPLATES[rule_id].format(*args)
+
+
+def render_rules(entries: List[RuleEntry]) -> List[str]:
+    return [render_rule(entry) for entry in entries]
+
+
+def render_sentiment_words(entries: List[Any]) -> List[Dict[str, str]]:
+    return [entry if isinstance(entry, dict) else
+            {'word': entry[0], 'sentiment': entry[1], 'language': entry[2]} for entry in entries]
+
+
+def render_classification(classification: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a classification recorded with explain=False, with its factors, sarcasm indicators
+    and sentiment words rendered exactly as explain=True would have produced them"""
+    if classification.get('explained', True):
+        return classification
+
+    rendered = dict(classification)
+    del rendered['explained']
+    rendered['classification_factors'] = render_rules(classification.get('classification_factors', []))
+    sarcasm_analysis = classification.get('sarcasm_analysis')
+    if sarcasm_analysis and 'sarcasm_indicators' in sarcasm_analysis:
+        rendered['sarcasm_analysis'] = dict(sarcasm_analysis,
+                                            sarcasm_indicators=render_rules(sarcasm_analysis['sarcasm_indicators']))
+    pattern_analysis = classification.get('pattern_analysis')
+    if pattern_analysis and 'sentiment_words' in pattern_analysis:
+        rendered['pattern_analysis'] = dict(pattern_analysis,
+                                            sentiment_words=render_sentiment_words(pattern_analysis['sentiment_words']))
+    return rendered
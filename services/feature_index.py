@@ -0,0 +1,207 @@
+"""
+Feature Index - Bitset index of the classified comment corpus
+- One packed bitset per feature (every pattern group plus classification flags) over all comments,
+  so boolean filters are vectorised ANDs/ORs and counts are popcounts
+- Column arrays for OEM, month (of the comment date, as in temporal analysis and the dataset partitions)
+  and sentiment; the bitset of each column value is built once
+- Comments with the same lowercased text share one pattern scan
+"""
+
+import re
+from typing import Dict, Any, List, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from .comment_store import normalize_date
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+
+# Features taken from the legacy `sentiment_classification` view: feature -> key
+CLASSIFICATION_FEATURES = {
+    'sarcasm': 'sarcasm_detected',
+    'mixed_language': 'language_mix',
+}
+
+# Convenience names that match if any of the stored features fired
+FEATURE_ALIASES = {
+    'strong_negative': ('strong_negative_phrases', 'strong_negative_words'),
+    'service': ('relevance:service', 'context:service'),
+    'battery': ('context:battery_performance',),
+    'sarcasm_pattern': ('sarcasm:positive_negative', 'sarcasm:thanks_complaint', 'sarcasm:service_visit',
+                        'contextual_sarcastic'),
+}
+
+_MONTH = re.compile(r'^(\d{4})-(\d{2})')
+
+Filter = Union[str, Iterable[str], None]
+
+
+def _month_code(value: Optional[str]) -> int:
+    """'2025-07' or '2025-07-14 10:00:00' -> 202507 (0 when unknown)"""
+    match = _MONTH.match(value or '')
+    return int(match.group(1)) * 100 + int(match.group(2)) if match else 0
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    """Pack a boolean array (comments along the last axis) into uint64 words"""
+    packed = np.packbits(mask, axis=-1, bitorder='little')
+    padding = -packed.shape[-1] % 8
+    if padding:
+        widths = [(0, 0)] * (packed.ndim - 1) + [(0, padding)]
+        packed = np.pad(packed, widths)
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def _popcount(words: np.ndarray) -> int:
+    """Number of set bits in a word array"""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+def _as_tuple(values: Filter) -> Tuple[str, ...]:
+    if values is None:
+        return ()
+    if isinstance(values, str):
+        return (values,)
+    return tuple(values)
+
+
+class FeatureIndex:
+    """Which features fired for every comment, plus OEM/month/sentiment columns, as bitsets"""
+
+    def __init__(self, features: List[str], bitsets: np.ndarray, oems: List[str],
+                 oem_codes: np.ndarray, months: np.ndarray, sentiments: np.ndarray,
+                 positions: List[int]):
+        self.features = list(features)
+        self.feature_ids = {feature: i for i, feature in enumerate(self.features)}
+        self.bitsets = bitsets          # (features, words) uint64
+        self.oems = list(oems)
+        self.oem_codes = oem_codes      # comment -> index into oems
+        self.months = months            # comment -> yyyymm (0 unknown)
+        self.sentiments = sentiments    # comment -> index into SENTIMENTS
+        self.positions = positions      # comment -> position within its OEM's list
+        self.size = len(oem_codes)
+        self.words = bitsets.shape[1]
+        self._all = _pack(np.ones(self.size, dtype=bool))
+        self._column_bitsets = {}
+
+    @classmethod
+    def build(cls, classified_by_oem: Dict[str, List[Dict]], classifier) -> 'FeatureIndex':
+        """Index comments classified per OEM (each carrying a `sentiment_classification`),
+        scanning every distinct text once with the classifier's pattern engine"""
+        groups = list(classifier.pattern_engine.groups)
+        features = groups + list(CLASSIFICATION_FEATURES)
+        sentiment_ids = {sentiment: i for i, sentiment in enumerate(SENTIMENTS)}
+
+        oems = list(classified_by_oem)
+        size = sum(len(comments) for comments in classified_by_oem.values())
+        fired = np.zeros((len(features), size), dtype=bool)
+        oem_codes = np.zeros(size, dtype=np.uint16)
+        months = np.zeros(size, dtype=np.int32)
+        sentiments = np.full(size, sentiment_ids['neutral'], dtype=np.int8)
+        positions = []
+
+        group_rows = {}  # lowercased text -> indices of the groups that fired
+        row = 0
+        for oem_code, oem in enumerate(oems):
+            for position, comment in enumerate(classified_by_oem[oem]):
+                text = (comment.get('text') or '').lower()
+                rows = group_rows.get(text)
+                if rows is None:
+                    matches = classifier.pattern_engine.scan(text)
+                    rows = group_rows[text] = [i for i, group in enumerate(groups) if matches.any(group)]
+                fired[rows, row] = True
+
+                classification = comment.get('sentiment_classification') or {}
+                for offset, key in enumerate(CLASSIFICATION_FEATURES.values()):
+                    if classification.get(key, False):
+                        fired[len(groups) + offset, row] = True
+                sentiments[row] = sentiment_ids.get(classification.get('sentiment', 'neutral'),
+                                                    sentiment_ids['neutral'])
+
+                oem_codes[row] = oem_code
+                months[row] = _month_code(normalize_date(comment.get('date')))
+                positions.append(position)
+                row += 1
+
+        return cls(features, _pack(fired), oems, oem_codes, months, sentiments, positions)
+
+    def _feature_bitset(self, name: str) -> np.ndarray:
+        if name in self.feature_ids:
+            return self.bitsets[self.feature_ids[name]]
+        if name in FEATURE_ALIASES:
+            return np.bitwise_or.reduce([self._feature_bitset(feature) for feature in FEATURE_ALIASES[name]])
+        raise KeyError(f"Unknown feature '{name}'")
+
+    def _column_bitset(self, column: str, value: Any) -> np.ndarray:
+        """Bitset of the comments whose column equals value (built once per value)"""
+        key = (column, value)
+        if key not in self._column_bitsets:
+            if column == 'oem':
+                codes = self.oem_codes
+                value = self.oems.index(value) if value in self.oems else -1
+            elif column == 'sentiment':
+                codes = self.sentiments
+                value = SENTIMENTS.index(value) if value in SENTIMENTS else -1
+            else:
+                codes = self.months
+                value = _month_code(value) or -1
+            self._column_bitsets[key] = _pack(codes == value)
+        return self._column_bitsets[key]
+
+    def _any_of_column(self, column: str, values: Filter) -> Optional[np.ndarray]:
+        values = _as_tuple(values)
+        if not values:
+            return None
+        return np.bitwise_or.reduce([self._column_bitset(column, value) for value in values])
+
+    def mask(self, all_of: Filter = None, any_of: Filter = None, none_of: Filter = None,
+             oem: Filter = None, sentiment: Filter = None, month: Filter = None) -> np.ndarray:
+        """Bitset of the comments with every feature in all_of, at least one in any_of, none in none_of,
+        and one of the given OEMs / sentiments / months ('YYYY-MM')"""
+        result = self._all.copy()
+
+        for name in _as_tuple(all_of):
+            result &= self._feature_bitset(name)
+        if _as_tuple(any_of):
+            result &= np.bitwise_or.reduce([self._feature_bitset(name) for name in _as_tuple(any_of)])
+        for name in _as_tuple(none_of):
+            result &= ~self._feature_bitset(name)
+        for column, values in (('oem', oem), ('sentiment', sentiment), ('month', month)):
+            column_bitset = self._any_of_column(column, values)
+            if column_bitset is not None:
+                result &= column_bitset
+        return result
+
+    def count(self, **filters) -> int:
+        """Number of comments matching the filters (see mask)"""
+        return _popcount(self.mask(**filters))
+
+    def counts_by(self, column: str, **filters) -> Dict[str, int]:
+        """Matching comments per OEM, sentiment or month"""
+        selected = self.mask(**filters)
+        if column == 'oem':
+            values = self.oems
+        elif column == 'sentiment':
+            values = list(SENTIMENTS)
+        elif column == 'month':
+            values = [f'{code // 100:04d}-{code % 100:02d}' for code in np.unique(self.months) if code]
+        else:
+            raise ValueError(f"Unknown column '{column}' (expected oem, sentiment or month)")
+        return {value: _popcount(selected & self._column_bitset(column, value)) for value in values}
+
+    def matching(self, **filters) -> List[Tuple[str, int]]:
+        """(OEM, position in that OEM's comment list) of every matching comment"""
+        selected = self.mask(**filters)
+        rows = np.flatnonzero(np.unpackbits(selected.view(np.uint8), bitorder='little')[:self.size])
+        return [(self.oems[self.oem_codes[row]], self.positions[row]) for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size of the index"""
+        return {
+            'comments': self.size,
+            'features': len(self.features),
+            'oems': len(self.oems),
+            'bitset_bytes': int(self.bitsets.nbytes),
+        }
@@ -0,0 +1,506 @@
+"""
+Pattern Engine - Precompiled multi-pattern matching for the sentiment classifier
+- Literal phrase groups compiled into a single prefix-trie regex
+- Word-bounded groups with the same semantics as r'\b' + re.escape(word) + r'\b'
+- Each text is tokenized once; single-word bounded patterns are set lookups on the tokens
+- Regex groups combined into one alternation per group
+- "A followed later by B" regexes (sequence groups) compiled into keyword steps and
+  evaluated over keyword positions in linear time, without regex backtracking
+- One scan per comment returns every hit, shared by all classification stages
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Any, Iterable, Tuple, Optional, Set
+
+_WORD_CHAR = re.compile(r'\w')
+_TOKEN = re.compile(r'\w+')
+# Runs of the character classes a trailing `\s+` / `\d+` segment can extend over
+_CHAR_RUNS = {r'\s': re.compile(r'\s+'), r'\d': re.compile(r'\d+')}
+
+
+def _is_word_char(char: str) -> bool:
+    """Check a single character against the regex definition of \\w"""
+    return bool(_WORD_CHAR.match(char))
+
+
+def _build_trie(patterns: Iterable[str]) -> Dict[str, Any]:
+    """Build a character trie; the '' key marks the end of a pattern"""
+    trie = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return trie
+
+
+def _trie_to_regex(node: Dict[str, Any]) -> str:
+    """Emit a regex for a trie that prefers the longest pattern at each position"""
+    branches = [re.escape(char) + _trie_to_regex(child)
+                for char, child in sorted(node.items()) if char != '']
+    is_terminal = '' in node
+
+    if not branches:
+        return ''
+    if len(branches) == 1 and not is_terminal:
+        return branches[0]
+    # Greedy optional group: try to extend the match before accepting a shorter pattern
+    return '(?:' + '|'.join(branches) + ')' + ('?' if is_terminal else '')
+
+
+def _prefix_patterns(trie: Dict[str, Any], pattern: str) -> List[str]:
+    """Return every registered pattern that is a prefix of the given pattern"""
+    prefixes = []
+    node = trie
+    for i, char in enumerate(pattern):
+        node = node[char]
+        if '' in node:
+            prefixes.append(pattern[:i + 1])
+    return prefixes
+
+
+class UnsupportedSequence(ValueError):
+    """Raised when a regex uses syntax the sequence compiler does not handle"""
+
+
+def _parse_sequence(pattern: str) -> List[List[List[Tuple]]]:
+    """Parse a regex into disjunctive normal form: alternatives of segments separated by `.*`
+    
+    Supported syntax: literal characters, escaped punctuation, \\s / \\d (optionally with +),
+    `.*` gaps and (?:...) / (...) groups with | alternation. Anything else raises UnsupportedSequence.
+    """
+    def concat(left, right):
+        return [a[:-1] + [a[-1] + b[0]] + b[1:] for a in left for b in right]
+
+    def parse_union(pos):
+        alternatives, pos = parse_concat(pos)
+        while pos < len(pattern) and pattern[pos] == '|':
+            more, pos = parse_concat(pos + 1)
+            alternatives = alternatives + more
+        return alternatives, pos
+
+    def parse_concat(pos):
+        result = [[[]]]
+        while pos < len(pattern) and pattern[pos] not in '|)':
+            char = pattern[pos]
+            if char == '.':
+                if pattern[pos + 1:pos + 2] != '*':
+                    raise UnsupportedSequence(pattern)
+                result = concat(result, [[[], []]])
+                pos += 2
+                continue
+            if char == '(':
+                pos += 3 if pattern.startswith('(?:', pos) else 1
+                if pattern[pos:pos + 1] == '?':
+                    raise UnsupportedSequence(pattern)
+                group, pos = parse_union(pos)
+                if pattern[pos:pos + 1] != ')':
+                    raise UnsupportedSequence(pattern)
+                pos += 1
+                if pattern[pos:pos + 1] in ('*', '+', '?', '{'):
+                    raise UnsupportedSequence(pattern)
+                result = concat(result, group)
+                continue
+            if char == '\\':
+                escaped = pattern[pos + 1:pos + 2]
+                pos += 2
+                if escaped in ('s', 'd'):
+                    plus = pattern[pos:pos + 1] == '+'
+                    pos += 1 if plus else 0
+                    atom = ('class', '\\' + escaped, plus)
+                elif escaped and not escaped.isalnum():
+                    atom = ('lit', escaped)
+                else:
+                    raise UnsupportedSequence(pattern)
+            elif char in '[]^$?*+{}':
+                raise UnsupportedSequence(pattern)
+            else:
+                atom = ('lit', char)
+                pos += 1
+            if pattern[pos:pos + 1] in ('*', '+', '?', '{'):
+                raise UnsupportedSequence(pattern)
+            result = concat(result, [[[atom]]])
+        return result, pos
+
+    alternatives, pos = parse_union(0)
+    if pos != len(pattern):
+        raise UnsupportedSequence(pattern)
+    return alternatives
+
+
+def _segment_to_step(segment: List[Tuple]) -> Tuple[str, str, Optional[str]]:
+    """Turn one gap-free segment into a literal keyword step or a small regex step
+    
+    A trailing \\s+ / \\d+ is matched as a single character and then extended over the run,
+    so every possible end is available to the next step (\\s+ may swallow a newline `.*` cannot).
+    """
+    if all(atom[0] == 'lit' for atom in segment):
+        return ('literal', ''.join(atom[1] for atom in segment), None)
+
+    parts = []
+    extend = None
+    for i, atom in enumerate(segment):
+        if atom[0] == 'lit':
+            parts.append(re.escape(atom[1]))
+        elif atom[2] and i == len(segment) - 1:
+            parts.append(atom[1])
+            extend = atom[1]
+        else:
+            parts.append(atom[1] + ('+' if atom[2] else ''))
+    return ('regex', ''.join(parts), extend)
+
+
+class PatternMatches:
+    """All pattern hits found in a single scan of one (lowercased) text"""
+
+    __slots__ = ('text', 'tokens', 'found', 'bounded_found', '_engine', '_regex_results',
+                 '_keyword_positions', '_step_occurrences', '_newlines', '_run_ends', '_sequence_results')
+
+    def __init__(self, engine: 'PatternEngine', text: str, tokens: Set[str],
+                 found: Set[str], bounded_found: Set[str]):
+        self.text = text
+        self.tokens = tokens
+        self.found = found
+        self.bounded_found = bounded_found
+        self._engine = engine
+        self._regex_results = {}
+        self._keyword_positions = None
+        self._step_occurrences = {}
+        self._run_ends = {}
+        self._newlines = None
+        self._sequence_results = {}
+
+    def contains(self, pattern: str) -> bool:
+        """Equivalent of `pattern in text` for any registered literal pattern"""
+        return pattern in self.found
+
+    def any(self, group: str) -> bool:
+        """True if at least one pattern of the group matched"""
+        kind, patterns = self._engine.groups[group]
+        if kind == 'sequence':
+            if len(self.text) <= self._engine.sequence_regex_max_chars:
+                return bool(self._engine.regex_groups[group].search(self.text))
+            return any(self._sequence_matches(group, i) for i in self._sequence_candidates(group))
+        if kind == 'regex':
+            if group not in self._regex_results:
+                self._regex_results[group] = bool(self._engine.regex_groups[group].search(self.text))
+            return self._regex_results[group]
+
+        found = self.bounded_found if kind == 'bounded' else self.found
+        return not found.isdisjoint(self._engine.group_sets[group])
+
+    def hits(self, group: str) -> List[str]:
+        """Matched patterns of a literal group, in group order (duplicates preserved)"""
+        kind, patterns = self._engine.groups[group]
+        if kind == 'sequence':
+            if len(self.text) <= self._engine.sequence_regex_max_chars:
+                # Backtracking stays cheap on short texts and the C regex engine beats the step walk
+                text = self.text
+                return [regex.pattern for regex in self._engine.sequence_regexes[group] if regex.search(text)]
+            return [patterns[i] for i in self._sequence_candidates(group) if self._sequence_matches(group, i)]
+        if kind == 'regex':
+            raise ValueError(f"Regex group '{group}' only supports any()")
+
+        found = self.bounded_found if kind == 'bounded' else self.found
+        index = self._engine.group_index[group]
+        positions = []
+        for pattern in found:
+            if pattern in index:
+                positions.extend(index[pattern])
+        positions.sort()
+        return [patterns[i] for i in positions]
+
+    def count(self, group: str) -> int:
+        """Number of group entries that matched (equivalent to sum(1 for p in group if p in text))"""
+        return len(self.hits(group))
+
+    def _sequence_candidates(self, group: str) -> List[int]:
+        """Indices of the rules of a group whose anchor keyword occurs in the text, in group order"""
+        engine = self._engine
+        if self._keyword_positions is None:
+            self._scan_keywords()
+        anchors, candidates = engine.sequence_anchors[group]
+        positions = self._keyword_positions
+        found = [keyword for keyword in positions if keyword in anchors]
+        if not found:
+            return candidates
+        candidates = set(candidates)
+        for keyword in found:
+            candidates.update(anchors[keyword])
+        return sorted(candidates)
+
+    def _sequence_matches(self, group: str, index: int) -> bool:
+        """Equivalent of re.search(pattern, text) for one sequence rule"""
+        key = (group, index)
+        if key not in self._sequence_results:
+            rule = self._engine.sequence_rules[group][index]
+            if rule[0] == 'regex':
+                result = bool(rule[1].search(self.text))
+            else:
+                result = any(self._steps_match(steps) for steps in rule[1])
+            self._sequence_results[key] = result
+        return self._sequence_results[key]
+
+    def _steps_match(self, steps: Tuple[int, ...]) -> bool:
+        """Is there a chain of step occurrences, each starting at or after the previous end,
+        with no newline in between (what `.*` can span)?"""
+        if not steps:
+            return True
+        if self._keyword_positions is None:
+            self._scan_keywords()
+
+        # Cheap rejection: a literal keyword that never occurs
+        engine = self._engine
+        for step in steps:
+            kind, value, _ = engine.sequence_steps[step]
+            if kind == 'literal' and value not in self._keyword_positions:
+                return False
+
+        ends = _merge_intervals(self._occurrences(steps[0]))
+        newlines = self._newlines
+        for step in steps[1:]:
+            if not ends:
+                return False
+            # Reachable ends are kept as disjoint (first, last) runs, so a trailing `\s+` on a long run
+            # of spaces costs one interval instead of one entry per possible end
+            firsts = [first for first, _ in ends]
+            reachable = []
+            for occurrence in self._occurrences(step):
+                start = occurrence[0]
+                # The latest reachable end before this start is the best candidate: later ends leave
+                # fewer newlines between the two positions
+                i = bisect_right(firsts, start) - 1
+                if i >= 0:
+                    end = min(ends[i][1], start)
+                    if bisect_left(newlines, end) == bisect_left(newlines, start):
+                        reachable.append(occurrence)
+            ends = _merge_intervals(reachable)
+        return bool(ends)
+
+    def _scan_keywords(self):
+        """Record every sequence keyword position in one pass"""
+        engine = self._engine
+        positions = {}
+        if engine._sequence_regex is not None:
+            prefixes = engine._sequence_prefixes
+            for match in engine._sequence_regex.finditer(self.text):
+                start = match.start()
+                for keyword in prefixes[match.group(1)]:
+                    positions.setdefault(keyword, []).append(start)
+        self._keyword_positions = positions
+        self._newlines = [i for i, char in enumerate(self.text) if char == '\n'] if '\n' in self.text else []
+
+    def _run_end(self, char_class: str, position: int) -> int:
+        """End of the run of `char_class` characters starting at `position` (computed once per class)"""
+        if char_class not in self._run_ends:
+            run_ends = list(range(len(self.text) + 1))
+            for run in _CHAR_RUNS[char_class].finditer(self.text):
+                end = run.end()
+                for i in range(run.start(), end):
+                    run_ends[i] = end
+            self._run_ends[char_class] = run_ends
+        return self._run_ends[char_class][position]
+
+    def _occurrences(self, step: int) -> List[Tuple[int, int, int]]:
+        """(start, first end, last end) of every occurrence of a step, ordered by start"""
+        if step not in self._step_occurrences:
+            kind, value, extend = self._engine.sequence_steps[step]
+            if kind == 'literal':
+                length = len(value)
+                occurrences = [(start, start + length, start + length)
+                               for start in self._keyword_positions.get(value, [])]
+            else:
+                regex = self._engine.sequence_step_regexes[step]
+                occurrences = []
+                for match in regex.finditer(self.text):
+                    start = match.start()
+                    end = start + len(match.group(1))
+                    # Every longer run of the trailing class is another possible end
+                    last = self._run_end(extend, end) if extend else end
+                    occurrences.append((start, end, last))
+            self._step_occurrences[step] = occurrences
+        return self._step_occurrences[step]
+
+
+def _merge_intervals(occurrences: List[Tuple[int, int, int]]) -> List[Tuple[int, int]]:
+    """Sorted, disjoint (first, last) end ranges covered by the given occurrences"""
+    merged = []
+    for _, first, last in sorted(occurrences, key=lambda occurrence: occurrence[1]):
+        if merged and first <= merged[-1][1]:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
+
+
+class PatternEngine:
+    """Compiles pattern groups once and scans each text in a single pass"""
+
+    def __init__(self, sequence_regex_max_chars: int = 300):
+        # Texts up to this length run sequence rules as plain regexes (backtracking stays bounded)
+        self.sequence_regex_max_chars = sequence_regex_max_chars
+        self.groups = {}          # group -> (kind, ordered pattern list)
+        self.group_sets = {}      # group -> frozenset of patterns
+        self.group_index = {}     # group -> {pattern: [positions in group list]}
+        self.regex_groups = {}    # group -> combined compiled regex
+        self.sequence_rules = {}  # group -> [('steps', [step id tuples]) | ('regex', compiled)]
+        self.sequence_steps = []  # step id -> ('literal', keyword) | ('regex', pattern)
+        self.sequence_step_regexes = {}
+        self.sequence_regexes = {}  # group -> compiled pattern per rule
+        self.sequence_anchors = {}  # group -> ({keyword: rule indices}, rule indices without a keyword)
+        self._sequence_regex = None
+        self._sequence_prefixes = {}
+        self._literal_regex = None
+        self._literal_prefixes = {}
+        self._bounded_tokens = frozenset()
+        self._bounded_regex = None
+        self._bounded_prefixes = {}
+        self._compiled = False
+
+    def add_literals(self, group: str, patterns: Iterable[str], word_boundary: bool = False):
+        """Register a group of literal patterns (substring or word-bounded matching)"""
+        patterns = list(patterns)
+        if any(not pattern for pattern in patterns):
+            raise ValueError(f"Empty pattern in group '{group}'")
+        self._register(group, 'bounded' if word_boundary else 'literal', patterns)
+
+    def add_regexes(self, group: str, patterns: Iterable[str]):
+        """Register a group of regexes that is only ever tested for any match"""
+        self._register(group, 'regex', list(patterns))
+
+    def add_sequences(self, group: str, patterns: Iterable[str]):
+        """Register "A followed later by B" regexes, evaluated per pattern over keyword positions"""
+        self._register(group, 'sequence', list(patterns))
+
+    def _register(self, group: str, kind: str, patterns: List[str]):
+        if group in self.groups:
+            raise ValueError(f"Pattern group '{group}' already registered")
+        self.groups[group] = (kind, patterns)
+        self._compiled = False
+
+    def compile(self) -> 'PatternEngine':
+        """Compile all registered groups into the scan automata"""
+        literal_patterns = set()
+        bounded_patterns = set()
+
+        sequence_keywords = set()
+        step_ids = {}
+        self.sequence_steps = []
+        self.sequence_step_regexes = {}
+
+        for group, (kind, patterns) in self.groups.items():
+            if kind == 'regex':
+                self.regex_groups[group] = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+                continue
+
+            if kind == 'sequence':
+                rules = []
+                anchors = {}
+                unanchored = []
+                for pattern in patterns:
+                    try:
+                        alternatives = _parse_sequence(pattern)
+                    except UnsupportedSequence:
+                        unanchored.append(len(rules))
+                        rules.append(('regex', re.compile(pattern)))
+                        continue
+                    step_lists = []
+                    rule_anchors = set()
+                    for segments in alternatives:
+                        steps = []
+                        for segment in segments:
+                            if not segment:
+                                continue
+                            step = _segment_to_step(segment)
+                            if step not in step_ids:
+                                step_ids[step] = len(self.sequence_steps)
+                                self.sequence_steps.append(step)
+                                if step[0] == 'literal':
+                                    sequence_keywords.add(step[1])
+                                else:
+                                    self.sequence_step_regexes[step_ids[step]] = re.compile('(?=(' + step[1] + '))')
+                            steps.append(step_ids[step])
+                        step_lists.append(tuple(steps))
+                        # An alternative can only match where its longest keyword occurs
+                        keywords = [self.sequence_steps[step][1] for step in steps
+                                    if self.sequence_steps[step][0] == 'literal']
+                        rule_anchors.add(max(keywords, key=len) if keywords else None)
+                    if None in rule_anchors:
+                        unanchored.append(len(rules))
+                    else:
+                        for keyword in rule_anchors:
+                            anchors.setdefault(keyword, []).append(len(rules))
+                    rules.append(('steps', step_lists))
+                self.sequence_rules[group] = rules
+                self.sequence_regexes[group] = [re.compile(pattern) for pattern in patterns]
+                self.regex_groups[group] = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+                self.sequence_anchors[group] = (anchors, unanchored)
+                continue
+
+            self.group_sets[group] = frozenset(patterns)
+            index = {}
+            for i, pattern in enumerate(patterns):
+                index.setdefault(pattern, []).append(i)
+            self.group_index[group] = index
+
+            if kind == 'bounded':
+                bounded_patterns.update(patterns)
+            else:
+                literal_patterns.update(patterns)
+
+        # Substring matching: at every position report the longest pattern starting there,
+        # every other pattern starting at the same position is one of its prefixes
+        if literal_patterns:
+            trie = _build_trie(literal_patterns)
+            self._literal_regex = re.compile('(?=(' + _trie_to_regex(trie) + '))')
+            self._literal_prefixes = {pattern: tuple(_prefix_patterns(trie, pattern))
+                                      for pattern in literal_patterns}
+
+        # Sequence keywords: positions are needed, so they get their own (lazily scanned) trie
+        if sequence_keywords:
+            trie = _build_trie(sequence_keywords)
+            self._sequence_regex = re.compile('(?=(' + _trie_to_regex(trie) + '))')
+            self._sequence_prefixes = {keyword: tuple(_prefix_patterns(trie, keyword))
+                                       for keyword in sequence_keywords}
+
+        # Word-bounded single words: r'\bword\b' matches exactly when word is one of the \w+ tokens
+        self._bounded_tokens = frozenset(p for p in bounded_patterns if _TOKEN.fullmatch(p))
+        bounded_patterns -= self._bounded_tokens
+
+        # Word-bounded phrases: a shorter prefix only counts if its own end is a word boundary,
+        # which is decided by the characters of the longer pattern alone
+        if bounded_patterns:
+            trie = _build_trie(bounded_patterns)
+            self._bounded_regex = re.compile(r'\b(?=(' + _trie_to_regex(trie) + r')\b)')
+            self._bounded_prefixes = {
+                pattern: tuple(prefix for prefix in _prefix_patterns(trie, pattern)
+                               if len(prefix) == len(pattern) or
+                               _is_word_char(pattern[len(prefix) - 1]) != _is_word_char(pattern[len(prefix)]))
+                for pattern in bounded_patterns
+            }
+
+        self._compiled = True
+        return self
+
+    def scan(self, text: str, tokens: Optional[Iterable[str]] = None) -> PatternMatches:
+        """Scan a text once and collect every literal and word-bounded hit
+        (tokens: the text's word tokens, if the caller already has them)"""
+        if not self._compiled:
+            self.compile()
+
+        found = set()
+        if self._literal_regex is not None:
+            prefixes = self._literal_prefixes
+            for longest in set(self._literal_regex.findall(text)):
+                found.update(prefixes[longest])
+
+        tokens = set(_TOKEN.findall(text) if tokens is None else tokens)
+        bounded_found = tokens & self._bounded_tokens
+        if self._bounded_regex is not None:
+            prefixes = self._bounded_prefixes
+            for longest in set(self._bounded_regex.findall(text)):
+                bounded_found.update(prefixes[longest])
+
+        return PatternMatches(self, text, tokens, found, bounded_found)
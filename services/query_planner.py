@@ -0,0 +1,122 @@
+"""
+Query Planner - Decides which comments a query needs before any of them is loaded
+- OEM scope: the OEMs a query names (by name or alias, as whole words); queries about competitors,
+  the market or all OEMs, and comparisons naming a single OEM, keep every OEM
+- Time window: TemporalAnalysisService.extract_time_period as a half-open date range
+- Loading a plan pushes it down: the consolidated dataset reads only the matching partitions, the
+  comment repository runs one indexed query per OEM, in-memory data is filtered per planned OEM only
+"""
+
+import re
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from .comment_dataset import DatasetCommentData
+from .comment_repository import RepositoryCommentData
+
+# Query term -> OEM
+OEM_ALIASES = {
+    'ola': 'Ola Electric',
+    'ola electric': 'Ola Electric',
+    'tvs': 'TVS iQube',
+    'tvs iqube': 'TVS iQube',
+    'iqube': 'TVS iQube',
+    'bajaj': 'Bajaj Chetak',
+    'bajaj chetak': 'Bajaj Chetak',
+    'chetak': 'Bajaj Chetak',
+    'ather': 'Ather',
+    'hero': 'Hero Vida',
+    'hero vida': 'Hero Vida',
+    'vida': 'Hero Vida',
+    'revolt': 'Revolt',
+    'ultraviolette': 'Ultraviolette',
+    'ultraviolette f77': 'Ultraviolette',
+    'f77': 'Ultraviolette',
+    'bgauss': 'BGauss',
+    'river': 'River Mobility',
+    'river mobility': 'River Mobility',
+    'river indie': 'River Mobility',
+    'ampere': 'Ampere'
+}
+
+# Queries that need every OEM even when they name one
+BROAD_SCOPE_PATTERNS = [
+    r'\bcompetit', r'\brivals?\b', r'\bother (oems?|brands?|companies|scooters|players)\b', r'\bothers\b',
+    r'\ball (the )?(oems?|brands?|companies|scooters)\b', r'\bevery (oem|brand|company)\b',
+    r'\bindustry\b', r'\bmarket\b', r'\bsegment\b', r'\brank', r'\bleaders?\b'
+]
+
+COMPARISON_PATTERNS = [r'\bvs\b', r'\bv/s\b', r'\bversus\b', r'\bcompar', r'\bbetter than\b', r'\balternatives?\b']
+
+
+@dataclass
+class QueryPlan:
+    """OEMs (None: every OEM) and half-open date range [start_date, end_date) a query reads"""
+    oems: Optional[List[str]] = None
+    time_period: Optional[Dict[str, Any]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    @property
+    def has_time_window(self) -> bool:
+        return self.start_date is not None
+
+    def scope_only(self) -> 'QueryPlan':
+        """The same OEM scope without the time window"""
+        return replace(self, time_period=None, start_date=None, end_date=None)
+
+    def describe(self) -> str:
+        oems = ', '.join(self.oems) if self.oems is not None else 'all OEMs'
+        if self.time_period:
+            return f"{oems} / {self.time_period.get('description', self.time_period['type'])}"
+        return f"{oems} / all dates"
+
+
+def mentioned_oems(query: str) -> List[str]:
+    """OEMs a query names, in order of first alias match"""
+    query_lower = query.lower()
+    oems = []
+    for alias, oem_name in OEM_ALIASES.items():
+        if oem_name not in oems and re.search(rf'\b{re.escape(alias)}\b', query_lower):
+            oems.append(oem_name)
+    return oems
+
+
+def plan_query(query: str, temporal_service, time_period: Optional[Dict[str, Any]] = None) -> QueryPlan:
+    """Plan the comments a query reads (time_period: an already extracted period of the query)"""
+    query_lower = query.lower()
+    oems = mentioned_oems(query)
+    broad = any(re.search(pattern, query_lower) for pattern in BROAD_SCOPE_PATTERNS)
+    if len(oems) == 1 and any(re.search(pattern, query_lower) for pattern in COMPARISON_PATTERNS):
+        broad = True
+
+    time_period = time_period or temporal_service.extract_time_period(query)
+    bounds = temporal_service.period_bounds(time_period) if time_period else None
+    return QueryPlan(
+        oems=oems if oems and not broad else None,
+        time_period=time_period,
+        start_date=bounds[0] if bounds else None,
+        end_date=bounds[1] if bounds else None
+    )
+
+
+def load_planned_comments(youtube_data: Dict[str, List[Dict]], plan: QueryPlan,
+                          temporal_service) -> Dict[str, List[Dict]]:
+    """OEM -> comments of the plan (OEMs without any are left out), read with pushdown where the data
+    source supports it"""
+    oems = [oem for oem in plan.oems if oem in youtube_data] if plan.oems is not None else list(youtube_data)
+    planned = {}
+    for oem_name in oems:
+        if plan.has_time_window and isinstance(youtube_data, DatasetCommentData):
+            comments = youtube_data.dataset.comments(oem_name, start_date=plan.start_date, end_date=plan.end_date)
+        elif plan.has_time_window and isinstance(youtube_data, RepositoryCommentData):
+            comments = youtube_data.repository.query(oem=oem_name, start_date=plan.start_date,
+                                                     end_date=plan.end_date)
+        elif plan.has_time_window:
+            comments = temporal_service.filter_comments_by_time_period(youtube_data[oem_name], plan.time_period)
+        else:
+            comments = youtube_data[oem_name]
+        if comments:
+            planned[oem_name] = comments
+    return planned
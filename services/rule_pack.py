@@ -0,0 +1,110 @@
+"""
+Rule Pack - Declarative lexicons, phrases, co-occurrence rules and rule scores of the classifier
+- A rule pack is a JSON file of sections; each section maps classifier attribute names to data
+- The pack version is a content hash of the file, part of every classification cache key
+- The classifier compiles a pack once into its matcher structures; the compiled form is pickled
+  per pack version and compiler code, so later startups skip recompilation until either changes
+"""
+
+import os
+import json
+import pickle
+import hashlib
+from typing import Dict, Any, Optional
+
+SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RULE_PACK_PATH = os.path.join(SERVICE_DIR, 'rule_packs', 'ev_sentiment.json')
+DEFAULT_COMPILED_DIR = os.path.join(os.path.dirname(SERVICE_DIR), 'models')
+
+# Modules whose code produces the compiled form: compile_rule_pack and COMPILED_RULE_ATTRIBUTES,
+# the pattern engine, the script profiler, and the pickling below
+COMPILER_MODULES = ['advanced_sentiment_classifier.py', 'pattern_engine.py', 'script_profiler.py', 'rule_pack.py']
+
+# Section -> attributes every pack must define
+RULE_PACK_SECTIONS = {
+    'language': ['english_patterns', 'local_language_patterns', 'script_patterns'],
+    'emoji': ['emoji_sentiment'],
+    'companies': ['company_patterns'],
+    'sentiment': ['positive_patterns', 'negative_patterns', 'intensity_modifiers'],
+    'rules': ['advice_patterns', 'strong_negative_patterns', 'negative_phrase_patterns',
+              'information_seeking_patterns', 'question_patterns', 'irrelevant_patterns', 'range_issue_patterns',
+              'transliteration_corrections', 'transliteration_context', 'contextual_patterns',
+              'good_negation_patterns', 'contextual_sarcastic_patterns'],
+    'sarcasm': ['sarcasm_patterns', 'exclamation_complaint_pattern', 'sarcasm_complaint_words'],
+    'relevance': ['relevance_keywords', 'context_patterns']
+}
+
+
+class RulePack:
+    """A loaded rule pack: its attributes and content version"""
+
+    def __init__(self, path: str, data: Dict[str, Any], version: str):
+        self.path = path
+        self.data = data
+        self.version = version
+        self.name = data.get('name', os.path.splitext(os.path.basename(path))[0])
+
+    @classmethod
+    def load(cls, path: str = None) -> 'RulePack':
+        """Read and validate a rule pack (CLASSIFIER_RULE_PACK, default: the bundled EV sentiment pack)"""
+        path = path or os.getenv('CLASSIFIER_RULE_PACK', DEFAULT_RULE_PACK_PATH)
+        with open(path, 'rb') as f:
+            content = f.read()
+        data = json.loads(content.decode('utf-8'))
+        for section, attributes in RULE_PACK_SECTIONS.items():
+            missing = [name for name in attributes if name not in data.get(section, {})]
+            if missing:
+                raise ValueError(f"Rule pack {path} is missing {section}: {', '.join(missing)}")
+        return cls(path, data, hashlib.sha256(content).hexdigest()[:16])
+
+    def attributes(self) -> Dict[str, Any]:
+        """Attribute name -> value for every entry of every section"""
+        return {name: value for section in RULE_PACK_SECTIONS for name, value in self.data[section].items()}
+
+
+def compiled_key(version: str) -> str:
+    """Key of a pack version's compiled form: the pack version plus the source of the compiler modules,
+    so a code change never loads structures compiled by older code"""
+    digest = hashlib.sha256(version.encode('ascii'))
+    for module in COMPILER_MODULES:
+        with open(os.path.join(SERVICE_DIR, module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def compiled_path(key: str, cache_dir: str = None) -> str:
+    """Pickle of one compiled form (CLASSIFIER_RULE_PACK_CACHE_DIR, default the project's models directory)"""
+    cache_dir = cache_dir or os.getenv('CLASSIFIER_RULE_PACK_CACHE_DIR', DEFAULT_COMPILED_DIR)
+    return os.path.join(cache_dir, f'rule_pack_{key}.pkl')
+
+
+def load_compiled(key: str, cache_dir: str = None) -> Optional[Dict[str, Any]]:
+    """Compiled classifier attributes stored under a compiled_key, or None when not compiled yet (or unreadable)"""
+    path = compiled_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            compiled = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable compiled rule pack {path}: {e}")
+        return None
+    if compiled.pop('compiled_key', None) != key:
+        return None
+    return compiled
+
+
+def save_compiled(compiled: Dict[str, Any], key: str, cache_dir: str = None):
+    """Pickle compiled classifier attributes under a compiled_key (written atomically; failures only
+    skip the cache)"""
+    path = compiled_path(key, cache_dir)
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(dict(compiled, compiled_key=key), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"⚠️ Failed to save compiled rule pack {path}: {e}")
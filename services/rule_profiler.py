@@ -0,0 +1,249 @@
+"""
+Rule Profiler - Hit counts, label flips and cumulative time of the classifier's rules
+- Pipeline stages are timed by wrapping the classifier's stage methods on the instance only while
+  profiling, so a classifier that is not profiled runs unchanged code
+- Pattern groups are timed and counted through a proxy around each comment's PatternMatches
+  (lazy sequence/regex evaluation is where group cost shows up; the single scan is the
+  scan_patterns stage)
+- Each comment is also swept against every group on a separate scan, so patterns that never
+  match any text are reported as dead even when the classifier does not consult their group
+- Label flips replay the final-combination factors: a rule flips the label when it changes the
+  running sentiment (emoji_influence flips when the final emoji adjustment does)
+- Reports are sorted by cumulative time and written as JSON and CSV
+"""
+
+import csv
+import json
+import time
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+from .explanations import render_rules
+
+# Pipeline stages of AdvancedSentimentClassifier (times are inclusive of nested stages)
+PROFILED_STAGES = [
+    'extract_features', 'score_features', 'profile_scripts', 'scan_patterns', 'detect_language_mix',
+    'analyze_emojis', 'calculate_engagement_weight', '_fast_path_decision', 'detect_company_mentions',
+    'analyze_sentiment_patterns', '_apply_contextual_sentiment_analysis', 'detect_sarcasm_advanced',
+    '_detect_context_advanced', '_calculate_product_relevance', '_calculate_final_sentiment'
+]
+
+# Final-combination rules that set the running sentiment
+LABEL_RULES = {
+    'strong_negative_emoji_override': 'negative',
+    'sarcasm_flip': 'negative',
+    'sarcasm_flip_emoji': 'negative',
+    'irrelevant_strong_negative_override': 'negative',
+    'irrelevant_content_override': 'neutral',
+    'wrong_brand_context': 'neutral',
+    'off_topic_brand_mention': 'neutral'
+}
+
+CSV_COLUMNS = ['kind', 'name', 'calls', 'comments_hit', 'hit_rate', 'total_ms', 'avg_us',
+               'fired', 'flips', 'patterns', 'dead_patterns']
+
+
+class ProfiledMatches:
+    """PatternMatches proxy that times and counts every group query of one comment"""
+
+    def __init__(self, matches, profiler: 'RuleProfiler'):
+        self._matches = matches
+        self._profiler = profiler
+        self._hit_groups = set()
+
+    def __getattr__(self, name):
+        return getattr(self._matches, name)
+
+    def _record(self, group: str, start_time: float, hit: bool):
+        stats = self._profiler.group_stats[group]
+        stats['calls'] += 1
+        stats['seconds'] += time.perf_counter() - start_time
+        if hit and group not in self._hit_groups:
+            self._hit_groups.add(group)
+            stats['comments_hit'] += 1
+
+    def contains(self, pattern: str) -> bool:
+        return self._matches.contains(pattern)
+
+    def any(self, group: str) -> bool:
+        start_time = time.perf_counter()
+        result = self._matches.any(group)
+        self._record(group, start_time, result)
+        return result
+
+    def hits(self, group: str) -> List[str]:
+        start_time = time.perf_counter()
+        result = self._matches.hits(group)
+        self._record(group, start_time, bool(result))
+        return result
+
+    def count(self, group: str) -> int:
+        start_time = time.perf_counter()
+        result = self._matches.count(group)
+        self._record(group, start_time, result > 0)
+        return result
+
+
+class RuleProfiler:
+    """Instrumentation of one AdvancedSentimentClassifier (attach, classify, report)"""
+
+    def __init__(self, classifier):
+        self.classifier = classifier
+        self.attached = False
+        self.reset()
+
+    def reset(self):
+        """Clear every counter"""
+        self.stage_stats = defaultdict(lambda: {'calls': 0, 'seconds': 0.0})
+        self.group_stats = defaultdict(lambda: {'calls': 0, 'comments_hit': 0, 'seconds': 0.0})
+        self.pattern_hits = defaultdict(lambda: defaultdict(int))
+        self.group_matches = defaultdict(int)
+        self.rule_stats = defaultdict(lambda: {'fired': 0, 'flips': 0})
+        self.comments = 0
+        self.overhead_seconds = 0.0
+
+    def attach(self) -> 'RuleProfiler':
+        """Start profiling: wrap the classifier's stage methods on the instance"""
+        if not self.attached:
+            for stage in PROFILED_STAGES:
+                setattr(self.classifier, stage, self._timed(stage, getattr(self.classifier, stage)))
+            scan_patterns = self.classifier.scan_patterns
+            self.classifier.scan_patterns = lambda text, profile=None: self._profile_scan(scan_patterns, text, profile)
+            final_sentiment = self.classifier._calculate_final_sentiment
+            self.classifier._calculate_final_sentiment = lambda *args: self._record_flips(final_sentiment, *args)
+            self.classifier.rule_profiler = self
+            self.attached = True
+        return self
+
+    def detach(self):
+        """Stop profiling: drop the instance wrappers so the class methods apply again"""
+        if self.attached:
+            for stage in PROFILED_STAGES:
+                self.classifier.__dict__.pop(stage, None)
+            self.classifier.rule_profiler = None
+            self.attached = False
+
+    def _timed(self, stage: str, method):
+        def timed(*args, **kwargs):
+            overhead = self.overhead_seconds
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats = self.stage_stats[stage]
+                stats['calls'] += 1
+                # Sweeps and rendering done by the profiler inside this stage are not its cost
+                stats['seconds'] += time.perf_counter() - start_time - (self.overhead_seconds - overhead)
+        return timed
+
+    def _profile_scan(self, scan_patterns, text: str, profile=None) -> ProfiledMatches:
+        matches = scan_patterns(text, profile)
+        self.comments += 1
+        start_time = time.perf_counter()
+
+        # Sweep every group on a separate scan (untimed, and without warming the lazy results
+        # of the scan the classifier uses)
+        engine = self.classifier.pattern_engine
+        sweep = engine.scan(matches.text, matches.tokens)
+        for group, (kind, _) in engine.groups.items():
+            if kind == 'regex':
+                if sweep.any(group):
+                    self.group_matches[group] += 1
+                continue
+            hits = set(sweep.hits(group))
+            if hits:
+                self.group_matches[group] += 1
+                group_hits = self.pattern_hits[group]
+                for pattern in hits:
+                    group_hits[pattern] += 1
+        self.overhead_seconds += time.perf_counter() - start_time
+        return ProfiledMatches(matches, self)
+
+    def _record_flips(self, final_sentiment, pattern_sentiment, emoji_info, sarcasm_info, engagement_info,
+                      company_info, target_oem, explain=True):
+        # Rule IDs are needed to replay the label; rendering them gives the explain=True output
+        result = final_sentiment(pattern_sentiment, emoji_info, sarcasm_info, engagement_info,
+                                 company_info, target_oem, False)
+        start_time = time.perf_counter()
+        label = pattern_sentiment['sentiment']
+        for rule_id, *_ in result['factors']:
+            stats = self.rule_stats[rule_id]
+            stats['fired'] += 1
+            target = LABEL_RULES.get(rule_id)
+            if target is not None and target != label:
+                stats['flips'] += 1
+                label = target
+        if result['sentiment'] != label:
+            self.rule_stats['emoji_influence']['flips'] += 1
+        if explain:
+            result['factors'] = render_rules(result['factors'])
+        self.overhead_seconds += time.perf_counter() - start_time
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        """Stages, pattern groups and final-combination rules, each sorted by cost or effect"""
+        comments = self.comments
+        stages = sorted(({
+            'name': stage,
+            'calls': stats['calls'],
+            'total_ms': round(stats['seconds'] * 1000, 3),
+            'avg_us': round(stats['seconds'] / stats['calls'] * 1e6, 2) if stats['calls'] else 0.0
+        } for stage, stats in self.stage_stats.items() if stats['calls']), key=lambda row: -row['total_ms'])
+
+        groups = []
+        for group, (kind, patterns) in self.classifier.pattern_engine.groups.items():
+            stats = self.group_stats.get(group, {'calls': 0, 'comments_hit': 0, 'seconds': 0.0})
+            pattern_hits = self.pattern_hits.get(group, {})
+            groups.append({
+                'name': group,
+                'kind': kind,
+                'patterns': len(patterns),
+                'calls': stats['calls'],
+                'comments_hit': stats['comments_hit'],
+                'hit_rate': round(stats['comments_hit'] / comments * 100, 2) if comments else 0.0,
+                'texts_matched': self.group_matches.get(group, 0),
+                'total_ms': round(stats['seconds'] * 1000, 3),
+                'avg_us': round(stats['seconds'] / stats['calls'] * 1e6, 2) if stats['calls'] else 0.0,
+                'pattern_hits': dict(sorted(pattern_hits.items(), key=lambda item: -item[1])),
+                # Regex groups are only tested as a whole
+                'dead_patterns': [] if kind == 'regex' else
+                                 [pattern for pattern in dict.fromkeys(patterns) if pattern not in pattern_hits]
+            })
+        groups.sort(key=lambda row: (-row['total_ms'], row['name']))
+
+        rules = sorted(({'name': rule_id, **stats} for rule_id, stats in self.rule_stats.items()),
+                       key=lambda row: (-row['flips'], -row['fired'], row['name']))
+
+        return {
+            'comments': comments,
+            'stages': stages,
+            'groups': groups,
+            'rules': rules,
+            'dead_patterns': sum(len(group['dead_patterns']) for group in groups),
+            'profiling_overhead_ms': round(self.overhead_seconds * 1000, 3)
+        }
+
+    def write_json(self, path: str, report: Optional[Dict[str, Any]] = None):
+        """Dump the full report (including per-pattern hit counts)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report or self.report(), f, indent=2, ensure_ascii=False)
+
+    def write_csv(self, path: str, report: Optional[Dict[str, Any]] = None):
+        """Dump one row per stage, pattern group and rule"""
+        report = report or self.report()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for kind in ('stages', 'groups', 'rules'):
+                for row in report[kind]:
+                    row = dict(row, kind=kind[:-1])
+                    if 'dead_patterns' in row:
+                        row['dead_patterns'] = len(row['dead_patterns'])
+                    writer.writerow(row)
+
+    def write_reports(self, path_prefix: str) -> Dict[str, Any]:
+        """Write <path_prefix>.json and <path_prefix>.csv from one report"""
+        report = self.report()
+        self.write_json(path_prefix + '.json', report)
+        self.write_csv(path_prefix + '.csv', report)
+        return report
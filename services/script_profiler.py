@@ -0,0 +1,70 @@
+"""
+Script Profiler - Single-pass Unicode script profile of a comment
+- All script codepoint ranges compiled into one alternation of named character classes,
+  so a single scan attributes every run of script characters
+- Emoji alternatives share the same scan, so emojis are collected without a separate pass
+- ASCII-only text (the common case) skips the script scan entirely
+- Word tokens (\\w+) are extracted once and shared with the pattern engine
+"""
+
+import re
+from typing import Dict, List, Pattern, Iterable, Optional
+
+_TOKEN = re.compile(r'\w+')
+_EMOJI_GROUP = '_emoji'
+
+
+class ScriptProfile:
+    """Tokens, per-script character counts and emojis of one (lowercased) text"""
+
+    __slots__ = ('text', 'tokens', 'word_chars', 'script_chars', 'emojis')
+
+    def __init__(self, text: str, tokens: List[str], word_chars: int, script_chars: Dict[str, int],
+                 emojis: List[str]):
+        self.text = text
+        self.tokens = tokens
+        self.word_chars = word_chars
+        self.script_chars = script_chars
+        self.emojis = emojis
+
+    def script_ratios(self) -> Dict[str, float]:
+        """Script characters relative to word characters (combining marks count towards their
+        script but are not word characters, so a ratio can exceed 1)"""
+        if not self.word_chars:
+            return {}
+        return {script: count / self.word_chars for script, count in self.script_chars.items()}
+
+
+class ScriptProfiler:
+    """Profiles texts against a fixed set of script character classes"""
+
+    def __init__(self, script_patterns: Dict[str, Pattern], emojis: Optional[Iterable[str]] = None):
+        """script_patterns: script name -> compiled run pattern such as [\\u0900-\\u097F]+
+        emojis: non-ASCII emoji strings to collect, matched in the given order like an alternation"""
+        self.scripts = list(script_patterns)
+        alternatives = [f'(?P<{name}>{pattern.pattern})' for name, pattern in script_patterns.items()]
+        emojis = list(emojis or [])
+        if any(emoji.isascii() or not emoji for emoji in emojis):
+            raise ValueError("Emojis must be non-empty and non-ASCII (ASCII text skips the scan)")
+        if emojis:
+            alternatives.append(f'(?P<{_EMOJI_GROUP}>' + '|'.join(re.escape(emoji) for emoji in emojis) + ')')
+        self._script_regex = re.compile('|'.join(alternatives))
+
+    def profile(self, text: str) -> ScriptProfile:
+        """Profile an already lowercased text"""
+        tokens = _TOKEN.findall(text)
+        word_chars = sum(map(len, tokens))
+
+        script_chars = {}
+        emojis = []
+        if not text.isascii():
+            for run in self._script_regex.finditer(text):
+                script = run.lastgroup
+                if script == _EMOJI_GROUP:
+                    emojis.append(run.group())
+                else:
+                    script_chars[script] = script_chars.get(script, 0) + run.end() - run.start()
+        # Report scripts in table order, like one findall per script would
+        script_chars = {script: script_chars[script] for script in self.scripts if script in script_chars}
+
+        return ScriptProfile(text, tokens, word_chars, script_chars, emojis)
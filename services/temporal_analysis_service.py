@@ -160,7 +160,42 @@ class TemporalAnalysisService:
                 filtered_comments.append(comment)
         
         return filtered_comments
-    
+
+    def period_bounds(self, time_period: Dict[str, Any]) -> Optional[Tuple[datetime, datetime]]:
+        """Half-open [start, end) datetime range of a time period (None for an unknown period type)"""
+        period_type = time_period['type']
+
+        if period_type == 'month':
+            start = datetime(time_period['year'], time_period['month'], 1)
+            end = datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+        elif period_type == 'quarter':
+            start = datetime(time_period['year'], min(time_period['months']), 1)
+            last_month = max(time_period['months'])
+            end = datetime(start.year + last_month // 12, last_month % 12 + 1, 1)
+        elif period_type == 'year':
+            start = datetime(time_period['year'], 1, 1)
+            end = datetime(time_period['year'] + 1, 1, 1)
+        elif period_type == 'specific_date':
+            start = datetime(time_period['year'], time_period['month'], time_period['day'])
+            end = start + timedelta(days=1)
+        elif period_type == 'duration':
+            # Comment dates have whole seconds; the duration includes both of its ends
+            start = time_period['start_date']
+            if start.microsecond:
+                start = start.replace(microsecond=0) + timedelta(seconds=1)
+            end = time_period['end_date'].replace(microsecond=0) + timedelta(seconds=1)
+        else:
+            return None
+        return start, end
+
+    def query_comments_by_time_period(self, repository, oem: str, time_period: Dict[str, Any],
+                                      **filters) -> List[Dict]:
+        """filter_comments_by_time_period pushed down to a CommentRepository: one indexed range query"""
+        bounds = self.period_bounds(time_period)
+        if bounds is None:
+            return []
+        return repository.query(oem=oem, start_date=bounds[0], end_date=bounds[1], order_by='id', **filters)
+
     def _parse_comment_date(self, comment: Dict) -> Optional[datetime]:
         """Parse comment date from various formats"""
         date_str = comment.get('date', '')
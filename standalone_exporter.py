@@ -6,6 +6,7 @@ import asyncio
 import os
 from services.enhanced_agent_service import EnhancedAgentService
 from services.export_service import ExportService
+from services.batch_summary import BatchSummaryAccumulator
 
 class StandaloneExporter:
     def __init__(self):
@@ -28,8 +29,10 @@ class StandaloneExporter:
         comments = self.youtube_data[oem_name]
         
         # Apply advanced sentiment analysis
-        enhanced_comments = await self.agent.sentiment_analyzer.analyze_comment_batch(comments, oem_name)
-        sentiment_summary = self.agent.sentiment_analyzer.advanced_classifier.get_batch_summary(enhanced_comments)
+        batch_counts = BatchSummaryAccumulator()
+        enhanced_comments = await self.agent.sentiment_analyzer.analyze_comment_batch(comments, oem_name,
+                                                                                      summary=batch_counts)
+        sentiment_summary = self.agent.sentiment_analyzer.advanced_classifier.summarize_batch(batch_counts)
         
         export_data = {
             'query': f'All {len(comments)} comments for {oem_name} with advanced sentiment analysis',
@@ -78,18 +81,15 @@ class StandaloneExporter:
         """Export comparison data for multiple OEMs with advanced sentiment analysis"""
         await self.initialize()
         
-        comparison_data = {}
         sentiment_summaries = {}
         
-        for oem in oem_list:
-            if oem in self.youtube_data:
-                comments = self.youtube_data[oem]
-                # Apply advanced sentiment analysis for each OEM
-                enhanced_comments = await self.agent.sentiment_analyzer.analyze_comment_batch(comments, oem)
-                sentiment_summary = self.agent.sentiment_analyzer.advanced_classifier.get_batch_summary(enhanced_comments)
-                
-                comparison_data[oem] = enhanced_comments
-                sentiment_summaries[oem] = sentiment_summary
+        # Apply advanced sentiment analysis for each OEM; comments shared between OEMs
+        # (comparison videos) have their OEM-independent features extracted once
+        comparison_data = await self.agent.sentiment_analyzer.analyze_comment_batches_by_oem(
+            {oem: self.youtube_data[oem] for oem in oem_list if oem in self.youtube_data}
+        )
+        for oem, enhanced_comments in comparison_data.items():
+            sentiment_summaries[oem] = self.agent.sentiment_analyzer.advanced_classifier.get_batch_summary(enhanced_comments)
         
         export_data = {
             'query': f'Advanced sentiment comparison of {", ".join(oem_list)}',
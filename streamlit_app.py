@@ -319,6 +319,9 @@ def main():
                                     st.metric("Unique Users", data.get('unique_authors', 0))
                                 with col_b:
                                     st.metric("Avg Likes", f"{data.get('avg_likes', 0):.1f}")
+                                    sentiment = data.get('sentiment_distribution', {})
+                                    if sentiment:
+                                        st.write("**Sentiment:** " + ", ".join(f"{label} {count}" for label, count in sentiment.items()))
                                 
                                 # Top keywords
                                 keywords = data.get('sentiment_keywords', {})
@@ -334,7 +337,8 @@ def main():
         if st.session_state.youtube_data_loaded:
             youtube_data = asyncio.run(st.session_state.agent.load_youtube_data())
             if youtube_data:
-                json_data = json.dumps(youtube_data, indent=2, ensure_ascii=False)
+                # The comment data may be a lazy OEM mapping (store, repository or dataset): materialize it
+                json_data = json.dumps(dict(youtube_data), indent=2, ensure_ascii=False)
                 st.download_button(
                     "💾 Download YouTube Data",
                     data=json_data,
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test duplicate-text folding in batch classification
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+COMMENTS = [
+    {'text': 'First', 'likes': 0},
+    {'text': 'FIRST', 'likes': 250, 'replies': 30},
+    {'text': 'first', 'likes': 3},
+    {'text': 'Ola S1 Pro is amazing 😍 but service center is worst', 'likes': 5},
+    {'text': 'ola s1 pro is amazing 😍 but service center is worst', 'likes': 180, 'replies': 10, 'shares': 20},
+    {'text': 'Service center is worst 😡', 'likes': 120},
+    {'text': 'Service center is worst 😡\n', 'likes': 0},
+    {'text': '', 'likes': 40},
+]
+
+
+def test_dedup_matches_per_comment_classification():
+    """Fanned-out duplicates equal classifying every comment on its own, engagement included"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    for tiered in [False, True]:
+        results = asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ola Electric', tiered=tiered))
+        for comment, result in zip(COMMENTS, results):
+            expected = classifier.classify_comment(comment, 'Ola Electric', tiered=tiered) if comment['text'] \
+                else classifier._create_default_classification()
+            assert result['advanced_sentiment_classification'] == expected, comment
+
+    viral = results[4]['advanced_sentiment_classification']
+    assert viral['engagement_analysis']['engagement_level'] == 'viral'
+    assert results[3]['advanced_sentiment_classification']['engagement_analysis']['engagement_level'] == 'low'
+
+
+def test_dedup_ratio_in_summary():
+    """Case variants fold together, whitespace variants do not"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    results = asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ola Electric'))
+    stats = classifier.get_batch_summary(results)['dedup_statistics']
+    assert stats['comments'] == 8
+    assert stats['unique_texts'] == 5
+    assert stats['duplicates'] == 3
+    assert stats['dedup_ratio'] == 37.5
+
+    classifier.reset_dedup_stats()
+    asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ola Electric', dedup=False))
+    assert classifier.get_dedup_stats()['comments'] == 0
+
+
+if __name__ == "__main__":
+    test_dedup_matches_per_comment_classification()
+    test_dedup_ratio_in_summary()
+    print("✅ Batch dedup tests passed")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the streaming batch summary: counts accumulated during classification match get_batch_summary
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.batch_summary import BatchSummaryAccumulator
+
+
+TEXTS = [
+    "Ather 450X is amazing, loving the ride 😍",
+    "Service center is worst, 3rd visit this month 😡",
+    "Wow great service, waited 3 weeks for a simple repair!!",
+    "Which is better, Ather or Chetak?",
+    "dil se bol raha hu, bahut badhiya scooter hai 👍",
+    "Ola S1 Pro battery died in a week",
+    "subscribe to my channel",
+    "ATHER 450X IS AMAZING, LOVING THE RIDE 😍",
+]
+
+
+def strip_stats(summary):
+    return {k: v for k, v in summary.items()
+            if k not in ('cache_statistics', 'tier_statistics', 'gate_statistics', 'dedup_statistics')}
+
+
+def test_accumulated_summary_matches_batch_summary():
+    """Full, compact and streamed batches give the same summary as a pass over the results"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text, 'likes': i * 7} for i, text in enumerate(TEXTS * 3)]
+
+    for compact in [False, True]:
+        summary = BatchSummaryAccumulator()
+        results = asyncio.run(classifier.analyze_comment_batch(comments, 'Ather', compact=compact, summary=summary))
+        expected = classifier.get_batch_summary(results)
+        assert strip_stats(classifier.summarize_batch(summary)) == strip_stats(expected)
+        assert set(classifier.summarize_batch(summary)) == set(expected)
+
+    streamed = BatchSummaryAccumulator()
+    chunks = list(classifier.iter_classify(comments, 'Ather', chunk_size=5, compact=True, summary=streamed))
+    assert streamed.summary() == strip_stats(classifier.get_batch_summary([c for chunk in chunks for c in chunk]))
+
+    assert BatchSummaryAccumulator().summary() == {'error': 'No comments to analyze'}
+    assert classifier.get_batch_summary([]) == {'error': 'No comments to analyze'}
+
+
+def test_sentiment_counts_per_oem():
+    """One accumulator shared across OEMs keeps each OEM's sentiment counts apart; merging adds up"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text} for text in TEXTS]
+
+    summary = BatchSummaryAccumulator()
+    by_oem = asyncio.run(classifier.analyze_comment_batches_by_oem(
+        {'Ather': comments, 'Ola Electric': comments[:5]}, compact=True, summary=summary))
+    oem_sentiment = summary.oem_sentiment()
+    for oem, results in by_oem.items():
+        counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        for comment in results:
+            counts[comment['advanced_sentiment_classification']['sentiment']] += 1
+        assert oem_sentiment[oem] == {'total': len(results), 'sentiment': counts}
+
+    merged = BatchSummaryAccumulator()
+    for oem, results in by_oem.items():
+        part = BatchSummaryAccumulator()
+        for comment in results:
+            part.add(comment['advanced_sentiment_classification'], oem)
+        merged.merge(part)
+    assert merged.summary() == summary.summary() and merged.oem_sentiment() == oem_sentiment
+
+
+if __name__ == "__main__":
+    test_accumulated_summary_matches_batch_summary()
+    test_sentiment_counts_per_oem()
+    print("✅ Batch summary tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the persistent classification cache (hits/misses, restarts and forked workers)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.classification_cache import ClassificationCache
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+def test_batch_uses_cache_across_restarts():
+    """Second batch (even from a fresh classifier) is served from disk with identical results"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'cache.db')
+        comments = [
+            {'text': 'Ola service center is worst, 3 visits already', 'likes': 12},
+            {'text': 'Ather 450X range is badhiya', 'likes': 3},
+            {'text': 'Ather 450X range is badhiya', 'likes': 40},
+        ]
+
+        classifier = AdvancedSentimentClassifier(use_cache=False)
+        classifier.classification_cache = ClassificationCache(db_path, classifier.rule_version)
+        first = asyncio.run(classifier.analyze_comment_batch(comments, 'Ola Electric'))
+        assert classifier.classification_cache.get_stats()['misses'] == 3
+
+        restarted = AdvancedSentimentClassifier(use_cache=False)
+        restarted.classification_cache = ClassificationCache(db_path, restarted.rule_version)
+        second = asyncio.run(restarted.analyze_comment_batch(comments, 'Ola Electric'))
+        stats = restarted.get_cache_stats()
+        assert stats['hits'] == 3 and stats['misses'] == 0, stats
+        assert first == second
+
+        # A different target OEM or rule version is a different key
+        asyncio.run(restarted.analyze_comment_batch(comments[:1], 'Ather'))
+        assert restarted.get_cache_stats()['misses'] == 1
+        other_version = ClassificationCache(db_path, 'other-rules')
+        assert other_version.get(other_version.key_for_comment(comments[0], 'Ola Electric')) is None
+
+
+def test_cache_survives_fork():
+    """A cache opened before os.fork() keeps working in the child process"""
+    if not hasattr(os, 'fork'):
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ClassificationCache(os.path.join(tmp, 'cache.db'), 'v1')
+        cache.put('parent', {'sentiment': 'neutral'})
+
+        pid = os.fork()
+        if pid == 0:
+            ok = cache.get('parent') == {'sentiment': 'neutral'}
+            cache.put('child', {'sentiment': 'positive'})
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        assert status == 0
+        assert cache.get('child') == {'sentiment': 'positive'}
+
+
+def test_stale_versions_purged_on_open():
+    """Opening the cache from a classifier drops entries of other rule versions; counts use an index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'cache.db')
+        stale = ClassificationCache(db_path, 'old-rules')
+        stale.put('old', {'sentiment': 'neutral'})
+        stale.put_many_by_id({'old-id': {'sentiment': 'neutral'}})
+
+        os.environ['CLASSIFICATION_CACHE_PATH'] = db_path
+        try:
+            classifier = AdvancedSentimentClassifier(use_cache=True)
+        finally:
+            del os.environ['CLASSIFICATION_CACHE_PATH']
+        cache = classifier.classification_cache
+        assert cache.db_path == db_path
+        assert stale.get('old') is None and stale.get_many_by_id(['old-id']) == {}
+
+        cache.put('current', {'sentiment': 'positive'})
+        assert cache.get_stats()['entries'] == 1
+        plan = cache._get_connection().execute(
+            'EXPLAIN QUERY PLAN SELECT COUNT(*) FROM classifications WHERE rule_version = ?', (cache.rule_version,)
+        ).fetchall()
+        assert 'classifications_rule_version' in str(plan)
+        cache.close()
+        stale.close()
+
+
+if __name__ == "__main__":
+    test_batch_uses_cache_across_restarts()
+    test_cache_survives_fork()
+    test_stale_versions_purged_on_open()
+    print("✅ Classification cache tests passed")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test the consolidated comment dataset: cross-file de-duplication, partitioning and pruned reads
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_dataset import CommentDataset, DatasetCommentData, consolidate_comments, oem_slug
+
+
+def comment(text, date, likes=0, author='@a', video_id='abcdefgh', oem='Ola Electric'):
+    return {'text': text, 'author': author, 'likes': likes, 'date': date, 'video_id': video_id,
+            'oem': oem, 'extraction_method': 'ytdlp'}
+
+
+AUGUST = [comment('range is good', '2024-08-03 10:00:00'), comment('service is slow', '2024-08-20 18:30:00')]
+AUGUST_RESCRAPED = [comment('range is good', '2024-08-03 10:00:00', likes=9),
+                    comment('app keeps crashing', '2024-08-31 23:59:59', author='@b')]
+COMBINED = {
+    'Ola Electric': {'2024': {'09': [comment('battery died', '2024-09-01 00:00:00', author='@c')]}},
+    'Ather': {'2024': {'08': [comment('smooth ride', '2024-08-15 09:00:00', oem='Ather')]}},
+    'Hero Vida': {'misc': [comment('when launch?', '', oem='Hero Vida')]}
+}
+
+
+def write_sources(tmp):
+    paths = []
+    for name, data, mtime in [('comments_ola_electric_2024_08_2_comments_a.json', AUGUST, 1_000),
+                              ('comments_ola_electric_2024_08_2_comments_b.json', AUGUST_RESCRAPED, 2_000),
+                              ('all_oem_comments_historical_test.json', COMBINED, 3_000)]:
+        path = os.path.join(tmp, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+    return paths
+
+
+def test_consolidation():
+    """Duplicates across files are kept once (newest file wins) and partitioned by OEM and month"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_sources(tmp)
+        dataset_dir = os.path.join(tmp, 'dataset')
+        manifest = consolidate_comments(paths, dataset_dir)
+        assert manifest['rows'] == 6 and manifest['duplicates'] == 1
+        assert [p['path'] for p in manifest['partitions']] == [
+            'ather/2024/08.json', 'hero_vida/undated.json', 'ola_electric/2024/08.json', 'ola_electric/2024/09.json']
+        august = manifest['partitions'][2]
+        assert august['rows'] == 3
+        assert (august['first_date'], august['last_date']) == ('2024-08-03 10:00:00', '2024-08-31 23:59:59')
+        assert manifest['oems']['Ola Electric'] == {'rows': 4, 'partitions': 2}
+
+        dataset = CommentDataset.open(dataset_dir)
+        data = DatasetCommentData(dataset)
+        assert data.comment_counts() == {'Ather': 1, 'Hero Vida': 1, 'Ola Electric': 4}
+        assert [(c['text'], c['likes']) for c in data['Ola Electric']] == [
+            ('range is good', 9), ('service is slow', 0), ('app keeps crashing', 0), ('battery died', 0)]
+        assert dataset.is_current(paths) and oem_slug('TVS iQube') == 'tvs_iqube'
+
+
+def test_pruned_reads():
+    """A query opens only the partitions it selects; straddled partitions are filtered by date"""
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_dir = os.path.join(tmp, 'dataset')
+        consolidate_comments(write_sources(tmp), dataset_dir)
+        dataset = CommentDataset.open(dataset_dir)
+
+        assert [c['text'] for c in dataset.comments('Ola Electric', year=2024, month=9)] == ['battery died']
+        assert list(dataset._partition_comments) == ['ola_electric/2024/09.json']
+
+        window = dataset.comments('Ola Electric', start_date='2024-08-20 18:30:00', end_date='2024-09-01 00:00:00')
+        assert [c['text'] for c in window] == ['service is slow', 'app keeps crashing']
+        assert [p['path'] for p in dataset.select(start_date='2024-08-16')] == [
+            'ola_electric/2024/08.json', 'ola_electric/2024/09.json']
+        assert dataset.comments('Hero Vida', start_date='2000-01-01') == []
+        assert dataset.count('Ather') == 1 and dataset.count('Revolt') == 0
+
+
+def test_incremental_consolidation():
+    """Unchanged inputs are skipped; only changed partitions are rewritten and emptied ones removed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_sources(tmp)
+        dataset_dir = os.path.join(tmp, 'dataset')
+        first = consolidate_comments(paths, dataset_dir)
+        assert consolidate_comments(paths, dataset_dir) == first
+        dataset = CommentDataset.open(dataset_dir)
+
+        ather_partition = os.path.join(dataset_dir, 'ather', '2024', '08.json')
+        os.utime(ather_partition, (1, 1))
+        second = consolidate_comments(paths[:2], dataset_dir)
+        assert second['version'] != first['version'] and second['rows'] == 3
+        assert not os.path.exists(ather_partition)
+        assert os.path.exists(os.path.join(dataset_dir, 'ola_electric', '2024', '08.json'))
+        assert not dataset.is_latest() and CommentDataset.open(dataset_dir).is_latest()
+
+        third = consolidate_comments(paths, dataset_dir)
+        assert third['version'] == first['version']
+        unchanged = os.path.join(dataset_dir, 'ola_electric', '2024', '08.json')
+        os.utime(unchanged, (1, 1))
+        consolidate_comments(paths, dataset_dir, force=True)
+        assert os.stat(unchanged).st_mtime == 1
+
+
+
+def test_json_export():
+    """The loaded data serializes like the JSON it came from (as the Streamlit download does)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_dir = os.path.join(tmp, 'dataset')
+        consolidate_comments(write_sources(tmp), dataset_dir)
+        data = DatasetCommentData(CommentDataset.open(dataset_dir))
+        exported = json.loads(json.dumps(dict(data), ensure_ascii=False))
+        assert {oem: len(comments) for oem, comments in exported.items()} == data.comment_counts()
+        assert exported['Ather'] == data['Ather']
+
+if __name__ == "__main__":
+    test_consolidation()
+    test_pruned_reads()
+    test_incremental_consolidation()
+    test_json_export()
+    print("✅ Comment dataset tests passed")
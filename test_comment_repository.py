@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite comment repository: importing, de-duplication and pushed-down filters
+"""
+
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_repository import CommentRepository, RepositoryCommentData, fts_query, normalize_date
+
+
+VIDEO_COMMENTS = [
+    {'text': 'Ather battery backup is badhiya', 'author': '@a', 'likes': 3, 'time': 1735725600,
+     'date': '2025-01-01 10:00:00', 'video_id': 'abcdefgh', 'oem': 'Ather', 'extraction_method': 'ytdlp'},
+    {'text': 'बैटरी बहुत अच्छी है', 'author': '@b', 'likes': 0, 'time': 1738404000,
+     'date': '2025-02-01 10:00:00', 'video_id': 'abcdefgh', 'oem': 'Ather', 'extraction_method': 'ytdlp'},
+]
+
+COMBINED = {
+    'Ather': {'2025': {'01': [dict(VIDEO_COMMENTS[0], likes=7)]}},
+    'Ola Electric': {'2025': {'03': [
+        {'text': 'Service "center" is worst, batteries die', 'author': '@c', 'likes': 12, 'time': 1741255200,
+         'date': '2025-03-06 10:00:00', 'video_id': 'ijklmnop', 'extraction_method': 'ytdlp'},
+        {'text': 'range is fine', 'author': '@d', 'likes': 1, 'time': 1743465599,
+         'date': '2025-03-31 23:59:59', 'video_id': 'ijklmnop', 'extraction_method': 'ytdlp'},
+    ]}}
+}
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_import_and_dedup():
+    """Comments seen in several files are stored once; unchanged files are skipped"""
+    with tempfile.TemporaryDirectory() as tmp:
+        video_file = os.path.join(tmp, 'comments_ather_2025_01_2_comments_test.json')
+        combined_file = os.path.join(tmp, 'all_oem_comments_historical_test.json')
+        write_json(video_file, VIDEO_COMMENTS)
+        write_json(combined_file, COMBINED)
+
+        repository = CommentRepository(os.path.join(tmp, 'comments.db'))
+        assert not repository.exists() and not os.path.exists(repository.db_path)
+        assert repository.import_file(video_file) == 2
+        assert repository.import_file(combined_file) == 3
+        assert repository.import_file(combined_file) is None
+        assert repository.exists()
+        assert repository.oem_counts() == {'Ather': 2, 'Ola Electric': 2}
+
+        # The later file's engagement counts win
+        assert [c['likes'] for c in repository.query(oem='Ather')] == [7, 0]
+        assert repository.stats()['sources'] == 2
+
+        data = RepositoryCommentData(repository)
+        assert data.comment_counts() == {'Ather': 2, 'Ola Electric': 2}
+        assert data['Ola Electric'][1]['text'] == 'range is fine'
+        assert 'Revolt' not in data
+        repository.close()
+
+
+def test_filters():
+    """Date, keyword, likes, video and author filters match a scan of the comments"""
+    with tempfile.TemporaryDirectory() as tmp:
+        combined_file = os.path.join(tmp, 'all_oem_comments_historical_test.json')
+        write_json(combined_file, COMBINED)
+        repository = CommentRepository(os.path.join(tmp, 'comments.db'))
+        repository.add_comments({'Ather': VIDEO_COMMENTS})
+        repository.import_file(combined_file)
+
+        march = repository.query(oem='Ola Electric', start_date='2025-03-01', end_date=datetime(2025, 4, 1))
+        assert [c['author'] for c in march] == ['@c', '@d']
+        assert repository.count(oem='Ola Electric', end_date='2025-03-31 23:59:59') == 1
+        assert repository.count(start_time=1735725600, end_time=1738404000) == 1
+
+        # Keywords match word prefixes, in any script, case-insensitively
+        assert [c['author'] for c in repository.query(keywords=['BATTER'])] == ['@a', '@c']
+        assert [c['author'] for c in repository.query(keywords=['बैटरी'])] == ['@b']
+        assert repository.count(keywords=['battery', 'badhiya']) == 1
+        assert repository.count(keywords=['badhiya', 'range'], match_all=False) == 2
+        assert repository.count(keywords=['"center" OR']) == 0
+
+        assert [c['likes'] for c in repository.query(min_likes=3, order_by='-likes')] == [12, 7]
+        assert repository.count(video_id='ijklmnop', author='@d') == 1
+        assert len(repository.query(order_by='time', limit=2, offset=1)) == 2
+
+        stats = repository.oem_stats('Ather')
+        assert stats['comments'] == 2 and stats['real_comments'] == 2 and stats['unique_authors'] == 2
+        assert stats['first_date'] == '2025-01-01 10:00:00'
+        worst = repository.comments_by_oem(keywords=['worst'])
+        assert list(worst) == ['Ola Electric'] and worst['Ola Electric'][0]['video_url'].endswith('ijklmnop')
+        repository.close()
+
+
+def test_query_helpers():
+    """Dates normalize to sortable text and keywords cannot inject FTS syntax"""
+    assert normalize_date('2025-03-06 10:00:00') == '2025-03-06 10:00:00'
+    assert normalize_date('March 6, 2025') == '2025-03-06 00:00:00'
+    assert normalize_date(datetime(2025, 3, 6, 10, 0, 0, 500)) == '2025-03-06 10:00:00'
+    assert normalize_date('not a date') is None and normalize_date(None) is None
+    assert fts_query(['battery', 'say "hi"']) == '"battery"* AND "say ""hi"""*'
+    assert fts_query([' '], match_all=False) is None
+
+
+
+def test_json_export():
+    """The loaded data serializes like the JSON it came from (as the Streamlit download does)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        video_file = os.path.join(tmp, 'comments_ather_2025_01_2_comments_test.json')
+        write_json(video_file, VIDEO_COMMENTS)
+        repository = CommentRepository(os.path.join(tmp, 'comments.db'))
+        repository.import_file(video_file)
+        exported = json.loads(json.dumps(dict(RepositoryCommentData(repository)), ensure_ascii=False))
+        assert [c['text'] for c in exported['Ather']] == [c['text'] for c in VIDEO_COMMENTS]
+        repository.close()
+
+if __name__ == "__main__":
+    test_import_and_dedup()
+    test_filters()
+    test_query_helpers()
+    test_json_export()
+    print("✅ Comment repository tests passed")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test the columnar comment store: lossless round trip, column access and staleness
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.comment_store import (CommentStore, StoredCommentData, ingest_scraped_json, open_current_store,
+                                    read_scraped_json, real_comments_by_oem, write_comment_store)
+
+
+NESTED = {
+    'Ather': {'2024': {'01': [
+        {'text': 'Ather 450X range is badhiya 👍', 'author': '@a', 'likes': 3, 'time': 1704067200,
+         'video_id': 'abcdefgh', 'is_reply': False, 'sentiment_score': 0.5},
+        {'text': 'कीमत ज़्यादा है', 'author': '@b', 'likes': 0, 'time': 1704153600, 'video_id': 'abcdefgh',
+         'is_reply': True, 'sentiment_score': -0.25, 'replies': [{'text': 'sahi'}]},
+    ]}},
+    'Ola Electric': {'2024': {'02': [
+        {'text': 'service is worst', 'author': '@c', 'likes': 12, 'time': 1706745600, 'video_id': 'ijklmnop',
+         'is_reply': False, 'sentiment_score': -0.9, 'extraction_method': 'ytdlp', 'rating': None},
+    ]}},
+    'Revolt': {'2024': {'03': [{'text': 'not real', 'likes': 1, 'verified_real': False}]}}
+}
+
+
+def test_store_round_trip():
+    """The store holds exactly the real comments the JSON loader returns, column by column"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'all_oem_comments_historical_test.json')
+        with open(source, 'w', encoding='utf-8') as f:
+            json.dump(NESTED, f, ensure_ascii=False, indent=2)
+        expected = real_comments_by_oem(read_scraped_json(source))
+        assert list(expected) == ['Ather', 'Ola Electric']
+
+        manifest = ingest_scraped_json(source, tmp)
+        assert manifest['rows'] == 3
+        kinds = {name: column['kind'] for name, column in manifest['columns'].items()}
+        assert kinds['likes'] == 'int' and kinds['is_reply'] == 'bool' and kinds['sentiment_score'] == 'float'
+        assert kinds['text'] == 'str' and kinds['replies'] == 'json' and kinds['rating'] == 'json'
+
+        store = open_current_store(source, tmp)
+        data = StoredCommentData(store)
+        assert data.comment_counts() == {'Ather': 2, 'Ola Electric': 1}
+        assert dict(data) == expected
+        assert 'replies' not in data['Ola Electric'][0] and data['Ola Electric'][0]['rating'] is None
+
+        assert store.column('likes', 'Ather').tolist() == [3, 0]
+        assert store.column('text', 'Ather')[1] == 'कीमत ज़्यादा है'
+        assert store.column('text').byte_lengths().tolist() == [len(c['text'].encode('utf-8'))
+                                                                 for comments in expected.values() for c in comments]
+        assert store.isin('extraction_method', ['ytdlp']).tolist() == [False, False, True]
+
+        # A changed source file is loaded from JSON again until it is re-ingested
+        with open(source, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        assert open_current_store(source, tmp) is None
+        ingest_scraped_json(source, tmp)
+        assert open_current_store(source, tmp) is not None
+
+
+def test_empty_and_sparse_columns():
+    """OEMs without comments and fields present in only some rows survive the round trip"""
+    comments_by_oem = {'Ather': [{'text': 'a'}, {'text': '', 'likes': 5}], 'Hero Vida': []}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'store')
+        write_comment_store(comments_by_oem, path)
+        store = CommentStore.open(path)
+        assert not store.is_current(path)
+        assert StoredCommentData(store)['Hero Vida'] == []
+        assert dict(StoredCommentData(store)) == comments_by_oem
+        assert store.present('likes', 'Ather').tolist() == [False, True]
+
+
+
+def test_json_export():
+    """The loaded data serializes like the JSON it came from (as the Streamlit download does)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'all_oem_comments_historical_test.json')
+        with open(source, 'w', encoding='utf-8') as f:
+            json.dump(NESTED, f, ensure_ascii=False)
+        ingest_scraped_json(source, tmp)
+        data = StoredCommentData(open_current_store(source, tmp))
+        exported = json.loads(json.dumps(dict(data), ensure_ascii=False))
+        assert exported == real_comments_by_oem(read_scraped_json(source))
+
+if __name__ == "__main__":
+    test_store_round_trip()
+    test_empty_and_sparse_columns()
+    test_json_export()
+    print("✅ Comment store tests passed")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test compact classification records against full batch results
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.compact_classification import CompactClassification, CompactSentimentView
+
+
+COMMENTS = [
+    {'text': 'Ola S1 Pro is amazing 😍 but service center is worst', 'likes': 25},
+    {'text': 'Ather ka range bahut badhiya hai', 'likes': 2},
+    {'text': '', 'likes': 0},
+    {'text': 'Which is better, Chetak or iQube?', 'likes': 7, 'replies': 3},
+]
+
+
+def test_compact_batch_matches_full_batch():
+    """Compact records give the same scalars, summary and lazily rebuilt detail"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    full = asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ola Electric'))
+    compact = asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ola Electric', compact=True))
+
+    full_summary = classifier.get_batch_summary(full)
+    for comment in compact:
+        record = comment['advanced_sentiment_classification']
+        assert isinstance(record, CompactClassification)
+        assert record._detail is None
+    assert classifier.get_batch_summary(compact) == full_summary
+    # The summary reads compact fields only
+    assert all(c['advanced_sentiment_classification']._detail is None for c in compact)
+
+    for full_comment, compact_comment in zip(full, compact):
+        expected = full_comment['advanced_sentiment_classification']
+        record = compact_comment['advanced_sentiment_classification']
+        assert record['sentiment'] == expected['sentiment']
+        assert record.get('context') == expected['context']
+        assert record['language_analysis'] == expected['language_analysis']
+        assert record.to_dict() == expected
+
+
+def test_legacy_view_is_lazy():
+    """The sentiment_classification view only rebuilds detail for detail keys"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    compact = asyncio.run(classifier.analyze_comment_batch(COMMENTS[:1], 'Ola Electric', compact=True))
+    record = compact[0]['advanced_sentiment_classification']
+    view = CompactSentimentView(record)
+
+    assert view['sentiment'] == record.sentiment
+    assert view.get('language_mix') == record.is_mixed
+    assert record._detail is None
+    assert view['key_factors'] == record['classification_factors']
+    assert set(view.to_dict()['advanced_features']) == {
+        'emoji_analysis', 'company_analysis', 'engagement_analysis', 'language_breakdown', 'context_details'
+    }
+
+
+if __name__ == "__main__":
+    test_compact_batch_matches_full_batch()
+    test_legacy_view_is_lazy()
+    print("✅ Compact classification tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the data watcher: dataset version changes with the data files, in event and polling mode
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_watcher import DataWatcher, _WATCHDOG_AVAILABLE
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def wait_for_version(watcher, version, timeout=5.0):
+    deadline = time.time() + timeout
+    while watcher.version < version and time.time() < deadline:
+        time.sleep(0.05)
+    return watcher.version
+
+
+def make_watcher(tmp, **kwargs):
+    return DataWatcher(tmp, dataset_dir=os.path.join(tmp, 'dataset'),
+                       repository_path=os.path.join(tmp, 'comments.db'), **kwargs)
+
+
+def test_scan_versions():
+    """Only changes to data files bump the version"""
+    with tempfile.TemporaryDirectory() as tmp:
+        write_json(os.path.join(tmp, 'comments_ather_2025_01_1_comments_a.json'), [])
+        watcher = make_watcher(tmp, scan_interval=60)
+        assert watcher.scan() and watcher.version == 1 and len(watcher.files) == 1
+        assert not watcher.scan() and watcher.version == 1
+
+        write_json(os.path.join(tmp, 'notes.json'), {})
+        write_json(os.path.join(tmp, 'all_oem_comments_10_enhanced_x.json'), {})
+        assert not watcher.scan()
+
+        write_json(os.path.join(tmp, 'all_oem_comments_historical_x.json'), {})
+        os.makedirs(os.path.join(tmp, 'dataset'))
+        write_json(os.path.join(tmp, 'dataset', 'manifest.json'), {})
+        assert watcher.scan() and watcher.version == 2 and len(watcher.files) == 3
+
+        os.remove(os.path.join(tmp, 'comments_ather_2025_01_1_comments_a.json'))
+        assert watcher.scan() and watcher.version == 3
+        assert watcher.is_data_file(os.path.join(tmp, 'comments.db-wal'))
+        assert not watcher.is_data_file(os.path.join(tmp, 'classification_cache.db'))
+
+
+def test_polling_watcher():
+    """Without file system events the watcher picks up changes at its scan interval"""
+    with tempfile.TemporaryDirectory() as tmp:
+        watcher = make_watcher(tmp, scan_interval=0.1, use_events=False)
+        try:
+            assert watcher.ensure_running() == 1 and watcher.get_status()['mode'] == 'polling'
+            write_json(os.path.join(tmp, 'comments_ola_electric_2025_02_3_comments_b.json'), [])
+            assert wait_for_version(watcher, 2) == 2
+            assert watcher.ensure_running() == 2 and watcher.get_status()['running']
+        finally:
+            watcher.stop()
+        assert not watcher.get_status()['running']
+
+
+def test_event_watcher():
+    """With file system events a change is seen long before the scan interval"""
+    if not _WATCHDOG_AVAILABLE:
+        print("⚠️ watchdog not installed, skipping event watcher test")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        watcher = make_watcher(tmp, scan_interval=60)
+        try:
+            assert watcher.ensure_running() == 1 and watcher.get_status()['mode'] == 'events'
+            write_json(os.path.join(tmp, 'real_youtube_comments_20250901.json'), [])
+            assert wait_for_version(watcher, 2) == 2
+        finally:
+            watcher.stop()
+
+
+if __name__ == "__main__":
+    test_scan_versions()
+    test_polling_watcher()
+    test_event_watcher()
+    print("✅ Data watcher tests passed")
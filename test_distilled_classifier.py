@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the distilled sentiment model: save/load round trip, rule fallback and the agreement report
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services import distilled_classifier
+from services.distilled_classifier import DistilledSentimentModel, DistilledSentimentScorer
+from services.enhanced_sentiment_analyzer import EnhancedSentimentAnalyzer
+
+
+TEXTS = [
+    "Ola S1 Pro is amazing 😍",
+    "Service center is worst, 3rd visit this month 😡",
+    "Which is better, Ather or Chetak?",
+    "battery range bahut badhiya hai",
+    "Thanks for nothing Ola!",
+    "Great scooter, loving the ride 👍",
+    "Worst purchase ever, battery died in a week",
+    "price kitna hai?",
+]
+
+
+def labelled_comments(classifier, oem='Ather', rounds=20):
+    comments = [{'text': text, 'likes': i} for i, text in enumerate(TEXTS * rounds)]
+    labels = [classifier.classify_comment(comment, oem)['sentiment'] for comment in comments]
+    return comments, labels
+
+
+def test_round_trip_and_fallback():
+    """Saved weights reproduce predictions; the margin threshold decides which comments use the rules"""
+    if not distilled_classifier._SKLEARN_AVAILABLE:
+        print("⚠️ scikit-learn not installed, skipping distilled model test")
+        return
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments, labels = labelled_comments(classifier)
+    model = DistilledSentimentModel.train([c['text'] for c in comments], labels, fallback_rate=0.25,
+                                          rule_version=classifier.rule_version)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'distilled.npz')
+        model.save(path)
+        loaded = DistilledSentimentModel.load(path)
+    predictions, margins = model.predict(TEXTS)
+    loaded_predictions, loaded_margins = loaded.predict(TEXTS)
+    assert loaded_predictions == predictions and loaded.min_margin == model.min_margin
+    assert all(abs(a - b) < 1e-4 for a, b in zip(margins, loaded_margins))
+
+    # Every comment below an infinite margin falls back, so the scorer returns the rule labels
+    rules_only = DistilledSentimentScorer(loaded, classifier, min_margin=float('inf'))
+    results = rules_only.score_batch(comments, 'Ather')
+    assert [r['sentiment'] for r in results] == labels and {r['method'] for r in results} == {'rules'}
+
+    distilled_only = DistilledSentimentScorer(loaded, classifier, min_margin=float('-inf'))
+    results = distilled_only.score_batch(comments + [{'text': ''}], 'Ather')
+    assert {r['method'] for r in results[:-1]} == {'distilled'}
+    assert results[-1]['sentiment'] == 'neutral'
+    assert distilled_only.get_stats()['fallback'] == 0
+
+
+def test_agreement_report():
+    """The report compares distilled and fallback labels with the rule labels"""
+    if not distilled_classifier._SKLEARN_AVAILABLE:
+        return
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments, labels = labelled_comments(classifier)
+    model = DistilledSentimentModel.train([c['text'] for c in comments], labels, fallback_rate=0.25)
+    scorer = DistilledSentimentScorer(model, classifier)
+
+    report = scorer.agreement_report(comments, 'Ather')
+    assert report == scorer.agreement_report(comments, 'Ather', rule_labels=labels)
+    assert report['with_fallback']['agreement'] >= report['confident_only']['agreement'] * report['coverage']
+    assert report['with_fallback']['agreement'] >= report['distilled_only']['agreement']
+    assert sum(report['distilled_only']['per_class'][s]['support'] for s in ('positive', 'negative', 'neutral')) \
+        == len(comments)
+    assert 0.6 <= report['coverage'] <= 1.0
+
+
+def test_estimate_sentiment_distribution():
+    """Analytics aggregates count the rule labels without a model and the scorer's labels with one"""
+    analyzer = EnhancedSentimentAnalyzer()
+    classifier = analyzer.advanced_classifier
+    classifier.classification_cache = None
+    comments, labels = labelled_comments(classifier, rounds=3)
+    expected = {sentiment: labels.count(sentiment) for sentiment in ('positive', 'negative', 'neutral')}
+
+    analyzer.distilled_scorer = None
+    estimate = asyncio.run(analyzer.estimate_sentiment_distribution(comments, 'Ather'))
+    assert estimate == {'total': len(comments), 'sentiment': expected, 'method': 'advanced_multi_layer'}
+
+    if not distilled_classifier._SKLEARN_AVAILABLE:
+        return
+    model = DistilledSentimentModel.train([c['text'] for c in comments], labels)
+    analyzer.distilled_scorer = DistilledSentimentScorer(model, classifier, min_margin=float('inf'))
+    estimate = asyncio.run(analyzer.estimate_sentiment_distribution(comments, 'Ather'))
+    assert estimate['method'] == 'distilled_with_rule_fallback' and estimate['sentiment'] == expected
+
+
+if __name__ == "__main__":
+    test_round_trip_and_fallback()
+    test_agreement_report()
+    test_estimate_sentiment_distribution()
+    print("✅ Distilled classifier tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the early-exit gates: settled requests and off-topic comments skip scoring with the same outcome
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+TEXTS = [
+    ("I will stick to my petrol scooter", 'irrelevant'),
+    ("Mere pas dono hai but Ola best yrr", 'irrelevant'),
+    ("Bro I have Bajaj Chetak electric, petrol bike bhi hai", 'irrelevant'),
+    ("Which scooter should I buy?", 'neutral_request'),
+    ("Which one has better range, Ather or Chetak? 🤔", 'neutral_request'),
+    ("Thanks for the review but which scooter should I buy?", 'neutral_request'),   # sarcastic thanks
+    ("Thanks for the video but I will stick to my petrol scooter", 'irrelevant'),   # sarcastic thanks
+    ("Which scooter should I buy? 😍", None),                           # positive emoji: sarcasm could flip
+    ("Should I buy Ola? its a scam", None),               # strong negative override
+    ("Is it good? amazing excellent superb awesome love it", None),    # scores could pass 2.5
+    ("Ather 450X is amazing, loving the ride", None),                  # no gate applies
+]
+
+
+# Lexicon score details the gates do not compute (the keys are still present)
+SKIPPED_SCORE_FIELDS = ['positive_score', 'negative_score', 'intensity_multiplier', 'sentiment_words']
+
+
+def test_gates_keep_the_outcome():
+    """Gated comments get the same classification as the fully scored pipeline, sarcasm included,
+    except for the lexicon score details the gates skip"""
+    gated = AdvancedSentimentClassifier(use_cache=False)
+    os.environ['CLASSIFIER_EARLY_EXIT_ENABLED'] = 'false'
+    try:
+        full = AdvancedSentimentClassifier(use_cache=False)
+    finally:
+        del os.environ['CLASSIFIER_EARLY_EXIT_ENABLED']
+    assert gated.rule_version != full.rule_version
+
+    sarcastic_exits = 0
+    for text, gate in TEXTS:
+        for target_oem in [None, 'Ather', 'Ola Electric']:
+            comment = {'text': text, 'likes': 800}
+            result = gated.classify_comment(comment, target_oem)
+            expected = full.classify_comment(comment, target_oem)
+            assert result['pattern_analysis'].get('early_exit') == gate, text
+            if gate is None:
+                assert result == expected, text
+                continue
+            sarcastic_exits += result['sarcasm_detected']
+
+            # Every exported field matches; only the skipped score details may differ
+            result_patterns = result.pop('pattern_analysis')
+            expected_patterns = expected.pop('pattern_analysis')
+            assert result == expected, text
+            assert set(result_patterns) - {'early_exit'} == set(expected_patterns), text
+            for field in SKIPPED_SCORE_FIELDS + ['early_exit']:
+                result_patterns.pop(field)
+                expected_patterns.pop(field, None)
+            assert result_patterns == expected_patterns, text
+    assert sarcastic_exits == 6
+    assert full.get_gate_stats()['total_comments'] == 0
+
+
+def test_gate_statistics():
+    """Per-gate exit counts and rates are reported with the batch summary"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text} for text, _ in TEXTS]
+    results = asyncio.run(classifier.analyze_comment_batch(comments, 'Ather'))
+
+    stats = classifier.get_batch_summary(results)['gate_statistics']
+    assert stats['total_comments'] == len(TEXTS)
+    assert stats['gates']['irrelevant'] == {'exits': 4, 'rate': round(400 / 11, 2)}
+    assert stats['gates']['neutral_request']['exits'] == 3
+    assert stats['fully_scored'] == 4
+    assert stats['early_exit_percentage'] == round(700 / 11, 2)
+
+
+if __name__ == "__main__":
+    test_gates_keep_the_outcome()
+    test_gate_statistics()
+    print("✅ Early exit tests passed")
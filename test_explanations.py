@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test explain=False classification: rule IDs render to exactly the explain=True strings
+"""
+
+import sys
+import os
+import json
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.explanations import render_classification
+
+
+TEXTS = [
+    "Great scooter, amazing service 😡",
+    "Thanks for nothing Ola! 3rd visit to the service center",
+    "Wow great service, waited 3 weeks for a simple repair!!",
+    "Like for Ola",
+    "dil se bol raha hu, bahut badhiya scooter hai 👍",
+    "Not good at all, range issue is real",
+    "subscribe to my channel",
+    "Which is better, Ather or Chetak?",
+    "❤️❤️ Ather",
+]
+
+
+def test_rule_ids_render_like_explained_output():
+    """Every mode (full, tiered, JSON round trip, re-applied engagement) renders identically"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    for text in TEXTS:
+        for oem in ['Ather', 'Hero Vida', None]:
+            for tiered in [False, True]:
+                comment = {'text': text, 'likes': 3}
+                explained = classifier.classify_comment(comment, oem, tiered)
+                compact = classifier.classify_comment(comment, oem, tiered, explain=False)
+                assert compact['explained'] is False and 'explained' not in explained
+                assert render_classification(compact) == explained, (text, oem, tiered)
+                assert render_classification(json.loads(json.dumps(compact))) == json.loads(json.dumps(explained))
+
+                viral = dict(comment, likes=500, replies=40)
+                assert render_classification(classifier.reapply_engagement(compact, viral, oem)) == \
+                    classifier.reapply_engagement(explained, viral, oem)
+
+    factors = classifier.classify_comment({'text': TEXTS[0]}, 'Ather', explain=False)['classification_factors']
+    assert all(isinstance(factor, tuple) for factor in factors)
+
+
+def test_batch_explain_defaults():
+    """Compact batches record rule IDs; their displayed detail is explained on demand"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': text, 'likes': i} for i, text in enumerate(TEXTS)]
+
+    full = asyncio.run(classifier.analyze_comment_batch(comments, 'Ather'))
+    assert all('explained' not in c['advanced_sentiment_classification'] for c in full)
+
+    ids = asyncio.run(classifier.analyze_comment_batch(comments, 'Ather', explain=False))
+    assert [classifier.explain_classification(c['advanced_sentiment_classification']) for c in ids] == \
+        [c['advanced_sentiment_classification'] for c in full]
+
+    compact = asyncio.run(classifier.analyze_comment_batch(comments, 'Ather', compact=True))
+    assert [classifier.explain_classification(c['advanced_sentiment_classification']) for c in compact] == \
+        [c['advanced_sentiment_classification'] for c in full]
+
+
+if __name__ == "__main__":
+    test_rule_ids_render_like_explained_output()
+    test_batch_explain_defaults()
+    print("✅ Explanation tests passed")
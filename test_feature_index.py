@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test the bitset feature index against brute-force filtering of the classified comments
+"""
+
+import sys
+import os
+import itertools
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.feature_index import FeatureIndex, FEATURE_ALIASES
+
+
+TEXTS = [
+    "Range issue hai, service center is worst",
+    "Ather range is amazing 😍",
+    "Service was good, thanks Ather",
+    "Battery range dropped to 60 km, very bad experience",
+    "Thanks for nothing, 3rd visit to service center",
+    "Which is better, Chetak or iQube?",
+    "",
+]
+OEMS = ['Ather', 'Ola Electric', 'TVS iQube']
+SENTIMENTS = ['negative', 'positive', 'neutral']
+
+
+def make_corpus(count_per_oem=70):
+    """Comments spread over OEMs, months and sentiments (more than one 64-bit word per OEM)"""
+    corpus = {}
+    for oem_number, oem in enumerate(OEMS):
+        comments = []
+        for i in range(count_per_oem):
+            comments.append({
+                'text': TEXTS[(i + oem_number) % len(TEXTS)],
+                'date': f'2025-0{1 + i % 3}-15 10:00:00',
+                'sentiment_classification': {
+                    'sentiment': SENTIMENTS[(i * 7 + oem_number) % 3],
+                    'sarcasm_detected': i % 5 == 0,
+                    'language_mix': i % 4 == 0,
+                },
+            })
+        corpus[oem] = comments
+    return corpus
+
+
+def brute_force(corpus, classifier, all_of=(), none_of=(), oem=None, sentiment=None, month=None):
+    def fired(comment, feature):
+        if feature == 'sarcasm':
+            return comment['sentiment_classification']['sarcasm_detected']
+        groups = FEATURE_ALIASES.get(feature, (feature,))
+        matches = classifier.pattern_engine.scan(comment['text'].lower())
+        return any(matches.any(group) for group in groups)
+
+    result = []
+    for comment_oem, comments in corpus.items():
+        for position, comment in enumerate(comments):
+            if oem and comment_oem != oem:
+                continue
+            if sentiment and comment['sentiment_classification']['sentiment'] != sentiment:
+                continue
+            if month and not comment['date'].startswith(month):
+                continue
+            if all(fired(comment, f) for f in all_of) and not any(fired(comment, f) for f in none_of):
+                result.append((comment_oem, position))
+    return result
+
+
+def test_filters_match_brute_force():
+    """Counts and matching comments equal a scan over every comment"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    corpus = make_corpus()
+    index = FeatureIndex.build(corpus, classifier)
+    assert index.size == 210
+
+    feature_sets = [(), ('range_issue',), ('range_issue', 'service'), ('strong_negative',), ('sarcasm',)]
+    for all_of, none_of, oem, sentiment, month in itertools.product(
+            feature_sets, [(), ('service',)], [None, 'Ather'], [None, 'negative'], [None, '2025-02']):
+        filters = dict(all_of=all_of, none_of=none_of, oem=oem, sentiment=sentiment, month=month)
+        expected = brute_force(corpus, classifier, **filters)
+        assert index.matching(**filters) == expected, filters
+        assert index.count(**filters) == len(expected), filters
+
+
+def test_counts_by_and_any_of():
+    """Per-column breakdowns add up, any_of is a union, unknown names are rejected"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    index = FeatureIndex.build(make_corpus(), classifier)
+
+    by_oem = index.counts_by('oem', all_of=['service'])
+    assert list(by_oem) == OEMS and sum(by_oem.values()) == index.count(all_of=['service'])
+    assert sum(index.counts_by('month').values()) == index.size
+    assert index.count(oem=['Ather', 'TVS iQube']) == 140
+    assert index.count(oem='Hero Vida') == 0 and index.count(month='not a month') == 0
+
+    either = index.count(any_of=['range_issue', 'sarcasm'])
+    both = index.count(all_of=['range_issue', 'sarcasm'])
+    assert either == index.count(all_of='range_issue') + index.count(all_of='sarcasm') - both
+
+    try:
+        index.count(all_of=['no_such_feature'])
+        assert False, "unknown feature accepted"
+    except KeyError:
+        pass
+
+
+def test_month_from_comment_date():
+    """Months come from the comment date, not the scrape bucket's `month` field"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    corpus = {'Ampere': [
+        {'text': 'Ampere service is slow', 'month': '2024-01', 'date': '2025-07-18 09:30:00'},
+        {'text': 'Good scooter', 'month': '2024-01', 'date': 'July 3, 2025'},
+        {'text': 'Nice', 'month': '2024-01'},
+    ]}
+    index = FeatureIndex.build(corpus, classifier)
+    assert index.counts_by('month') == {'2025-07': 2}
+    assert index.count(month='2024-01') == 0 and index.count(month='2025-07') == 2
+
+
+if __name__ == "__main__":
+    test_filters_match_brute_force()
+    test_counts_by_and_any_of()
+    test_month_from_comment_date()
+    print("✅ Feature index tests passed")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test incremental classification: re-scraped comments reuse their results by stable comment ID
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.classification_cache import ClassificationCache, stable_comment_id
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.comment_dataset import CommentDataset, DatasetCommentData, consolidate_comments
+from services.comment_repository import CommentRepository, RepositoryCommentData
+from services.classification_refresh import changed_comment_batches, refresh_classifications
+
+
+COMMENTS = [
+    {'text': 'Ola service center is worst, 3 visits already 😡', 'author': '@a', 'time': 1, 'video_id': 'v1', 'likes': 2},
+    {'text': 'Ather 450X range is badhiya', 'author': '@b', 'time': 2, 'video_id': 'v1', 'likes': 0},
+    {'text': 'Wow great service, waited 3 weeks!!', 'author': '@c', 'time': 3, 'video_id': 'v2', 'likes': 1},
+    {'text': 'Ather 450X range is badhiya', 'author': '@d', 'time': 4, 'video_id': 'v2', 'likes': 9},
+]
+
+
+def test_refresh_classifies_only_new_comments():
+    """Changed like counts are re-weighted without reclassifying; new or edited comments are classified"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'cache.db')
+        classifier = AdvancedSentimentClassifier(use_cache=False)
+        classifier.classification_cache = ClassificationCache(db_path, classifier.rule_version)
+        asyncio.run(classifier.analyze_comment_batch(COMMENTS, 'Ather', compact=True))
+        assert classifier.get_reuse_stats()['classified'] == 3  # one duplicate text
+
+        refreshed = [dict(comment, likes=comment['likes'] + 500, replies=30) for comment in COMMENTS]
+        refreshed[2] = dict(refreshed[2], text='Wow great service, waited 4 weeks!!')
+        refreshed.append({'text': 'Chetak is decent', 'author': '@e', 'time': 5, 'video_id': 'v3'})
+
+        restarted = AdvancedSentimentClassifier(use_cache=False)
+        restarted.classification_cache = ClassificationCache(db_path, restarted.rule_version)
+        results = asyncio.run(restarted.analyze_comment_batch(refreshed, 'Ather', compact=True))
+        stats = restarted.get_reuse_stats()
+        assert stats == {'comments': 5, 'classified': 2, 'cache_hits': 0, 'id_hits': 3, 'reused': 3}, stats
+
+        uncached = AdvancedSentimentClassifier(use_cache=False)
+        expected = asyncio.run(uncached.analyze_comment_batch(refreshed, 'Ather'))
+        assert [restarted.explain_classification(c['advanced_sentiment_classification']) for c in results] == \
+            [c['advanced_sentiment_classification'] for c in expected]
+
+        # A new rule version classifies everything again
+        other_rules = AdvancedSentimentClassifier(use_cache=False)
+        other_rules.classification_cache = ClassificationCache(db_path, 'other-rules')
+        asyncio.run(other_rules.analyze_comment_batch(refreshed, 'Ather', compact=True, dedup=False))
+        assert other_rules.get_reuse_stats()['classified'] == 5
+
+
+def test_stable_comment_id():
+    """The ID ignores engagement counts but not the author, time, video or text"""
+    comment = COMMENTS[0]
+    assert stable_comment_id(comment) == stable_comment_id(dict(comment, likes=99, replies=4))
+    for field, value in [('author', '@z'), ('time', 7), ('video_id', 'v9'), ('text', 'edited')]:
+        assert stable_comment_id(comment) != stable_comment_id(dict(comment, **{field: value}))
+
+
+def write_month(tmp, name, comments, mtime):
+    path = os.path.join(tmp, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(comments, f, ensure_ascii=False)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_refresh_visits_only_changed_data():
+    """A refresh reads only new dataset partitions or newly imported repository files"""
+    july = [dict(c, oem='Ather', date='2025-07-0%d 10:00:00' % (i + 1)) for i, c in enumerate(COMMENTS[:2])]
+    august = [dict(c, oem='Ather', date='2025-08-0%d 10:00:00' % (i + 1)) for i, c in enumerate(COMMENTS[2:])]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [write_month(tmp, 'comments_ather_2025_07_1_comments_a.json', july, 1_000)]
+        dataset_dir = os.path.join(tmp, 'dataset')
+        consolidate_comments(paths, dataset_dir)
+        before = DatasetCommentData(CommentDataset.open(dataset_dir))
+        paths.append(write_month(tmp, 'comments_ather_2025_08_1_comments_b.json', august, 2_000))
+        consolidate_comments(paths, dataset_dir)
+        after = DatasetCommentData(CommentDataset.open(dataset_dir))
+
+        batches = list(changed_comment_batches(before, after))
+        assert [(oem, [c['text'] for c in comments]) for oem, comments in batches] == \
+            [('Ather', [c['text'] for c in august])]
+        assert not after.dataset._partition_comments and not after._comments
+        assert len(list(changed_comment_batches(None, after))) == 2
+
+        repository = CommentRepository(os.path.join(tmp, 'comments.db'))
+        repository.import_file(paths[0])
+        loaded_at = time.time()
+        assert list(changed_comment_batches(RepositoryCommentData(repository), RepositoryCommentData(repository),
+                                            loaded_at)) == []
+        repository.import_file(paths[1])
+        batches = list(changed_comment_batches(RepositoryCommentData(repository), RepositoryCommentData(repository),
+                                               loaded_at))
+        assert [(oem, len(comments)) for oem, comments in batches] == [('Ather', 2)]
+        repository.close()
+
+        classifier = AdvancedSentimentClassifier(use_cache=False)
+        classifier.classification_cache = ClassificationCache(os.path.join(tmp, 'cache.db'), classifier.rule_version)
+        stats = asyncio.run(refresh_classifications(classifier, changed_comment_batches(before, after)))
+        assert (stats['batches'], stats['comments'], stats['classified']) == (1, 2, 2)
+        stats = asyncio.run(refresh_classifications(classifier, changed_comment_batches(None, after)))
+        assert (stats['batches'], stats['comments'], stats['classified']) == (2, 4, 2)
+
+
+if __name__ == "__main__":
+    test_refresh_classifies_only_new_comments()
+    test_refresh_visits_only_changed_data()
+    test_stable_comment_id()
+    print("✅ Incremental classification tests passed")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the split between OEM-independent feature extraction and OEM-specific scoring
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+OEMS = [None, 'Ola Electric', 'Ather', 'Bajaj Chetak', 'TVS iQube', 'Hero Vida', 'Revolt']
+COMMENTS = [
+    {'text': 'Ola S1 Pro is amazing 😍 but service center is worst', 'likes': 150, 'replies': 25},
+    {'text': 'Ather 450X ka range bahut badhiya hai, like for ola', 'likes': 3},
+    {'text': 'Which is better, Chetak or iQube?', 'replies': 4},
+    {'text': 'i love the scooter, it is excellent'},
+    {'text': ''},
+]
+
+
+def test_multi_oem_scoring_matches_single_oem():
+    """Scoring one set of features per OEM gives the same result as classifying per OEM"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    for tiered in [False, True]:
+        for comment in COMMENTS:
+            by_oem = classifier.classify_comment_for_oems(comment, OEMS, tiered=tiered)
+            assert list(by_oem) == OEMS
+            for oem in OEMS:
+                assert by_oem[oem] == classifier.classify_comment(comment, oem, tiered=tiered), (comment, oem)
+
+
+def test_batches_by_oem_extract_shared_comments_once():
+    """Comments listed under several OEMs are analyzed once and scored per OEM"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments_by_oem = {'Ola Electric': COMMENTS[:3], 'Ather': COMMENTS[1:4]}
+
+    extracted = []
+    extract_features = classifier.extract_features
+    classifier.extract_features = lambda comment, *args: (extracted.append(comment['text']),
+                                                          extract_features(comment, *args))[1]
+    results = asyncio.run(classifier.analyze_comment_batches_by_oem(comments_by_oem))
+    assert sorted(extracted) == sorted(c['text'] for c in COMMENTS[:4])
+
+    for oem, comments in comments_by_oem.items():
+        expected = asyncio.run(classifier.analyze_comment_batch(comments, oem))
+        assert results[oem] == expected
+
+
+if __name__ == "__main__":
+    test_multi_oem_scoring_matches_single_oem()
+    test_batches_by_oem_extract_shared_comments_once()
+    print("✅ OEM scoring tests passed")
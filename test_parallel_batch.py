@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test parallel (process pool) batch classification against the sequential batch
+"""
+
+import sys
+import os
+import asyncio
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier, _worker_context
+
+
+def test_parallel_batch_matches_sequential():
+    """Sharded results come back in input order and equal the sequential results"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    texts = [
+        "Ola S1 Pro is amazing 😍",
+        "Service center is worst, 3rd visit this month 😡",
+        "Which is better, Ather or Chetak?",
+        "battery range bahut badhiya hai",
+        "",
+        "Thanks for nothing Ola!",
+    ]
+    comments = [{'text': texts[i % len(texts)], 'likes': i} for i in range(40)]
+
+    # Workers are never forked from this (threaded) process
+    assert _worker_context().get_start_method() in ('forkserver', 'spawn')
+    stop = threading.Event()
+    background = threading.Thread(target=stop.wait, daemon=True)
+    background.start()
+    try:
+        sequential = asyncio.run(classifier.analyze_comment_batch(comments, 'Ola Electric', parallel=False))
+        parallel = asyncio.run(classifier.analyze_comment_batch(comments, 'Ola Electric', parallel=True,
+                                                                workers=2, chunk_size=7))
+    finally:
+        stop.set()
+        classifier.shutdown_process_pool()
+
+    assert [c['likes'] for c in parallel] == list(range(40))
+    assert parallel == sequential
+
+
+if __name__ == "__main__":
+    test_parallel_batch_matches_sequential()
+    print("✅ Parallel batch tests passed")
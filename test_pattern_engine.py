@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the precompiled pattern engine against naive per-pattern matching
+"""
+
+import sys
+import os
+import re
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.pattern_engine import PatternEngine
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+def test_literal_and_bounded_matching():
+    """Overlapping literals and word-bounded words match like `in` and r'\\b...\\b'"""
+    engine = PatternEngine()
+    engine.add_literals('words', ['bad', 'badhiya', 'dil se', 'dil se recommend', 'bad'])
+    engine.add_literals('english', ['bad', 'bad service', 'good'], word_boundary=True)
+    engine.add_regexes('range', [r'range.*issue', r'issue.*range'])
+    engine.compile()
+
+    texts = [
+        "badhiya scooter, dil se recommend",
+        "bad service but good range",
+        "the range is the main issue",
+        "goodness badhiya",
+        "",
+    ]
+    for text in texts:
+        matches = engine.scan(text)
+        for pattern in ['bad', 'badhiya', 'dil se', 'dil se recommend']:
+            assert matches.contains(pattern) == (pattern in text), (text, pattern)
+        expected = [w for w in ['bad', 'bad service', 'good']
+                    if re.search(r'\b' + re.escape(w) + r'\b', text)]
+        assert matches.hits('english') == expected, (text, matches.hits('english'))
+        assert matches.count('words') == sum(1 for w in ['bad', 'badhiya', 'dil se', 'dil se recommend', 'bad'] if w in text)
+        assert matches.any('range') == any(re.search(p, text) for p in [r'range.*issue', r'issue.*range'])
+
+
+def test_single_words_use_token_set():
+    """Single-word bounded patterns come from the token set, phrases still match across tokens"""
+    engine = PatternEngine()
+    engine.add_literals('english', ['bad', 'not good', "don't", 'worst'], word_boundary=True)
+    engine.compile()
+
+    matches = engine.scan("not good, don't buy. bad_service badly worst!")
+    assert matches.tokens >= {'not', 'good', 'worst', 'bad_service'}
+    assert matches.hits('english') == ['not good', "don't", 'worst']
+
+
+def test_sequences_match_like_re_search():
+    """Sequence rules agree with re.search, including `.*` stopping at newlines and long whitespace runs"""
+    patterns = [r'great.*service.*terrible', r'not\s+good', r'range\s+\d+\s+km', r'(worst|bad).*(service|range)',
+                r'thanks.*!', r'good\s+.*bad', r'(?<=x)odd']
+    # Cutoff 0 forces the keyword-position walk even on short texts
+    engines = [PatternEngine(), PatternEngine(sequence_regex_max_chars=0)]
+    for engine in engines:
+        engine.add_sequences('phrases', patterns)
+        engine.compile()
+    # Lookbehind is outside the supported subset and falls back to a plain regex
+    assert engines[1].sequence_rules['phrases'][-1][0] == 'regex'
+
+    texts = [
+        "great service, terrible range",
+        "great service \n terrible",
+        "great\nservice terrible",
+        "not    good",
+        "not \n good",
+        "range 80   km only",
+        "bad " * 2000 + "range",
+        "worst\n" * 500 + "service",
+        "good " + " " * 5000 + "\nbad",
+        "thanks a lot" + " a" * 3000,
+        "xodd",
+    ]
+    for text in texts:
+        expected = [p for p in patterns if re.search(p, text)]
+        for engine in engines:
+            assert engine.scan(text).hits('phrases') == expected, (text[:40], expected)
+            assert engine.scan(text).any('phrases') == bool(expected)
+
+
+def test_classifier_shares_one_scan():
+    """Classifier stages accept a precomputed scan and give the same result"""
+    classifier = AdvancedSentimentClassifier()
+    text = "Ola scooter is badhiya but service center is worst, dil se bol raha mat lo"
+    language_info = classifier.detect_language_mix(text)
+    matches = classifier.scan_patterns(text)
+
+    assert classifier.analyze_sentiment_patterns(text, language_info, matches) == \
+        classifier.analyze_sentiment_patterns(text, language_info)
+    assert classifier.detect_company_mentions(text, matches) == classifier.detect_company_mentions(text)
+
+
+if __name__ == "__main__":
+    test_literal_and_bounded_matching()
+    test_single_words_use_token_set()
+    test_sequences_match_like_re_search()
+    test_classifier_shares_one_scan()
+    print("✅ Pattern engine tests passed")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the query planner: OEM scope and time window of queries, and pruned loading
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.temporal_analysis_service import TemporalAnalysisService
+from services.comment_dataset import CommentDataset, DatasetCommentData, consolidate_comments
+from services.query_planner import plan_query, load_planned_comments, mentioned_oems
+
+temporal_service = TemporalAnalysisService()
+
+
+def comment(text, date, oem):
+    return {'text': text, 'author': '@a', 'likes': 1, 'date': date, 'video_id': 'abcdefgh', 'oem': oem}
+
+
+COMMENTS = {
+    'Ola Electric': [comment('range dropped', '2024-07-31 23:59:59', 'Ola Electric'),
+                     comment('service delayed', '2024-08-01 00:00:00', 'Ola Electric'),
+                     comment('software update is good', '2024-08-31 12:00:00', 'Ola Electric')],
+    'Ather': [comment('smooth ride', '2024-08-10 10:00:00', 'Ather')],
+    'TVS iQube': [comment('solid build', '2025-01-05 10:00:00', 'TVS iQube')]
+}
+
+
+def test_plan_scope():
+    """Named OEMs narrow the plan unless the query is about competitors or compares against one OEM"""
+    plan = plan_query("What did people say about Ola Electric in August 2024?", temporal_service)
+    assert plan.oems == ['Ola Electric'] and plan.time_period['type'] == 'month'
+    assert (plan.start_date.isoformat(), plan.end_date.isoformat()) == ('2024-08-01T00:00:00', '2024-09-01T00:00:00')
+
+    assert plan_query("Ola vs Ather battery complaints", temporal_service).oems == ['Ola Electric', 'Ather']
+    assert plan_query("Is TVS iQube better than Ola?", temporal_service).oems == ['Ola Electric', 'TVS iQube']
+    assert plan_query("Compare Ola with competitors", temporal_service).oems is None
+    assert plan_query("How does Ather compare?", temporal_service).oems is None
+    assert plan_query("best scooter for city rides", temporal_service).oems is None
+    assert not plan_query("Ather service complaints", temporal_service).has_time_window
+
+    # Aliases match whole words only
+    assert mentioned_oems("solar charging for a driver") == []
+    assert mentioned_oems("Chetak or the F77?") == ['Bajaj Chetak', 'Ultraviolette']
+
+
+def test_planned_loading():
+    """A plan loads the same comments from memory and from the dataset, reading one partition"""
+    plan = plan_query("Ola Electric feedback in August 2024", temporal_service)
+    in_memory = load_planned_comments(COMMENTS, plan, temporal_service)
+    assert {oem: [c['text'] for c in comments] for oem, comments in in_memory.items()} == {
+        'Ola Electric': ['service delayed', 'software update is good']}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'all_oem_comments_historical_test.json')
+        with open(source, 'w', encoding='utf-8') as f:
+            json.dump(COMMENTS, f)
+        dataset_dir = os.path.join(tmp, 'dataset')
+        consolidate_comments([source], dataset_dir)
+        dataset = CommentDataset.open(dataset_dir)
+        data = DatasetCommentData(dataset)
+
+        planned = load_planned_comments(data, plan, temporal_service)
+        assert {oem: [c['text'] for c in comments] for oem, comments in planned.items()} == {
+            'Ola Electric': ['service delayed', 'software update is good']}
+        assert list(dataset._partition_comments) == ['ola_electric/2024/08.json']
+
+        # Without a time window every comment of the planned OEMs is loaded
+        scoped = load_planned_comments(data, plan.scope_only(), temporal_service)
+        assert list(scoped) == ['Ola Electric'] and len(scoped['Ola Electric']) == 3
+        everything = load_planned_comments(data, plan_query("best scooter", temporal_service), temporal_service)
+        assert sum(len(comments) for comments in everything.values()) == 5
+
+
+if __name__ == "__main__":
+    test_plan_scope()
+    test_planned_loading()
+    print("✅ Query planner tests passed")
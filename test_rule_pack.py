@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the declarative rule pack: pickled compiled form, content versioning and validation
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services import rule_pack
+from services.rule_pack import RulePack, DEFAULT_RULE_PACK_PATH, compiled_key, compiled_path
+
+
+TEXTS = [
+    "Wow great service, waited 3 weeks for a simple repair!!",
+    "dil se bol raha hu, bahut badhiya scooter hai 👍",
+    "बैटरी बहुत अच्छी है लेकिन सर्विस खराब है 😡",
+    "Thanks for nothing Ola!",
+    "Which is better, Ather or Chetak?",
+]
+
+
+def test_pickled_pack_classifies_identically():
+    """A classifier started from the pickled compiled pack matches one compiled from source"""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR'] = tmp
+        try:
+            compiled = AdvancedSentimentClassifier(use_cache=False)
+            cached = AdvancedSentimentClassifier(use_cache=False)
+        finally:
+            del os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR']
+    assert compiled.rule_pack_info['compiled_from'] == 'source'
+    assert cached.rule_pack_info['compiled_from'] == 'cache'
+    assert cached.rule_version == compiled.rule_version
+    for text in TEXTS:
+        comment = {'text': text, 'likes': 5}
+        assert cached.classify_comment(comment, 'Ola Electric') == compiled.classify_comment(comment, 'Ola Electric')
+
+
+def test_pack_edit_changes_versions():
+    """Editing a rule changes the pack version and the classification cache key; bad packs are rejected"""
+    with open(DEFAULT_RULE_PACK_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    default = AdvancedSentimentClassifier(use_cache=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR'] = tmp
+        try:
+            data['sentiment']['positive_patterns']['english'].extend(['zippy', 'peppy'])
+            path = os.path.join(tmp, 'edited.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            edited = AdvancedSentimentClassifier(use_cache=False, rule_pack_path=path)
+        finally:
+            del os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR']
+        assert edited.rule_pack_info['version'] != default.rule_pack_info['version']
+        assert edited.rule_version != default.rule_version
+        assert edited.classify_comment({'text': 'this scooter is zippy and peppy'})['sentiment'] == 'positive'
+        assert default.classify_comment({'text': 'this scooter is zippy and peppy'})['sentiment'] == 'neutral'
+
+        del data['sarcasm']['sarcasm_patterns']
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        try:
+            RulePack.load(path)
+            assert False, "pack without sarcasm_patterns accepted"
+        except ValueError as e:
+            assert 'sarcasm_patterns' in str(e)
+
+
+def test_compiled_form_tracks_compiler_code():
+    """A compiled form pickled by other compiler code is not loaded; the default directory ignores the cwd"""
+    version = RulePack.load().version
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR'] = tmp
+        modules = rule_pack.COMPILER_MODULES
+        try:
+            AdvancedSentimentClassifier(use_cache=False)
+            key = compiled_key(version)
+            rule_pack.COMPILER_MODULES = modules + ['explanations.py']  # as if compiler code had changed
+            assert compiled_key(version) != key
+            recompiled = AdvancedSentimentClassifier(use_cache=False)
+        finally:
+            rule_pack.COMPILER_MODULES = modules
+            del os.environ['CLASSIFIER_RULE_PACK_CACHE_DIR']
+        assert recompiled.rule_pack_info['compiled_from'] == 'source'
+        assert len(os.listdir(tmp)) == 2
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            path = compiled_path(compiled_key(version))
+        finally:
+            os.chdir(cwd)
+    assert path == os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models', os.path.basename(path))
+
+
+if __name__ == "__main__":
+    test_pickled_pack_classifies_identically()
+    test_pack_edit_changes_versions()
+    test_compiled_form_tracks_compiler_code()
+    print("✅ Rule pack tests passed")
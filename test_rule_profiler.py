@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test per-rule profiling: unchanged results, group hit counts, label flips and the JSON/CSV reports
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+COMMENTS = [
+    {'text': 'Wow great service, waited 3 weeks for a simple repair!!', 'likes': 4},
+    {'text': 'Service center is worst, 3rd visit this month 😡'},
+    {'text': 'Great scooter 😡'},
+    {'text': 'Which is better, Ather or Chetak?'},
+    {'text': 'Like for Ola'},
+]
+
+
+def test_profiling_keeps_results_and_counts_rules():
+    """Profiled classifications are identical; hits, flips and stage times are recorded"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    expected = [classifier.classify_comment(comment, 'Hero Vida', tiered) for tiered in [False, True]
+                for comment in COMMENTS]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rules')
+        with classifier.profile_rules(path) as profiler:
+            results = [classifier.classify_comment(comment, 'Hero Vida', tiered) for tiered in [False, True]
+                       for comment in COMMENTS]
+            assert classifier.rule_profiler is profiler
+        assert results == expected
+        assert classifier.rule_profiler is None and 'extract_features' not in classifier.__dict__
+
+        with open(path + '.json', encoding='utf-8') as f:
+            report = json.load(f)
+        with open(path + '.csv', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+    assert report['comments'] == 2 * len(COMMENTS)
+    stages = {stage['name']: stage for stage in report['stages']}
+    assert stages['extract_features']['calls'] == 2 * len(COMMENTS)
+    groups = {group['name']: group for group in report['groups']}
+    assert groups['question']['comments_hit'] == 2 and groups['question']['pattern_hits'] == {' or ': 2}
+    assert ' or ' not in groups['question']['dead_patterns']
+    assert [group['total_ms'] for group in report['groups']] == \
+        sorted((group['total_ms'] for group in report['groups']), reverse=True)
+    rules = {rule['name']: rule for rule in report['rules']}
+    assert rules['strong_negative_emoji_override']['flips'] >= 1
+    assert rules['off_topic_brand_mention']['flips'] >= 1
+    assert rules['pattern_sentiment']['flips'] == 0
+    assert {row['kind'] for row in rows} == {'stage', 'group', 'rule'}
+    assert len(rows) == len(report['stages']) + len(report['groups']) + len(report['rules'])
+
+
+if __name__ == "__main__":
+    test_profiling_keeps_results_and_counts_rules()
+    print("✅ Rule profiler tests passed")
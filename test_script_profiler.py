@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass script profiler against one findall per script
+"""
+
+import sys
+import os
+import re
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+TEXTS = [
+    "ola s1 pro is amazing 😍",
+    "बैटरी बहुत अच्छी है लेकिन सर्विस खराब है",
+    "இது நல்ல scooter, range சிறந்த",
+    "ഇത് നല്ല വണ്ടി ఇది మంచి",
+    "ગુજરાતી ಕನ್ನಡ বাংলা mix",
+    "!!! 😡",
+    "",
+]
+
+
+def test_profile_matches_per_script_findall():
+    """Script counts, tokens and word characters equal the multi-pass computation"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    for text in TEXTS:
+        profile = classifier.profile_scripts(text)
+        lowered = text.lower()
+        assert profile.tokens == re.findall(r'\b\w+\b', lowered)
+        assert profile.word_chars == len(re.sub(r'[^\w]', '', lowered))
+        expected = {}
+        for script, pattern in classifier.script_patterns.items():
+            count = sum(len(run) for run in pattern.findall(lowered))
+            if count:
+                expected[script] = count
+        assert profile.script_chars == expected, text
+        assert list(profile.script_chars) == [s for s in classifier.script_patterns if s in expected]
+
+
+def test_language_mix_uses_profile():
+    """Passing a precomputed profile gives the same language analysis, and the scan reuses its tokens"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    for text in TEXTS:
+        profile = classifier.profile_scripts(text)
+        assert classifier.detect_language_mix(text, profile) == classifier.detect_language_mix(text)
+        assert classifier.scan_patterns(text, profile).tokens == classifier.scan_patterns(text).tokens
+
+    hindi = classifier.detect_language_mix(TEXTS[1])
+    # Combining vowel signs belong to the script but are not word characters
+    assert hindi['primary_language'] == 'devanagari' and hindi['script_distribution']['devanagari'] > 1
+
+
+def test_emojis_collected_by_profile_scan():
+    """Emojis from the shared scan give the same analysis as the separate emoji regex"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    texts = TEXTS + ["❤️❤ ☹️ बैटरी😍अच्छी 🕉️🙏", "Great video 🔥🔥👍"]
+    for text in texts:
+        profile = classifier.profile_scripts(text)
+        assert profile.emojis == classifier.emoji_regex.findall(text), text
+        assert classifier.analyze_emojis(text, profile) == classifier.analyze_emojis(text)
+
+    profile = classifier.profile_scripts(texts[-2])
+    # A bare heart without the variation selector is not in the mapping
+    assert profile.emojis == ['❤️', '☹️', '😍', '🕉️', '🙏']
+    assert profile.script_chars == classifier.profile_scripts("बैटरी अच्छी").script_chars
+
+
+if __name__ == "__main__":
+    test_profile_matches_per_script_findall()
+    test_language_mix_uses_profile()
+    test_emojis_collected_by_profile_scan()
+    print("✅ Script profiler tests passed")
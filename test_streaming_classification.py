@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test chunked streaming classification (iter_classify / aiter_classify)
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.enhanced_sentiment_analyzer import EnhancedSentimentAnalyzer
+from services.batch_summary import BatchSummaryAccumulator
+
+
+TEXTS = [
+    "Ola S1 Pro is amazing 😍",
+    "Service center is worst, 3rd visit this month 😡",
+    "Which is better, Ather or Chetak?",
+    "battery range bahut badhiya hai",
+    "",
+    "Thanks for nothing Ola!",
+    "first",
+]
+
+
+def make_comments(count):
+    return [{'text': TEXTS[i % len(TEXTS)], 'likes': i} for i in range(count)]
+
+
+def test_iter_classify_matches_batch_and_is_lazy():
+    """Chunks concatenate to the batch result; the input is only consumed one chunk ahead"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    expected = asyncio.run(classifier.analyze_comment_batch(make_comments(23), 'Ather'))
+
+    consumed = []
+
+    def source():
+        for comment in make_comments(23):
+            consumed.append(comment)
+            yield comment
+
+    stream = classifier.iter_classify(source(), 'Ather', chunk_size=10)
+    first = next(stream)
+    assert len(first) == 10 and len(consumed) == 10
+    chunks = [first] + list(stream)
+    assert [len(chunk) for chunk in chunks] == [10, 10, 3]
+    assert [comment for chunk in chunks for comment in chunk] == expected
+
+
+def test_aiter_classify_matches_batch():
+    """The async variant yields the same chunks"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = make_comments(15)
+
+    async def collect():
+        return [chunk async for chunk in classifier.aiter_classify(iter(comments), 'Ola Electric',
+                                                                   chunk_size=4, compact=True)]
+
+    chunks = asyncio.run(collect())
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4, 3]
+    expected = asyncio.run(classifier.analyze_comment_batch(comments, 'Ola Electric'))
+    streamed = [comment for chunk in chunks for comment in chunk]
+    assert [c['advanced_sentiment_classification'].to_dict() for c in streamed] == \
+        [c['advanced_sentiment_classification'] for c in expected]
+
+
+def test_analyzer_aiter_classify():
+    """The analyzer streams legacy views and summary counts like its batch call, with fallback per chunk"""
+    analyzer = EnhancedSentimentAnalyzer()
+    analyzer.advanced_classifier.classification_cache = None
+    comments = make_comments(15)
+    batch_summary = BatchSummaryAccumulator()
+    expected = asyncio.run(analyzer.analyze_comment_batch([dict(c) for c in comments], 'Ather', compact=True,
+                                                          summary=batch_summary))
+
+    async def collect(summary):
+        return [chunk async for chunk in analyzer.aiter_classify(iter(comments), 'Ather', chunk_size=4,
+                                                                 compact=True, summary=summary)]
+
+    stream_summary = BatchSummaryAccumulator()
+    streamed = [comment for chunk in asyncio.run(collect(stream_summary)) for comment in chunk]
+    assert [c['sentiment_classification'] for c in streamed] == [c['sentiment_classification'] for c in expected]
+    assert stream_summary.sentiment_by_oem == batch_summary.sentiment_by_oem
+
+    # A failing chunk is classified by the rule-based fallback, the others by the advanced classifier
+    batch = analyzer.advanced_classifier.analyze_comment_batch
+    calls = []
+
+    async def failing_second_chunk(chunk, *args, **kwargs):
+        calls.append(len(chunk))
+        if len(calls) == 2:
+            raise RuntimeError("classifier unavailable")
+        return await batch(chunk, *args, **kwargs)
+
+    analyzer.advanced_classifier.analyze_comment_batch = failing_second_chunk
+    fallback_summary = BatchSummaryAccumulator()
+    chunks = asyncio.run(collect(fallback_summary))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4, 3]
+    assert all('advanced_sentiment_classification' not in c and 'sentiment_classification' in c for c in chunks[1])
+    assert all('advanced_sentiment_classification' in c for c in chunks[2])
+    assert sum(fallback_summary.sentiment_by_oem['Ather'].values()) == 15
+
+
+if __name__ == "__main__":
+    test_iter_classify_matches_batch_and_is_lazy()
+    test_aiter_classify_matches_batch()
+    test_analyzer_aiter_classify()
+    print("✅ Streaming classification tests passed")
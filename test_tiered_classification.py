@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test tiered (fast-path) classification: escalation, agreement and tier statistics
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+
+
+def test_fast_path_and_escalation():
+    """Clear short comments take the fast path, ambiguous ones escalate to the full pipeline"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+
+    for text in ['i love the scooter, it is excellent', 'the battery is bad and the range is poor']:
+        fast = classifier.classify_comment({'text': text}, tiered=True)
+        assert fast['analysis_method'] == 'tiered_fast_path', text
+        assert fast['sentiment'] == classifier.classify_comment({'text': text})['sentiment']
+
+    no_signal = classifier.classify_comment({'text': 'kal showroom jaunga'}, tiered=True)
+    assert no_signal['analysis_method'] == 'tiered_fast_path' and no_signal['sentiment'] == 'neutral'
+
+    for text in ['Which scooter should I buy?',                       # neutral request
+                 'great service, third time at the service center',  # mixed polarity / sarcasm
+                 'Ola is good',                                        # brand mention
+                 'good ' * 40]:                                        # long text
+        result = classifier.classify_comment({'text': text}, 'Ather', tiered=True)
+        assert result['analysis_method'] == 'advanced_multi_layer', text
+
+    stats = classifier.get_tier_stats()
+    assert stats['tiers']['fast']['count'] == 3
+    assert stats['tiers']['full']['count'] == 4
+    assert sum(stats['escalation_reasons'].values()) == 4
+
+
+def test_tiered_batch_reports_tiers():
+    """Batch summary carries per-tier counts and timings"""
+    classifier = AdvancedSentimentClassifier(use_cache=False)
+    comments = [{'text': 'the scooter is good and i love it'}, {'text': 'Is Ather better than Ola?'}]
+    results = asyncio.run(classifier.analyze_comment_batch(comments, tiered=True))
+
+    summary = classifier.get_batch_summary(results)
+    tiers = summary['tier_statistics']['tiers']
+    assert tiers['fast']['count'] == 1 and tiers['full']['count'] == 1
+    assert summary['tier_statistics']['total_comments'] == 2
+
+
+if __name__ == "__main__":
+    test_fast_path_and_escalation()
+    test_tiered_batch_reports_tiers()
+    print("✅ Tiered classification tests passed")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Train the distilled sentiment model on comments labelled by the rule classifier
+Usage: python train_distilled_model.py [comments.json ...]
+(default: every comments_*_comments_*.json file; each file holds a list of comments or {oem: [comments]})
+Writes DISTILLED_MODEL_PATH (default models/distilled_sentiment.npz) and prints an agreement report
+on a held-out fifth of the comments
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.advanced_sentiment_classifier import AdvancedSentimentClassifier
+from services.distilled_classifier import DistilledSentimentModel, DistilledSentimentScorer, _SKLEARN_AVAILABLE
+
+
+def load_comments(paths):
+    """(comment, oem) pairs with text from every file"""
+    pairs = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        groups = data.items() if isinstance(data, dict) else [(None, data)]
+        for oem, comments in groups:
+            if not isinstance(comments, list):
+                continue
+            for comment in comments:
+                if isinstance(comment, dict) and comment.get('text'):
+                    pairs.append((comment, oem or comment.get('oem') or 'Ola Electric'))
+    return pairs
+
+
+def main():
+    if not _SKLEARN_AVAILABLE:
+        # Checked before the (slow) rule labelling
+        print("❌ scikit-learn is required to train the distilled model: pip install scikit-learn")
+        sys.exit(1)
+    paths = sys.argv[1:] or sorted(glob.glob('comments_*_comments_*.json'))
+    output_path = os.getenv('DISTILLED_MODEL_PATH', 'models/distilled_sentiment.npz')
+    fallback_rate = float(os.getenv('DISTILLED_FALLBACK_RATE', 0.1))
+
+    pairs = load_comments(paths)
+    print(f"📂 Loaded {len(pairs)} comments from {len(paths)} files")
+    if not pairs:
+        print("❌ No comments to train on")
+        return
+
+    classifier = AdvancedSentimentClassifier()
+    start_time = time.time()
+    by_oem = {}
+    for comment, oem in pairs:
+        by_oem.setdefault(oem, []).append(comment)
+    labels_by_oem = {
+        oem: [comment['advanced_sentiment_classification'].get('sentiment', 'neutral')
+              for chunk in classifier.iter_classify(comments, oem, compact=True) for comment in chunk]
+        for oem, comments in by_oem.items()
+    }
+    print(f"🏷️ Rule labels computed in {time.time() - start_time:.1f}s")
+
+    rows = [(comment, oem, label) for oem, comments in by_oem.items()
+            for comment, label in zip(comments, labels_by_oem[oem])]
+    random.Random(0).shuffle(rows)
+    split = len(rows) * 4 // 5
+    train_rows, holdout_rows = rows[:split], rows[split:]
+
+    start_time = time.time()
+    model = DistilledSentimentModel.train([comment['text'] for comment, _, _ in train_rows],
+                                          [label for _, _, label in train_rows],
+                                          fallback_rate=fallback_rate, rule_version=classifier.rule_version)
+    print(f"🧠 Trained on {len(train_rows)} comments in {time.time() - start_time:.1f}s "
+          f"(fallback margin {model.min_margin:.3f})")
+
+    scorer = DistilledSentimentScorer(model, classifier)
+    report = scorer.agreement_report([comment for comment, _, _ in holdout_rows],
+                                     rule_labels=[label for _, _, label in holdout_rows])
+    print(f"📊 Held-out agreement with rule labels ({len(holdout_rows)} comments):")
+    print(f"   Distilled only:  {report['distilled_only']['agreement'] * 100:.1f}%")
+    print(f"   Confident only:  {report['confident_only']['agreement'] * 100:.1f}% "
+          f"({report['coverage'] * 100:.1f}% of comments)")
+    print(f"   With fallback:   {report['with_fallback']['agreement'] * 100:.1f}%")
+    for sentiment, scores in report['distilled_only']['per_class'].items():
+        print(f"   {sentiment:>8}: precision {scores['precision']:.3f}, recall {scores['recall']:.3f} "
+              f"({scores['support']} comments)")
+
+    model.save(output_path)
+    print(f"💾 Saved distilled model to {output_path} ({os.path.getsize(output_path) / 1024:.0f} KB)")
+    with open(os.path.splitext(output_path)[0] + '_report.json', 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()